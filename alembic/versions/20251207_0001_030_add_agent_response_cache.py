@@ -0,0 +1,40 @@
+"""Add per-agent LLM response cache settings
+
+Revision ID: 030
+Revises: 029
+Create Date: 2025-12-07
+
+Adds response_cache_enabled (opt-in, default off) and response_cache_bypass
+(extra regex patterns of questions never answered from cache) to agents.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic
+revision = '030'
+down_revision = '029'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('agents', sa.Column(
+        'response_cache_enabled',
+        sa.Boolean(),
+        server_default='false',
+        nullable=False
+    ))
+    op.add_column('agents', sa.Column(
+        'response_cache_bypass',
+        postgresql.JSONB(),
+        server_default='[]',
+        nullable=False
+    ))
+
+
+def downgrade():
+    op.drop_column('agents', 'response_cache_bypass')
+    op.drop_column('agents', 'response_cache_enabled')
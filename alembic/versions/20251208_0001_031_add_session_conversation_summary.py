@@ -0,0 +1,29 @@
+"""Add rolling conversation summary to sessions
+
+Revision ID: 031
+Revises: 030
+Create Date: 2025-12-08
+
+Adds conversation_summary (running summary of turns folded out of the prompt)
+and summary_through_id (last conversations.id covered by it) to sessions.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = '031'
+down_revision = '030'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('sessions', sa.Column('conversation_summary', sa.Text(), nullable=True))
+    op.add_column('sessions', sa.Column('summary_through_id', sa.Integer(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('sessions', 'summary_through_id')
+    op.drop_column('sessions', 'conversation_summary')
@@ -0,0 +1,32 @@
+"""Add idempotency key to conversations
+
+Revision ID: 032
+Revises: 031
+Create Date: 2025-12-09
+
+Adds conversations.idempotency_key (unique, nullable for existing rows) so
+batched write-behind inserts can use ON CONFLICT DO NOTHING and a retried
+batch never duplicates a message.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = '032'
+down_revision = '031'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('conversations', sa.Column('idempotency_key', sa.String(length=64), nullable=True))
+    op.create_unique_constraint(
+        'conversations_idempotency_key_key', 'conversations', ['idempotency_key']
+    )
+
+
+def downgrade():
+    op.drop_constraint('conversations_idempotency_key_key', 'conversations', type_='unique')
+    op.drop_column('conversations', 'idempotency_key')
@@ -59,6 +59,9 @@ export function AgentForm({ open, onOpenChange, agent, onSubmit }: AgentFormProp
   // Memory Scope (Phase 5: Per-Agent Memory Preferences)
   const [memoryScope, setMemoryScope] = useState<'global' | 'agent'>('global');
 
+  // Response Cache (answer repeated questions without an LLM call)
+  const [responseCacheEnabled, setResponseCacheEnabled] = useState(false);
+
   // Voice Configuration
   const [maxUtteranceTimeMs, setMaxUtteranceTimeMs] = useState<number>(120000); // 2 minutes default
 
@@ -128,6 +131,7 @@ export function AgentForm({ open, onOpenChange, agent, onSubmit }: AgentFormProp
       setFilterActionsForTts(agent.filter_actions_for_tts || false);
       setMaxUtteranceTimeMs(agent.max_utterance_time_ms ?? 120000);
       setMemoryScope(agent.memory_scope);
+      setResponseCacheEnabled(agent.response_cache_enabled || false);
 
       // Load Discord plugin config if present
       if (agent.plugins?.discord) {
@@ -158,6 +162,7 @@ export function AgentForm({ open, onOpenChange, agent, onSubmit }: AgentFormProp
       setFilterActionsForTts(false);
       setMaxUtteranceTimeMs(120000);
       setMemoryScope('global');
+      setResponseCacheEnabled(false);
       setDiscordEnabled(false);
       setDiscordBotToken('');
       setDiscordAutoJoin(false);
@@ -191,6 +196,7 @@ export function AgentForm({ open, onOpenChange, agent, onSubmit }: AgentFormProp
         use_n8n: useN8n,
         n8n_webhook_url: n8nWebhookUrl || null,
         memory_scope: memoryScope,
+        response_cache_enabled: responseCacheEnabled,
         tts_voice: ttsVoice || null,
         tts_exaggeration: ttsExaggeration,
         tts_cfg_weight: ttsCfgWeight,
@@ -343,6 +349,21 @@ export function AgentForm({ open, onOpenChange, agent, onSubmit }: AgentFormProp
             />
           </div>
 
+          {/* Response Cache */}
+          <div className="flex items-center justify-between space-x-2 py-2">
+            <div className="space-y-0.5">
+              <Label htmlFor="responseCacheEnabled">Response Cache</Label>
+              <p className="text-xs text-muted-foreground">
+                Answer repeated questions (greetings, common asks) instantly from cache
+              </p>
+            </div>
+            <Switch
+              id="responseCacheEnabled"
+              checked={responseCacheEnabled}
+              onCheckedChange={setResponseCacheEnabled}
+            />
+          </div>
+
           {/* TTS Configuration - Aligned with Chatterbox TTS API */}
           <div className="space-y-4 pt-4 border-t">
             <h4 className="text-sm font-medium">Text-to-Speech Configuration (Optional)</h4>
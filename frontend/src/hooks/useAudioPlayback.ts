@@ -2,7 +2,9 @@
  * Audio Playback Hook for WebRTC TTS
  *
  * Handles playback of TTS audio received via WebSocket binary frames.
- * Supports both streaming chunks and complete WAV files.
+ * Supports both streaming chunks and complete WAV or WebM/Opus files.
+ * Consecutive utterances (e.g. a filler clip followed by the response) play
+ * back-to-back: a new utterance waits for the current one to end.
  */
 
 import { useState, useCallback, useRef, useEffect } from 'react';
@@ -33,6 +35,9 @@ export function useAudioPlayback(options: UseAudioPlaybackOptions = {}): UseAudi
 
   const audioRef = useRef<HTMLAudioElement | null>(null);
   const audioChunksRef = useRef<Uint8Array[]>([]);
+  // Resolves when the current utterance finishes (or is stopped)
+  const playbackDoneRef = useRef<Promise<void>>(Promise.resolve());
+  const resolvePlaybackDoneRef = useRef<(() => void) | null>(null);
 
   // Cleanup on unmount
   useEffect(() => {
@@ -64,6 +69,9 @@ export function useAudioPlayback(options: UseAudioPlaybackOptions = {}): UseAudi
         return;
       }
 
+      // Wait for the previous utterance to finish so clips don't overlap
+      await playbackDoneRef.current;
+
       options.onPlaybackStart?.();
       setIsPlaying(true);
 
@@ -77,15 +85,22 @@ export function useAudioPlayback(options: UseAudioPlaybackOptions = {}): UseAudi
         offset += chunk.length;
       }
 
-      // Create WAV blob
-      const audioBlob = new Blob([combined], { type: 'audio/wav' });
+      // Create audio blob (WebM/Opus if negotiated, detected by EBML magic bytes; otherwise WAV)
+      const isWebm = combined.length >= 4 &&
+        combined[0] === 0x1a && combined[1] === 0x45 && combined[2] === 0xdf && combined[3] === 0xa3;
+      const audioBlob = new Blob([combined], { type: isWebm ? 'audio/webm' : 'audio/wav' });
       const audioUrl = URL.createObjectURL(audioBlob);
-      console.log(`🔍 DEBUG: Created WAV blob: ${audioBlob.size} bytes, URL: ${audioUrl}`);
+      console.log(`🔍 DEBUG: Created ${isWebm ? 'WebM' : 'WAV'} blob: ${audioBlob.size} bytes, URL: ${audioUrl}`);
 
       // Create audio element
       const audio = new Audio(audioUrl);
       audio.volume = isMuted ? 0 : volume;
       audioRef.current = audio;
+      playbackDoneRef.current = new Promise<void>((resolve) => {
+        resolvePlaybackDoneRef.current = resolve;
+        audio.addEventListener('ended', () => resolve());
+        audio.addEventListener('error', () => resolve());
+      });
       console.log(`🔍 DEBUG: Created Audio element, volume=${audio.volume}, muted=${isMuted}`);
 
       // Play audio
@@ -170,9 +185,11 @@ export function useAudioPlayback(options: UseAudioPlaybackOptions = {}): UseAudi
       console.log(`✅ Audio chunks arrived after ${elapsed}ms (${finalBytes} bytes)`);
     }
 
-    await playAudioChunks(audioChunksRef.current);
-    console.log('🔍 DEBUG: playAudioChunks() completed, clearing buffer');
+    // Take this utterance's chunks now so the next utterance starts a fresh buffer
+    const chunks = audioChunksRef.current;
     audioChunksRef.current = [];
+    await playAudioChunks(chunks);
+    console.log('🔍 DEBUG: playAudioChunks() completed');
   }, [playAudioChunks, options]);
 
   const stop = useCallback(() => {
@@ -181,6 +198,9 @@ export function useAudioPlayback(options: UseAudioPlaybackOptions = {}): UseAudi
       audioRef.current.currentTime = 0;
       audioRef.current = null;
     }
+    resolvePlaybackDoneRef.current?.();
+    resolvePlaybackDoneRef.current = null;
+    playbackDoneRef.current = Promise.resolve();
     audioChunksRef.current = [];
     setIsPlaying(false);
   }, []);
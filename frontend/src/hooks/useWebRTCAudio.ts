@@ -161,7 +161,10 @@ export function useWebRTCAudio(options: UseWebRTCAudioOptions): UseWebRTCAudioRe
 
     try {
       // Build WebSocket URL with required query parameters
-      const wsUrl = `${WS_URL}/ws/voice?session_id=${encodeURIComponent(sessionId)}&user_id=${encodeURIComponent(effectiveUserId)}`;
+      // Negotiate WebM/Opus TTS audio (~10x smaller than WAV) when the browser can play it
+      const canPlayOpus = typeof Audio !== 'undefined' && new Audio().canPlayType('audio/webm; codecs="opus"') !== '';
+      const ttsFormat = canPlayOpus ? 'opus' : 'wav';
+      const wsUrl = `${WS_URL}/ws/voice?session_id=${encodeURIComponent(sessionId)}&user_id=${encodeURIComponent(effectiveUserId)}&tts_format=${ttsFormat}`;
       logger.debug('🔗 Full WebSocket URL:', wsUrl);
 
       const ws = new WebSocket(wsUrl);
@@ -286,8 +289,13 @@ export function useWebRTCAudio(options: UseWebRTCAudioOptions): UseWebRTCAudioRe
             // After TTS completes, we wait for user to speak again (auto-restart detection on backend)
             // Only disconnect when user explicitly stops or closes page
             if (message.event === 'tts_complete') {
-              logger.info('✅ TTS complete - ready for next conversation turn');
-              setIsPendingTTS(false);
+              if (message.data.filler) {
+                // Filler clip masks LLM latency; the response audio is still pending
+                logger.info('💬 Filler clip complete - response audio follows');
+              } else {
+                logger.info('✅ TTS complete - ready for next conversation turn');
+                setIsPendingTTS(false);
+              }
 
               // Notify parent so it can trigger audio playback
               if (onMessage) {
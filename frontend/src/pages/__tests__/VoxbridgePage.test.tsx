@@ -93,6 +93,8 @@ describe('VoxbridgePage', () => {
     tts_temperature: 0.3,
     tts_language: 'en',
     filter_actions_for_tts: false,
+    response_cache_enabled: false,
+    response_cache_bypass: [],
     created_at: '2025-11-20T00:00:00Z',
     updated_at: '2025-11-20T00:00:00Z',
   };
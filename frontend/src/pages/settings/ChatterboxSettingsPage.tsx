@@ -380,6 +380,7 @@ export function ChatterboxSettingsPage() {
                       <SelectItem value="sentence">Sentence</SelectItem>
                       <SelectItem value="paragraph">Paragraph</SelectItem>
                       <SelectItem value="fixed">Fixed</SelectItem>
+                      <SelectItem value="adaptive">Adaptive</SelectItem>
                       <SelectItem value="word">Word</SelectItem>
                     </SelectContent>
                   </Select>
@@ -609,7 +610,7 @@ export function ChatterboxSettingsPage() {
                     onValueChange={(value) =>
                       setEditedStreamingConfig({
                         ...editedStreamingConfig,
-                        chunking_strategy: value as 'sentence' | 'paragraph' | 'word' | 'fixed',
+                        chunking_strategy: value as 'sentence' | 'paragraph' | 'word' | 'fixed' | 'adaptive',
                       })
                     }
                   >
@@ -621,6 +622,7 @@ export function ChatterboxSettingsPage() {
                       <SelectItem value="paragraph">Paragraph</SelectItem>
                       <SelectItem value="word">Word</SelectItem>
                       <SelectItem value="fixed">Fixed</SelectItem>
+                      <SelectItem value="adaptive">Adaptive</SelectItem>
                     </SelectContent>
                   </Select>
                   <p className="text-xs text-muted-foreground">
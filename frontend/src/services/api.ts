@@ -155,6 +155,8 @@ export interface Agent {
   tts_temperature: number; // Sampling randomness (0.05-5.0)
   tts_language: string; // Language code (e.g., "en")
   filter_actions_for_tts: boolean; // Remove roleplay actions (*text*) before TTS
+  response_cache_enabled: boolean; // Answer repeated questions from the response cache
+  response_cache_bypass: string[]; // Regex patterns of questions never answered from cache
   max_utterance_time_ms?: number; // Voice configuration: max duration per speaking turn
   plugins?: {
     discord?: {
@@ -186,6 +188,8 @@ export interface AgentCreateRequest {
   tts_temperature?: number; // Sampling randomness (0.05-5.0, default 0.3)
   tts_language?: string; // Language code (default "en")
   filter_actions_for_tts?: boolean; // Remove roleplay actions (*text*) before TTS (default false)
+  response_cache_enabled?: boolean; // Answer repeated questions from the response cache (default false)
+  response_cache_bypass?: string[]; // Regex patterns of questions never answered from cache
   max_utterance_time_ms?: number; // Voice configuration: max duration per speaking turn
   plugins?: {
     discord?: {
@@ -215,6 +219,8 @@ export interface AgentUpdateRequest {
   tts_temperature?: number; // Sampling randomness (0.05-5.0)
   tts_language?: string; // Language code
   filter_actions_for_tts?: boolean; // Remove roleplay actions (*text*) before TTS
+  response_cache_enabled?: boolean; // Answer repeated questions from the response cache
+  response_cache_bypass?: string[]; // Regex patterns of questions never answered from cache
   max_utterance_time_ms?: number; // Voice configuration: max duration per speaking turn
   plugins?: {
     discord?: {
@@ -348,7 +354,7 @@ export interface TTSOptions {
 
 export interface StreamingConfig {
   enabled: boolean;
-  chunking_strategy: 'sentence' | 'paragraph' | 'word' | 'fixed';
+  chunking_strategy: 'sentence' | 'paragraph' | 'word' | 'fixed' | 'adaptive';
   min_chunk_length: number;
   max_concurrent_tts: number;
   error_strategy: 'skip' | 'retry' | 'fallback';
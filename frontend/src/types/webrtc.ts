@@ -36,6 +36,8 @@ export interface WebRTCAudioMessage {
     session_id?: string;
     duration_s?: number;  // For tts_complete event
     total_bytes?: number; // For tts_complete event - expected audio bytes
+    audio_format?: string; // For tts_start event - MIME type of TTS audio ("audio/wav" or "audio/webm;codecs=opus")
+    filler?: boolean;      // For tts_start/tts_complete - latency-masking filler clip (response audio follows)
     message?: string;     // For error event
     // Bot speaking state (multi-turn conversations)
     is_speaking?: boolean;  // For bot_speaking_state_changed event
@@ -24,8 +24,9 @@ from pydantic import BaseModel
 # VoxBridge 2.0 Service Layer
 from src.services.conversation_service import ConversationService
 from src.services.stt_service import get_stt_service
-from src.services.llm_service import get_llm_service, LLMConfig, ProviderType
+from src.services.llm_service import get_llm_service, get_llm_service_cache, LLMConfig, ProviderType
 from src.services.tts_service import get_tts_service
+from src.services.tts_backend_pool import close_tts_backend_pools
 from src.services.plugin_manager import get_plugin_manager
 from src.services.memory_service import MemoryService, get_global_embedding_config
 
@@ -613,6 +614,10 @@ async def startup_services():
     _global_memory_service = memory_service  # Store for metrics endpoint access
     logger.info("🧠 Global MemoryService singleton initialized")
 
+    # Semantic response cache reuses the memory system's embedding model
+    from src.services.response_cache import get_response_cache
+    get_response_cache().embed = memory_service.embed_text
+
     # Start memory extraction queue processor
     asyncio.create_task(memory_service.process_extraction_queue())
     logger.info("🧠 Memory extraction queue processor started")
@@ -675,6 +680,14 @@ async def startup_services():
         logger.error(f"❌ Error during plugin initialization: {e}", exc_info=True)
         # Don't crash app - continue startup even if plugins fail
 
+    # Keep LLM connections open and local models loaded between turns
+    from src.services.llm_keepwarm import LLM_KEEPWARM_PRELOAD_ON_STARTUP, get_llm_keepwarm_manager
+    llm_keepwarm = get_llm_keepwarm_manager()
+    if llm_keepwarm:
+        llm_keepwarm.start()
+        if LLM_KEEPWARM_PRELOAD_ON_STARTUP:
+            asyncio.create_task(llm_keepwarm.preload_agents())
+
     logger.info("✅ VoxBridge services started")
 
 @app.on_event("shutdown")
@@ -683,11 +696,22 @@ async def shutdown_services():
     logger.info("🛑 Shutting down services...")
 
     await conversation_service.stop()
+
+    from src.services.llm_keepwarm import get_llm_keepwarm_manager
+    llm_keepwarm = get_llm_keepwarm_manager()
+    if llm_keepwarm:
+        await llm_keepwarm.stop()
+
     await llm_service.close()
     await tts_service.close()
+    await close_tts_backend_pools()
     await stt_service.shutdown()
     await plugin_manager.shutdown()
 
+    llm_service_cache = get_llm_service_cache()
+    if llm_service_cache:
+        await llm_service_cache.close()
+
     logger.info("✅ Services shutdown complete")
 
 # ============================================================
@@ -813,6 +837,76 @@ async def get_metrics():
     """
     return metrics_tracker.get_metrics()
 
+@app.get("/api/metrics/tts")
+async def get_tts_metrics():
+    """
+    Get TTS service metrics
+
+    Returns:
+        Chatterbox circuit breaker state, admission queue stats (queue
+        wait percentiles, load shedding), audio cache statistics
+        (hit ratio, bytes saved, tier usage) and filler clip fire rate
+    """
+    from src.services.filler_clips import get_filler_clip_bank
+
+    return {
+        "health": tts_service.get_health_status(),
+        "cache": tts_service.get_cache_stats(),
+        "fillers": get_filler_clip_bank().get_stats()
+    }
+
+@app.get("/api/metrics/llm")
+async def get_llm_metrics():
+    """
+    Get LLM service metrics
+
+    Returns:
+        Per-agent LLM service cache stats (size, connection reuse and
+        cold-start counts, mean cold-start time), whether HTTP/2 is in use,
+        hedged-request stats per provider (win rate, wasted tokens,
+        current hedge delay), scheduler lanes (concurrency, queue-wait
+        percentiles per priority, rejections), and keep-warm state (models
+        kept loaded, pings, preloads, cold-start incidents per provider),
+        the response cache (hits, misses, bypasses, entries per agent) and
+        rolling conversation summaries (folds, deferrals, fold time)
+    """
+    from src.llm.base import HTTP2_AVAILABLE
+    from src.services.conversation_summary import get_conversation_summarizer
+    from src.services.llm_hedging import LLM_HEDGE_ENABLED, get_llm_hedge_tracker
+    from src.services.llm_keepwarm import get_llm_keepwarm_manager
+    from src.services.llm_scheduler import get_llm_scheduler
+    from src.services.response_cache import get_response_cache
+
+    llm_service_cache = get_llm_service_cache()
+    llm_scheduler = get_llm_scheduler()
+    llm_keepwarm = get_llm_keepwarm_manager()
+    summarizer = get_conversation_summarizer()
+    return {
+        "scheduler": llm_scheduler.get_stats() if llm_scheduler else None,
+        "keepwarm": llm_keepwarm.get_stats() if llm_keepwarm else None,
+        "response_cache": get_response_cache().get_stats(),
+        "conversation_summary": summarizer.get_stats() if summarizer else None,
+        "agent_service_cache": llm_service_cache.get_stats() if llm_service_cache else None,
+        "http2": HTTP2_AVAILABLE,
+        "hedging": {
+            "enabled": LLM_HEDGE_ENABLED,
+            "providers": get_llm_hedge_tracker().get_stats(),
+        },
+    }
+
+@app.get("/api/metrics/message-writer")
+async def get_message_writer_metrics():
+    """
+    Get write-behind message persistence metrics
+
+    Returns:
+        Queued messages (count, oldest age), batches written, batch sizes,
+        flush time, failed and dropped batches
+    """
+    from src.services.message_writer import get_message_writer
+
+    return get_message_writer().get_stats()
+
 @app.get("/api/metrics/extraction-queue")
 async def get_extraction_queue_metrics():
     """
@@ -878,8 +972,13 @@ async def get_llm_optimization_metrics():
     Get LLM optimization metrics (Phase 5 + Phase 7)
 
     Returns:
-        Optimization statistics including retrieval filtering, extraction shortcuts, and deduplication
+        Optimization statistics including retrieval filtering, memory prefetch
+        from partial transcripts (hit rate, latency saved), lookup cache hit
+        rates, extraction shortcuts, and deduplication
     """
+    from src.services.memory_prefetch import get_memory_prefetcher
+    from src.utils.ttl_cache import get_ttl_cache_stats
+
     global _global_memory_service
 
     try:
@@ -914,6 +1013,8 @@ async def get_llm_optimization_metrics():
                 "filtered_low_confidence": metrics["retrieval_filtered"],
                 "filter_percentage": round(retrieval_filter_pct, 1),
             },
+            "prefetch": get_memory_prefetcher().get_stats() if get_memory_prefetcher() else None,
+            "lookup_caches": get_ttl_cache_stats(),
             "extraction": {
                 "total": extraction_total,
                 "shortcuts_used": metrics["extraction_shortcuts"],
@@ -1588,7 +1689,9 @@ async def websocket_voice_endpoint(
     cache, enabling multi-turn conversations.
 
     Protocol:
-    - Client Query Params: ?session_id={uuid}&user_id={string}
+    - Client Query Params: ?session_id={uuid}&user_id={string}[&tts_format=wav|opus|pcm][&tts_sample_rate={hz}]
+      (tts_format=opus streams TTS audio as WebM/Opus instead of WAV; tts_format=pcm
+      streams headerless s16le at tts_sample_rate, e.g. the AudioContext rate)
     - Client → Server: Binary audio chunks (Opus, 100ms intervals)
     - Server → Client: JSON events
 
@@ -1611,6 +1714,13 @@ async def websocket_voice_endpoint(
         query_params = websocket.query_params
         session_id_str = query_params.get('session_id')
         user_id = query_params.get('user_id')
+        tts_format = query_params.get('tts_format', 'wav')
+        try:
+            tts_sample_rate = int(query_params.get('tts_sample_rate', 0)) or None
+        except ValueError:
+            tts_sample_rate = None
+        if tts_sample_rate is not None and not 8000 <= tts_sample_rate <= 96000:
+            tts_sample_rate = None
 
         if not session_id_str or not user_id:
             await websocket.send_json({
@@ -1652,7 +1762,10 @@ async def websocket_voice_endpoint(
         logger.info(f"✅ WebSocket voice connection established: user={user_id}, session={session_id}")
 
         # Create handler with injected ConversationService singleton
-        handler = WebRTCVoiceHandler(websocket, user_id, session_id, conv_service)
+        handler = WebRTCVoiceHandler(
+            websocket, user_id, session_id, conv_service,
+            tts_format=tts_format, tts_sample_rate=tts_sample_rate
+        )
         await handler.start()
 
     except WebSocketDisconnect:
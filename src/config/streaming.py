@@ -30,7 +30,9 @@ class StreamingConfig:
     # - 'paragraph': Split on paragraph boundaries (double newlines)
     # - 'word': Split on word boundaries (spaces) - very granular
     # - 'fixed': Split at fixed character intervals
-    chunking_strategy: Literal['sentence', 'paragraph', 'word', 'fixed'] = 'sentence'
+    # - 'adaptive': First chunk at a clause boundary (comma, semicolon, conjunction)
+    #   for fast first audio, later chunks grow to full sentences/paragraphs
+    chunking_strategy: Literal['sentence', 'paragraph', 'word', 'fixed', 'adaptive'] = 'sentence'
 
     # Minimum chunk length before TTS synthesis (characters)
     # Shorter chunks are buffered with next chunk to avoid choppy audio
@@ -58,8 +60,8 @@ class StreamingConfig:
             raise ValueError("min_chunk_length must be between 5 and 200")
         if not 1 <= self.max_concurrent_tts <= 8:
             raise ValueError("max_concurrent_tts must be between 1 and 8")
-        if self.chunking_strategy not in ['sentence', 'paragraph', 'word', 'fixed']:
-            raise ValueError("chunking_strategy must be 'sentence', 'paragraph', 'word', or 'fixed'")
+        if self.chunking_strategy not in ['sentence', 'paragraph', 'word', 'fixed', 'adaptive']:
+            raise ValueError("chunking_strategy must be 'sentence', 'paragraph', 'word', 'fixed', or 'adaptive'")
         if self.error_strategy not in ['skip', 'retry', 'fallback']:
             raise ValueError("error_strategy must be 'skip', 'retry', or 'fallback'")
         if self.interruption_strategy not in ['immediate', 'graceful', 'drain']:
@@ -137,7 +139,7 @@ def update_streaming_config(
 
     Args:
         enabled: Enable/disable response streaming
-        chunking_strategy: Chunking strategy (sentence/paragraph/word/fixed)
+        chunking_strategy: Chunking strategy (sentence/paragraph/word/fixed/adaptive)
         min_chunk_length: Minimum chunk length (5-200)
         max_concurrent_tts: Maximum concurrent TTS requests (1-8)
         error_strategy: Error handling strategy (skip/retry/fallback)
@@ -93,6 +93,17 @@ class Agent(Base):
     Default: False (opt-in per agent)
     """
 
+    # LLM Response Cache - Answer repeated questions without an LLM call
+    response_cache_enabled = Column(Boolean, nullable=False, default=False, server_default='false')
+    """
+    Serve answers to repeated questions ("hello", "what can you do") from the
+    semantic response cache, streamed like a live response. Questions about
+    the time/date or referring back to the conversation are never cached.
+
+    Default: False (opt-in per agent)
+    """
+    response_cache_bypass = Column(JSONB, nullable=False, default=list, server_default='[]')  # Extra regex patterns never answered from cache
+
     # VoxBridge 2.0 Phase 3: LLM Routing (DEPRECATED - use plugins instead)
     use_n8n = Column(Boolean, nullable=False, default=False)  # Use n8n webhook instead of direct LLM
     n8n_webhook_url = Column(String(500), nullable=True)  # Per-agent n8n webhook URL
@@ -166,6 +177,10 @@ class Session(Base):
     # One session per guild at a time (guild isolation), but multiple sessions per guild over time
     discord_guild_id = Column(String(100), nullable=True, index=True)  # Discord guild (server) ID if linked
 
+    # Rolling Summary (older turns folded in so prompts stay bounded)
+    conversation_summary = Column(Text, nullable=True)  # Running summary of turns no longer sent verbatim
+    summary_through_id = Column(Integer, nullable=True)  # Last conversations.id folded into the summary
+
     # Relationships
     conversations = relationship(
         "Conversation", back_populates="session", cascade="all, delete-orphan"
@@ -206,6 +221,9 @@ class Conversation(Base):
     llm_latency_ms = Column(Integer, nullable=True)  # For assistant messages
     total_latency_ms = Column(Integer, nullable=True)  # End-to-end latency
 
+    # Write-behind idempotency: a retried batch never inserts a message twice
+    idempotency_key = Column(String(64), nullable=True, unique=True)
+
     def __repr__(self):
         return f"<Conversation(id={self.id}, session_id={self.session_id}, role='{self.role}', timestamp={self.timestamp})>"
 
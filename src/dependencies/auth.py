@@ -2,27 +2,95 @@
 Authentication Dependencies
 
 FastAPI dependencies for JWT-based authentication and role-based access control.
+
+The authenticated user is cached briefly (AUTH_USER_CACHE_TTL_S) so every
+request doesn't re-read the users table. The cache holds a read-only snapshot
+of the user's columns; each request gets its own detached User built from it
+(columns only, no relationships), so changes to one request's user never leak
+into another. Every path that changes or deletes a user calls
+invalidate_user_lookups().
 """
 
 import logging
-from typing import Annotated
+import os
+from types import MappingProxyType
+from typing import Annotated, Any, Mapping, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from src.database.models import User, UserRole
 from src.database.session import get_db_session
 from src.services.auth_service import get_auth_service
+from src.services.conversation_service import invalidate_user_timezone
+from src.services.memory_service import invalidate_memory_lookups
+from src.utils.ttl_cache import get_ttl_cache
 
 logger = logging.getLogger(__name__)
 
+AUTH_USER_CACHE_TTL_S = float(os.getenv('AUTH_USER_CACHE_TTL_S', '30'))
+
 # HTTP Bearer token extractor
 security = HTTPBearer(auto_error=True)
 optional_security = HTTPBearer(auto_error=False)
 
 
+async def _load_user(user_id: str) -> Optional[Mapping[str, Any]]:
+    """Load a user's column values as a read-only snapshot (what the auth cache holds)"""
+    async with get_db_session() as db:
+        result = await db.execute(
+            select(User).where(User.id == user_id)
+        )
+        user = result.scalar_one_or_none()
+        if user is None:
+            return None
+        return MappingProxyType({
+            attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs
+        })
+
+
+def _detached_user(columns: Mapping[str, Any]) -> User:
+    """Build a fresh User from a cached snapshot, detached (persistent identity, no session)"""
+    user = User(**columns)
+    make_transient_to_detached(user)
+    return user
+
+
+async def get_user_by_id(user_id: str) -> Optional[User]:
+    """
+    Look up a user by id through the short-lived auth cache.
+
+    Returns:
+        A new detached User per call (columns loaded), or None if not found
+    """
+    cache = get_ttl_cache("auth_users", ttl_s=AUTH_USER_CACHE_TTL_S)
+    columns = await cache.get_or_load(str(user_id), lambda: _load_user(user_id))
+    return _detached_user(columns) if columns is not None else None
+
+
+def invalidate_cached_user(user_id) -> None:
+    """Drop a user from the auth cache (call after changing or deleting the user)"""
+    get_ttl_cache("auth_users", ttl_s=AUTH_USER_CACHE_TTL_S).invalidate(str(user_id))
+
+
+def invalidate_user_lookups(user: User) -> None:
+    """
+    Drop every cached lookup of a user row (auth, memory, timezone).
+
+    Call after committing any change to the user, or deleting it.
+
+    Args:
+        user: The changed or deleted user
+    """
+    invalidate_cached_user(user.id)
+    if user.user_id:
+        invalidate_memory_lookups(user_id=user.user_id)
+    invalidate_user_timezone(user.id, user.user_id)
+
+
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
 ) -> User:
@@ -68,12 +136,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Fetch user from database
-    async with get_db_session() as db:
-        result = await db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
+    # Fetch user (cached briefly)
+    user = await get_user_by_id(user_id)
 
     if not user:
         raise HTTPException(
@@ -121,11 +185,7 @@ async def get_optional_user(
     if not user_id:
         return None
 
-    async with get_db_session() as db:
-        result = await db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
+    user = await get_user_by_id(user_id)
 
     if not user or not user.is_active:
         return None
@@ -64,6 +64,8 @@ from src.services.conversation_service import ConversationService
 from src.services.factory import create_conversation_service  # Factory for memory-enabled initialization
 from src.services.stt_service import get_stt_service
 from src.services.llm_service import get_llm_service, LLMConfig, ProviderType
+from src.services.response_cache import ResponseCachePolicy
+from src.services.llm_scheduler import LLMPriority
 from src.services.tts_service import get_tts_service
 from src.services.agent_service import AgentService
 
@@ -533,6 +535,10 @@ async def on_stt_transcript(session_id: str, user_id: str, username: str, text:
                 logger.info(f"⏱️ LATENCY [WhisperX connected → first partial]: {latency:.3f}s")
                 metrics_tracker.record_first_partial_transcript_latency(latency)
 
+        # Start memory retrieval early; the final context build reuses it if the words still match
+        if conversation_service:
+            conversation_service.prefetch_memory_context(session_id, text)
+
         # Broadcast partial transcript
         await broadcast_partial_transcript(user_id, username, text)
         return
@@ -592,7 +598,6 @@ async def generate_and_play_response(session_id: str, user_id: str, username: st
         # Get conversation context from ConversationService
         messages = await conversation_service.get_conversation_context(
             session_id=session_id,
-            limit=10,
             include_system_prompt=True
         )
 
@@ -607,7 +612,8 @@ async def generate_and_play_response(session_id: str, user_id: str, username: st
             provider=ProviderType(agent.llm_provider),
             model=agent.llm_model,
             temperature=agent.temperature,
-            system_prompt=agent.system_prompt
+            system_prompt=agent.system_prompt,
+            response_cache=ResponseCachePolicy.for_agent(agent),
         )
 
         logger.info(f"🤖 Generating LLM response (session={session_id[:8]}..., provider={llm_config.provider.value})")
@@ -634,7 +640,8 @@ async def generate_and_play_response(session_id: str, user_id: str, username: st
                 messages=llm_messages,
                 config=llm_config,
                 stream=True,
-                callback=on_llm_chunk
+                callback=on_llm_chunk,
+                priority=LLMPriority.VOICE,
             )
 
             # Record total LLM latency
@@ -2,10 +2,25 @@
 Abstract base class for LLM providers.
 """
 
+import os
 from abc import ABC, abstractmethod
 from typing import AsyncIterator, Optional
 from src.llm.types import LLMRequest
 
+# HTTP/2 multiplexes concurrent streams over one TLS connection per host.
+# Needs the optional 'h2' package (httpx[http2]); plain-HTTP endpoints such
+# as a local Ollama keep using HTTP/1.1 keep-alive either way.
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = os.getenv('LLM_HTTP2_ENABLED', 'true').lower() in ('true', '1', 'yes')
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# How long an idle pooled connection stays open (httpx closes them after 5s
+# by default, so every turn after a pause paid a new TCP + TLS handshake).
+# The keep-warm manager pings idle providers more often than this.
+LLM_CONNECTION_KEEPALIVE_S = float(os.getenv('LLM_CONNECTION_KEEPALIVE_S', '120'))
+
 
 class LLMProvider(ABC):
     """
@@ -60,6 +75,18 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def warm_connection(self) -> bool:
+        """
+        Keep the provider's pooled connection open with a minimal request.
+
+        Called periodically by the keep-warm manager while the provider is
+        idle. Providers without a persistent connection need not override it.
+
+        Returns:
+            bool: True if the request succeeded
+        """
+        return True
+
     @property
     def provider_name(self) -> str:
         """Return provider name (for logging)."""
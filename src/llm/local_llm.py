@@ -9,19 +9,17 @@ Supports any LLM service that implements the OpenAI Chat Completions API:
 - Text Generation WebUI (http://localhost:5000/v1)
 """
 
-import json
+import asyncio
 import logging
+import os
+import time
+from contextlib import aclosing
 from typing import AsyncIterator, Optional
 
 import httpx
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
 
-from src.llm.base import LLMProvider
+from src.llm.base import HTTP2_AVAILABLE, LLM_CONNECTION_KEEPALIVE_S, LLMProvider
+from src.llm.stream_decoder import StreamDecoder, stream_content
 from src.llm.types import (
     LLMRequest,
     LLMError,
@@ -39,8 +37,11 @@ class LocalLLMProvider(LLMProvider):
     Supports any service implementing the OpenAI Chat Completions API with streaming.
     """
 
-    TIMEOUT_FIRST_TOKEN = 120.0  # seconds (local models may be slower)
-    TIMEOUT_BETWEEN_TOKENS = 60.0  # seconds
+    TIMEOUT_FIRST_TOKEN = float(os.getenv("LOCAL_LLM_FIRST_TOKEN_TIMEOUT_S", "120"))  # local models may be slower
+    TIMEOUT_BETWEEN_TOKENS = float(os.getenv("LOCAL_LLM_TOKEN_TIMEOUT_S", "60"))
+    TIMEOUT_TOTAL = float(os.getenv("LOCAL_LLM_TOTAL_TIMEOUT_S", "300"))
+    MAX_ATTEMPTS = 3  # Only before the first token
+    RETRY_BACKOFF_S = 0.5
 
     def __init__(self, base_url: str, api_key: Optional[str] = None):
         """
@@ -65,7 +66,9 @@ class LocalLLMProvider(LLMProvider):
                 write=10.0,
                 pool=10.0,
             ),
+            limits=httpx.Limits(keepalive_expiry=LLM_CONNECTION_KEEPALIVE_S),
             follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
         )
 
         logger.info(f"🤖 LLM [local]: Initialized with base URL {self.base_url}")
@@ -74,7 +77,12 @@ class LocalLLMProvider(LLMProvider):
         """
         Generate streaming response from local LLM.
 
-        Yields text chunks as they arrive via SSE.
+        Yields text chunks as the server produces them (the response body is
+        read incrementally, not buffered). Transient errors are retried only
+        until the first chunk has been yielded; after that the caller has
+        consumed partial output and the error is raised. Closing the iterator
+        early (barge-in) closes the HTTP response, which aborts generation on
+        Ollama/vLLM.
 
         Args:
             request: LLMRequest with messages, model, temperature
@@ -83,7 +91,7 @@ class LocalLLMProvider(LLMProvider):
             str: Text chunks
 
         Raises:
-            LLMTimeoutError: Request timeout
+            LLMTimeoutError: Request, first-token or total timeout
             LLMConnectionError: Network/connection error
             LLMError: Other errors
         """
@@ -106,17 +114,17 @@ class LocalLLMProvider(LLMProvider):
         logger.info(f"🤖 LLM [local]: Streaming request to model '{request.model}' at {self.base_url}")
 
         try:
-            # Use retry decorator for transient errors
-            response = await self._make_request_with_retry(url, headers, payload)
-
-            # Stream SSE response
             chunk_count = 0
-            async for chunk in self._parse_sse_stream(response):
-                chunk_count += 1
-                yield chunk
+            async with aclosing(self._stream_with_retry(url, headers, payload)) as stream:
+                async for chunk in stream:
+                    chunk_count += 1
+                    yield chunk
 
             logger.info(f"🤖 LLM [local]: Streaming complete ({chunk_count} chunks)")
 
+        except LLMError:
+            raise
+
         except httpx.TimeoutException as e:
             logger.error(f"🤖 LLM [local]: Timeout - {e}")
             raise LLMTimeoutError(f"Local LLM request timeout: {e}") from e
@@ -129,90 +137,86 @@ class LocalLLMProvider(LLMProvider):
             logger.error(f"🤖 LLM [local]: Unexpected error - {e}")
             raise LLMError(f"Local LLM unexpected error: {e}") from e
 
-        finally:
-            # Don't close client here - it's reused across requests
-            pass
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=5),
-        retry=retry_if_exception_type((httpx.RequestError, httpx.TimeoutException)),
-        reraise=True,
-    )
-    async def _make_request_with_retry(
+    async def _stream_with_retry(
         self,
         url: str,
         headers: dict,
         payload: dict,
-    ) -> httpx.Response:
+    ) -> AsyncIterator[str]:
         """
-        Make POST request with retry logic for transient errors.
+        Open the stream and yield content, retrying transient errors before the first chunk.
 
         Args:
             url: API endpoint URL
             headers: Request headers
             payload: JSON payload
 
-        Returns:
-            httpx.Response: Streaming response
+        Yields:
+            str: Content deltas
 
         Raises:
             httpx.HTTPStatusError: Non-2xx status code
             httpx.TimeoutException: Timeout
             httpx.RequestError: Connection error
+            LLMTimeoutError: First-token or total timeout
         """
-        response = await self.client.post(
-            url,
-            headers=headers,
-            json=payload,
-        )
-        response.raise_for_status()
-        return response
-
-    async def _parse_sse_stream(self, response: httpx.Response) -> AsyncIterator[str]:
-        """
-        Parse Server-Sent Events stream from local LLM.
-
-        OpenAI-compatible format:
-        data: {"choices":[{"delta":{"content":"hello"}}]}
-        data: [DONE]
-
-        Args:
-            response: httpx.Response with streaming body
-
-        Yields:
-            str: Content deltas from SSE stream
-        """
-        async for line in response.aiter_lines():
-            line = line.strip()
-
-            # Skip empty lines and non-data lines
-            if not line or not line.startswith("data: "):
-                continue
-
-            # Extract data payload
-            data = line[6:]  # Remove "data: " prefix
-
-            # Check for stream end marker
-            if data == "[DONE]":
-                break
-
-            # Parse JSON chunk
+        attempt = 1
+        while True:
+            response = None
+            yielded = False
             try:
-                chunk = json.loads(data)
-
-                # Extract content delta (OpenAI format)
-                choices = chunk.get("choices", [])
-                if choices:
-                    delta = choices[0].get("delta", {})
-                    content = delta.get("content", "")
-
-                    if content:
+                t_start = time.monotonic()
+                async with asyncio.timeout(self.TIMEOUT_FIRST_TOKEN):
+                    response = await self.client.send(
+                        self.client.build_request("POST", url, headers=headers, json=payload),
+                        stream=True,
+                    )
+                response.raise_for_status()
+
+                decoder = StreamDecoder("local", label="Local LLM")
+                contents = stream_content(
+                    response,
+                    decoder,
+                    t_start,
+                    first_token_timeout_s=self.TIMEOUT_FIRST_TOKEN,
+                    idle_timeout_s=self.TIMEOUT_BETWEEN_TOKENS,
+                    total_timeout_s=self.TIMEOUT_TOTAL,
+                )
+                async with aclosing(contents) as contents:
+                    async for content in contents:
+                        if not yielded:
+                            yielded = True
+                            logger.info(
+                                f"🤖 LLM [local]: First token after {(time.monotonic() - t_start) * 1000:.0f}ms"
+                            )
                         yield content
-
-            except json.JSONDecodeError as e:
-                logger.warning(f"🤖 LLM [local]: Failed to parse SSE chunk: {e}")
-                continue
+                if not yielded:
+                    decoder.log_empty_response()
+                return
+
+            except TimeoutError as e:
+                # Opening the stream used up the first-token budget
+                raise LLMTimeoutError(
+                    f"Local LLM first token timeout ({self.TIMEOUT_FIRST_TOKEN:.0f}s)"
+                ) from e
+
+            except (httpx.RequestError, httpx.TimeoutException) as e:
+                if yielded or attempt >= self.MAX_ATTEMPTS:
+                    if attempt > 1:
+                        logger.error(f"🤖 LLM [local]: All retry attempts exhausted: {e}")
+                    raise
+                wait_time = min(self.RETRY_BACKOFF_S * 2 ** (attempt - 1), 5.0)
+                logger.warning(
+                    f"🤖 LLM [local]: Request failed before first token "
+                    f"(attempt {attempt}/{self.MAX_ATTEMPTS}), retrying in {wait_time}s: {e}"
+                )
+                attempt += 1
+                await asyncio.sleep(wait_time)
+
+            finally:
+                # Closing mid-stream drops the connection, which stops generation server-side
+                if response is not None:
+                    await response.aclose()
 
     async def health_check(self) -> bool:
         """
@@ -251,6 +255,65 @@ class LocalLLMProvider(LLMProvider):
             logger.error("🤖 LLM [local]: Health check failed (all attempts)")
             return False
 
+    async def warm_connection(self) -> bool:
+        """
+        Keep the pooled connection open (GET /models).
+
+        Returns:
+            bool: True if the endpoint answered
+        """
+        try:
+            response = await self.client.get(f"{self.base_url}/models", headers=self._auth_headers(), timeout=10.0)
+            return response.status_code < 500
+        except Exception as e:
+            logger.debug(f"🤖 LLM [local]: Keep-alive request failed - {e}")
+            return False
+
+    async def preload_model(self, model: str, keep_alive_s: float) -> Optional[float]:
+        """
+        Load a model and keep it resident (Ollama native API).
+
+        POST /api/generate with only model and keep_alive loads the model
+        without generating anything and resets its unload timer.
+
+        Args:
+            model: Model name (e.g., "llama3.1:8b")
+            keep_alive_s: Seconds to keep the model loaded from now
+
+        Returns:
+            Seconds the server spent loading the model (about 0 if it was
+            already resident), or None if the server has no native Ollama API
+
+        Raises:
+            LLMError: Server rejected the request (e.g., unknown model)
+        """
+        # Native API lives at the server root, next to the /v1 compatibility layer
+        native_url = self.base_url[:-3] if self.base_url.endswith("/v1") else self.base_url
+        payload = {"model": model, "keep_alive": f"{max(1, round(keep_alive_s))}s"}
+
+        t_start = time.monotonic()
+        response = await self.client.post(
+            f"{native_url}/api/generate",
+            json=payload,
+            headers=self._auth_headers(),
+            timeout=self.TIMEOUT_FIRST_TOKEN,
+        )
+        if response.status_code in (404, 405):
+            return None
+        if response.status_code >= 400:
+            raise LLMError(f"Local LLM preload of {model} failed: HTTP {response.status_code} {response.text[:200]}")
+
+        try:
+            load_duration_ns = response.json().get("load_duration")
+        except ValueError:
+            load_duration_ns = None
+        if load_duration_ns is not None:
+            return load_duration_ns / 1e9
+        return time.monotonic() - t_start
+
+    def _auth_headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+
     async def close(self):
         """Close HTTP client."""
         await self.client.aclose()
@@ -8,11 +8,15 @@ through a unified API with pay-per-use pricing.
 import asyncio
 import json
 import logging
+import os
+import time
+from contextlib import aclosing
 from typing import AsyncIterator, Optional
 
 import httpx
 
-from src.llm.base import LLMProvider
+from src.llm.base import HTTP2_AVAILABLE, LLM_CONNECTION_KEEPALIVE_S, LLMProvider
+from src.llm.stream_decoder import StreamDecoder, stream_content
 from src.llm.types import (
     LLMRequest,
     LLMError,
@@ -34,7 +38,8 @@ class OpenRouterProvider(LLMProvider):
 
     API_BASE = "https://openrouter.ai/api/v1"
     TIMEOUT_FIRST_TOKEN = 30.0  # seconds (reduced from 60s for faster failure detection)
-    TIMEOUT_BETWEEN_TOKENS = 30.0  # seconds
+    TIMEOUT_BETWEEN_TOKENS = float(os.getenv("OPENROUTER_TOKEN_TIMEOUT_S", "30"))
+    TIMEOUT_TOTAL = float(os.getenv("OPENROUTER_TOTAL_TIMEOUT_S", "60"))
 
     def __init__(self, api_key: str, base_url: Optional[str] = None):
         """
@@ -57,6 +62,8 @@ class OpenRouterProvider(LLMProvider):
                 pool=10.0,
             ),
             follow_redirects=True,
+            limits=httpx.Limits(keepalive_expiry=LLM_CONNECTION_KEEPALIVE_S),
+            http2=HTTP2_AVAILABLE,
         )
 
         logger.info(f"🤖 LLM [openrouter]: Initialized with base URL {self.base_url}")
@@ -65,7 +72,10 @@ class OpenRouterProvider(LLMProvider):
         """
         Generate streaming response from OpenRouter.
 
-        Yields text chunks as they arrive via SSE.
+        Yields text chunks as they arrive via SSE. The first chunk must
+        arrive within TIMEOUT_FIRST_TOKEN of the response opening, later
+        ones within TIMEOUT_BETWEEN_TOKENS of each other, and the whole
+        response within TIMEOUT_TOTAL.
 
         Args:
             request: LLMRequest with messages, model, temperature
@@ -74,7 +84,7 @@ class OpenRouterProvider(LLMProvider):
             str: Text chunks
 
         Raises:
-            LLMTimeoutError: Request timeout
+            LLMTimeoutError: Request, first-token, idle or total timeout
             LLMRateLimitError: Rate limit (429 status)
             LLMAuthenticationError: Invalid API key (401/403)
             LLMConnectionError: Network error
@@ -102,18 +112,37 @@ class OpenRouterProvider(LLMProvider):
         logger.info(f"🤖 LLM [openrouter]: Streaming request to model '{request.model}'")
         logger.debug(f"🤖 LLM [openrouter]: Request payload size: {len(json.dumps(payload))} bytes, {len(request.messages)} messages")
 
+        response = None
         try:
             # Use retry decorator for transient errors
             logger.debug(f"🤖 LLM [openrouter]: Sending POST to {url}")
             response = await self._make_request_with_retry(url, headers, payload)
 
             # Stream SSE response
+            decoder = StreamDecoder("openrouter", label="OpenRouter")
+            contents = stream_content(
+                response,
+                decoder,
+                time.monotonic(),
+                first_token_timeout_s=self.TIMEOUT_FIRST_TOKEN,
+                idle_timeout_s=self.TIMEOUT_BETWEEN_TOKENS,
+                total_timeout_s=self.TIMEOUT_TOTAL,
+            )
             chunk_count = 0
-            async for chunk in self._parse_sse_stream(response):
-                chunk_count += 1
-                yield chunk
+            async with aclosing(contents) as contents:
+                async for chunk in contents:
+                    chunk_count += 1
+                    yield chunk
+
+            if chunk_count == 0:
+                decoder.log_empty_response()
+            logger.info(
+                f"🤖 LLM [openrouter]: Streaming complete ({chunk_count} chunks, "
+                f"{decoder.lines} lines, {decoder.fast_path_hits} fast-path)"
+            )
 
-            logger.info(f"🤖 LLM [openrouter]: Streaming complete ({chunk_count} chunks)")
+        except LLMError:
+            raise
 
         except httpx.TimeoutException as e:
             logger.error(f"🤖 LLM [openrouter]: Timeout - {e}")
@@ -139,8 +168,10 @@ class OpenRouterProvider(LLMProvider):
             raise LLMError(f"OpenRouter unexpected error: {e}") from e
 
         finally:
-            # Don't close client here - it's reused across requests
-            pass
+            # Don't close client here - it's reused across requests. Closing the
+            # response mid-stream (barge-in, hedge loser) stops generation.
+            if response is not None:
+                await response.aclose()
 
     async def _make_request_with_retry(
         self,
@@ -194,91 +225,6 @@ class OpenRouterProvider(LLMProvider):
                 logger.error(f"🤖 LLM [openrouter]: All retry attempts exhausted: {e}")
                 raise
 
-    async def _parse_sse_stream(self, response: httpx.Response) -> AsyncIterator[str]:
-        """
-        Parse Server-Sent Events stream from OpenRouter.
-
-        OpenRouter sends data in SSE format:
-        data: {"choices":[{"delta":{"content":"hello"}}]}
-        data: [DONE]
-
-        Args:
-            response: httpx.Response with streaming body
-
-        Yields:
-            str: Content deltas from SSE stream
-
-        Raises:
-            LLMTimeoutError: Stream timeout (no data for 60s)
-        """
-        line_count = 0
-        content_chunks = 0
-        all_chunks = []  # Store chunks for debugging empty responses
-        MAX_STREAM_TIME = 60.0  # Maximum time to wait for stream data
-
-        try:
-            async with asyncio.timeout(MAX_STREAM_TIME):
-                async for line in response.aiter_lines():
-                    line = line.strip()
-                    line_count += 1
-
-                    # Skip empty lines and non-data lines
-                    if not line or not line.startswith("data: "):
-                        continue
-
-                    # Extract data payload
-                    data = line[6:]  # Remove "data: " prefix
-
-                    # Check for stream end marker
-                    if data == "[DONE]":
-                        logger.info(f"🤖 LLM [openrouter]: SSE stream ended after {line_count} lines, {content_chunks} content chunks")
-
-                        # Enhanced debugging: Log full stream when 0 content chunks received
-                        if content_chunks == 0:
-                            logger.error(f"🤖 LLM [openrouter]: ❌ EMPTY RESPONSE - Received {line_count} SSE lines but 0 content chunks!")
-                            logger.error(f"🤖 LLM [openrouter]: First 5 chunks (for debugging):")
-                            for i, stored_chunk in enumerate(all_chunks[:5], 1):
-                                logger.error(f"🤖 LLM [openrouter]:   Chunk #{i}: {json.dumps(stored_chunk, indent=2)[:500]}")
-                            logger.error(f"🤖 LLM [openrouter]: This may indicate:")
-                            logger.error(f"🤖 LLM [openrouter]:   1. Content in different field (check chunk structure above)")
-                            logger.error(f"🤖 LLM [openrouter]:   2. Model safety filter triggered")
-                            logger.error(f"🤖 LLM [openrouter]:   3. OpenRouter API issue")
-
-                        break
-
-                    # Parse JSON chunk
-                    try:
-                        chunk = json.loads(data)
-                        all_chunks.append(chunk)  # Store for debugging
-
-                        # Debug: Log first chunk structure
-                        if line_count <= 2:
-                            logger.info(f"🤖 LLM [openrouter]: SSE chunk #{line_count} structure: {json.dumps(chunk)[:250]}")
-
-                        # Extract content delta
-                        choices = chunk.get("choices", [])
-                        if choices:
-                            delta = choices[0].get("delta", {})
-                            content = delta.get("content", "")
-
-                            if content:
-                                content_chunks += 1
-                                yield content
-                            elif line_count <= 5:
-                                # Debug: Log why content is empty (first 5 chunks only)
-                                logger.info(f"🤖 LLM [openrouter]: Empty content in chunk #{line_count} (delta keys: {list(delta.keys())})")
-
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"🤖 LLM [openrouter]: Failed to parse SSE chunk: {e}, data: {data[:100]}")
-                        continue
-
-        except asyncio.TimeoutError:
-            logger.error(f"🤖 LLM [openrouter]: ⏱️ SSE stream timeout after {MAX_STREAM_TIME}s (received {line_count} lines, {content_chunks} content chunks)")
-            if content_chunks == 0:
-                raise LLMTimeoutError(f"OpenRouter SSE stream timeout: No content received in {MAX_STREAM_TIME}s")
-            # If we got some content before timeout, log warning but don't raise (partial response is acceptable)
-            logger.warning(f"🤖 LLM [openrouter]: Partial response received before timeout ({content_chunks} chunks)")
-
     async def health_check(self) -> bool:
         """
         Check if OpenRouter API is available.
@@ -302,6 +248,24 @@ class OpenRouterProvider(LLMProvider):
             logger.error(f"🤖 LLM [openrouter]: Health check failed - {e}")
             return False
 
+    async def warm_connection(self) -> bool:
+        """
+        Keep the pooled HTTP/2 connection open (GET /key, a few hundred bytes).
+
+        Returns:
+            bool: True if the API answered
+        """
+        try:
+            response = await self.client.get(
+                f"{self.base_url}/key",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=10.0,
+            )
+            return response.status_code < 500
+        except Exception as e:
+            logger.debug(f"🤖 LLM [openrouter]: Keep-alive request failed - {e}")
+            return False
+
     async def close(self):
         """Close HTTP client."""
         await self.client.aclose()
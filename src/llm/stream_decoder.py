@@ -0,0 +1,294 @@
+"""
+Incremental decoder for streamed chat completions.
+
+Shared by all LLM providers. Turns the raw bytes of a streaming response
+into content deltas as they arrive, whatever the framing:
+- OpenAI-compatible Server-Sent Events (OpenRouter, vLLM, LM Studio, Ollama /v1)
+  data: {"choices":[{"delta":{"content":"hello"}}]}
+  data: [DONE]
+- Newline-delimited JSON (Ollama's native API)
+  {"message":{"content":"hello"},"done":false}
+
+Key Features:
+- Works on raw byte chunks; partial lines are reassembled in a bounded buffer
+- Fast path: the common single-delta line is matched with one regex and its
+  content taken as-is, skipping json.loads (full parse only for escapes,
+  errors, unusual layouts)
+- Zero retention: only a small ring of recent raw lines is kept, for
+  diagnosing empty or failed responses
+- stream_content() enforces separate first-token, inter-token idle and
+  total deadlines while reading a response
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from collections import deque
+from typing import AsyncIterator, Deque, List, Optional
+
+import httpx
+
+from src.llm.types import LLMError, LLMTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Largest partial line held while waiting for its newline
+LLM_STREAM_MAX_LINE_BYTES = int(os.getenv("LLM_STREAM_MAX_LINE_BYTES", str(1024 * 1024)))
+# Raw lines kept for diagnostics
+LLM_STREAM_DIAGNOSTIC_LINES = int(os.getenv("LLM_STREAM_DIAGNOSTIC_LINES", "8"))
+
+# Single-delta lines as OpenAI-compatible servers and Ollama emit them. The
+# captured content contains no quote or backslash, so it is the decoded value.
+_FAST_OPENAI = re.compile(
+    rb'"choices":\[\{(?:"index":0,)?"delta":\{(?:"role":"assistant",)?"content":"([^"\\]+)"'
+)
+_FAST_OLLAMA = re.compile(
+    rb'"message":\{"role":"assistant","content":"([^"\\]+)"\},"done":false'
+)
+
+# Characters of each raw line kept in the diagnostic ring
+_DIAGNOSTIC_LINE_CHARS = 500
+
+
+class StreamDecoder:
+    """
+    Incremental SSE / NDJSON decoder for one streamed response.
+
+    Example usage:
+        decoder = StreamDecoder("openrouter")
+        async for data in response.aiter_bytes():
+            for content in decoder.feed(data):
+                yield content
+            if decoder.done:
+                break
+        for content in decoder.finish():
+            yield content
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        label: Optional[str] = None,
+        max_line_bytes: int = LLM_STREAM_MAX_LINE_BYTES,
+        diagnostic_lines: int = LLM_STREAM_DIAGNOSTIC_LINES,
+    ):
+        """
+        Initialize decoder.
+
+        Args:
+            provider: Provider name (log tag)
+            label: Provider name for error messages (default: provider)
+            max_line_bytes: Largest partial line to buffer before failing
+            diagnostic_lines: Recent raw lines kept for diagnostics
+        """
+        self.provider = provider
+        self.label = label or provider
+        self.max_line_bytes = max_line_bytes
+        self.recent_lines: Deque[str] = deque(maxlen=max(diagnostic_lines, 1))
+
+        self.done = False
+        self.bytes_received = 0
+        self.lines = 0
+        self.content_chunks = 0
+        self.fast_path_hits = 0
+
+        self._buffer = b""
+
+    def feed(self, data: bytes) -> List[str]:
+        """
+        Decode the next piece of the response body.
+
+        Args:
+            data: Raw bytes as received (any split, including mid-line)
+
+        Returns:
+            Content deltas completed by this piece (often zero or one)
+
+        Raises:
+            LLMError: Server reported an error, or a line exceeded max_line_bytes
+        """
+        if self.done or not data:
+            return []
+        self.bytes_received += len(data)
+
+        if self._buffer:
+            data = self._buffer + data
+        if b"\n" not in data:
+            self._hold(data)
+            return []
+
+        lines = data.split(b"\n")
+        self._buffer = b""
+        self._hold(lines.pop())
+
+        contents = []
+        for line in lines:
+            content = self._decode_line(line)
+            if content:
+                contents.append(content)
+            if self.done:
+                break
+        return contents
+
+    def finish(self) -> List[str]:
+        """
+        Decode a final line that had no trailing newline.
+
+        Returns:
+            Content deltas from the remaining buffer
+        """
+        line, self._buffer = self._buffer, b""
+        if self.done or not line:
+            return []
+        content = self._decode_line(line)
+        return [content] if content else []
+
+    def log_empty_response(self) -> None:
+        """Log the recent raw lines when a stream ended without any content"""
+        logger.error(
+            f"🤖 LLM [{self.provider}]: ❌ EMPTY RESPONSE - Received {self.lines} lines "
+            f"({self.bytes_received} bytes) but 0 content chunks! Last {len(self.recent_lines)} lines:"
+        )
+        for line in self.recent_lines:
+            logger.error(f"🤖 LLM [{self.provider}]:   {line}")
+        logger.error(
+            f"🤖 LLM [{self.provider}]: This may indicate content in a different field, "
+            f"a model safety filter, or a provider API issue"
+        )
+
+    def _hold(self, partial: bytes) -> None:
+        if len(partial) > self.max_line_bytes:
+            raise LLMError(
+                f"{self.label} stream line exceeds {self.max_line_bytes} bytes without a newline"
+            )
+        self._buffer = partial
+
+    def _decode_line(self, line: bytes) -> Optional[str]:
+        """
+        Decode one complete line.
+
+        Returns:
+            Content delta, or None (no content, control line, end of stream)
+        """
+        line = line.strip()
+        if not line:
+            return None
+        self.lines += 1
+
+        # Fast path: plain single-delta chunk (not kept for diagnostics - a
+        # stream that produces content doesn't need them)
+        match = _FAST_OPENAI.search(line) or _FAST_OLLAMA.search(line)
+        if match:
+            self.fast_path_hits += 1
+            self.content_chunks += 1
+            return match.group(1).decode("utf-8", errors="replace")
+
+        text = line.decode("utf-8", errors="replace")
+        self.recent_lines.append(text[:_DIAGNOSTIC_LINE_CHARS])
+
+        # SSE comments (": keep-alive") and other event fields carry no data
+        if text.startswith("data:"):
+            text = text[5:].lstrip()
+        elif not text.startswith("{"):
+            return None
+
+        if text == "[DONE]":
+            self.done = True
+            return None
+
+        try:
+            chunk = json.loads(text)
+        except json.JSONDecodeError as e:
+            logger.warning(f"🤖 LLM [{self.provider}]: Failed to parse stream chunk: {e}, data: {text[:100]}")
+            return None
+        if not isinstance(chunk, dict):
+            return None
+
+        if chunk.get("error"):
+            error = chunk["error"]
+            message = error.get("message", error) if isinstance(error, dict) else error
+            raise LLMError(f"{self.label} stream error: {message}")
+
+        # OpenAI format
+        choices = chunk.get("choices")
+        if choices:
+            content = (choices[0].get("delta") or {}).get("content")
+        else:
+            # Ollama native format
+            message = chunk.get("message")
+            content = message.get("content") if isinstance(message, dict) else chunk.get("response")
+            if chunk.get("done"):
+                self.done = True
+
+        if content:
+            self.content_chunks += 1
+            return content
+        return None
+
+
+async def stream_content(
+    response: httpx.Response,
+    decoder: StreamDecoder,
+    t_start: float,
+    first_token_timeout_s: float,
+    idle_timeout_s: float,
+    total_timeout_s: float,
+) -> AsyncIterator[str]:
+    """
+    Read content deltas from a streaming response as bytes arrive.
+
+    Deadlines apply only while waiting on the server, never while the
+    consumer is processing a yielded chunk:
+    - first content within first_token_timeout_s of the request
+    - then no gap in received bytes longer than idle_timeout_s
+    - whole response within total_timeout_s
+
+    Args:
+        response: httpx.Response opened with stream=True
+        decoder: Decoder for this response
+        t_start: time.monotonic() when the request was sent
+        first_token_timeout_s: Deadline for the first content delta
+        idle_timeout_s: Longest silence allowed once content is flowing
+        total_timeout_s: Deadline for the whole response
+
+    Yields:
+        str: Content deltas
+
+    Raises:
+        LLMTimeoutError: A deadline passed
+        LLMError: Server reported an error inside the stream
+    """
+    label = decoder.label
+    loop = asyncio.get_running_loop()
+    # Deadlines are on the loop clock; shift t_start (monotonic) onto it
+    offset = loop.time() - time.monotonic()
+    total_deadline = t_start + offset + total_timeout_s
+    deadline = min(t_start + offset + first_token_timeout_s, total_deadline)
+    first = True
+
+    received = response.aiter_bytes().__aiter__()
+    while not decoder.done:
+        try:
+            async with asyncio.timeout_at(deadline):
+                data = await received.__anext__()
+        except StopAsyncIteration:
+            break
+        except TimeoutError as e:
+            if deadline >= total_deadline:
+                raise LLMTimeoutError(f"{label} response exceeded {total_timeout_s:.0f}s") from e
+            if first:
+                raise LLMTimeoutError(f"{label} first token timeout ({first_token_timeout_s:.0f}s)") from e
+            raise LLMTimeoutError(f"{label} stream stalled (no data for {idle_timeout_s:.0f}s)") from e
+
+        for content in decoder.feed(data):
+            first = False
+            yield content
+        if not first:
+            # Measured from here so time the consumer spends on a chunk doesn't count
+            deadline = min(loop.time() + idle_timeout_s, total_deadline)
+
+    for content in decoder.finish():
+        yield content
@@ -64,7 +64,6 @@ import asyncio
 import logging
 import os
 import statistics
-import tempfile
 import time
 import uuid
 from collections import deque
@@ -83,18 +82,26 @@ from src.plugins.registry import plugin
 from src.services.conversation_service import ConversationService
 from src.services.stt_service import get_stt_service
 from src.services.llm_service import get_llm_service, get_llm_service_for_agent, LLMConfig, ProviderType
+from src.services.response_cache import ResponseCachePolicy
+from src.services.llm_scheduler import LLMPriority
 from src.services.tts_service import get_tts_service
 
 # Phase 5: Import sentence-level streaming services
 from src.services.sentence_parser import SentenceParser
 from src.services.tts_queue_manager import TTSQueueManager
 from src.services.audio_playback_queue import AudioPlaybackQueue
+from src.services.streaming_audio_source import DISCORD_PCM_FORMAT
+from src.services.filler_clips import FillerClip, get_filler_clip_bank
 
 # LLM exceptions for error handling
 from src.llm import LLMError, LLMConnectionError, LLMTimeoutError
 
 logger = logging.getLogger(__name__)
 
+# Ask TTS for raw 48kHz stereo PCM (no WAV parsing/conversion at playback)
+DISCORD_TTS_RAW_PCM = os.getenv('DISCORD_TTS_RAW_PCM', 'true').lower() in ['true', '1', 'yes']
+DISCORD_TTS_OUTPUT_FORMAT = 'pcm' if DISCORD_TTS_RAW_PCM else 'wav'
+
 # Note: MetricsTracker is imported from src.api to ensure
 # metrics are shared between the plugin and API endpoints
 
@@ -470,11 +477,20 @@ class DiscordPlugin(PluginBase):
                     max_concurrent=self.tts_service.streaming_config.max_concurrent_tts,
                     tts_service=self.tts_service,
                     on_complete=self._on_tts_sentence_complete,
-                    on_error=self._on_tts_sentence_error
+                    on_error=self._on_tts_sentence_error,
+                    # Synthesize at most N sentences ahead of the one playing
+                    lookahead=self.tts_service.streaming_config.max_concurrent_tts,
+                    output_format=DISCORD_TTS_OUTPUT_FORMAT,
+                    pcm_format=DISCORD_PCM_FORMAT,
+                    # Shrink look-ahead when the global TTS budget is saturated
+                    scheduler=self.tts_service.scheduler
                 )
             else:
                 logger.info("📝 Sentence-level streaming disabled for this agent")
 
+            # Pre-synthesize filler clips for this agent's voice (background)
+            get_filler_clip_bank().ensure_warm(self.agent)
+
             logger.info(
                 f"✅ Initialized services for Discord plugin (agent: {self.agent_name})"
             )
@@ -568,13 +584,7 @@ class DiscordPlugin(PluginBase):
 
                         # Phase 5: Create audio playback queue if streaming enabled
                         if self.tts_service.streaming_config.enabled and after.channel.guild.id not in self.audio_playback_queues:
-                            playback_queue = AudioPlaybackQueue(
-                                voice_client=voice_client,
-                                on_complete=None,  # Optional callback
-                                on_error=None  # Optional callback
-                            )
-                            await playback_queue.start()
-                            self.audio_playback_queues[after.channel.guild.id] = playback_queue
+                            await self._get_playback_queue(after.channel.guild.id, voice_client)
                             logger.info(f"🎵 Created audio playback queue for guild {after.channel.guild.id} (auto-join)")
 
                     except Exception as e:
@@ -1268,6 +1278,10 @@ class DiscordPlugin(PluginBase):
                     logger.info(f"⏱️ LATENCY [utterance start → first partial]: {latency:.3f}s")
                     self.metrics.record_first_partial_transcript_latency(latency)
 
+            # Start memory retrieval early; the final context build reuses it if the words still match
+            if self.conversation_service:
+                self.conversation_service.prefetch_memory_context(session_id, text)
+
             # Broadcast partial transcript via WebSocket (Phase 2 Tests)
             try:
                 # Lazy import to avoid circular dependency
@@ -1383,7 +1397,7 @@ class DiscordPlugin(PluginBase):
 
         # Enqueue audio to playback queue
         playback_queue = self.audio_playback_queues[guild_id]
-        await playback_queue.enqueue_audio(audio_bytes, metadata)
+        await playback_queue.enqueue_audio(audio_bytes, metadata, pcm=DISCORD_TTS_RAW_PCM)
 
         # Phase 8: Calculate and record sentence-to-audio latency
         t_sentence_detected = metadata.get('t_sentence_detected')
@@ -1395,6 +1409,82 @@ class DiscordPlugin(PluginBase):
                 f"(sentence detected → audio enqueued)"
             )
 
+    async def _get_playback_queue(self, guild_id: int, voice_client: discord.VoiceClient) -> AudioPlaybackQueue:
+        """
+        Get (or create) the guild's audio playback queue for a voice client.
+
+        A queue bound to a stale voice client (after reconnect) is replaced.
+
+        Args:
+            guild_id: Discord guild ID
+            voice_client: Current voice client for the guild
+
+        Returns:
+            Running AudioPlaybackQueue
+        """
+        playback_queue = self.audio_playback_queues.get(guild_id)
+        if playback_queue is not None and playback_queue.voice_client is voice_client:
+            return playback_queue
+
+        if playback_queue is not None:
+            await playback_queue.stop()
+
+        playback_queue = AudioPlaybackQueue(
+            voice_client=voice_client,
+            on_complete=self._on_playback_chunk_complete,
+            on_error=self._on_playback_chunk_error
+        )
+        await playback_queue.start()
+        self.audio_playback_queues[guild_id] = playback_queue
+        return playback_queue
+
+    async def _play_filler_clip(self, guild_id: int, session_id: str, clip: FillerClip) -> None:
+        """
+        Queue a pre-synthesized filler clip ahead of the response audio.
+
+        Args:
+            guild_id: Discord guild ID
+            session_id: Session UUID
+            clip: Filler clip from the FillerClipBank
+        """
+        voice_client = self.voice_clients.get(guild_id)
+        if not voice_client:
+            return
+        playback_queue = await self._get_playback_queue(guild_id, voice_client)
+        await playback_queue.enqueue_audio(
+            clip.audio,
+            metadata={'session_id': session_id, 'sentence': clip.phrase, 'filler': True}
+        )
+
+    async def _on_playback_chunk_complete(self, metadata: Dict[str, Any]) -> None:
+        """
+        Callback when a sentence finishes (or stops) playing.
+
+        Reports playback progress to the TTS queue manager so the bounded
+        look-ahead window advances; interrupted sentences (metadata['played']
+        is False) free their slot too.
+
+        Args:
+            metadata: Chunk metadata (includes session_id and sequence from TTS)
+        """
+        session_id = metadata.get('session_id')
+        sequence = metadata.get('sequence')
+        if self.tts_queue_manager and session_id and sequence is not None:
+            self.tts_queue_manager.mark_played(session_id, sequence)
+
+    async def _on_playback_chunk_error(self, error: Exception, metadata: Dict[str, Any]) -> None:
+        """
+        Callback when a sentence fails to play.
+
+        A failed chunk still frees its look-ahead slot.
+
+        Args:
+            error: Exception that occurred
+            metadata: Chunk metadata (includes session_id and sequence from TTS)
+        """
+        logger.warning(f"⚠️ [STREAMING] Playback failed for sentence (sequence={metadata.get('sequence')}): {error}")
+        await self._on_playback_chunk_complete(metadata)
+
     async def _on_tts_sentence_error(self, sentence: str, error: Exception, metadata: Dict[str, Any]) -> None:
         """
         Callback when TTS synthesis fails for a sentence.
@@ -1454,7 +1544,8 @@ class DiscordPlugin(PluginBase):
                     f"task={task_id[:8] if task_id else 'unknown'}...)"
                 )
 
-                # Re-enqueue the same sentence
+                # Re-enqueue the same sentence (metadata carries its sequence,
+                # so the retry keeps its original playback position)
                 if self.tts_queue_manager:
                     await self.tts_queue_manager.enqueue_sentence(
                         sentence=sentence,
@@ -1658,7 +1749,6 @@ class DiscordPlugin(PluginBase):
             # Phase 1 integration: Get conversation context from ConversationService
             messages = await self.conversation_service.get_conversation_context(
                 session_id=session_id,
-                limit=10,
                 include_system_prompt=True
             )
 
@@ -1671,7 +1761,8 @@ class DiscordPlugin(PluginBase):
                 provider=ProviderType(self.agent.llm_provider),
                 model=self.agent.llm_model,
                 temperature=self.agent.temperature,
-                system_prompt=self.agent.system_prompt
+                system_prompt=self.agent.system_prompt,
+                response_cache=ResponseCachePolicy.for_agent(self.agent),
             )
 
             logger.info(f"🤖 Generating LLM response (session={session_id[:8]}..., provider={llm_config.provider.value})")
@@ -1686,7 +1777,8 @@ class DiscordPlugin(PluginBase):
             streaming_config = self.tts_service.streaming_config if self.tts_service else None
             if streaming_config and streaming_config.enabled and self.tts_queue_manager:
                 sentence_parser = SentenceParser(
-                    min_sentence_length=streaming_config.min_chunk_length
+                    min_sentence_length=streaming_config.min_chunk_length,
+                    strategy=streaming_config.chunking_strategy
                 )
                 self.sentence_parsers[session_id] = sentence_parser
                 logger.info(
@@ -1712,6 +1804,7 @@ class DiscordPlugin(PluginBase):
                     logger.info(f"⏱️ LATENCY [LLM first chunk]: {latency:.3f}s")
                     self.metrics.record_n8n_first_chunk_latency(latency)
                     first_chunk = False
+                    first_token.set()
 
                 # Phase 5: Process chunk through sentence parser if streaming enabled
                 if sentence_parser and self.tts_queue_manager:
@@ -1764,6 +1857,18 @@ class DiscordPlugin(PluginBase):
                 except Exception as e:
                     logger.error(f"❌ Failed to broadcast AI response chunk: {e}")
 
+            # Filler clip masks a slow first token (response audio queues behind it)
+            first_token = asyncio.Event()
+            filler_task = None
+            if guild_id and guild_id in self.voice_clients:
+                filler_task = asyncio.create_task(
+                    get_filler_clip_bank().play_if_slow(
+                        self.agent,
+                        first_token,
+                        lambda clip: self._play_filler_clip(guild_id, session_id, clip)
+                    )
+                )
+
             # Retry logic for empty LLM responses
             max_retries = 2
             retry_count = 0
@@ -1776,7 +1881,8 @@ class DiscordPlugin(PluginBase):
                         messages=llm_messages,
                         config=llm_config,
                         stream=True,
-                        callback=on_llm_chunk
+                        callback=on_llm_chunk,
+                        priority=LLMPriority.VOICE,
                     )
 
                     # Record total LLM latency (Phase 1 integration)
@@ -1931,6 +2037,12 @@ class DiscordPlugin(PluginBase):
                     logger.error(f"❌ n8n webhook fallback failed: {n8n_error}", exc_info=True)
                     raise LLMError(f"Both LLM providers and n8n webhook failed. LLM: {e}, n8n: {n8n_error}") from n8n_error
 
+            finally:
+                # Let a filler that already started finish queueing before the response audio
+                first_token.set()
+                if filler_task:
+                    await filler_task
+
             # Phase 5: Finalize sentence parser and enqueue remaining text
             if sentence_parser and self.tts_queue_manager:
                 remaining_text = sentence_parser.finalize()
@@ -2040,9 +2152,9 @@ class DiscordPlugin(PluginBase):
         Synthesize speech and play in Discord voice channel.
 
         Phase 2: Complete TTS pipeline
-        - Synthesizes speech via TTSService (Phase 1 integration)
-        - Saves to temp WAV file
-        - Plays via discord.FFmpegPCMAudio
+        - Streams speech from TTSService straight into the guild's in-memory
+          audio source (no temp files, no ffmpeg subprocess)
+        - Playback starts from the first streamed bytes
         - Tracks TTS and playback latency
 
         Original source: discord_bot.py synthesize_and_play_discord (lines 898-989)
@@ -2053,7 +2165,7 @@ class DiscordPlugin(PluginBase):
             session_id: Session UUID for metrics tracking
 
         Returns:
-            Path to temp audio file, or None on error
+            Playback chunk status ("completed"), or None on error/interruption
         """
         if not voice_client or not voice_client.is_connected():
             logger.warning("⚠️ Not in voice channel, cannot play TTS")
@@ -2069,21 +2181,33 @@ class DiscordPlugin(PluginBase):
                 self.metrics.record_tts_queue_latency(tts_queue_latency)
                 logger.info(f"⏱️ LATENCY [TTS queue wait]: {tts_queue_latency:.3f}s")
 
-            # Phase 1 integration: Synthesize using TTSService (non-streaming for Discord)
-            audio_bytes = await self.tts_service.synthesize_speech(
-                session_id=session_id,
-                text=text,
-                voice_id=self.agent.tts_voice or os.getenv('CHATTERBOX_VOICE_ID', 'default'),
-                exaggeration=self.agent.tts_exaggeration,
-                cfg_weight=self.agent.tts_cfg_weight,
-                temperature=self.agent.tts_temperature,
-                language_id=self.agent.tts_language,
-                stream=False,  # Discord needs complete audio file
-                callback=None,
-                filter_actions=self.agent.filter_actions_for_tts
-            )
+            # Queue a streamed chunk: audio plays as soon as the first bytes arrive
+            playback_queue = await self._get_playback_queue(voice_client.guild.id, voice_client)
+            stream = await playback_queue.enqueue_stream({
+                'session_id': session_id,
+                'sentence': text,
+            }, pcm=DISCORD_TTS_RAW_PCM)
 
-            if not audio_bytes:
+            # Phase 1 integration: Synthesize using TTSService (streamed into playback)
+            try:
+                await self.tts_service.synthesize_speech(
+                    session_id=session_id,
+                    text=text,
+                    voice_id=self.agent.tts_voice or os.getenv('CHATTERBOX_VOICE_ID', 'default'),
+                    exaggeration=self.agent.tts_exaggeration,
+                    cfg_weight=self.agent.tts_cfg_weight,
+                    temperature=self.agent.tts_temperature,
+                    language_id=self.agent.tts_language,
+                    stream=True,
+                    callback=stream.write,
+                    filter_actions=self.agent.filter_actions_for_tts,
+                    output_format=DISCORD_TTS_OUTPUT_FORMAT,
+                    pcm_format=DISCORD_PCM_FORMAT
+                )
+            finally:
+                stream.finish()
+
+            if not stream.bytes_written:
                 logger.error("❌ TTS synthesis failed, no audio received")
                 return None
 
@@ -2092,78 +2216,59 @@ class DiscordPlugin(PluginBase):
             logger.info(f"⏱️ LATENCY [TTS generation]: {tts_duration:.3f}s")
             self.metrics.record_tts_generation_latency(tts_duration)
 
-            # Save to temp file and play
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as f:
-                f.write(audio_bytes)
-                temp_path = f.name
+            t_playback_start = await stream.wait_started()
+            if t_playback_start is None:
+                logger.info("⏹️ TTS playback interrupted before it started")
+                return None
 
-            try:
-                t_playback_start = time.time()
-
-                # Record time to first audio (user stops speaking → first audio plays)
-                if session_id in self.session_timings and 't_transcription_complete' in self.session_timings[session_id]:
-                    # Measure from when user STOPPED speaking (transcription complete), not when they started
-                    t_transcription_complete = self.session_timings[session_id]['t_transcription_complete']
-                    time_to_first_audio = t_playback_start - t_transcription_complete
-                    self.metrics.record_time_to_first_audio(time_to_first_audio)
-                    logger.info(f"⏱️ ⭐⭐⭐ LATENCY [time to first audio]: {time_to_first_audio:.3f}s (transcription complete → audio plays)")
-
-                # Wait for current audio to finish if playing
-                while voice_client.is_playing():
-                    await asyncio.sleep(0.1)
-
-                # Create FFmpeg audio source
-                t_ffmpeg_start = time.time()
-                before_options = '-loglevel error'
-                options = '-vn -ac 2 -ar 48000'
-                audio_source = discord.FFmpegPCMAudio(temp_path, before_options=before_options, options=options)
-                t_ffmpeg_end = time.time()
-
-                ffmpeg_latency_ms = (t_ffmpeg_end - t_ffmpeg_start) * 1000
-                logger.info(f"⏱️ LATENCY [FFmpeg processing]: {ffmpeg_latency_ms:.2f}ms")
-                self.metrics.record_ffmpeg_processing_latency(ffmpeg_latency_ms)
-
-                # Play audio
-                voice_client.play(audio_source)
-                logger.info(f"🔊 Playing TTS audio ({len(audio_bytes):,} bytes)")
-
-                # Wait for playback to complete
-                while voice_client.is_playing():
-                    await asyncio.sleep(0.1)
-
-                t_playback_complete = time.time()
-                playback_duration = t_playback_complete - t_playback_start
-                logger.info(f"⏱️ LATENCY [audio playback]: {playback_duration:.3f}s")
-                self.metrics.record_audio_playback_latency(playback_duration)
-
-                # Record total pipeline latency (Phase 1 integration)
-                if session_id in self.session_timings:
-                    t_start = self.session_timings[session_id]['t_start']
-                    total_latency = t_playback_complete - t_start
-                    logger.info(f"⏱️ ⭐⭐⭐ TOTAL PIPELINE LATENCY: {total_latency:.3f}s")
-                    self.metrics.record_total_pipeline_latency(total_latency)
-
-                    # Broadcast metrics update to frontend
-                    try:
-                        from src.api import get_ws_manager
-                        ws_manager = get_ws_manager()
-                        metrics_snapshot = self.metrics.get_metrics()
-                        await ws_manager.broadcast({
-                            "event": "metrics_updated",
-                            "data": metrics_snapshot
-                        })
-                        logger.debug(f"📊 Broadcast metrics update to frontend")
-                    except Exception as e:
-                        logger.error(f"❌ Failed to broadcast metrics update: {e}")
+            # Record time to first audio (user stops speaking → first audio plays)
+            if session_id in self.session_timings and 't_transcription_complete' in self.session_timings[session_id]:
+                # Measure from when user STOPPED speaking (transcription complete), not when they started
+                t_transcription_complete = self.session_timings[session_id]['t_transcription_complete']
+                time_to_first_audio = t_playback_start - t_transcription_complete
+                self.metrics.record_time_to_first_audio(time_to_first_audio)
+                logger.info(f"⏱️ ⭐⭐⭐ LATENCY [time to first audio]: {time_to_first_audio:.3f}s (transcription complete → audio plays)")
 
-                return temp_path
+            logger.info(f"🔊 Playing TTS audio ({stream.bytes_written:,} bytes)")
 
-            finally:
-                # Cleanup temp file
+            # Wait for playback to complete
+            played = await stream.wait_played()
+
+            # In-process WAV → PCM conversion replaces the FFmpeg subprocess
+            conversion_ms = stream.convert_time_s * 1000
+            logger.info(f"⏱️ LATENCY [PCM conversion]: {conversion_ms:.2f}ms")
+            self.metrics.record_ffmpeg_processing_latency(conversion_ms)
+
+            if not played:
+                logger.info("⏹️ TTS playback interrupted")
+                return None
+
+            t_playback_complete = time.time()
+            playback_duration = t_playback_complete - t_playback_start
+            logger.info(f"⏱️ LATENCY [audio playback]: {playback_duration:.3f}s")
+            self.metrics.record_audio_playback_latency(playback_duration)
+
+            # Record total pipeline latency (Phase 1 integration)
+            if session_id in self.session_timings:
+                t_start = self.session_timings[session_id]['t_start']
+                total_latency = t_playback_complete - t_start
+                logger.info(f"⏱️ ⭐⭐⭐ TOTAL PIPELINE LATENCY: {total_latency:.3f}s")
+                self.metrics.record_total_pipeline_latency(total_latency)
+
+                # Broadcast metrics update to frontend
                 try:
-                    os.unlink(temp_path)
+                    from src.api import get_ws_manager
+                    ws_manager = get_ws_manager()
+                    metrics_snapshot = self.metrics.get_metrics()
+                    await ws_manager.broadcast({
+                        "event": "metrics_updated",
+                        "data": metrics_snapshot
+                    })
+                    logger.debug(f"📊 Broadcast metrics update to frontend")
                 except Exception as e:
-                    logger.warning(f"⚠️ Failed to delete temp file {temp_path}: {e}")
+                    logger.error(f"❌ Failed to broadcast metrics update: {e}")
+
+            return "completed"
 
         except Exception as e:
             logger.error(f"❌ Error with TTS playback: {e}", exc_info=True)
@@ -2206,6 +2311,10 @@ class DiscordPlugin(PluginBase):
             if session_id in self.session_timings:
                 del self.session_timings[session_id]
 
+            # Drop sentence ordering state
+            if self.tts_queue_manager:
+                self.tts_queue_manager.release_session(session_id)
+
             # Phase 6: Cleanup error handling state
             if session_id in self.fallback_triggered:
                 del self.fallback_triggered[session_id]
@@ -2287,13 +2396,7 @@ class DiscordPlugin(PluginBase):
 
             # Phase 5: Create audio playback queue if streaming enabled
             if self.tts_service.streaming_config.enabled and guild_id not in self.audio_playback_queues:
-                playback_queue = AudioPlaybackQueue(
-                    voice_client=voice_client,
-                    on_complete=None,  # Optional callback
-                    on_error=None  # Optional callback
-                )
-                await playback_queue.start()
-                self.audio_playback_queues[guild_id] = playback_queue
+                await self._get_playback_queue(guild_id, voice_client)
                 logger.info(f"🎵 Created audio playback queue for guild {guild_id} (manual join)")
 
             # Phase 6.X: Store session mapping if provided
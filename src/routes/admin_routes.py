@@ -16,7 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User, UserRole, UserFact
 from src.database.session import get_db_session
-from src.dependencies.auth import require_admin
+from src.dependencies.auth import invalidate_user_lookups, require_admin
 from src.services.auth_service import get_auth_service
 
 logger = logging.getLogger(__name__)
@@ -257,6 +257,7 @@ async def update_user(
 
         await db.commit()
         await db.refresh(user)
+        invalidate_user_lookups(user)  # Role and active status take effect immediately
 
         # Get fact count
         fact_result = await db.execute(
@@ -312,6 +313,7 @@ async def delete_user(
         username = user.username
         await db.delete(user)
         await db.commit()
+        invalidate_user_lookups(user)
 
         logger.warning(f"🗑️ Admin {admin.username} deleted user {username}")
 
@@ -366,6 +368,7 @@ async def reset_user_password(
         # Hash and update password
         user.password_hash = auth_service.hash_password(request.new_password)
         await db.commit()
+        invalidate_user_lookups(user)
 
         logger.warning(f"🔑 Admin {admin.username} reset password for user {user.username}")
 
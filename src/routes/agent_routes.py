@@ -11,6 +11,8 @@ from pydantic import BaseModel, Field
 from sqlalchemy import select, func
 
 from src.services.agent_service import AgentService
+from src.services.llm_service import invalidate_agent_llm_services
+from src.services.memory_service import invalidate_memory_lookups
 from src.database.session import get_db_session
 from src.database.models import UserAgentMemorySetting
 
@@ -52,6 +54,8 @@ class AgentCreateRequest(BaseModel):
     tts_temperature: float = Field(0.3, ge=0.05, le=5.0, description="TTS voice sampling (0.05-5.0)")
     tts_language: str = Field("en", description="TTS language code (e.g., 'en', 'es', 'fr')")
     filter_actions_for_tts: bool = Field(False, description="Remove roleplay actions (*text*) before TTS synthesis")
+    response_cache_enabled: bool = Field(False, description="Answer repeated questions from the response cache")
+    response_cache_bypass: List[str] = Field(default_factory=list, description="Regex patterns of questions never answered from cache")
     plugins: Optional[dict] = Field(None, description="Plugin configurations (e.g., discord plugin)")
 
 
@@ -72,6 +76,8 @@ class AgentUpdateRequest(BaseModel):
     tts_temperature: Optional[float] = Field(None, ge=0.05, le=5.0)
     tts_language: Optional[str] = None
     filter_actions_for_tts: Optional[bool] = Field(None, description="Remove roleplay actions (*text*) before TTS synthesis")
+    response_cache_enabled: Optional[bool] = Field(None, description="Answer repeated questions from the response cache")
+    response_cache_bypass: Optional[List[str]] = Field(None, description="Regex patterns of questions never answered from cache")
     memory_scope: Optional[str] = Field(None, description="Memory scope: 'global' or 'agent'")
     plugins: Optional[dict] = Field(None, description="Plugin configurations (e.g., discord plugin)")
 
@@ -95,6 +101,8 @@ class AgentResponse(BaseModel):
     tts_temperature: float
     tts_language: str
     filter_actions_for_tts: bool
+    response_cache_enabled: bool = False
+    response_cache_bypass: List[str] = Field(default_factory=list)
     plugins: Optional[dict] = None
     created_at: str
     updated_at: str
@@ -164,6 +172,8 @@ async def create_agent(request: AgentCreateRequest):
             tts_temperature=request.tts_temperature,
             tts_language=request.tts_language,
             filter_actions_for_tts=request.filter_actions_for_tts,
+            response_cache_enabled=request.response_cache_enabled,
+            response_cache_bypass=request.response_cache_bypass,
             plugins=request.plugins,
         )
 
@@ -184,6 +194,8 @@ async def create_agent(request: AgentCreateRequest):
             tts_temperature=agent.tts_temperature,
             tts_language=agent.tts_language,
             filter_actions_for_tts=agent.filter_actions_for_tts,
+            response_cache_enabled=bool(agent.response_cache_enabled),
+            response_cache_bypass=agent.response_cache_bypass or [],
             plugins=agent.plugins,
             created_at=agent.created_at.isoformat(),
             updated_at=agent.updated_at.isoformat(),
@@ -235,6 +247,8 @@ async def list_agents():
                 tts_temperature=agent.tts_temperature,
                 tts_language=agent.tts_language,
                 filter_actions_for_tts=agent.filter_actions_for_tts,
+                response_cache_enabled=bool(agent.response_cache_enabled),
+                response_cache_bypass=agent.response_cache_bypass or [],
                 plugins=agent.plugins,
                 created_at=agent.created_at.isoformat(),
                 updated_at=agent.updated_at.isoformat(),
@@ -293,6 +307,8 @@ async def get_agent(agent_id: UUID):
             tts_temperature=agent.tts_temperature,
             tts_language=agent.tts_language,
             filter_actions_for_tts=agent.filter_actions_for_tts,
+            response_cache_enabled=bool(agent.response_cache_enabled),
+            response_cache_bypass=agent.response_cache_bypass or [],
             plugins=agent.plugins,
             created_at=agent.created_at.isoformat(),
             updated_at=agent.updated_at.isoformat(),
@@ -344,6 +360,8 @@ async def update_agent(agent_id: UUID, request: AgentUpdateRequest):
             tts_temperature=request.tts_temperature,
             tts_language=request.tts_language,
             filter_actions_for_tts=request.filter_actions_for_tts,
+            response_cache_enabled=request.response_cache_enabled,
+            response_cache_bypass=request.response_cache_bypass,
             memory_scope=request.memory_scope,
             plugins=request.plugins,
         )
@@ -371,11 +389,16 @@ async def update_agent(agent_id: UUID, request: AgentUpdateRequest):
             tts_temperature=agent.tts_temperature,
             tts_language=agent.tts_language,
             filter_actions_for_tts=agent.filter_actions_for_tts,
+            response_cache_enabled=bool(agent.response_cache_enabled),
+            response_cache_bypass=agent.response_cache_bypass or [],
             plugins=agent.plugins,
             created_at=agent.created_at.isoformat(),
             updated_at=agent.updated_at.isoformat(),
         )
 
+        # Drop cached LLM services built from the previous config
+        invalidate_agent_llm_services(agent_id)
+
         # Broadcast agent update event
         await broadcast_agent_event("updated", response.model_dump())
 
@@ -416,6 +439,8 @@ async def delete_agent(agent_id: UUID):
                 detail=f"Agent with ID {agent_id} not found"
             )
 
+        invalidate_agent_llm_services(agent_id)
+
         # Broadcast agent deletion event
         await broadcast_agent_event("deleted", {"id": str(agent_id)})
 
@@ -476,6 +501,8 @@ async def set_default_agent(agent_id: UUID):
             tts_temperature=agent.tts_temperature,
             tts_language=agent.tts_language,
             filter_actions_for_tts=agent.filter_actions_for_tts,
+            response_cache_enabled=bool(agent.response_cache_enabled),
+            response_cache_bypass=agent.response_cache_bypass or [],
             plugins=agent.plugins,
             created_at=agent.created_at.isoformat(),
             updated_at=agent.updated_at.isoformat(),
@@ -610,6 +637,7 @@ async def set_memory_preference(
 
             await db.commit()
             await db.refresh(setting)
+            invalidate_memory_lookups(user_id=request.user_id, agent_id=agent_id)
 
             return UserAgentMemoryPreferenceResponse(
                 id=str(setting.id),
@@ -671,6 +699,7 @@ async def delete_memory_preference(
 
             await db.delete(setting)
             await db.commit()
+            invalidate_memory_lookups(user_id=user_id, agent_id=agent_id)
 
             return {"message": "Memory preference deleted, reverted to agent default"}
     except HTTPException:
@@ -17,7 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User, UserRole
 from src.database.session import get_db_session
-from src.dependencies.auth import get_current_user
+from src.dependencies.auth import get_current_user, invalidate_user_lookups
 from src.services.auth_service import get_auth_service
 
 logger = logging.getLogger(__name__)
@@ -254,6 +254,7 @@ async def login(request: LoginRequest):
         # Update last login
         user.last_login_at = datetime.now(timezone.utc)
         await db.commit()
+        invalidate_user_lookups(user)
 
         logger.info(f"🔐 User logged in: {user.username}")
 
@@ -434,6 +435,7 @@ async def update_preferences(
 
         await db.commit()
         await db.refresh(db_user)
+        invalidate_user_lookups(db_user)
 
         return UserResponse(
             id=str(db_user.id),
@@ -512,6 +514,7 @@ async def change_password(
 
         db_user.password_hash = auth_service.hash_password(request.new_password)
         await db.commit()
+        invalidate_user_lookups(db_user)
 
     logger.info(f"🔑 Password changed for user: {user.username}")
     return MessageResponse(message="Password changed successfully")
@@ -12,6 +12,7 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
 from src.services.llm_provider_service import LLMProviderService
+from src.services.llm_service import invalidate_provider_llm_services
 
 # WebSocket manager will be set by server.py
 _ws_manager = None
@@ -296,6 +297,9 @@ async def update_provider(provider_id: UUID, request: LLMProviderUpdateRequest):
             updated_at=provider.updated_at.isoformat(),
         )
 
+        # Agents using this provider pick up the new key/URL on their next turn
+        invalidate_provider_llm_services(provider_id)
+
         # Broadcast provider update event
         await broadcast_provider_event("updated", response.model_dump())
 
@@ -336,6 +340,8 @@ async def delete_provider(provider_id: UUID):
                 detail=f"Provider with ID {provider_id} not found"
             )
 
+        invalidate_provider_llm_services(provider_id)
+
         # Broadcast provider deletion event
         await broadcast_provider_event("deleted", {"id": str(provider_id)})
 
@@ -33,6 +33,7 @@ from sqlalchemy import select, delete as sql_delete, and_, func
 
 from src.database.models import User, UserFact, Agent, ExtractionTask
 from src.database.session import get_db_session
+from src.dependencies.auth import invalidate_user_lookups
 from src.services.memory_service import MemoryService, get_global_embedding_config, get_admin_memory_policy
 from src.config.logging_config import get_logger
 import uuid as uuid_module
@@ -707,6 +708,7 @@ async def update_memory_settings(user_id: str, request: MemorySettingsUpdateRequ
 
             await db.commit()
             await db.refresh(user)
+            invalidate_user_lookups(user)
 
             # Count facts with separate queries
             total_result = await db.execute(
@@ -890,6 +892,7 @@ async def delete_user_data(user_id: str):
             # Delete user (cascades to facts and extraction tasks)
             await db.delete(user)
             await db.commit()
+            invalidate_user_lookups(user)
 
             logger.info(f"🗑️ Deleted user {user_id} and {facts_count} facts (GDPR erasure)")
 
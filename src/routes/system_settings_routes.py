@@ -27,7 +27,7 @@ from sqlalchemy.sql import func
 from src.database.models import SystemSettings
 from src.database.session import get_db_session
 from src.config.logging_config import get_logger
-from src.services.memory_service import get_embedding_model_status
+from src.services.memory_service import get_embedding_model_status, invalidate_memory_lookups
 from src.utils.encryption import encrypt_api_key, decrypt_api_key, is_encryption_configured
 
 logger = get_logger(__name__)
@@ -620,6 +620,7 @@ async def update_admin_memory_policy(request: AdminMemoryPolicyRequest):
 
             await db.commit()
             await db.refresh(setting)
+            invalidate_memory_lookups(admin_policy=True)
 
             return {
                 "status": "updated",
@@ -649,6 +650,7 @@ async def reset_admin_memory_policy():
                 delete(SystemSettings).where(SystemSettings.setting_key == "admin_memory_policy")
             )
             await db.commit()
+            invalidate_memory_lookups(admin_policy=True)
             logger.info("🔄 Reset admin memory policy to environment defaults (deleted database config)")
 
         # Return environment defaults
@@ -6,6 +6,7 @@ Provides CRUD operations with validation and database interaction.
 """
 
 import logging
+import re
 from typing import List, Optional
 from uuid import UUID
 from sqlalchemy import select
@@ -14,10 +15,28 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.database.models import Agent
 from src.database.session import get_db_session
 from src.plugins.encryption import PluginEncryption, PluginEncryptionError
+from src.services.response_cache import get_response_cache
 
 logger = logging.getLogger(__name__)
 
 
+def _validate_bypass_patterns(patterns: List[str]) -> None:
+    """Raise ValueError unless every response cache bypass pattern is a valid regex"""
+    for pattern in patterns:
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid response cache bypass pattern {pattern!r}: {e}")
+
+
+def _invalidate_agent_lookups(*agent_ids: UUID) -> None:
+    """Drop cached snapshots of changed or deleted agents (memory hot path lookups)"""
+    from src.services.memory_service import invalidate_memory_lookups
+
+    for agent_id in agent_ids:
+        invalidate_memory_lookups(agent_id=agent_id)
+
+
 class AgentService:
     """Service for managing AI agents"""
 
@@ -37,6 +56,8 @@ class AgentService:
         tts_temperature: float = 0.3,
         tts_language: str = "en",
         filter_actions_for_tts: bool = False,
+        response_cache_enabled: bool = False,
+        response_cache_bypass: Optional[List[str]] = None,
         plugins: Optional[dict] = None,
     ) -> Agent:
         """
@@ -56,6 +77,8 @@ class AgentService:
             tts_cfg_weight: TTS speech pace (0.0-1.0)
             tts_temperature: TTS voice sampling (0.05-5.0)
             tts_language: TTS language code (e.g., 'en', 'es', 'fr')
+            response_cache_enabled: Answer repeated questions from the response cache
+            response_cache_bypass: Regex patterns of questions never answered from cache
             plugins: Plugin configurations (dict mapping plugin_type -> config)
 
         Returns:
@@ -79,6 +102,8 @@ class AgentService:
             raise ValueError("TTS cfg_weight must be between 0.0 and 1.0")
         if not 0.05 <= tts_temperature <= 5.0:
             raise ValueError("TTS temperature must be between 0.05 and 5.0")
+        if response_cache_bypass:
+            _validate_bypass_patterns(response_cache_bypass)
 
         # Encrypt sensitive plugin fields
         encrypted_plugins = {}
@@ -119,6 +144,8 @@ class AgentService:
                 tts_temperature=tts_temperature,
                 tts_language=tts_language,
                 filter_actions_for_tts=filter_actions_for_tts,
+                response_cache_enabled=response_cache_enabled,
+                response_cache_bypass=response_cache_bypass or [],
                 plugins=encrypted_plugins,
             )
 
@@ -213,6 +240,8 @@ class AgentService:
         tts_temperature: Optional[float] = None,
         tts_language: Optional[str] = None,
         filter_actions_for_tts: Optional[bool] = None,
+        response_cache_enabled: Optional[bool] = None,
+        response_cache_bypass: Optional[List[str]] = None,
         memory_scope: Optional[str] = None,
         plugins: Optional[dict] = None,
     ) -> Optional[Agent]:
@@ -233,6 +262,8 @@ class AgentService:
             tts_cfg_weight: New TTS cfg_weight (optional)
             tts_temperature: New TTS temperature (optional)
             tts_language: New TTS language (optional)
+            response_cache_enabled: Enable/disable the response cache (optional)
+            response_cache_bypass: New response cache bypass patterns (optional)
             memory_scope: New memory scope ('global' or 'agent') (optional)
             plugins: New plugin configurations (optional)
 
@@ -314,6 +345,15 @@ class AgentService:
             if filter_actions_for_tts is not None:
                 agent.filter_actions_for_tts = filter_actions_for_tts
 
+            if response_cache_enabled is not None:
+                agent.response_cache_enabled = response_cache_enabled
+                if not response_cache_enabled:
+                    get_response_cache().invalidate_agent(agent_id)
+
+            if response_cache_bypass is not None:
+                _validate_bypass_patterns(response_cache_bypass)
+                agent.response_cache_bypass = response_cache_bypass
+
             if memory_scope is not None:
                 if memory_scope not in ["global", "agent"]:
                     raise ValueError("Memory scope must be 'global' or 'agent'")
@@ -340,6 +380,8 @@ class AgentService:
             await session.commit()
             await session.refresh(agent)
 
+        _invalidate_agent_lookups(agent_id)
+
         # NEW Phase 4 Batch 1: Restart plugins if config changed
         if plugins_changed:
             logger.info(f"🔄 Plugin config changed for agent '{agent.name}' - restarting plugins...")
@@ -413,6 +455,8 @@ class AgentService:
             await session.commit()
             await session.refresh(agent)
 
+            _invalidate_agent_lookups(agent_id, *(existing.id for existing in existing_defaults))
+
             return agent
 
     @staticmethod
@@ -438,6 +482,8 @@ class AgentService:
             await session.delete(agent)
             await session.commit()
 
+        _invalidate_agent_lookups(agent_id)
+
         # NEW Phase 4 Batch 1: Invalidate default agent cache after deletion
         from src.services.plugin_manager import get_plugin_manager
 
@@ -7,19 +7,25 @@ sentences play in the correct order without gaps or overlaps.
 Key Design Principles:
 - FIFO queue (preserves sentence order)
 - Sequential playback (one audio chunk at a time)
-- Gap-free transitions between sentences
+- Gap-free transitions between sentences: audio is fed into a single
+  in-memory StreamingPCMAudioSource (no ffmpeg subprocess, no temp files),
+  with the next chunk pre-buffered while the current one plays
+- Streamed chunks (enqueue_stream) start playing from their first bytes
+- Audio may be WAV (converted in process) or raw Discord PCM negotiated
+  with TTS (pcm=True, appended without header handling)
 - Configurable interruption strategies (immediate, graceful, drain)
 - Discord voice client integration
 """
 
 import asyncio
 import logging
+import uuid
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, Callable, Awaitable
 from enum import Enum
 import time
-import tempfile
-import os
+
+from src.services.streaming_audio_source import AudioSegment, StreamingPCMAudioSource
 
 logger = logging.getLogger(__name__)
 
@@ -40,12 +46,14 @@ class AudioChunk:
 
     Attributes:
         chunk_id: Unique identifier
-        audio_bytes: WAV audio data
+        audio_bytes: WAV (or raw Discord PCM) audio data (empty for streamed chunks)
         metadata: Associated metadata (sentence, task_id, etc.)
         status: Current playback status
         queued_at: Timestamp when added to queue
         started_at: Timestamp when playback started
         completed_at: Timestamp when playback completed
+        stream: Live stream feeding this chunk (enqueue_stream), if any
+        pcm: audio_bytes is raw 48kHz stereo s16le PCM rather than WAV
     """
     chunk_id: str
     audio_bytes: bytes
@@ -54,6 +62,93 @@ class AudioChunk:
     queued_at: float = field(default_factory=time.time)
     started_at: Optional[float] = None
     completed_at: Optional[float] = None
+    stream: Optional["AudioStream"] = None
+    pcm: bool = False
+
+
+class AudioStream:
+    """
+    Writer for a chunk whose audio is still being synthesized.
+
+    Bytes written before the chunk's turn are buffered; once the chunk reaches
+    the audio source they are played as they arrive.
+
+    Example usage:
+        stream = await queue.enqueue_stream({"sentence": "Hello!"})
+        await tts_service.synthesize_speech(..., callback=stream.write)
+        stream.finish()
+        await stream.wait_played()
+    """
+
+    def __init__(self, pcm: bool = False):
+        self.pcm = pcm
+        self._pending = bytearray()
+        self._finished = False
+        self._segment: Optional[AudioSegment] = None
+        self._attached = asyncio.get_running_loop().create_future()
+        self.bytes_written = 0
+
+    async def write(self, audio_bytes: bytes) -> None:
+        """Append WAV (or raw PCM) bytes (async so it can be used directly as a TTS callback)"""
+        self.bytes_written += len(audio_bytes)
+        if self._segment is not None:
+            self._write_segment(audio_bytes)
+        else:
+            self._pending.extend(audio_bytes)
+
+    def finish(self) -> None:
+        """Mark the stream complete"""
+        self._finished = True
+        if self._segment is not None:
+            self._segment.finish()
+
+    async def wait_started(self) -> Optional[float]:
+        """
+        Wait until the first frame of this stream is played.
+
+        Returns:
+            Wall-clock start time, or None if the stream was dropped first
+        """
+        segment = await self._attached
+        if segment is None:
+            return None
+        await asyncio.wait({segment.started, segment.played}, return_when=asyncio.FIRST_COMPLETED)
+        return segment.started.result() if segment.started.done() else None
+
+    async def wait_played(self) -> bool:
+        """
+        Wait until the stream has finished playing.
+
+        Returns:
+            True if played to the end, False if dropped (interruption/failure)
+        """
+        segment = await self._attached
+        if segment is None:
+            return False
+        return await segment.wait_played()
+
+    @property
+    def convert_time_s(self) -> float:
+        """In-process WAV → Discord PCM conversion time"""
+        return self._segment.convert_time_s if self._segment is not None else 0.0
+
+    def _attach(self, segment: Optional[AudioSegment]) -> None:
+        """Bind to an audio source segment (None = dropped before playback)"""
+        self._segment = segment
+        if segment is not None:
+            if self._pending:
+                self._write_segment(bytes(self._pending))
+                self._pending.clear()
+            if self._finished:
+                segment.finish()
+        if not self._attached.done():
+            self._attached.set_result(segment)
+
+    def _write_segment(self, audio_bytes: bytes) -> None:
+        if self.pcm:
+            self._segment.write_pcm(audio_bytes)
+        else:
+            self._segment.write(audio_bytes)
 
 
 class AudioPlaybackQueue:
@@ -88,7 +183,8 @@ class AudioPlaybackQueue:
         Args:
             voice_client: Discord VoiceClient for audio playback
             on_complete: Optional async callback when audio chunk completes
-                        Args: (metadata)
+                        Args: (metadata); metadata['played'] is False if the
+                        chunk was interrupted before it finished
             on_error: Optional async callback when playback fails
                      Args: (error, metadata)
         """
@@ -100,6 +196,11 @@ class AudioPlaybackQueue:
         self.queue: asyncio.Queue[AudioChunk] = asyncio.Queue()
         self.current_chunk: Optional[AudioChunk] = None
 
+        # In-memory audio source (one continuous source across chunks)
+        self.audio_source: Optional[StreamingPCMAudioSource] = None
+        self._last_segment: Optional[AudioSegment] = None
+        self._segment_watchers: set = set()
+
         # Playback control
         self.playing = False
         self.stop_requested = False
@@ -130,31 +231,60 @@ class AudioPlaybackQueue:
         self,
         audio_bytes: bytes,
         metadata: Optional[Dict[str, Any]] = None,
+        pcm: bool = False,
     ) -> str:
         """
         Add audio chunk to playback queue.
 
         Args:
-            audio_bytes: WAV audio data
+            audio_bytes: WAV audio data (or raw PCM if pcm=True)
             metadata: Associated metadata (sentence, task_id, latency, etc.)
+            pcm: audio_bytes is raw 48kHz stereo s16le PCM (DISCORD_PCM_FORMAT)
 
         Returns:
             Chunk ID for tracking
         """
-        import uuid
-
         chunk = AudioChunk(
             chunk_id=str(uuid.uuid4()),
             audio_bytes=audio_bytes,
             metadata=metadata or {},
+            pcm=pcm,
         )
+        return await self._enqueue(chunk)
 
+    async def enqueue_stream(
+        self,
+        metadata: Optional[Dict[str, Any]] = None,
+        pcm: bool = False,
+    ) -> AudioStream:
+        """
+        Add a chunk whose audio will be streamed in (plays from its first bytes).
+
+        Args:
+            metadata: Associated metadata (sentence, session_id, etc.)
+            pcm: Stream carries raw 48kHz stereo s16le PCM instead of WAV
+
+        Returns:
+            AudioStream to write audio bytes into (call finish() when done)
+        """
+        stream = AudioStream(pcm=pcm)
+        await self._enqueue(AudioChunk(
+            chunk_id=str(uuid.uuid4()),
+            audio_bytes=b'',
+            metadata=metadata or {},
+            stream=stream,
+            pcm=pcm,
+        ))
+        return stream
+
+    async def _enqueue(self, chunk: AudioChunk) -> str:
+        """Put a chunk on the playback queue"""
         await self.queue.put(chunk)
         self.total_queued += 1
 
         logger.debug(
             f"📥 Enqueued audio chunk (chunk={chunk.chunk_id[:8]}..., "
-            f"size={len(audio_bytes)} bytes, queue_size={self.queue.qsize()})"
+            f"size={len(chunk.audio_bytes)} bytes, queue_size={self.queue.qsize()})"
         )
 
         return chunk.chunk_id
@@ -163,18 +293,14 @@ class AudioPlaybackQueue:
         """
         Worker coroutine that plays audio chunks sequentially.
 
-        Ensures gap-free playback by immediately starting next chunk
-        when current chunk completes.
+        Ensures gap-free playback by buffering the next chunk into the audio
+        source while the current chunk plays. Interruptions are applied by
+        stop_playback() directly; the worker keeps running afterwards.
         """
         logger.debug("🎵 Playback worker started")
 
         while self.playing:
             try:
-                # Check for stop signal
-                if self.stop_requested:
-                    await self._handle_interruption()
-                    break
-
                 # Wait for next audio chunk
                 try:
                     chunk = await asyncio.wait_for(self.queue.get(), timeout=0.5)
@@ -192,9 +318,22 @@ class AudioPlaybackQueue:
 
         logger.debug("🎵 Playback worker stopped")
 
+    def _ensure_source(self) -> StreamingPCMAudioSource:
+        """Return the live audio source, starting a new one if playback ended"""
+        if self.audio_source is None or self.audio_source.closed:
+            self.audio_source = StreamingPCMAudioSource()
+            if self.voice_client.is_playing():
+                self.voice_client.stop()
+            self.voice_client.play(self.audio_source)
+            logger.debug("🎵 Started in-memory audio source")
+        return self.audio_source
+
     async def _play_chunk(self, chunk: AudioChunk):
         """
-        Play a single audio chunk through Discord voice client.
+        Hand a single audio chunk to the Discord audio source.
+
+        Returns once the chunk is buffered and the previous chunk has finished
+        playing, so exactly one chunk is pre-buffered for a gapless transition.
 
         Args:
             chunk: Audio chunk to play
@@ -202,70 +341,54 @@ class AudioPlaybackQueue:
         if not self.voice_client or not self.voice_client.is_connected():
             logger.error("❌ Voice client not connected, cannot play audio")
             chunk.status = PlaybackStatus.FAILED
+            chunk.completed_at = time.time()
             self.total_failed += 1
-            return
+            if chunk.stream is not None:
+                chunk.stream._attach(None)
 
-        chunk.status = PlaybackStatus.PLAYING
-        chunk.started_at = time.time()
-        self.current_chunk = chunk
+            # Report like any other failure (listeners release per-chunk state)
+            if self.on_error:
+                await self.on_error(RuntimeError("Voice client not connected"), {
+                    'chunk_id': chunk.chunk_id,
+                    **chunk.metadata,
+                })
+            return
 
         try:
             logger.debug(
                 f"🔊 Playing audio chunk (chunk={chunk.chunk_id[:8]}..., "
-                f"size={len(chunk.audio_bytes)} bytes)"
+                f"size={len(chunk.audio_bytes)} bytes, streamed={chunk.stream is not None})"
             )
 
-            # Save audio to temporary file (Discord.py requires file path)
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_file:
-                temp_path = temp_file.name
-                temp_file.write(chunk.audio_bytes)
-
+            source = self._ensure_source()
             try:
-                # Create FFmpeg audio source
-                import discord
-                audio_source = discord.FFmpegPCMAudio(temp_path)
-
-                # Play audio (blocking until complete)
-                self.voice_client.play(audio_source)
-
-                # Wait for playback to complete
-                while self.voice_client.is_playing():
-                    await asyncio.sleep(0.1)
-
-                    # Check for interruption
-                    if self.stop_requested:
-                        self.voice_client.stop()
-                        chunk.status = PlaybackStatus.INTERRUPTED
-                        self.total_interrupted += 1
-                        logger.debug(f"⏹️ Playback interrupted (chunk={chunk.chunk_id[:8]}...)")
-                        return
-
-                # Playback completed successfully
-                chunk.status = PlaybackStatus.COMPLETED
-                chunk.completed_at = time.time()
-                self.total_played += 1
-
-                # Calculate latency
-                latency = chunk.completed_at - chunk.started_at if chunk.started_at else 0
-                logger.debug(
-                    f"✅ Playback complete (chunk={chunk.chunk_id[:8]}..., "
-                    f"latency={latency:.2f}s)"
-                )
-
-                # Call completion callback
-                if self.on_complete:
-                    await self.on_complete({
-                        'chunk_id': chunk.chunk_id,
-                        'latency': latency,
-                        **chunk.metadata,
-                    })
-
-            finally:
-                # Cleanup temp file
-                try:
-                    os.unlink(temp_path)
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to delete temp file {temp_path}: {e}")
+                segment = source.begin_segment(chunk.metadata)
+            except RuntimeError:
+                # Source ended between the check and the append
+                self.audio_source = None
+                source = self._ensure_source()
+                segment = source.begin_segment(chunk.metadata)
+
+            if chunk.stream is not None:
+                chunk.stream._attach(segment)
+            elif chunk.pcm:
+                segment.write_pcm(chunk.audio_bytes)
+                segment.finish()
+            else:
+                segment.write(chunk.audio_bytes)
+                segment.finish()
+
+            chunk.status = PlaybackStatus.PLAYING
+            self.current_chunk = chunk
+
+            watcher = asyncio.create_task(self._watch_segment(chunk, segment))
+            self._segment_watchers.add(watcher)
+            watcher.add_done_callback(self._segment_watchers.discard)
+
+            # Back-pressure: keep one chunk buffered ahead of the playing one
+            previous, self._last_segment = self._last_segment, segment
+            if previous is not None and not previous.played.done():
+                await previous.played
 
         except Exception as e:
             chunk.status = PlaybackStatus.FAILED
@@ -277,6 +400,9 @@ class AudioPlaybackQueue:
                 exc_info=True
             )
 
+            if chunk.stream is not None:
+                chunk.stream._attach(None)
+
             # Call error callback
             if self.on_error:
                 await self.on_error(e, {
@@ -284,9 +410,49 @@ class AudioPlaybackQueue:
                     **chunk.metadata,
                 })
 
-        finally:
+    async def _watch_segment(self, chunk: AudioChunk, segment: AudioSegment):
+        """Track a segment's playback and fire completion callbacks"""
+        await asyncio.wait({segment.started, segment.played}, return_when=asyncio.FIRST_COMPLETED)
+        if segment.started.done():
+            chunk.started_at = segment.started.result()
+
+        played = await segment.played
+        chunk.completed_at = time.time()
+
+        if self.current_chunk is chunk:
             self.current_chunk = None
 
+        if not played:
+            if chunk.status == PlaybackStatus.PLAYING:
+                chunk.status = PlaybackStatus.INTERRUPTED
+                self.total_interrupted += 1
+            logger.debug(f"⏹️ Playback interrupted (chunk={chunk.chunk_id[:8]}...)")
+        else:
+            # Playback completed successfully
+            chunk.status = PlaybackStatus.COMPLETED
+            self.total_played += 1
+
+        # Calculate latency
+        latency = chunk.completed_at - chunk.started_at if chunk.started_at else 0
+        if played:
+            logger.debug(
+                f"✅ Playback complete (chunk={chunk.chunk_id[:8]}..., "
+                f"latency={latency:.2f}s)"
+            )
+
+        # Call completion callback (interrupted chunks too, so listeners can
+        # release per-chunk state such as the TTS look-ahead window)
+        if self.on_complete:
+            try:
+                await self.on_complete({
+                    'chunk_id': chunk.chunk_id,
+                    'latency': latency,
+                    'played': played,
+                    **chunk.metadata,
+                })
+            except Exception as e:
+                logger.error(f"❌ Playback on_complete callback error: {e}", exc_info=True)
+
     async def stop_playback(self, strategy: str = 'immediate'):
         """
         Stop audio playback with specified strategy.
@@ -302,24 +468,43 @@ class AudioPlaybackQueue:
 
         logger.info(f"⏹️ Stopping playback (strategy={strategy})")
 
+        try:
+            await self._handle_interruption()
+        finally:
+            self.stop_requested = False
+
+    def _drop_queued(self, chunk: AudioChunk) -> None:
+        """Mark a queued chunk interrupted (and release any stream waiting on it)"""
+        chunk.status = PlaybackStatus.INTERRUPTED
+        self.total_interrupted += 1
+        if chunk.stream is not None:
+            chunk.stream._attach(None)
+
+    def _cancel_queue(self) -> int:
+        """Drop every queued chunk, returning how many were dropped"""
+        cancelled_count = 0
+        while not self.queue.empty():
+            try:
+                self._drop_queued(self.queue.get_nowait())
+                cancelled_count += 1
+            except asyncio.QueueEmpty:
+                break
+        return cancelled_count
+
     async def _handle_interruption(self):
         """Handle interruption based on configured strategy"""
         strategy = self.interruption_strategy or 'immediate'
 
         if strategy == 'immediate':
-            # Stop current playback immediately
+            # Stop current playback immediately (drops buffered audio)
+            if self.audio_source is not None:
+                self.audio_source.clear()
+                self.audio_source = None
             if self.voice_client and self.voice_client.is_playing():
                 self.voice_client.stop()
 
             # Cancel all queued chunks
-            cancelled_count = self.queue.qsize()
-            while not self.queue.empty():
-                try:
-                    chunk = self.queue.get_nowait()
-                    chunk.status = PlaybackStatus.INTERRUPTED
-                    self.total_interrupted += 1
-                except asyncio.QueueEmpty:
-                    break
+            cancelled_count = self._cancel_queue()
 
             logger.info(
                 f"🚫 Immediate interruption (current stopped, "
@@ -327,16 +512,12 @@ class AudioPlaybackQueue:
             )
 
         elif strategy == 'graceful':
-            # Let current chunk finish (already handled by _play_chunk)
-            # Cancel remaining queue
-            cancelled_count = self.queue.qsize()
-            while not self.queue.empty():
-                try:
-                    chunk = self.queue.get_nowait()
-                    chunk.status = PlaybackStatus.INTERRUPTED
-                    self.total_interrupted += 1
-                except asyncio.QueueEmpty:
-                    break
+            # Let current chunk finish, drop the pre-buffered next chunk
+            # and the remaining queue
+            cancelled_count = 0
+            if self.audio_source is not None:
+                cancelled_count += self.audio_source.clear_pending()
+            cancelled_count += self._cancel_queue()
 
             logger.info(
                 f"🚫 Graceful interruption (current finishing, "
@@ -367,17 +548,13 @@ class AudioPlaybackQueue:
 
             # Cancel remaining
             for chunk in chunks_to_cancel:
-                chunk.status = PlaybackStatus.INTERRUPTED
-                self.total_interrupted += 1
+                self._drop_queued(chunk)
 
             logger.info(
                 f"🚫 Drain interruption (keeping={len(chunks_to_keep)}, "
                 f"cancelled={len(chunks_to_cancel)})"
             )
 
-            # Don't stop immediately, let drain complete
-            self.stop_requested = False
-
     async def stop(self):
         """
         Stop playback queue and cleanup resources.
@@ -392,9 +569,13 @@ class AudioPlaybackQueue:
         self.stop_requested = True
         self.playing = False
 
-        # Stop current playback
+        # Stop current playback and release anything still queued
+        if self.audio_source is not None:
+            self.audio_source.clear()
+            self.audio_source = None
         if self.voice_client and self.voice_client.is_playing():
             self.voice_client.stop()
+        self._cancel_queue()
 
         # Wait for worker to finish
         if self.playback_worker:
@@ -423,4 +604,6 @@ class AudioPlaybackQueue:
             'total_played': self.total_played,
             'total_interrupted': self.total_interrupted,
             'total_failed': self.total_failed,
+            'buffered_segments': self.audio_source.pending_segments() if self.audio_source else 0,
+            'underrun_frames': self.audio_source.underrun_frames if self.audio_source else 0,
         }
@@ -0,0 +1,716 @@
+"""
+Streaming TTS Audio Transcoding
+
+Converts Chatterbox WAV output into compressed audio for browser delivery.
+Uncompressed 24 kHz PCM costs roughly 10x the bandwidth of Opus per spoken
+second, so clients that can play WebM/Opus get far fewer bytes and their first
+audio sooner.
+
+Consumers that play raw PCM (Discord voice, Web Audio) can instead negotiate
+headerless PCM at their own sample rate. Chatterbox is asked for raw PCM at
+that rate; when it can't deliver it, the audio is resampled in process.
+
+Key Features:
+- Incremental WAV header parsing (header may be split across chunks)
+- PCM → Opus encoding as chunks arrive (no full-utterance buffering)
+- Live WebM muxing with short clusters so bytes flush every ~100ms
+- Passthrough fallback when the input isn't 16-bit PCM WAV
+- Streaming polyphase resampler (numpy, Kaiser-windowed sinc) for raw PCM
+  output at the consumer's rate, with frame-aligned output chunks
+
+Key Design Principles:
+- Output format is negotiated per client ('wav', 'opus' or 'pcm')
+- One encoder per utterance (each output is a standalone WebM file)
+- Encoding errors never drop audio: the encoder falls back to passthrough
+  before the first encoded byte is emitted
+- Audio between Chatterbox and the transcoder is always self-describing WAV
+  (raw backend PCM gets a header), so the audio cache serves any consumer
+"""
+
+import math
+import os
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+
+import av
+import numpy as np
+
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+TTS_OPUS_BITRATE = int(os.getenv('TTS_OPUS_BITRATE', '32000'))
+TTS_OPUS_CLUSTER_MS = int(os.getenv('TTS_OPUS_CLUSTER_MS', '100'))
+TTS_PCM_SAMPLE_RATE = int(os.getenv('TTS_PCM_SAMPLE_RATE', '24000'))
+TTS_PCM_CHANNELS = int(os.getenv('TTS_PCM_CHANNELS', '1'))
+TTS_RESAMPLER_ZERO_CROSSINGS = int(os.getenv('TTS_RESAMPLER_ZERO_CROSSINGS', '16'))
+
+# Output formats a client may negotiate → MIME type announced to the client
+AUDIO_OUTPUT_FORMATS: Dict[str, str] = {
+    'wav': 'audio/wav',
+    'opus': 'audio/webm;codecs=opus',
+    'pcm': 'audio/pcm',
+}
+
+# Sample rates libopus accepts natively (anything else is resampled to 48 kHz)
+_OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+_WAV_FORMAT_PCM = 1
+_WAV_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+@dataclass
+class WavFormat:
+    """
+    PCM layout from a WAV 'fmt ' chunk.
+
+    Attributes:
+        sample_rate: Samples per second
+        channels: Channel count
+        bits_per_sample: Sample width in bits
+    """
+    sample_rate: int
+    channels: int
+    bits_per_sample: int
+
+    @property
+    def frame_bytes(self) -> int:
+        """Bytes per PCM frame (one sample for every channel)"""
+        return self.channels * self.bits_per_sample // 8
+
+
+@dataclass(frozen=True)
+class PCMFormat:
+    """
+    Raw PCM layout negotiated by a consumer (signed 16-bit little endian).
+
+    Attributes:
+        sample_rate: Samples per second
+        channels: Channel count (1 or 2)
+        align_frames: Output chunks are a multiple of this many frames
+                      (e.g. 960 = one 20ms Discord frame at 48 kHz)
+    """
+    sample_rate: int = TTS_PCM_SAMPLE_RATE
+    channels: int = TTS_PCM_CHANNELS
+    align_frames: int = 1
+
+    @property
+    def frame_bytes(self) -> int:
+        """Bytes per PCM frame (one sample for every channel)"""
+        return self.channels * 2
+
+    @property
+    def mime_type(self) -> str:
+        """MIME type announced to clients (rate and channels as parameters)"""
+        return f"{AUDIO_OUTPUT_FORMATS['pcm']};rate={self.sample_rate};channels={self.channels}"
+
+
+def make_wav_header(sample_rate: int, channels: int) -> bytes:
+    """
+    Build a streaming 16-bit PCM WAV header (placeholder sizes).
+
+    Args:
+        sample_rate: Samples per second
+        channels: Channel count
+
+    Returns:
+        44-byte RIFF/WAVE header whose 'data' chunk extends to end of stream
+    """
+    fmt = struct.pack('<HHIIHH', _WAV_FORMAT_PCM, channels, sample_rate, sample_rate * channels * 2, channels * 2, 16)
+    return (
+        b'RIFF' + struct.pack('<I', 0xFFFFFFFF) + b'WAVE'
+        + b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+        + b'data' + struct.pack('<I', 0xFFFFFFFF)
+    )
+
+
+def parse_wav_header(data: bytes) -> Optional[tuple]:
+    """
+    Parse a (possibly incomplete) WAV header.
+
+    Streaming WAVs often carry a placeholder data size, so the 'data' chunk is
+    taken to extend to the end of the stream.
+
+    Args:
+        data: Bytes received so far
+
+    Returns:
+        (WavFormat, data_offset) once the 'data' chunk header is available,
+        or None if more bytes are needed
+
+    Raises:
+        ValueError: If data is not a RIFF/WAVE stream
+    """
+    if len(data) < 12:
+        if not b'RIFF'.startswith(data[:4]):
+            raise ValueError("Not a RIFF stream")
+        return None
+
+    if data[:4] != b'RIFF' or data[8:12] != b'WAVE':
+        raise ValueError("Not a RIFF/WAVE stream")
+
+    wav_format = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        chunk_size = struct.unpack_from('<I', data, offset + 4)[0]
+        body = offset + 8
+
+        if chunk_id == b'data':
+            if wav_format is None:
+                raise ValueError("WAV 'data' chunk before 'fmt ' chunk")
+            return wav_format, body
+
+        if body + chunk_size > len(data):
+            return None  # Chunk body not fully received yet
+
+        if chunk_id == b'fmt ':
+            audio_format, channels, sample_rate = struct.unpack_from('<HHI', data, body)
+            bits_per_sample = struct.unpack_from('<H', data, body + 14)[0]
+            if audio_format not in (_WAV_FORMAT_PCM, _WAV_FORMAT_EXTENSIBLE):
+                raise ValueError(f"Unsupported WAV encoding (format tag {audio_format})")
+            wav_format = WavFormat(sample_rate, channels, bits_per_sample)
+
+        # Chunks are word-aligned
+        offset = body + chunk_size + (chunk_size & 1)
+
+    return None
+
+
+class _ByteSink:
+    """Write-only (non-seekable) file object collecting muxer output"""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b''.join(self._parts)
+        self._parts.clear()
+        return data
+
+
+class StreamingOpusEncoder:
+    """
+    Incremental WAV → WebM/Opus transcoder for one utterance.
+
+    Example usage:
+        encoder = StreamingOpusEncoder()
+
+        async for chunk in wav_stream:
+            encoded = encoder.feed(chunk)
+            if encoded:
+                await websocket.send_bytes(encoded)
+
+        await websocket.send_bytes(encoder.finish())
+    """
+
+    def __init__(self, bitrate: int = TTS_OPUS_BITRATE, cluster_ms: int = TTS_OPUS_CLUSTER_MS):
+        """
+        Initialize Opus encoder.
+
+        Args:
+            bitrate: Target Opus bitrate in bits per second
+            cluster_ms: Max WebM cluster duration (controls how often bytes flush)
+        """
+        self.bitrate = bitrate
+        self.cluster_ms = cluster_ms
+
+        self.wav_format: Optional[WavFormat] = None
+        self.passthrough = False
+        self.mime_type = AUDIO_OUTPUT_FORMATS['opus']
+
+        self._header_buffer = bytearray()
+        self._remainder = b''
+        self._sink = _ByteSink()
+        self._container = None
+        self._stream = None
+        self._resampler = None
+        self._pts = 0
+        self._finished = False
+
+        # Metrics
+        self.input_bytes = 0
+        self.output_bytes = 0
+
+    def feed(self, chunk: bytes) -> bytes:
+        """
+        Feed a chunk of the WAV stream.
+
+        Args:
+            chunk: Next bytes of the WAV stream (any size/alignment)
+
+        Returns:
+            Encoded bytes ready to send (may be empty)
+        """
+        if not chunk:
+            return b''
+        self.input_bytes += len(chunk)
+
+        if self.passthrough:
+            return self._emit(chunk)
+
+        if self.wav_format is None:
+            self._header_buffer.extend(chunk)
+            try:
+                parsed = parse_wav_header(bytes(self._header_buffer))
+                if parsed is None:
+                    return b''
+                self.wav_format, data_offset = parsed
+                self._open_encoder()
+            except Exception as e:
+                return self._fall_back(e)
+
+            chunk = bytes(self._header_buffer[data_offset:])
+            self._header_buffer.clear()
+
+        try:
+            return self._emit(self._encode_pcm(chunk))
+        except Exception as e:
+            logger.error(f"❌ Opus encoding failed mid-stream: {e}", exc_info=True)
+            return b''
+
+    def finish(self) -> bytes:
+        """
+        Flush the encoder and close the WebM stream.
+
+        Returns:
+            Remaining encoded bytes
+        """
+        if self._finished:
+            return b''
+        self._finished = True
+
+        if self.passthrough:
+            return b''
+
+        if self.wav_format is None:
+            # Stream ended before a complete header: pass through whatever arrived
+            if self._header_buffer:
+                return self._fall_back(ValueError("Incomplete WAV header"))
+            return b''
+
+        try:
+            for packet in self._stream.encode(None):
+                self._container.mux(packet)
+            self._container.close()
+        except Exception as e:
+            logger.error(f"❌ Opus encoder flush failed: {e}", exc_info=True)
+
+        return self._emit(self._sink.drain())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get transcoding statistics.
+
+        Returns:
+            Dictionary with byte counts and compression ratio
+        """
+        return {
+            'passthrough': self.passthrough,
+            'input_bytes': self.input_bytes,
+            'output_bytes': self.output_bytes,
+            'compression_ratio': (self.input_bytes / self.output_bytes) if self.output_bytes else 0.0,
+        }
+
+    def _open_encoder(self) -> None:
+        """Create the WebM container and Opus stream for the parsed WAV format"""
+        fmt = self.wav_format
+        if fmt.bits_per_sample != 16 or fmt.channels not in (1, 2):
+            raise ValueError(
+                f"Unsupported PCM layout ({fmt.bits_per_sample}-bit, {fmt.channels} channels)"
+            )
+
+        layout = 'mono' if fmt.channels == 1 else 'stereo'
+        rate = fmt.sample_rate if fmt.sample_rate in _OPUS_SAMPLE_RATES else 48000
+        if rate != fmt.sample_rate:
+            self._resampler = av.AudioResampler(format='s16', layout=layout, rate=rate)
+
+        self._container = av.open(
+            self._sink,
+            mode='w',
+            format='webm',
+            options={
+                'live': '1',
+                'cluster_time_limit': str(self.cluster_ms),
+                'flush_packets': '1',
+            },
+        )
+        self._stream = self._container.add_stream('libopus', rate=rate)
+        self._stream.layout = layout
+        self._stream.bit_rate = self.bitrate
+
+    def _encode_pcm(self, pcm: bytes) -> bytes:
+        """Encode whole PCM frames (carrying any partial frame to the next call)"""
+        fmt = self.wav_format
+        pcm = self._remainder + pcm
+        usable = len(pcm) - (len(pcm) % fmt.frame_bytes)
+        self._remainder = pcm[usable:]
+        if usable == 0:
+            return b''
+
+        samples = np.frombuffer(pcm[:usable], dtype='<i2').reshape(1, -1)
+        frame = av.AudioFrame.from_ndarray(
+            samples,
+            format='s16',
+            layout='mono' if fmt.channels == 1 else 'stereo'
+        )
+        frame.sample_rate = fmt.sample_rate
+
+        frames = self._resampler.resample(frame) if self._resampler else [frame]
+        for out_frame in frames:
+            out_frame.pts = self._pts
+            self._pts += out_frame.samples
+            for packet in self._stream.encode(out_frame):
+                self._container.mux(packet)
+
+        return self._sink.drain()
+
+    def _fall_back(self, error: Exception) -> bytes:
+        """Switch to passthrough and release buffered input unchanged"""
+        logger.warning(f"⚠️ TTS audio not transcodable, passing through unchanged: {error}")
+        self.passthrough = True
+        self.mime_type = AUDIO_OUTPUT_FORMATS['wav']
+        buffered = bytes(self._header_buffer)
+        self._header_buffer.clear()
+        return self._emit(buffered)
+
+    def _emit(self, data: bytes) -> bytes:
+        self.output_bytes += len(data)
+        return data
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational-ratio resampler (polyphase Kaiser-windowed sinc).
+
+    Resamples by L/M (out_rate/in_rate reduced) without materializing the
+    zero-stuffed signal: each output sample is one row of the polyphase filter
+    bank dotted with the last few input samples. History between calls keeps
+    chunk boundaries seamless, and the filter delay is compensated so output
+    sample n lines up with input time n / out_rate.
+
+    Example usage:
+        resampler = PolyphaseResampler(24000, 48000, channels=1)
+        for samples in chunks:          # float32, shape (frames, channels)
+            out = resampler.process(samples)
+        out = resampler.flush()
+    """
+
+    def __init__(
+        self,
+        in_rate: int,
+        out_rate: int,
+        channels: int = 1,
+        zero_crossings: int = TTS_RESAMPLER_ZERO_CROSSINGS,
+        kaiser_beta: float = 8.6,
+    ):
+        """
+        Initialize resampler.
+
+        Args:
+            in_rate: Input sample rate
+            out_rate: Output sample rate
+            channels: Channel count (processed together)
+            zero_crossings: Sinc zero crossings on each side of the filter centre
+                            (filter quality vs. CPU)
+            kaiser_beta: Kaiser window shape (stopband attenuation)
+        """
+        divisor = math.gcd(in_rate, out_rate)
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self.channels = channels
+        self.up = out_rate // divisor
+        self.down = in_rate // divisor
+
+        # Low-pass at the lower of the two Nyquist rates (in zero-stuffed samples)
+        ratio = max(self.up, self.down)
+        cutoff = 0.5 / ratio
+        self.taps_per_phase = 2 * int(math.ceil(zero_crossings * ratio / self.up))
+        length = self.taps_per_phase * self.up
+        self._delay = length // 2
+
+        n = np.arange(length) - self._delay
+        window = np.kaiser(length + 1, kaiser_beta)[:length]
+        taps = 2 * cutoff * np.sinc(2 * cutoff * n) * window * self.up
+
+        # Polyphase bank: row p holds taps p, p + L, p + 2L, ...
+        self._bank = taps.reshape(self.taps_per_phase, self.up).T.astype(np.float32)
+
+        # Input history (leading zeros stand in for samples before the stream)
+        self._history = np.zeros((self.taps_per_phase - 1, channels), dtype=np.float32)
+        self._history_start = -(self.taps_per_phase - 1)
+        self._next_output = 0
+        self._input_frames = 0
+        self._output_frames = 0
+        self._flushed = False
+
+    @property
+    def passthrough(self) -> bool:
+        """True when input and output rates match"""
+        return self.up == self.down
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Resample the next block of input.
+
+        Args:
+            samples: float32 array of shape (frames, channels)
+
+        Returns:
+            Resampled float32 array of shape (frames, channels)
+        """
+        if self.passthrough:
+            self._input_frames += len(samples)
+            self._output_frames += len(samples)
+            return samples
+        self._input_frames += len(samples)
+        self._history = np.concatenate([self._history, samples.astype(np.float32, copy=False)])
+        return self._emit(self._available_outputs())
+
+    def flush(self) -> np.ndarray:
+        """
+        Drain the filter tail at end of stream.
+
+        Returns:
+            Remaining output, trimmed so total duration matches the input
+        """
+        if self.passthrough or self._flushed:
+            return np.zeros((0, self.channels), dtype=np.float32)
+        self._flushed = True
+
+        # Zero padding lets the outputs that look ahead of the last input be computed
+        padding = np.zeros((self.taps_per_phase, self.channels), dtype=np.float32)
+        self._history = np.concatenate([self._history, padding])
+        expected = int(round(self._input_frames * self.up / self.down))
+        return self._emit(max(0, expected - self._output_frames))
+
+    def _available_outputs(self) -> int:
+        last_input = self._history_start + len(self._history) - 1
+        last_output = (last_input * self.up + self.up - 1 - self._delay) // self.down
+        return max(0, last_output - self._next_output + 1)
+
+    def _emit(self, count: int) -> np.ndarray:
+        if count <= 0:
+            return np.zeros((0, self.channels), dtype=np.float32)
+
+        positions = (np.arange(count) + self._next_output) * self.down + self._delay
+        phases = positions % self.up
+        newest = positions // self.up - self._history_start
+
+        # (count, taps) indices of the input samples each output depends on
+        indices = newest[:, None] - np.arange(self.taps_per_phase)[None, :]
+        output = np.einsum('nk,nkc->nc', self._bank[phases], self._history[indices])
+
+        self._next_output += count
+        self._output_frames += count
+
+        # Drop history no future output needs
+        next_newest = (self._next_output * self.down + self._delay) // self.up
+        drop = min(len(self._history), max(0, next_newest - (self.taps_per_phase - 1) - self._history_start))
+        if drop:
+            self._history = self._history[drop:]
+            self._history_start += drop
+
+        return output.astype(np.float32, copy=False)
+
+
+class StreamingPCMConverter:
+    """
+    Incremental WAV → raw PCM converter for one utterance.
+
+    Parses the WAV header, maps channels, resamples to the target rate when
+    it differs (PolyphaseResampler) and emits headerless s16le chunks that
+    are a whole number of target.align_frames frames. When the source already
+    matches the target, the data chunk is passed through unchanged.
+
+    Example usage:
+        converter = StreamingPCMConverter(PCMFormat(48000, 2, align_frames=960))
+
+        async for chunk in wav_stream:
+            pcm = converter.feed(chunk)
+            if pcm:
+                sink.write_pcm(pcm)
+
+        sink.write_pcm(converter.finish())
+    """
+
+    def __init__(self, target: Optional[PCMFormat] = None):
+        """
+        Initialize PCM converter.
+
+        Args:
+            target: Output layout (defaults to TTS_PCM_SAMPLE_RATE / TTS_PCM_CHANNELS)
+        """
+        self.target = target or PCMFormat()
+        self.wav_format: Optional[WavFormat] = None
+        self.mime_type = self.target.mime_type
+
+        self._header_buffer = bytearray()
+        self._remainder = b''
+        self._pending = bytearray()
+        self._resampler: Optional[PolyphaseResampler] = None
+        self._finished = False
+
+        # Metrics
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.resampled = False
+
+    def feed(self, chunk: bytes) -> bytes:
+        """
+        Convert the next chunk of a WAV stream.
+
+        Args:
+            chunk: Next WAV bytes (any size/alignment)
+
+        Returns:
+            Raw PCM in the target layout (may be empty)
+
+        Raises:
+            ValueError: If the stream is not 16-bit PCM WAV
+        """
+        if not chunk:
+            return b''
+        self.input_bytes += len(chunk)
+
+        if self.wav_format is None:
+            self._header_buffer.extend(chunk)
+            parsed = parse_wav_header(bytes(self._header_buffer))
+            if parsed is None:
+                return b''
+            self.wav_format, data_offset = parsed
+            self._open()
+            chunk = bytes(self._header_buffer[data_offset:])
+            self._header_buffer.clear()
+
+        return self._align(self._convert(chunk))
+
+    def finish(self) -> bytes:
+        """
+        Flush the resampler tail and any partially aligned output.
+
+        Returns:
+            Remaining PCM (the last chunk may be shorter than the alignment)
+        """
+        if self._finished:
+            return b''
+        self._finished = True
+
+        tail = b''
+        if self._resampler is not None:
+            tail = self._to_bytes(self._resampler.flush())
+        self._pending.extend(tail)
+
+        # Whole frames only (a trailing odd byte can't be played)
+        usable = len(self._pending) - (len(self._pending) % self.target.frame_bytes)
+        data = bytes(self._pending[:usable])
+        self._pending.clear()
+        self.output_bytes += len(data)
+        return data
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get conversion statistics.
+
+        Returns:
+            Dictionary with byte counts and whether resampling was needed
+        """
+        return {
+            'source_rate': self.wav_format.sample_rate if self.wav_format else None,
+            'target_rate': self.target.sample_rate,
+            'resampled': self.resampled,
+            'input_bytes': self.input_bytes,
+            'output_bytes': self.output_bytes,
+        }
+
+    def _open(self) -> None:
+        """Validate the parsed WAV format and create a resampler if rates differ"""
+        fmt = self.wav_format
+        if fmt.bits_per_sample != 16 or fmt.channels not in (1, 2):
+            raise ValueError(
+                f"Unsupported PCM layout ({fmt.bits_per_sample}-bit, {fmt.channels} channels)"
+            )
+        if fmt.sample_rate != self.target.sample_rate:
+            self.resampled = True
+            self._resampler = PolyphaseResampler(
+                fmt.sample_rate, self.target.sample_rate, channels=self.target.channels
+            )
+
+    def _convert(self, pcm: bytes) -> bytes:
+        """Convert whole source frames (carrying any partial frame to the next call)"""
+        fmt = self.wav_format
+        pcm = self._remainder + pcm
+        usable = len(pcm) - (len(pcm) % fmt.frame_bytes)
+        self._remainder = pcm[usable:]
+        if usable == 0:
+            return b''
+
+        # Fast path: source already in the target layout
+        if self._resampler is None and fmt.channels == self.target.channels:
+            return pcm[:usable]
+
+        samples = np.frombuffer(pcm[:usable], dtype='<i2').reshape(-1, fmt.channels)
+        if fmt.channels != self.target.channels:
+            if self.target.channels == 2:
+                samples = np.repeat(samples, 2, axis=1)
+            else:
+                samples = samples.mean(axis=1, keepdims=True, dtype=np.float32)
+
+        if self._resampler is None:
+            return samples.astype('<i2').tobytes()
+        return self._to_bytes(self._resampler.process(samples.astype(np.float32)))
+
+    def _align(self, pcm: bytes) -> bytes:
+        """Hold back output until a whole number of aligned frames is available"""
+        chunk_bytes = self.target.frame_bytes * self.target.align_frames
+        if chunk_bytes == self.target.frame_bytes and not self._pending:
+            self.output_bytes += len(pcm)
+            return pcm
+
+        self._pending.extend(pcm)
+        usable = len(self._pending) - (len(self._pending) % chunk_bytes)
+        if usable == 0:
+            return b''
+        data = bytes(self._pending[:usable])
+        del self._pending[:usable]
+        self.output_bytes += len(data)
+        return data
+
+    @staticmethod
+    def _to_bytes(samples: np.ndarray) -> bytes:
+        return np.clip(np.rint(samples), -32768, 32767).astype('<i2').tobytes()
+
+
+def create_transcoder(
+    output_format: str,
+    pcm_format: Optional[PCMFormat] = None
+) -> Optional[Union[StreamingOpusEncoder, StreamingPCMConverter]]:
+    """
+    Create a per-utterance transcoder for a negotiated output format.
+
+    Args:
+        output_format: 'wav' (no transcoding), 'opus' or 'pcm'
+        pcm_format: Target layout for 'pcm' (defaults to TTS_PCM_SAMPLE_RATE / TTS_PCM_CHANNELS)
+
+    Returns:
+        Transcoder instance, or None if audio should be sent unchanged
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if output_format not in AUDIO_OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unsupported audio output format '{output_format}' "
+            f"(supported: {', '.join(AUDIO_OUTPUT_FORMATS)})"
+        )
+    if output_format == 'wav':
+        return None
+    if output_format == 'pcm':
+        return StreamingPCMConverter(pcm_format)
+    return StreamingOpusEncoder()
@@ -0,0 +1,191 @@
+"""
+Circuit Breaker for Backend Health Tracking
+
+Tracks the health of a remote backend (e.g. Chatterbox TTS) from the outcome
+of real requests and periodic background probes, so callers can check
+availability in O(1) instead of issuing a health request per call.
+
+States:
+- CLOSED: Backend healthy, all requests allowed
+- OPEN: Backend failing, requests rejected until recovery timeout elapses
+- HALF_OPEN: Recovery timeout elapsed, a single trial request is allowed;
+  its outcome closes or re-opens the circuit
+
+Key Design Principles:
+- O(1) state checks on the hot path (no I/O)
+- Real request failures trip the breaker directly
+- Lazy OPEN → HALF_OPEN transition (no timer tasks)
+"""
+
+import time
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitState(Enum):
+    """Circuit breaker state"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker.
+
+    Example usage:
+        breaker = CircuitBreaker(name="chatterbox", failure_threshold=3)
+
+        if not breaker.allow_request():
+            return b''  # Fail fast
+
+        try:
+            result = await do_request()
+            breaker.record_success()
+        except Exception:
+            breaker.record_failure()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        recovery_timeout_s: float = 10.0,
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            name: Backend name (used in logs and stats)
+            failure_threshold: Consecutive failures before the circuit opens
+            recovery_timeout_s: Seconds to stay open before allowing a trial request
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout_s = recovery_timeout_s
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+        # Metrics
+        self.total_successes = 0
+        self.total_failures = 0
+        self.total_rejected = 0
+        self.times_opened = 0
+        self.last_success_at: Optional[float] = None
+        self.last_failure_at: Optional[float] = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (OPEN transitions to HALF_OPEN once recovery timeout elapses)"""
+        if (
+            self._state == CircuitState.OPEN
+            and self._opened_at is not None
+            and time.monotonic() - self._opened_at >= self.recovery_timeout_s
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+            logger.info(f"🔌 Circuit half-open: {self.name} (allowing trial request)")
+        return self._state
+
+    def is_available(self) -> bool:
+        """
+        Check whether the backend is believed to be available (no side effects
+        beyond the lazy OPEN → HALF_OPEN transition).
+
+        Returns:
+            False only while the circuit is OPEN
+        """
+        return self.state != CircuitState.OPEN
+
+    def allow_request(self) -> bool:
+        """
+        Decide whether a request may proceed.
+
+        In HALF_OPEN state only one trial request is admitted at a time.
+
+        Returns:
+            True if the request should be sent to the backend
+        """
+        state = self.state
+
+        if state == CircuitState.CLOSED:
+            return True
+
+        if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+
+        self.total_rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request or probe (closes the circuit)"""
+        self.total_successes += 1
+        self.last_success_at = time.time()
+        self._consecutive_failures = 0
+        self._trial_in_flight = False
+
+        if self._state != CircuitState.CLOSED:
+            logger.info(f"✅ Circuit closed: {self.name} (backend recovered)")
+            self._state = CircuitState.CLOSED
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed request or probe (may open the circuit)"""
+        self.total_failures += 1
+        self.last_failure_at = time.time()
+        self._consecutive_failures += 1
+        self._trial_in_flight = False
+
+        # A failed trial re-opens immediately; otherwise open at threshold
+        if self._state == CircuitState.HALF_OPEN or (
+            self._state == CircuitState.CLOSED
+            and self._consecutive_failures >= self.failure_threshold
+        ):
+            self._open()
+        elif self._state == CircuitState.OPEN:
+            # Restart recovery window
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Release a HALF_OPEN trial slot without recording an outcome (e.g. cancellation)"""
+        self._trial_in_flight = False
+
+    def _open(self) -> None:
+        """Transition to OPEN state"""
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+        logger.warning(
+            f"🔌 Circuit opened: {self.name} "
+            f"(consecutive_failures={self._consecutive_failures}, "
+            f"retry_in={self.recovery_timeout_s:.1f}s)"
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get circuit breaker statistics.
+
+        Returns:
+            Dictionary with state and counters
+        """
+        return {
+            'name': self.name,
+            'state': self.state.value,
+            'consecutive_failures': self._consecutive_failures,
+            'failure_threshold': self.failure_threshold,
+            'recovery_timeout_s': self.recovery_timeout_s,
+            'total_successes': self.total_successes,
+            'total_failures': self.total_failures,
+            'total_rejected': self.total_rejected,
+            'times_opened': self.times_opened,
+            'last_success_at': self.last_success_at,
+            'last_failure_at': self.last_failure_at,
+        }
@@ -0,0 +1,392 @@
+"""
+Conversation Cache Backends
+
+ConversationService keeps each session's recent messages and rolling summary
+in a per-process cache guarded by per-process locks. With several uvicorn
+workers, each worker would build its own copy from the database and miss the
+turns other workers added. A cache backend holds the shareable part of a
+session (message window, summary) where every worker can see it, versions
+it, and provides the per-session lock that orders writers across processes.
+
+Backends:
+- memory (default): single process; the service's own cache is the only
+  copy, so nothing is stored and locking is left to the per-session
+  asyncio locks
+- shared: one JSON file per session in a tmpfs directory (/dev/shm by
+  default), replaced atomically on every write, with fcntl advisory locks;
+  needs no external service, only a directory all workers can reach
+
+Key Features:
+- Versioned entries: store() is a compare-and-set on the version the writer
+  last loaded; readers skip unchanged entries by version
+- Per-session advisory locks across processes (striped over a fixed set of
+  lock files, which are never deleted)
+- Expired entries are pruned by the service's cache cleanup task
+
+Key Design Principles:
+- The database stays the source of truth; a lost or stale entry only costs
+  a reload
+- Only plain data is shared (no ORM objects); each worker loads its own
+  Session/Agent rows
+"""
+
+import asyncio
+import fcntl
+import json
+import os
+import tempfile
+import time
+import zlib
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+CONVERSATION_CACHE_BACKEND = os.getenv('CONVERSATION_CACHE_BACKEND', 'memory').lower()
+CONVERSATION_CACHE_SHARED_DIR = os.getenv('CONVERSATION_CACHE_SHARED_DIR', '/dev/shm/voxbridge-conversations')
+CONVERSATION_CACHE_LOCK_TIMEOUT_S = float(os.getenv('CONVERSATION_CACHE_LOCK_TIMEOUT_S', '5'))
+CONVERSATION_CACHE_LOCK_STRIPES = int(os.getenv('CONVERSATION_CACHE_LOCK_STRIPES', '256'))
+
+
+class ConversationCacheError(Exception):
+    """Base exception for conversation cache backends"""
+    pass
+
+
+class ConversationCacheConflictError(ConversationCacheError):
+    """Entry changed since the writer loaded it"""
+    pass
+
+
+class ConversationCacheLockTimeout(ConversationCacheError):
+    """Session lock not acquired within the timeout"""
+    pass
+
+
+@dataclass
+class SessionSnapshot:
+    """Shareable state of one session (messages as plain dicts, chronological)"""
+    messages: List[Dict[str, Any]] = field(default_factory=list)
+    summary: Optional[str] = None
+    summary_through_id: int = 0
+    version: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SessionSnapshot':
+        return cls(
+            messages=list(data.get('messages') or []),
+            summary=data.get('summary'),
+            summary_through_id=int(data.get('summary_through_id') or 0),
+            version=int(data.get('version') or 0),
+        )
+
+
+class ConversationCacheBackend(ABC):
+    """
+    Interface for where session state is shared and how sessions are locked.
+
+    Usage:
+        backend = get_conversation_cache_backend()
+
+        async with backend.lock(session_id):
+            snapshot = await backend.load(session_id)
+            version = snapshot.version if snapshot else 0
+            ...  # change the session
+            version = await backend.store(session_id, new_snapshot, expected_version=version)
+    """
+
+    #: True if other processes see what this backend stores
+    shared = False
+
+    @abstractmethod
+    async def load(self, session_id: str, newer_than: int = 0) -> Optional[SessionSnapshot]:
+        """
+        Load a session's entry.
+
+        Args:
+            session_id: Session UUID string
+            newer_than: Version the caller already has
+
+        Returns:
+            The entry if its version is above newer_than, otherwise None
+        """
+        pass
+
+    @abstractmethod
+    async def store(self, session_id: str, snapshot: SessionSnapshot, expected_version: int) -> int:
+        """
+        Replace a session's entry (call while holding lock(session_id)).
+
+        Args:
+            session_id: Session UUID string
+            snapshot: New state (its version is ignored)
+            expected_version: Version the change was based on (0 = no entry)
+
+        Returns:
+            The new version
+
+        Raises:
+            ConversationCacheConflictError: The entry is no longer at expected_version
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> None:
+        """Drop a session's entry"""
+        pass
+
+    @abstractmethod
+    async def prune(self, max_age_s: float) -> int:
+        """Drop entries not written for max_age_s; returns how many"""
+        pass
+
+    @abstractmethod
+    def lock(self, session_id: str):
+        """Async context manager holding the session's cross-process lock"""
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Backend counters"""
+        pass
+
+
+class InProcessConversationCache(ConversationCacheBackend):
+    """
+    Single-process backend: the service's own cache is the only copy.
+
+    Nothing is stored: load() never returns an entry, store() just advances
+    the caller's version, and lock() doesn't wait.
+    """
+
+    shared = False
+
+    def __init__(self):
+        self._stores = 0
+
+    async def load(self, session_id: str, newer_than: int = 0) -> Optional[SessionSnapshot]:
+        return None
+
+    async def store(self, session_id: str, snapshot: SessionSnapshot, expected_version: int) -> int:
+        self._stores += 1
+        return expected_version + 1
+
+    async def delete(self, session_id: str) -> None:
+        pass
+
+    async def prune(self, max_age_s: float) -> int:
+        return 0
+
+    @asynccontextmanager
+    async def lock(self, session_id: str) -> AsyncIterator[None]:
+        yield
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", "stores": self._stores}
+
+
+class SharedFileConversationCache(ConversationCacheBackend):
+    """
+    Cross-process backend on a shared (tmpfs) directory.
+
+    Layout:
+        <dir>/<session_id>.json   entry (JSON, replaced atomically)
+        <dir>/lock-<n>.lock       advisory lock stripe (flock)
+
+    Entries are small (a message window and a summary) and live in memory
+    on tmpfs, so reads and writes are done inline.
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        directory: str = CONVERSATION_CACHE_SHARED_DIR,
+        lock_timeout_s: float = CONVERSATION_CACHE_LOCK_TIMEOUT_S,
+        lock_stripes: int = CONVERSATION_CACHE_LOCK_STRIPES,
+    ):
+        """
+        Initialize the backend.
+
+        Args:
+            directory: Directory shared by all workers (created if missing)
+            lock_timeout_s: How long lock() waits before giving up
+            lock_stripes: Lock files sessions are hashed onto
+        """
+        self.directory = directory
+        self.lock_timeout_s = lock_timeout_s
+        self.lock_stripes = max(1, lock_stripes)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        # session_id -> (file signature, version) of the entry last read
+        self._seen: Dict[str, Tuple[Tuple[int, int, int], int]] = {}
+
+        self._loads = 0
+        self._unchanged = 0
+        self._stores = 0
+        self._conflicts = 0
+        self._lock_waits = 0
+        self._lock_timeouts = 0
+        self._total_lock_wait_s = 0.0
+
+    def _entry_path(self, session_id: str) -> str:
+        # Session ids are UUIDs; parsing them also keeps paths inside the directory
+        return os.path.join(self.directory, f"{UUID(session_id)}.json")
+
+    def _lock_path(self, session_id: str) -> str:
+        stripe = zlib.crc32(str(UUID(session_id)).encode()) % self.lock_stripes
+        return os.path.join(self.directory, f"lock-{stripe}.lock")
+
+    def _read(self, path: str) -> Optional[SessionSnapshot]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return SessionSnapshot.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Unreadable conversation cache entry {os.path.basename(path)}: {e}")
+            return None
+
+    async def load(self, session_id: str, newer_than: int = 0) -> Optional[SessionSnapshot]:
+        path = self._entry_path(session_id)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self._seen.pop(session_id, None)
+            return None
+
+        # Unchanged file and nothing newer than what the caller has: skip parsing
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        seen = self._seen.get(session_id)
+        if seen and seen[0] == signature and seen[1] <= newer_than:
+            self._unchanged += 1
+            return None
+
+        snapshot = self._read(path)
+        self._loads += 1
+        if snapshot is None:
+            return None
+        self._seen[session_id] = (signature, snapshot.version)
+        return snapshot if snapshot.version > newer_than else None
+
+    async def store(self, session_id: str, snapshot: SessionSnapshot, expected_version: int) -> int:
+        path = self._entry_path(session_id)
+        current = self._read(path)
+        current_version = current.version if current else 0
+        if current_version != expected_version:
+            self._conflicts += 1
+            raise ConversationCacheConflictError(
+                f"Session {session_id[:8]}... is at version {current_version}, expected {expected_version}"
+            )
+
+        data = asdict(snapshot)
+        data['version'] = current_version + 1
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        stat = os.stat(path)
+        self._seen[session_id] = ((stat.st_ino, stat.st_mtime_ns, stat.st_size), data['version'])
+        self._stores += 1
+        return data['version']
+
+    async def delete(self, session_id: str) -> None:
+        self._seen.pop(session_id, None)
+        try:
+            os.unlink(self._entry_path(session_id))
+        except FileNotFoundError:
+            pass
+
+    async def prune(self, max_age_s: float) -> int:
+        cutoff = time.time() - max_age_s
+        pruned = 0
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(('.json', '.tmp')):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    pruned += 1
+            except FileNotFoundError:
+                pass
+        if pruned:
+            logger.info(f"🔄 Pruned {pruned} expired shared conversation cache entries")
+        return pruned
+
+    @asynccontextmanager
+    async def lock(self, session_id: str) -> AsyncIterator[None]:
+        fd = os.open(self._lock_path(session_id), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            start = time.monotonic()
+            delay = 0.001
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() - start >= self.lock_timeout_s:
+                        self._lock_timeouts += 1
+                        raise ConversationCacheLockTimeout(
+                            f"Lock for session {session_id[:8]}... not acquired within {self.lock_timeout_s}s"
+                        )
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 0.02)
+
+            waited = time.monotonic() - start
+            if waited > 0.001:
+                self._lock_waits += 1
+                self._total_lock_wait_s += waited
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "shared",
+            "directory": self.directory,
+            "loads": self._loads,
+            "unchanged_skips": self._unchanged,
+            "stores": self._stores,
+            "conflicts": self._conflicts,
+            "lock_waits": self._lock_waits,
+            "lock_timeouts": self._lock_timeouts,
+            "avg_lock_wait_ms": round(self._total_lock_wait_s / self._lock_waits * 1000, 2) if self._lock_waits else 0.0,
+        }
+
+
+_backend: Optional[ConversationCacheBackend] = None
+
+
+def get_conversation_cache_backend() -> ConversationCacheBackend:
+    """Get the process-wide backend selected by CONVERSATION_CACHE_BACKEND"""
+    global _backend
+    if _backend is None:
+        if CONVERSATION_CACHE_BACKEND == 'shared':
+            _backend = SharedFileConversationCache()
+            logger.info(f"🗂️ Shared conversation cache at {CONVERSATION_CACHE_SHARED_DIR}")
+        else:
+            if CONVERSATION_CACHE_BACKEND != 'memory':
+                logger.warning(f"⚠️ Unknown CONVERSATION_CACHE_BACKEND '{CONVERSATION_CACHE_BACKEND}', using memory")
+            _backend = InProcessConversationCache()
+    return _backend
+
+
+def reset_conversation_cache_backend() -> None:
+    """Drop the process-wide backend (tests)"""
+    global _backend
+    _backend = None
@@ -10,6 +10,15 @@ Key Features:
 - Support multiple concurrent sessions (async/await)
 - Load context from PostgreSQL conversations table
 - Cache conversation history (last N messages, default 20)
+- Rolling summary: turns leaving the recent window are folded into a
+  per-session summary in the background (prompts stay bounded)
+- Speculative memory prefetch from partial transcripts, reused by the
+  final context build when the final transcript matches
+- Write-behind message persistence: add_message() updates the cache and
+  queues the row; MessageWriter batches inserts across sessions
+- Pluggable cache backend: with CONVERSATION_CACHE_BACKEND=shared, uvicorn
+  workers share each session's messages and summary (versioned entries,
+  cross-process session locks)
 - TTL-based cache expiration with background cleanup task
 - Agent configuration loading from database
 - Per-session async locks for concurrency control
@@ -23,20 +32,39 @@ Design Patterns:
 
 import os
 import asyncio
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import hashlib
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import select, update, and_
 from sqlalchemy.orm import selectinload
 
-from zoneinfo import ZoneInfo
-
 from src.config.logging_config import get_logger
 from src.database.models import Agent, Session, Conversation, User
 from src.database.session import get_db_session
+from src.services.conversation_cache import (
+    ConversationCacheBackend,
+    ConversationCacheConflictError,
+    SessionSnapshot,
+    get_conversation_cache_backend,
+)
+from src.services.conversation_summary import ConversationSummarizer, get_conversation_summarizer
+from src.services.memory_prefetch import get_memory_prefetcher
 from src.services.memory_service import MemoryService
+from src.services.message_writer import MESSAGE_WRITE_BEHIND_ENABLED, MessageWriter, get_message_writer
+from src.services.prompt_builder import (
+    assemble_prompt,
+    estimate_message_tokens,
+    format_datetime_context,
+    format_summary_context,
+    history_token_budget,
+    select_history,
+)
+from src.utils.ttl_cache import get_ttl_cache
 
 # Configure logging with emoji prefixes
 logger = get_logger(__name__)
@@ -45,6 +73,21 @@ logger = get_logger(__name__)
 CONVERSATION_CACHE_TTL_MINUTES = int(os.getenv('CONVERSATION_CACHE_TTL_MINUTES', '15'))
 MAX_CONTEXT_MESSAGES = int(os.getenv('MAX_CONTEXT_MESSAGES', '20'))
 CACHE_CLEANUP_INTERVAL_SECONDS = int(os.getenv('CACHE_CLEANUP_INTERVAL_SECONDS', '60'))
+# Per-turn budgets for context lookups (a lookup that misses its budget is skipped for the turn)
+CONTEXT_TIMEZONE_TIMEOUT_MS = int(os.getenv('CONTEXT_TIMEZONE_TIMEOUT_MS', '200'))
+CONTEXT_MEMORY_TIMEOUT_MS = int(os.getenv('CONTEXT_MEMORY_TIMEOUT_MS', '400'))
+# Same role + content within this window is treated as a duplicate add_message() call
+MESSAGE_DUPLICATE_WINDOW_S = float(os.getenv('MESSAGE_DUPLICATE_WINDOW_S', '10'))
+
+
+async def _no_lookup() -> None:
+    """Placeholder for a context lookup that isn't needed this turn"""
+    return None
+
+
+def invalidate_user_timezone(*user_ids) -> None:
+    """Drop cached timezones (call after a user changes theirs; pass both id and legacy user_id)"""
+    get_ttl_cache("user_timezones").invalidate(*[str(user_id) for user_id in user_ids if user_id])
 
 
 @dataclass
@@ -57,7 +100,7 @@ class Message:
     copied from the ORM model at cache time, creating a fully independent object.
 
     Attributes:
-        id: Database primary key
+        id: Database primary key (None until a write-behind flush persists it)
         session_id: UUID of the conversation session
         role: Message role ('user', 'assistant', or 'system')
         content: Message text content
@@ -66,8 +109,9 @@ class Message:
         tts_duration_ms: Duration of TTS synthesis (nullable)
         llm_latency_ms: LLM generation latency (nullable)
         total_latency_ms: Total end-to-end latency (nullable)
+        idempotency_key: Key the row is written under (messages added in this process)
     """
-    id: int
+    id: Optional[int]
     session_id: str
     role: str
     content: str
@@ -76,6 +120,21 @@ class Message:
     tts_duration_ms: Optional[int] = None
     llm_latency_ms: Optional[int] = None
     total_latency_ms: Optional[int] = None
+    idempotency_key: Optional[str] = None
+
+
+def _message_to_dict(message: Message) -> Dict:
+    """Plain-data form of a Message for the shared cache"""
+    data = asdict(message)
+    data['timestamp'] = message.timestamp.isoformat() if message.timestamp else None
+    return data
+
+
+def _message_from_dict(data: Dict) -> Message:
+    """Message from its shared cache form"""
+    data = dict(data)
+    data['timestamp'] = datetime.fromisoformat(data['timestamp']) if data.get('timestamp') else None
+    return Message(**data)
 
 
 @dataclass
@@ -89,6 +148,12 @@ class CachedContext:
         messages: Recent conversation history as Message dataclasses (detached from SQLAlchemy)
         last_activity: Last cache access time (updated on each access)
         expires_at: When to evict from cache (last_activity + TTL)
+        history_anchor_id: First message of the last prompt's history window
+                           (kept stable so the prompt prefix is reusable)
+        summary: Rolling summary of turns no longer sent verbatim
+        summary_through_id: Last message id folded into the summary (0 = none)
+        summary_task: In-flight background fold, if any
+        version: Shared cache entry version this copy reflects
         lock: Async lock for concurrent access control
     """
     session: Session
@@ -96,6 +161,11 @@ class CachedContext:
     messages: List[Message]  # Changed from List[Conversation] to prevent detachment errors
     last_activity: datetime
     expires_at: datetime
+    history_anchor_id: Optional[int] = None
+    summary: Optional[str] = None
+    summary_through_id: int = 0
+    summary_task: Optional[asyncio.Task] = None
+    version: int = 0
     lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
 
@@ -122,7 +192,6 @@ class ConversationService:
         # Get conversation context
         context = await conv_service.get_conversation_context(
             session_id="550e8400-e29b-41d4-a716-446655440000",
-            limit=10,
             include_system_prompt=True
         )
 
@@ -144,7 +213,10 @@ class ConversationService:
     def __init__(self,
                  cache_ttl_minutes: int = CONVERSATION_CACHE_TTL_MINUTES,
                  max_context_messages: int = MAX_CONTEXT_MESSAGES,
-                 memory_service: Optional['MemoryService'] = None):
+                 memory_service: Optional['MemoryService'] = None,
+                 summarizer: Optional[ConversationSummarizer] = None,
+                 message_writer: Optional[MessageWriter] = None,
+                 cache_backend: Optional[ConversationCacheBackend] = None):
         """
         Initialize ConversationService.
 
@@ -152,10 +224,20 @@ class ConversationService:
             cache_ttl_minutes: How long to keep inactive sessions in cache (default: 15)
             max_context_messages: Maximum messages to cache per session (default: 20)
             memory_service: Optional MemoryService instance (provided by factory)
+            summarizer: Rolling summarizer (default: process-wide one, None if
+                        CONVERSATION_SUMMARY_ENABLED is off)
+            message_writer: Message persistence (default: process-wide writer)
+            cache_backend: Where session state is shared between workers
+                           (default: CONVERSATION_CACHE_BACKEND)
         """
         self._cache: Dict[str, CachedContext] = {}
         self._cache_ttl = timedelta(minutes=cache_ttl_minutes)
         self._max_context = max_context_messages
+        self._summarizer = summarizer or get_conversation_summarizer()
+        self._memory_prefetch = get_memory_prefetcher() if memory_service else None
+        self._message_writer = message_writer or get_message_writer()
+        self._write_behind = MESSAGE_WRITE_BEHIND_ENABLED
+        self._shared_cache = cache_backend or get_conversation_cache_backend()
         self._cleanup_task: Optional[asyncio.Task] = None
         self._running = False
 
@@ -170,7 +252,10 @@ class ConversationService:
         logger.info(
             f"🎤 ConversationService initialized: "
             f"cache_ttl={cache_ttl_log}, max_context={max_context_messages}, "
-            f"memory_enabled={self._memory_service is not None}"
+            f"memory_enabled={self._memory_service is not None}, "
+            f"summary_enabled={self._summarizer is not None}, "
+            f"write_behind={self._write_behind}, "
+            f"shared_cache={self._shared_cache.shared}"
         )
 
     async def start(self) -> None:
@@ -205,6 +290,9 @@ class ConversationService:
             except asyncio.CancelledError:
                 pass
 
+        # Write queued messages before the process exits
+        await self._message_writer.close()
+
         logger.info("✅ ConversationService stopped")
 
     async def get_or_create_session(
@@ -298,7 +386,7 @@ class ConversationService:
     async def get_conversation_context(
         self,
         session_id: str,
-        limit: int = 10,
+        limit: Optional[int] = None,
         include_system_prompt: bool = True
     ) -> List[Message]:
         """
@@ -306,7 +394,8 @@ class ConversationService:
 
         Args:
             session_id: UUID string for the session
-            limit: Maximum number of recent messages to return (default: 10)
+            limit: Optional cap on recent messages considered (default: None,
+                   history is sized by the agent model's token budget)
             include_system_prompt: Prepend agent's system prompt (default: True)
 
         Returns:
@@ -314,7 +403,15 @@ class ConversationService:
 
         Note:
             - Returns empty list if session not found (graceful degradation)
-            - System prompt is inserted as first message if include_system_prompt=True
+            - System prompt is inserted as first message if include_system_prompt=True,
+              unchanged across turns (prefix-cache friendly)
+            - A rolling summary of older turns, if any, follows the system prompt;
+              only turns after it are sent verbatim
+            - Date/time and memories go in one system message just before the
+              latest user message; they are looked up concurrently, outside
+              the session lock, and a lookup that misses its budget
+              (CONTEXT_TIMEZONE_TIMEOUT_MS, CONTEXT_MEMORY_TIMEOUT_MS) is
+              skipped for the turn
             - Messages are in chronological order (oldest first, newest last)
             - ✅ FIX: Messages are now loaded from DB in ASC order to match append() behavior
         """
@@ -322,137 +419,158 @@ class ConversationService:
             # Ensure session is cached
             cached = await self._ensure_session_cached(session_id)
 
+            # Snapshot under the lock; the lookups below run without it so a
+            # slow memory search never holds up add_message() for this session
             async with cached.lock:
+                # Pick up turns other workers added (shared cache backend)
+                await self._sync_from_shared(session_id, cached)
+
                 # Update activity
                 cached.last_activity = datetime.utcnow()
                 cached.expires_at = cached.last_activity + self._cache_ttl
+                unsummarized = self._unsummarized(cached)
+                summary = cached.summary
+
+            # Stable prefix: the system prompt verbatim, so provider prefix
+            # (KV) caches can reuse it and the earlier turns on every request
+            prefix = []
+            if include_system_prompt and cached.agent.system_prompt:
+                prefix.append(Message(
+                    id=0,  # System message placeholder (not from database)
+                    session_id=session_id,
+                    role="system",
+                    content=cached.agent.system_prompt,
+                    timestamp=cached.session.started_at
+                ))
+
+            # Rolling summary of older turns: changes only when a fold
+            # lands, so it stays part of the cacheable prefix between folds
+            if summary:
+                prefix.append(Message(
+                    id=0,  # System message placeholder (not from database)
+                    session_id=session_id,
+                    role="system",
+                    content=format_summary_context(summary),
+                    timestamp=cached.session.started_at
+                ))
+
+            # Volatile context (date/time, memories) changes every turn, so it
+            # goes late: just before the user message being answered.
+            # Timezone and memories are independent lookups: run them
+            # concurrently, each within its own deadline
+            include_datetime = bool(prefix and unsummarized)
+            timezone_lookup = self._with_deadline(
+                self._get_user_timezone(cached.session.user_id),
+                CONTEXT_TIMEZONE_TIMEOUT_MS, "Timezone lookup", session_id
+            ) if include_datetime else _no_lookup()
+
+            # Add user memories (VoxBridge 2.0 Phase 2: Memory System)
+            # Get last user message as query for relevant memories
+            last_user_msg = next((m for m in reversed(unsummarized) if m.role == "user"), None)
+            memory_lookup = self._with_deadline(
+                self._memory_context_for_turn(session_id, cached, last_user_msg.content),
+                CONTEXT_MEMORY_TIMEOUT_MS, "Memory retrieval", session_id
+            ) if self._memory_service and last_user_msg else _no_lookup()
+
+            user_timezone, memory_context = await asyncio.gather(timezone_lookup, memory_lookup)
+
+            volatile_parts = []
+            if include_datetime:
+                volatile_parts.append(format_datetime_context(user_timezone))  # None = default timezone
+            if memory_context:
+                volatile_parts.append(memory_context)
+
+            volatile = None
+            if volatile_parts:
+                volatile = Message(
+                    id=0,  # System message placeholder (not from database)
+                    session_id=session_id,
+                    role="system",
+                    content="\n\n".join(volatile_parts),
+                    timestamp=datetime.utcnow()
+                )
 
-                # Build message list
-                messages = []
-
-                # Add system prompt if requested
-                if include_system_prompt and cached.agent.system_prompt:
-                    # Build system prompt with date/time awareness (user's timezone)
-                    user_timezone = await self._get_user_timezone(cached.session.user_id)
-                    try:
-                        user_tz = ZoneInfo(user_timezone)
-                    except Exception:
-                        user_tz = ZoneInfo("America/Los_Angeles")
-
-                    now = datetime.now(user_tz)
-                    tz_abbrev = now.strftime('%Z')  # e.g., "PST", "EST"
-
-                    date_context = (
-                        f"\n\n[Current Date/Time Context]\n"
-                        f"Today is {now.strftime('%A, %B %d, %Y')}. "
-                        f"The current time is {now.strftime('%I:%M %p')} {tz_abbrev}."
-                    )
-                    enhanced_prompt = cached.agent.system_prompt + date_context
-
-                    messages.append(Message(
-                        id=0,  # System message placeholder (not from database)
-                        session_id=session_id,
-                        role="system",
-                        content=enhanced_prompt,
-                        timestamp=cached.session.started_at
-                    ))
-
-                # Add user memories (VoxBridge 2.0 Phase 2: Memory System)
-                if self._memory_service and cached.messages:
-                    # Get last user message as query for relevant memories
-                    last_user_msg = next((m for m in reversed(cached.messages) if m.role == "user"), None)
-                    if last_user_msg:
-                        try:
-                            # Log memory retrieval attempt
-                            query_preview = last_user_msg.content[:100] + '...' if len(last_user_msg.content) > 100 else last_user_msg.content
-                            logger.info(
-                                f"🧠 Memory retrieval started: "
-                                f"session={session_id[:8]}, "
-                                f"user={str(cached.session.user_id)[:8]}, "
-                                f"agent={str(cached.agent.id)[:8]}, "
-                                f"query=\"{query_preview}\""
-                            )
-
-                            memory_context = await self._memory_service.get_user_memory_context(
-                                user_id=cached.session.user_id,
-                                agent_id=cached.agent.id,
-                                query=last_user_msg.content,
-                                limit=5
-                            )
-
-                            if memory_context:
-                                # Log successful retrieval with content preview
-                                context_preview = memory_context[:150] + '...' if len(memory_context) > 150 else memory_context
-                                logger.info(
-                                    f"🧠 Memory retrieval successful: "
-                                    f"session={session_id[:8]}, "
-                                    f"context_length={len(memory_context)}, "
-                                    f"preview=\"{context_preview}\""
-                                )
-
-                                messages.append(Message(
-                                    id=0,  # System message placeholder (not from database)
-                                    session_id=session_id,
-                                    role="system",
-                                    content=memory_context,
-                                    timestamp=datetime.utcnow()
-                                ))
-                                logger.info(f"✅ Injected user memories into conversation context: session={session_id[:8]}")
-                            else:
-                                # Log when no memories found
-                                logger.info(
-                                    f"🧠 Memory retrieval returned empty context: "
-                                    f"session={session_id[:8]}, "
-                                    f"user={str(cached.session.user_id)[:8]}, "
-                                    f"agent={str(cached.agent.id)[:8]}"
-                                )
-                        except Exception as e:
-                            logger.error(
-                                f"❌ Memory retrieval failed: "
-                                f"session={session_id[:8]}, "
-                                f"user={str(cached.session.user_id)[:8]}, "
-                                f"error={str(e)}"
-                            )
+            # Add conversation messages that fit the model's token budget
+            # ✅ cached.messages are Message dataclasses in ASC order (oldest first)
+            # No awaits from here on, so the anchor update can't interleave
+            candidates = unsummarized[-limit:] if limit else unsummarized
+            fixed_tokens = sum(estimate_message_tokens(m) for m in prefix)
+            if volatile:
+                fixed_tokens += estimate_message_tokens(volatile)
+            budget = history_token_budget(cached.agent.llm_model, cached.agent.llm_provider, fixed_tokens)
+            history, cached.history_anchor_id = select_history(
+                candidates, budget, anchor_id=cached.history_anchor_id
+            )
 
-                # Add conversation messages (already Message dataclasses, no conversion needed)
-                # ✅ FIX: cached.messages are now in ASC order (oldest first)
-                # No need to reverse - just take last N messages directly
-                # ✅ cached.messages are already Message dataclasses, so no reconstruction needed
-                messages.extend(cached.messages[-limit:])
+            messages = assemble_prompt(prefix, history, volatile)
 
-                # DIAGNOSTIC: Log all messages being returned
-                logger.info(f"📋 [CONVERSATION_CONTEXT] Returning {len(messages)} messages for session {session_id[:8]}:")
-                for idx, msg in enumerate(messages):
-                    content_preview = msg.content[:60] + '...' if len(msg.content) > 60 else msg.content
-                    logger.info(f"   [{idx}] {msg.role}: \"{content_preview}\"")
+            # DIAGNOSTIC: Log all messages being returned
+            logger.info(f"📋 [CONVERSATION_CONTEXT] Returning {len(messages)} messages for session {session_id[:8]}:")
+            for idx, msg in enumerate(messages):
+                content_preview = msg.content[:60] + '...' if len(msg.content) > 60 else msg.content
+                logger.info(f"   [{idx}] {msg.role}: \"{content_preview}\"")
 
-                return messages
+            return messages
 
         except Exception as e:
             logger.error(f"💥 Error getting conversation context {session_id[:8]}...: {e}")
             # Graceful degradation: return empty context
             return []
 
+    def prefetch_memory_context(self, session_id: str, partial_text: str) -> None:
+        """
+        Start retrieving memories from a partial transcript (non-blocking).
+
+        The next get_conversation_context() for the session reuses the result
+        if the final transcript is close enough to the partial, taking the
+        vector search off the turn's critical path.
+
+        Args:
+            session_id: UUID string for the session
+            partial_text: Partial transcript (full text so far)
+        """
+        if not self._memory_prefetch:
+            return
+        cached = self._cache.get(session_id)
+        if not cached:
+            return  # Not loaded yet; the final context build retrieves as usual
+        try:
+            self._memory_prefetch.on_partial(
+                session_id,
+                partial_text,
+                lambda query: self._retrieve_memory_context(session_id, cached, query),
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Memory prefetch failed to start for session {session_id[:8]}: {e}")
+
     async def add_message(
         self,
         session_id: str,
         role: str,
         content: str,
         metadata: Optional[Dict] = None,
-        correlation_id: Optional[str] = None
+        correlation_id: Optional[str] = None,
+        idempotency_key: Optional[str] = None
     ) -> Message:
         """
         Add message to conversation history.
 
+        The message is added to the session cache immediately and queued for
+        a batched database write (write-behind); its id is set once the batch
+        commits. With MESSAGE_WRITE_BEHIND_ENABLED=false it is written before
+        returning.
+
         Args:
             session_id: UUID string for the session
             role: Message role ('user', 'assistant', or 'system')
             content: Message text content
             metadata: Optional metrics (audio_duration_ms, tts_duration_ms, etc.)
             correlation_id: Optional correlation ID for end-to-end tracing
+            idempotency_key: Optional caller key; repeating a call with the same
+                             key (or correlation ID) returns the first message
 
         Returns:
-            Message: The added message
+            Message: The added message (or the earlier one, for a duplicate call)
 
         Raises:
             ValueError: If session not found
@@ -461,6 +579,10 @@ class ConversationService:
         import time
         import uuid
 
+        # A caller-supplied correlation ID identifies the message, so retries are idempotent
+        key_source = idempotency_key or correlation_id or str(uuid.uuid4())
+        idempotency_key = hashlib.sha1(f"{session_id}:{role}:{key_source}".encode()).hexdigest()
+
         # Generate correlation ID if not provided
         if not correlation_id:
             correlation_id = str(uuid.uuid4())
@@ -478,102 +600,54 @@ class ConversationService:
             # Ensure session is cached
             cached = await self._ensure_session_cached(session_id)
 
-            async with cached.lock:
+            async with self._locked(session_id, cached):
                 # Update activity
                 cached.last_activity = datetime.utcnow()
                 cached.expires_at = cached.last_activity + self._cache_ttl
 
-                # Create conversation entry
-                t_db_start = time.time()
-                async with get_db_session() as db:
-                    # ✅ FIX: Check for duplicate messages and PREVENT insertion
-                    ten_seconds_ago = datetime.utcnow() - timedelta(seconds=10)
-                    existing_check = await db.execute(
-                        select(Conversation)
-                        .where(
-                            and_(
-                                Conversation.session_id == UUID(session_id),
-                                Conversation.role == role,
-                                Conversation.content == content,
-                                Conversation.timestamp >= ten_seconds_ago
-                            )
-                        )
-                    )
-                    existing = existing_check.scalar_one_or_none()
-                    if existing:
-                        logger.warning(
-                            f"🚫 [DB_DUPLICATE] Duplicate message detected - returning existing! "
-                            f"session={session_id[:8]}..., role={role}, "
-                            f"existing_id={existing.id}, existing_timestamp={existing.timestamp}"
-                        )
-
-                        # Return existing message instead of creating duplicate
-                        return Message(
-                            id=existing.id,
-                            session_id=str(existing.session_id),
-                            role=existing.role,
-                            content=existing.content,
-                            timestamp=existing.timestamp,
-                            audio_duration_ms=existing.audio_duration_ms,
-                            tts_duration_ms=existing.tts_duration_ms,
-                            llm_latency_ms=existing.llm_latency_ms,
-                            total_latency_ms=existing.total_latency_ms
-                        )
-
-                    # Create and insert new conversation (only if not duplicate)
-                    logger.info(
-                        f"💾 [DB_INSERT] Inserting message: session={session_id[:8]}..., "
-                        f"role={role}, length={len(content)} chars"
-                    )
-
-                    conversation = Conversation(
-                        session_id=UUID(session_id),
-                        role=role,
-                        content=content,
-                        audio_duration_ms=metadata.get("audio_duration_ms"),
-                        tts_duration_ms=metadata.get("tts_duration_ms"),
-                        llm_latency_ms=metadata.get("llm_latency_ms"),
-                        total_latency_ms=metadata.get("total_latency_ms")
-                    )
-                    db.add(conversation)
-                    await db.commit()
-                    await db.refresh(conversation)
-
-                    # Calculate database transaction duration
-                    t_db_end = time.time()
-                    db_duration_ms = (t_db_end - t_db_start) * 1000
-
-                    logger.info(
-                        f"✅ [DB_INSERT] Saved with id={conversation.id}, "
-                        f"timestamp={conversation.timestamp}"
+                # ✅ FIX: Check for duplicate messages and PREVENT insertion
+                # (checked against the cache, no database round trip)
+                existing = self._find_duplicate(cached, role, content, idempotency_key)
+                if existing:
+                    logger.warning(
+                        f"🚫 [DB_DUPLICATE] Duplicate message detected - returning existing! "
+                        f"session={session_id[:8]}..., role={role}, "
+                        f"existing_id={existing.id}, existing_timestamp={existing.timestamp}"
                     )
+                    return existing
 
-                # Convert ORM object to Message dataclass before adding to cache
-                # This prevents SQLAlchemy DetachedInstanceError when the database session closes
                 message = Message(
-                    id=conversation.id,
-                    session_id=str(conversation.session_id),
-                    role=conversation.role,
-                    content=conversation.content,
-                    timestamp=conversation.timestamp,
-                    audio_duration_ms=conversation.audio_duration_ms,
-                    tts_duration_ms=conversation.tts_duration_ms,
-                    llm_latency_ms=conversation.llm_latency_ms,
-                    total_latency_ms=conversation.total_latency_ms
+                    id=None,
+                    session_id=session_id,
+                    role=role,
+                    content=content,
+                    timestamp=datetime.now(timezone.utc),
+                    audio_duration_ms=metadata.get("audio_duration_ms"),
+                    tts_duration_ms=metadata.get("tts_duration_ms"),
+                    llm_latency_ms=metadata.get("llm_latency_ms"),
+                    total_latency_ms=metadata.get("total_latency_ms"),
+                    idempotency_key=idempotency_key
                 )
 
+                t_db_start = time.time()
+                if self._write_behind:
+                    self._message_writer.enqueue(message)
+                else:
+                    await self._message_writer.write(message)
+                db_duration_ms = (time.time() - t_db_start) * 1000
+
                 # Add to cache (maintain max_context limit)
-                cached.messages.append(message)  # Now appends Message dataclass, not ORM object
-                if len(cached.messages) > self._max_context:
-                    cached.messages = cached.messages[-self._max_context:]
+                cached.messages.append(message)
+                self._trim_cached_messages(cached)
+                await self._publish(session_id, cached)
 
                 # Calculate total duration
                 t_end = time.time()
                 total_duration_ms = (t_end - t_start) * 1000
 
                 logger.info(
-                    f"💾 [DB_SAVE_COMPLETE] Message saved "
-                    f"(id={conversation.id}, role={role}, "
+                    f"💾 [DB_SAVE_COMPLETE] Message {'queued' if self._write_behind else 'saved'} "
+                    f"(id={message.id}, role={role}, "
                     f"db_duration={db_duration_ms:.2f}ms, "
                     f"total_duration={total_duration_ms:.2f}ms, "
                     f"correlation_id={correlation_id[:8]}...)"
@@ -588,12 +662,55 @@ class ConversationService:
                 if role == "assistant" and self._memory_service:
                     asyncio.create_task(self._queue_memory_extraction(session_id, cached, content))
 
+                # Fold turns leaving the recent window into the rolling summary
+                if role == "assistant":
+                    self._schedule_summary_update(session_id, cached)
+
                 return message
 
         except Exception as e:
             logger.error(f"💥 Error adding message to session {session_id[:8]}...: {e}")
             raise
 
+    @staticmethod
+    def _find_duplicate(
+        cached: CachedContext,
+        role: str,
+        content: str,
+        idempotency_key: str
+    ) -> Optional[Message]:
+        """
+        Find an earlier add_message() call for the same message.
+
+        Args:
+            cached: Session cache entry
+            role: Message role
+            content: Message text
+            idempotency_key: Key of the new message
+
+        Returns:
+            The cached message with the same idempotency key (any age), or with
+            the same role and content within MESSAGE_DUPLICATE_WINDOW_S; None otherwise
+        """
+        now = datetime.now(timezone.utc)
+        in_window = True
+        for message in reversed(cached.messages):
+            # A replayed key is a duplicate however old the original is
+            if message.idempotency_key == idempotency_key:
+                return message
+            if not in_window:
+                continue
+
+            # Same role and content only counts within the time window
+            timestamp = message.timestamp
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            if (now - timestamp).total_seconds() > MESSAGE_DUPLICATE_WINDOW_S:
+                in_window = False
+            elif message.role == role and message.content == content:
+                return message
+        return None
+
     async def get_agent_config(self, session_id: str) -> Agent:
         """
         Get agent configuration for a session.
@@ -665,9 +782,12 @@ class ConversationService:
             if session_id in self._cache:
                 del self._cache[session_id]
                 logger.info(f"🎤 Removed session {session_id[:8]}... from cache")
+            if self._memory_prefetch:
+                self._memory_prefetch.discard(session_id)
 
             # Update database if persisting
             if persist:
+                await self._shared_cache.delete(session_id)
                 async with get_db_session() as db:
                     await db.execute(
                         update(Session)
@@ -716,6 +836,98 @@ class ConversationService:
         """
         return list(self._cache.keys())
 
+    async def _with_deadline(self, lookup, timeout_ms: int, label: str, session_id: str):
+        """
+        Await a context lookup within its per-turn budget.
+
+        Args:
+            lookup: Lookup coroutine
+            timeout_ms: Budget in milliseconds
+            label: Lookup name for logs
+            session_id: Session ID for logs
+
+        Returns:
+            Lookup result, or None if it missed its budget (the lookup is cancelled)
+        """
+        t_start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(lookup, timeout=timeout_ms / 1000)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"⏱️ {label} skipped for this turn: "
+                f"session={session_id[:8]}, budget={timeout_ms}ms"
+            )
+            return None
+        finally:
+            logger.debug(f"⏱️ {label} took {(time.perf_counter() - t_start) * 1000:.1f}ms (session={session_id[:8]})")
+
+    async def _memory_context_for_turn(self, session_id: str, cached: CachedContext, query: str) -> Optional[str]:
+        """Prefetched memories if they match the final query, otherwise a fresh retrieval"""
+        if self._memory_prefetch:
+            prefetched = self._memory_prefetch.take(session_id, query)
+            if prefetched is not None:
+                return await prefetched
+        return await self._retrieve_memory_context(session_id, cached, query)
+
+    async def _retrieve_memory_context(self, session_id: str, cached: CachedContext, query: str) -> Optional[str]:
+        """
+        Retrieve user memories relevant to the latest user message.
+
+        Args:
+            session_id: Session ID
+            cached: Cached context (user and agent)
+            query: Latest user message
+
+        Returns:
+            Memory context block, or None if nothing relevant was found or retrieval failed
+        """
+        try:
+            # Log memory retrieval attempt
+            query_preview = query[:100] + '...' if len(query) > 100 else query
+            logger.info(
+                f"🧠 Memory retrieval started: "
+                f"session={session_id[:8]}, "
+                f"user={str(cached.session.user_id)[:8]}, "
+                f"agent={str(cached.agent.id)[:8]}, "
+                f"query=\"{query_preview}\""
+            )
+
+            memory_context = await self._memory_service.get_user_memory_context(
+                user_id=cached.session.user_id,
+                agent_id=cached.agent.id,
+                query=query,
+                limit=5
+            )
+
+            if memory_context:
+                # Log successful retrieval with content preview
+                context_preview = memory_context[:150] + '...' if len(memory_context) > 150 else memory_context
+                logger.info(
+                    f"🧠 Memory retrieval successful: "
+                    f"session={session_id[:8]}, "
+                    f"context_length={len(memory_context)}, "
+                    f"preview=\"{context_preview}\""
+                )
+                logger.info(f"✅ Injected user memories into conversation context: session={session_id[:8]}")
+                return memory_context
+
+            # Log when no memories found
+            logger.info(
+                f"🧠 Memory retrieval returned empty context: "
+                f"session={session_id[:8]}, "
+                f"user={str(cached.session.user_id)[:8]}, "
+                f"agent={str(cached.agent.id)[:8]}"
+            )
+            return None
+        except Exception as e:
+            logger.error(
+                f"❌ Memory retrieval failed: "
+                f"session={session_id[:8]}, "
+                f"user={str(cached.session.user_id)[:8]}, "
+                f"error={str(e)}"
+            )
+            return None
+
     async def _get_user_timezone(self, user_id: str) -> str:
         """
         Get the user's timezone preference from the database.
@@ -729,6 +941,11 @@ class ConversationService:
 
         Returns:
             str: IANA timezone string (e.g., "America/Los_Angeles")
+
+        Note:
+            Cached per user (LOOKUP_CACHE_TTL_S); the preferences route
+            invalidates it via invalidate_user_timezone(). Lookup errors
+            return the default and are not cached.
         """
         default_tz = "America/Los_Angeles"
 
@@ -736,43 +953,51 @@ class ConversationService:
             return default_tz
 
         try:
-            async with get_db_session() as db:
-                # Try to find user by UUID first
-                try:
-                    user_uuid = UUID(user_id)
-                    result = await db.execute(
-                        select(User.timezone).where(User.id == user_uuid)
-                    )
-                    timezone = result.scalar_one_or_none()
-                    if timezone:
-                        return timezone
-                except ValueError:
-                    pass  # Not a valid UUID, try legacy lookup
+            timezone = await get_ttl_cache("user_timezones").get_or_load(
+                str(user_id), lambda: self._load_user_timezone(str(user_id))
+            )
+            return timezone or default_tz
+        except Exception as e:
+            logger.debug(f"⚠️ Could not fetch user timezone: {e}")
+            return default_tz
 
-                # Fallback: try legacy user_id field
+    async def _load_user_timezone(self, user_id: str) -> Optional[str]:
+        """Read a user's timezone from the database (None if the user has none)"""
+        async with get_db_session() as db:
+            # Try to find user by UUID first
+            try:
+                user_uuid = UUID(user_id)
                 result = await db.execute(
-                    select(User.timezone).where(User.user_id == user_id)
+                    select(User.timezone).where(User.id == user_uuid)
                 )
                 timezone = result.scalar_one_or_none()
                 if timezone:
                     return timezone
+            except ValueError:
+                pass  # Not a valid UUID, try legacy lookup
 
-                return default_tz
-        except Exception as e:
-            logger.debug(f"⚠️ Could not fetch user timezone: {e}")
-            return default_tz
+            # Fallback: try legacy user_id field
+            result = await db.execute(
+                select(User.timezone).where(User.user_id == user_id)
+            )
+            return result.scalar_one_or_none()
 
-    async def _load_session_from_db(self, session_id: str) -> Optional[CachedContext]:
+    async def _load_session_from_db(self, session_id: str, load_messages: bool = True) -> Optional[CachedContext]:
         """
         Load session from database and create cache entry.
 
         Args:
             session_id: UUID string for the session
+            load_messages: Load recent messages too (False when the shared
+                           cache already has them)
 
         Returns:
             Optional[CachedContext]: Cache entry if session found, None otherwise
         """
         try:
+            # Messages still queued for write-behind must be in the table we read
+            await self._message_writer.flush()
+
             async with get_db_session() as db:
                 # Load session with agent (eager loading)
                 result = await db.execute(
@@ -786,15 +1011,28 @@ class ConversationService:
                     logger.warning(f"⚠️ Session {session_id[:8]}... not found in database")
                     return None
 
-                # Load recent messages in ASC order (oldest first)
-                # This matches the order when we append() new messages to the cache
-                result = await db.execute(
-                    select(Conversation)
-                    .where(Conversation.session_id == UUID(session_id))
-                    .order_by(Conversation.timestamp.asc())
-                    .limit(self._max_context)
-                )
-                orm_messages = list(result.scalars().all())
+                # Rolling summary (ignore anything that isn't a stored value)
+                summary = session.conversation_summary
+                summary = summary if isinstance(summary, str) and summary else None
+                through_id = session.summary_through_id
+                through_id = through_id if isinstance(through_id, int) and summary else 0
+
+                orm_messages = []
+                if load_messages:
+                    # Load the most recent messages not yet in the summary, then
+                    # reverse to ASC order (oldest first) to match append() order
+                    result = await db.execute(
+                        select(Conversation)
+                        .where(
+                            and_(
+                                Conversation.session_id == UUID(session_id),
+                                Conversation.id > through_id
+                            )
+                        )
+                        .order_by(Conversation.timestamp.desc())
+                        .limit(self._max_context)
+                    )
+                    orm_messages = list(reversed(result.scalars().all()))
 
                 # Convert ORM objects to Message dataclasses immediately
                 # This prevents SQLAlchemy DetachedInstanceError when the database session closes
@@ -820,7 +1058,9 @@ class ConversationService:
                     agent=session.agent,
                     messages=messages,  # Now stores Message dataclasses, not ORM objects
                     last_activity=now,
-                    expires_at=now + self._cache_ttl
+                    expires_at=now + self._cache_ttl,
+                    summary=summary,
+                    summary_through_id=through_id
                 )
 
                 logger.debug(
@@ -880,6 +1120,143 @@ class ConversationService:
         except Exception as e:
             logger.error(f"❌ Failed to queue memory extraction for session {session_id[:8]}: {e}")
 
+    def _unsummarized(self, cached: CachedContext) -> List[Message]:
+        """Cached messages newer than the rolling summary (unsaved ones included)"""
+        if not cached.summary_through_id:
+            return list(cached.messages)
+        return [m for m in cached.messages if not m.id or m.id > cached.summary_through_id]
+
+    def _trim_cached_messages(self, cached: CachedContext) -> None:
+        """
+        Keep the cache at max_context messages.
+
+        With summarization on, messages not yet folded into the summary are
+        kept past that (up to twice max_context) so a slow or deferred fold
+        doesn't lose them.
+        """
+        keep = self._max_context
+        if self._summarizer:
+            pending = len(self._unsummarized(cached))
+            keep = min(max(keep, pending), 2 * self._max_context)
+        if len(cached.messages) > keep:
+            cached.messages = cached.messages[-keep:]
+
+    def _schedule_summary_update(self, session_id: str, cached: CachedContext) -> None:
+        """Start a background fold if enough turns have left the recent window"""
+        if not self._summarizer:
+            return
+        if cached.summary_task and not cached.summary_task.done():
+            return  # One fold per session at a time; the next turn picks up the rest
+        if not self._summarizer.select_fold(self._unsummarized(cached)):
+            return
+        cached.summary_task = asyncio.create_task(self._update_summary(session_id, cached))
+
+    async def _update_summary(self, session_id: str, cached: CachedContext) -> None:
+        """
+        Fold older turns into the session's rolling summary (background task).
+
+        The LLM call runs without the session lock, so turns keep flowing
+        while the summary is written; prompts use the previous summary (and
+        the turns it doesn't cover yet) until the new one lands.
+
+        Args:
+            session_id: Session ID
+            cached: Cached context to update
+        """
+        try:
+            async with self._locked(session_id, cached):
+                fold = self._summarizer.select_fold(self._unsummarized(cached))
+                previous = cached.summary
+                through_id = cached.summary_through_id
+            if not fold:
+                return
+
+            summary = await self._summarizer.summarize(cached.agent, previous, fold)
+            if not summary:
+                return  # Deferred or failed: retried after a later turn
+
+            async with self._locked(session_id, cached):
+                if cached.summary_through_id != through_id:
+                    return  # Superseded (session reloaded, or another worker folded)
+                cached.summary = summary
+                cached.summary_through_id = fold[-1].id
+                self._trim_cached_messages(cached)
+                await self._publish(session_id, cached)
+
+            await self._persist_summary(session_id, summary, fold[-1].id)
+
+            logger.info(
+                f"📝 Updated rolling summary for session {session_id[:8]}... "
+                f"(through message {fold[-1].id}, {len(self._unsummarized(cached))} recent messages)"
+            )
+
+        except Exception as e:
+            logger.error(f"❌ Failed to update rolling summary for session {session_id[:8]}: {e}")
+
+    async def _persist_summary(self, session_id: str, summary: str, through_id: int) -> None:
+        """Store the rolling summary alongside the session"""
+        async with get_db_session() as db:
+            await db.execute(
+                update(Session)
+                .where(Session.id == UUID(session_id))
+                .values(conversation_summary=summary, summary_through_id=through_id)
+            )
+            await db.commit()
+
+    @asynccontextmanager
+    async def _locked(self, session_id: str, cached: CachedContext):
+        """
+        Hold a session for a change: its asyncio lock, then its cross-process
+        lock, with the cached copy brought up to date from the shared cache.
+        """
+        async with cached.lock:
+            async with self._shared_cache.lock(session_id):
+                await self._sync_from_shared(session_id, cached)
+                yield
+
+    async def _sync_from_shared(self, session_id: str, cached: CachedContext) -> None:
+        """Apply the shared entry if another worker changed the session"""
+        snapshot = await self._shared_cache.load(session_id, newer_than=cached.version)
+        if snapshot:
+            self._apply_snapshot(cached, snapshot)
+
+    def _apply_snapshot(self, cached: CachedContext, snapshot: SessionSnapshot) -> None:
+        """
+        Replace the cached messages and summary with a shared entry.
+
+        Messages this worker already has are kept as the same objects (matched
+        by idempotency key), so ids set by its write-behind flushes still land
+        on them.
+        """
+        local = {m.idempotency_key: m for m in cached.messages if m.idempotency_key}
+        messages = []
+        for data in snapshot.messages:
+            message = local.get(data.get('idempotency_key'))
+            if message is None:
+                message = _message_from_dict(data)
+            elif message.id is None and data.get('id'):
+                message.id = data['id']
+            messages.append(message)
+
+        cached.messages = messages
+        cached.summary = snapshot.summary
+        cached.summary_through_id = snapshot.summary_through_id
+        cached.version = snapshot.version
+
+    async def _publish(self, session_id: str, cached: CachedContext) -> None:
+        """Store the cached messages and summary for other workers (caller holds the session)"""
+        snapshot = SessionSnapshot(
+            messages=[_message_to_dict(m) for m in cached.messages],
+            summary=cached.summary,
+            summary_through_id=cached.summary_through_id,
+        )
+        try:
+            cached.version = await self._shared_cache.store(session_id, snapshot, expected_version=cached.version)
+        except ConversationCacheConflictError as e:
+            # Entry pruned or written without the lock: resync on next access
+            logger.warning(f"⚠️ Shared conversation cache conflict: {e}")
+            cached.version = 0
+
     async def _cleanup_expired_cache(self) -> None:
         """
         Background task to remove expired cache entries.
@@ -903,6 +1280,9 @@ class ConversationService:
                 for session_id in expired:
                     del self._cache[session_id]
 
+                # Entries no worker has written for a full TTL
+                await self._shared_cache.prune(self._cache_ttl.total_seconds())
+
                 if expired:
                     logger.info(
                         f"🔄 Cleaned up {len(expired)} expired sessions from cache "
@@ -933,10 +1313,22 @@ class ConversationService:
         if session_id in self._cache:
             return self._cache[session_id]
 
-        # Load from database
-        cached = await self._load_session_from_db(session_id)
-        if not cached:
-            raise ValueError(f"Session {session_id} not found")
+        # One loader per session across workers; the rest reuse its entry
+        async with self._shared_cache.lock(session_id):
+            if session_id in self._cache:
+                return self._cache[session_id]
+
+            snapshot = await self._shared_cache.load(session_id)
+
+            # Load from database (messages only if no worker has them cached)
+            cached = await self._load_session_from_db(session_id, load_messages=snapshot is None)
+            if not cached:
+                raise ValueError(f"Session {session_id} not found")
+
+            if snapshot:
+                self._apply_snapshot(cached, snapshot)
+            else:
+                await self._publish(session_id, cached)
 
         # Add to cache
         self._cache[session_id] = cached
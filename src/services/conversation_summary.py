@@ -0,0 +1,249 @@
+"""
+Rolling Conversation Summarization
+
+Keeps long sessions from growing the prompt without bound. Instead of
+sending every earlier turn verbatim (or silently dropping the oldest once
+the history budget is full), turns that leave the recent window are folded
+into a per-session running summary, and prompts are built from that summary
+plus the most recent turns.
+
+Key Features:
+- Incremental: each fold sends only the previous summary and the turns being
+  folded, never the whole history
+- Batched: turns are folded several at a time, so the summary message (and
+  the prompt prefix providers cache) stays unchanged between folds
+- Background: folds run at BACKGROUND priority on the agent's own LLM after
+  the turn has been answered; a rejected or failed fold is retried after a
+  later turn
+- Bounded output: summaries are capped at CONVERSATION_SUMMARY_MAX_WORDS
+  (hard cut at twice that if the model ignores the instruction)
+
+Key Design Principles:
+- Never on the interactive path: callers schedule folds and move on
+- Pure fold selection (select_fold) so cache trimming and tests can reason
+  about what is still unsummarized
+"""
+
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from src.config.logging_config import get_logger
+from src.services.llm_scheduler import LLMPriority, LLMRequestRejectedError
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+CONVERSATION_SUMMARY_ENABLED = os.getenv('CONVERSATION_SUMMARY_ENABLED', 'true').lower() in ('true', '1', 'yes')
+CONVERSATION_SUMMARY_RECENT_MESSAGES = int(os.getenv('CONVERSATION_SUMMARY_RECENT_MESSAGES', '8'))
+CONVERSATION_SUMMARY_FOLD_MESSAGES = int(os.getenv('CONVERSATION_SUMMARY_FOLD_MESSAGES', '8'))
+CONVERSATION_SUMMARY_MAX_WORDS = int(os.getenv('CONVERSATION_SUMMARY_MAX_WORDS', '200'))
+
+SUMMARY_INSTRUCTIONS = (
+    "You maintain a running summary of a voice conversation between a user and an assistant. "
+    "Update the current summary with the new turns. Keep names, facts, preferences, decisions, "
+    "open questions and anything the assistant promised to do; drop greetings and small talk. "
+    "Write plain prose in the third person, at most {max_words} words. Reply with the summary only."
+)
+
+# generate(agent, messages) -> summary text
+GenerateFn = Callable[[Any, List[Dict[str, str]]], Awaitable[str]]
+
+
+def select_fold(
+    unsummarized: Sequence,
+    keep_recent: int = CONVERSATION_SUMMARY_RECENT_MESSAGES,
+    fold_batch: int = CONVERSATION_SUMMARY_FOLD_MESSAGES,
+) -> List:
+    """
+    Pick the messages to fold into the summary.
+
+    Nothing is folded until at least fold_batch messages sit outside the
+    keep_recent newest ones; then all of them are. The cut is moved back so
+    the recent window starts on a user message, and messages without a
+    database id (not yet persisted) are never folded.
+
+    Args:
+        unsummarized: Messages newer than the summary, chronological
+        keep_recent: Newest messages always sent verbatim
+        fold_batch: Minimum messages per fold
+
+    Returns:
+        Oldest messages to fold (empty if it's not time yet)
+    """
+    cut = len(unsummarized) - keep_recent
+    if cut < fold_batch:
+        return []
+
+    while cut > 0 and unsummarized[cut].role != 'user':
+        cut -= 1
+
+    fold = list(unsummarized[:cut])
+    persisted = 0
+    while persisted < len(fold) and getattr(fold[persisted], 'id', None):
+        persisted += 1
+    fold = fold[:persisted]
+    return fold if len(fold) >= fold_batch else []
+
+
+def build_summary_messages(
+    previous: Optional[str],
+    messages: Sequence,
+    max_words: int = CONVERSATION_SUMMARY_MAX_WORDS,
+) -> List[Dict[str, str]]:
+    """
+    Build the summarization request.
+
+    Args:
+        previous: Current summary, if any
+        messages: Turns to fold in (chronological)
+        max_words: Summary length limit
+
+    Returns:
+        Chat messages ({role, content} dicts)
+    """
+    turns = "\n".join(
+        f"{'User' if m.role == 'user' else 'Assistant'}: {m.content}"
+        for m in messages
+        if m.role in ('user', 'assistant')
+    )
+    return [
+        {"role": "system", "content": SUMMARY_INSTRUCTIONS.format(max_words=max_words)},
+        {"role": "user", "content": f"Current summary:\n{previous or '(none)'}\n\nNew turns:\n{turns}"},
+    ]
+
+
+async def generate_with_agent_llm(agent, messages: List[Dict[str, str]]) -> str:
+    """Run a summarization request on the agent's LLM at background priority"""
+    from src.services.llm_service import LLMConfig, ProviderType, get_llm_service_for_agent
+
+    llm_service = await get_llm_service_for_agent(agent)
+    config = LLMConfig(
+        provider=ProviderType(agent.llm_provider),
+        model=agent.llm_model,
+        temperature=0.2,
+    )
+    return await llm_service.generate_response(
+        session_id="conversation_summary",
+        messages=messages,
+        config=config,
+        stream=False,
+        priority=LLMPriority.BACKGROUND,
+    )
+
+
+class ConversationSummarizer:
+    """
+    Folds older conversation turns into a running summary.
+
+    Usage:
+        summarizer = get_conversation_summarizer()
+        fold = summarizer.select_fold(unsummarized_messages)
+        if fold:
+            summary = await summarizer.summarize(agent, previous_summary, fold)
+    """
+
+    def __init__(
+        self,
+        generate: Optional[GenerateFn] = None,
+        keep_recent: int = CONVERSATION_SUMMARY_RECENT_MESSAGES,
+        fold_batch: int = CONVERSATION_SUMMARY_FOLD_MESSAGES,
+        max_words: int = CONVERSATION_SUMMARY_MAX_WORDS,
+    ):
+        """
+        Initialize the summarizer.
+
+        Args:
+            generate: Coroutine producing the summary (default: agent's LLM)
+            keep_recent: Newest messages always sent verbatim
+            fold_batch: Minimum messages per fold
+            max_words: Summary length limit
+        """
+        self.generate = generate or generate_with_agent_llm
+        self.keep_recent = max(2, keep_recent)
+        self.fold_batch = max(2, fold_batch)
+        self.max_words = max_words
+
+        self._folds = 0
+        self._messages_folded = 0
+        self._rejected = 0
+        self._failures = 0
+        self._total_fold_s = 0.0
+
+    def select_fold(self, unsummarized: Sequence) -> List:
+        """Messages to fold now (see select_fold)"""
+        return select_fold(unsummarized, self.keep_recent, self.fold_batch)
+
+    async def summarize(self, agent, previous: Optional[str], messages: Sequence) -> Optional[str]:
+        """
+        Fold messages into the previous summary.
+
+        Args:
+            agent: Agent whose LLM writes the summary
+            previous: Current summary, if any
+            messages: Turns to fold in (chronological)
+
+        Returns:
+            New summary, or None if the fold should be retried later
+        """
+        start = time.perf_counter()
+        try:
+            summary = await self.generate(agent, build_summary_messages(previous, messages, self.max_words))
+        except LLMRequestRejectedError as e:
+            self._rejected += 1
+            logger.info(f"📝 Summary fold deferred (LLM busy): {e}")
+            return None
+        except Exception as e:
+            self._failures += 1
+            logger.warning(f"⚠️ Summary fold failed: {e}")
+            return None
+
+        words = (summary or '').split()
+        if not words:
+            self._failures += 1
+            logger.warning("⚠️ Summary fold returned empty text")
+            return None
+        if len(words) > self.max_words * 2:
+            words = words[:self.max_words * 2]
+
+        elapsed = time.perf_counter() - start
+        self._folds += 1
+        self._messages_folded += len(messages)
+        self._total_fold_s += elapsed
+        logger.info(
+            f"📝 Folded {len(messages)} messages into summary "
+            f"({len(words)} words, {elapsed * 1000:.0f}ms)"
+        )
+        return " ".join(words)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Fold counters and average fold duration"""
+        return {
+            "folds": self._folds,
+            "messages_folded": self._messages_folded,
+            "rejected": self._rejected,
+            "failures": self._failures,
+            "avg_fold_ms": round(self._total_fold_s / self._folds * 1000, 1) if self._folds else 0.0,
+            "keep_recent": self.keep_recent,
+            "fold_batch": self.fold_batch,
+            "max_words": self.max_words,
+        }
+
+
+_summarizer: Optional[ConversationSummarizer] = None
+
+
+def get_conversation_summarizer() -> Optional[ConversationSummarizer]:
+    """Get the process-wide summarizer (None if CONVERSATION_SUMMARY_ENABLED is off)"""
+    global _summarizer
+    if not CONVERSATION_SUMMARY_ENABLED:
+        return None
+    if _summarizer is None:
+        _summarizer = ConversationSummarizer()
+    return _summarizer
+
+
+def reset_conversation_summarizer() -> None:
+    """Drop the process-wide summarizer (tests)"""
+    global _summarizer
+    _summarizer = None
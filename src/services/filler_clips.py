@@ -0,0 +1,295 @@
+"""
+Filler / Backchannel Clip Bank
+
+Masks perceived latency while the LLM is producing its first token. A short
+clip ("Mm-hm.", "Let me check.", "One sec.") is synthesized once per agent
+voice, held in memory, and played when no LLM token has arrived within a
+configurable budget. Real response audio is queued behind it, so the filler
+splices cleanly ahead of the answer.
+
+Key Features:
+- Per-agent, per-voice clip bank (re-synthesized when the agent's voice changes)
+- Background warm-up (never blocks a conversation turn)
+- Budget-based firing policy driven by a first-token event
+- Fire-rate metrics
+
+Key Design Principles:
+- Fillers are optional: if the bank isn't warm yet, nothing is played
+- Clips rotate so the same phrase isn't repeated back-to-back
+- Synthesis uses per-utterance TTS IDs so it never cancels session TTS
+"""
+
+import asyncio
+import os
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.config.logging_config import get_logger
+from src.services.tts_scheduler import TTSPriority
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+FILLER_ENABLED = os.getenv('FILLER_ENABLED', 'false').lower() in ['true', '1', 'yes']
+FILLER_BUDGET_MS = int(os.getenv('FILLER_BUDGET_MS', '1200'))
+FILLER_PHRASES = [
+    phrase.strip()
+    for phrase in os.getenv('FILLER_PHRASES', 'Mm-hm.|Let me check.|One sec.|Hmm, let me think.').split('|')
+    if phrase.strip()
+]
+
+
+@dataclass
+class FillerClip:
+    """
+    A pre-synthesized filler phrase.
+
+    Attributes:
+        phrase: Text that was synthesized
+        audio: Complete WAV audio
+    """
+    phrase: str
+    audio: bytes
+
+
+@dataclass
+class _VoiceBank:
+    """Clips synthesized for one agent voice configuration"""
+    voice_key: Tuple
+    clips: List[FillerClip]
+    next_index: int = 0
+
+
+def voice_key_for_agent(agent: Any) -> Tuple:
+    """
+    Build the voice identity of an agent (a change triggers re-synthesis).
+
+    Args:
+        agent: Agent model instance
+
+    Returns:
+        Tuple of the agent's TTS parameters
+    """
+    return (
+        agent.tts_voice or os.getenv('CHATTERBOX_VOICE_ID', 'default'),
+        agent.tts_exaggeration,
+        agent.tts_cfg_weight,
+        agent.tts_temperature,
+        agent.tts_language or 'en',
+    )
+
+
+class FillerClipBank:
+    """
+    In-memory filler clips per agent voice plus the firing policy.
+
+    Example usage:
+        bank = get_filler_clip_bank()
+        bank.ensure_warm(agent)  # Background synthesis on startup / voice change
+
+        first_token = asyncio.Event()
+        filler_task = asyncio.create_task(
+            bank.play_if_slow(agent, first_token, play=send_clip)
+        )
+        # ... set first_token when the LLM emits its first chunk ...
+        first_token.set()
+        await filler_task  # Filler (if any) is queued before real audio
+    """
+
+    def __init__(
+        self,
+        tts_service: Any,
+        phrases: Optional[List[str]] = None,
+        enabled: bool = FILLER_ENABLED,
+        budget_ms: int = FILLER_BUDGET_MS,
+    ):
+        """
+        Initialize filler clip bank.
+
+        Args:
+            tts_service: TTSService used to synthesize clips
+            phrases: Filler phrases (defaults to FILLER_PHRASES)
+            enabled: Whether fillers may fire
+            budget_ms: Wait this long for the first LLM token before firing
+        """
+        self.tts_service = tts_service
+        self.phrases = phrases if phrases is not None else list(FILLER_PHRASES)
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+
+        self._banks: Dict[str, _VoiceBank] = {}  # agent_id → clips
+        self._warming: Dict[str, asyncio.Task] = {}  # agent_id → warm-up task
+
+        # Metrics
+        self.turns = 0
+        self.fired = 0
+        self.not_ready = 0
+        self.clips_synthesized = 0
+
+    def is_warm(self, agent: Any) -> bool:
+        """Check whether clips for the agent's current voice are loaded"""
+        bank = self._banks.get(str(agent.id))
+        return bank is not None and bank.voice_key == voice_key_for_agent(agent) and bool(bank.clips)
+
+    def ensure_warm(self, agent: Any) -> None:
+        """
+        Start background synthesis if the agent's clips are missing or stale.
+
+        Args:
+            agent: Agent model instance
+        """
+        if not self.enabled or not self.phrases or self.is_warm(agent):
+            return
+
+        agent_id = str(agent.id)
+        task = self._warming.get(agent_id)
+        if task is not None and not task.done():
+            return
+
+        task = asyncio.create_task(self.warm(agent))
+        self._warming[agent_id] = task
+        task.add_done_callback(lambda _: self._warming.pop(agent_id, None))
+
+    async def warm(self, agent: Any) -> int:
+        """
+        Synthesize all filler phrases for the agent's current voice.
+
+        Args:
+            agent: Agent model instance
+
+        Returns:
+            Number of clips held for the agent
+        """
+        voice_key = voice_key_for_agent(agent)
+        voice_id, exaggeration, cfg_weight, temperature, language = voice_key
+
+        clips = []
+        for phrase in self.phrases:
+            try:
+                audio = await self.tts_service.synthesize_speech(
+                    session_id=f"filler-{agent.id}",
+                    text=phrase,
+                    voice_id=voice_id,
+                    exaggeration=exaggeration,
+                    cfg_weight=cfg_weight,
+                    temperature=temperature,
+                    language_id=language,
+                    stream=False,
+                    callback=None,
+                    utterance_id=f"filler-{uuid.uuid4()}",
+                    priority=TTSPriority.BACKGROUND,
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Filler synthesis failed for \"{phrase}\": {e}")
+                continue
+
+            if audio:
+                clips.append(FillerClip(phrase=phrase, audio=audio))
+
+        self.clips_synthesized += len(clips)
+        if clips:
+            self._banks[str(agent.id)] = _VoiceBank(voice_key=voice_key, clips=clips)
+            logger.info(f"💬 Filler clips ready for agent {agent.name} ({len(clips)}/{len(self.phrases)} phrases)")
+        else:
+            logger.warning(f"⚠️ No filler clips synthesized for agent {agent.name}")
+
+        return len(clips)
+
+    def pick(self, agent: Any) -> Optional[FillerClip]:
+        """
+        Pick the next filler clip for the agent (rotating).
+
+        Args:
+            agent: Agent model instance
+
+        Returns:
+            Clip, or None if the bank isn't warm for the agent's current voice
+        """
+        if not self.is_warm(agent):
+            return None
+        bank = self._banks[str(agent.id)]
+        clip = bank.clips[bank.next_index % len(bank.clips)]
+        bank.next_index += 1
+        return clip
+
+    async def play_if_slow(
+        self,
+        agent: Any,
+        first_token: asyncio.Event,
+        play: Callable[[FillerClip], Awaitable[None]],
+    ) -> bool:
+        """
+        Play a filler if no LLM token arrives within the budget.
+
+        Args:
+            agent: Agent model instance
+            first_token: Set when the LLM emits its first chunk (or the turn ends)
+            play: Async callable that queues the clip ahead of response audio
+
+        Returns:
+            True if a filler was played
+        """
+        if not self.enabled:
+            return False
+
+        self.turns += 1
+        self.ensure_warm(agent)
+
+        try:
+            await asyncio.wait_for(first_token.wait(), timeout=self.budget_ms / 1000)
+            return False
+        except asyncio.TimeoutError:
+            pass
+
+        clip = self.pick(agent)
+        if clip is None:
+            self.not_ready += 1
+            return False
+
+        self.fired += 1
+        logger.info(f"💬 No LLM token after {self.budget_ms}ms, playing filler \"{clip.phrase}\"")
+        await play(clip)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get filler statistics.
+
+        Returns:
+            Dictionary with fire counts and rate
+        """
+        return {
+            'enabled': self.enabled,
+            'budget_ms': self.budget_ms,
+            'turns': self.turns,
+            'fired': self.fired,
+            'not_ready': self.not_ready,
+            'fire_rate': (self.fired / self.turns) if self.turns else 0.0,
+            'agents_warm': len(self._banks),
+            'clips_synthesized': self.clips_synthesized,
+        }
+
+
+# Singleton instance (shared by Discord plugin and WebRTC handlers)
+_filler_clip_bank: Optional[FillerClipBank] = None
+
+
+def get_filler_clip_bank() -> FillerClipBank:
+    """
+    Get the shared FillerClipBank instance.
+
+    Returns:
+        Shared filler clip bank (backed by the shared TTSService)
+    """
+    global _filler_clip_bank
+    if _filler_clip_bank is None:
+        from src.services.tts_service import get_tts_service
+        _filler_clip_bank = FillerClipBank(tts_service=get_tts_service())
+    return _filler_clip_bank
+
+
+def reset_filler_clip_bank() -> None:
+    """Drop the shared bank (next get_filler_clip_bank() creates a fresh one)"""
+    global _filler_clip_bank
+    _filler_clip_bank = None
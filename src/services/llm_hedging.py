@@ -0,0 +1,211 @@
+"""
+LLM Hedged Request Tracking
+
+Latency statistics and race outcomes for hedged LLM calls. When hedging is
+enabled, LLMService starts the fallback provider in parallel if the primary
+hasn't produced a first token within an adaptive delay; whichever streams a
+first token first wins and the other stream is cancelled. This module
+decides that delay and records how races turn out.
+
+Key Features:
+- Adaptive hedge delay: a percentile of the primary's recent first-token
+  latency, clamped to [LLM_HEDGE_MIN_DELAY_MS, LLM_HEDGE_MAX_DELAY_MS]
+- Per-provider race counters: races entered, wins, win rate, hedges fired
+- Waste accounting: streams cancelled after losing and the tokens they had
+  already produced
+
+Key Design Principles:
+- Process-wide (shared by every cached per-agent LLMService) so latency
+  samples accumulate across agents using the same provider type
+- Bookkeeping only; the race itself runs in LLMService
+"""
+
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional
+
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+LLM_HEDGE_ENABLED = os.getenv('LLM_HEDGE_ENABLED', 'false').lower() in ('true', '1', 'yes')
+LLM_HEDGE_PERCENTILE = float(os.getenv('LLM_HEDGE_PERCENTILE', '0.9'))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv('LLM_HEDGE_MIN_SAMPLES', '10'))
+LLM_HEDGE_DEFAULT_DELAY_MS = int(os.getenv('LLM_HEDGE_DEFAULT_DELAY_MS', '2000'))
+LLM_HEDGE_MIN_DELAY_MS = int(os.getenv('LLM_HEDGE_MIN_DELAY_MS', '500'))
+LLM_HEDGE_MAX_DELAY_MS = int(os.getenv('LLM_HEDGE_MAX_DELAY_MS', '5000'))
+
+# Recent first-token latencies kept per provider for the hedge percentile
+_LATENCY_WINDOW = 100
+
+
+@dataclass
+class ProviderRaceStats:
+    """
+    Race statistics for one provider type.
+
+    Attributes:
+        races: Hedged races this provider took part in
+        wins: Races it won (streamed the first token first)
+        hedges_fired: Times a hedge was started because it was slow as primary
+        failovers: Times it failed as primary before a first token
+        wasted_streams: Streams cancelled after losing a race
+        wasted_tokens: Approximate tokens those streams had produced
+    """
+    races: int = 0
+    wins: int = 0
+    hedges_fired: int = 0
+    failovers: int = 0
+    wasted_streams: int = 0
+    wasted_tokens: int = 0
+    first_token_samples: Deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+
+    def get_stats(self) -> Dict[str, Any]:
+        samples = sorted(self.first_token_samples)
+        return {
+            'races': self.races,
+            'wins': self.wins,
+            'win_rate': self.wins / self.races if self.races else None,
+            'hedges_fired': self.hedges_fired,
+            'failovers': self.failovers,
+            'wasted_streams': self.wasted_streams,
+            'wasted_tokens': self.wasted_tokens,
+            'first_token_p50_ms': samples[len(samples) // 2] * 1000 if samples else None,
+        }
+
+
+class LLMHedgeTracker:
+    """
+    Adaptive hedge delay and race outcome statistics per provider type.
+
+    Example usage:
+        tracker = get_llm_hedge_tracker()
+
+        delay_s = tracker.hedge_delay_s("openrouter")
+        ...  # race primary and fallback
+        tracker.record_first_token("local", 0.42)
+        tracker.record_race(winner="local", loser="openrouter", wasted_tokens=0)
+    """
+
+    def __init__(
+        self,
+        percentile: float = LLM_HEDGE_PERCENTILE,
+        min_samples: int = LLM_HEDGE_MIN_SAMPLES,
+        default_delay_ms: int = LLM_HEDGE_DEFAULT_DELAY_MS,
+        min_delay_ms: int = LLM_HEDGE_MIN_DELAY_MS,
+        max_delay_ms: int = LLM_HEDGE_MAX_DELAY_MS,
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            percentile: Percentile of recent first-token latency used as hedge delay
+            min_samples: Samples required before the percentile is trusted
+            default_delay_ms: Hedge delay until then
+            min_delay_ms: Lower bound of the hedge delay
+            max_delay_ms: Upper bound of the hedge delay
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.default_delay_s = default_delay_ms / 1000
+        self.min_delay_s = min_delay_ms / 1000
+        self.max_delay_s = max(max_delay_ms, min_delay_ms) / 1000
+        self._providers: Dict[str, ProviderRaceStats] = {}
+
+    def provider(self, name: str) -> ProviderRaceStats:
+        """Stats for a provider type (created on first use)"""
+        stats = self._providers.get(name)
+        if stats is None:
+            stats = self._providers[name] = ProviderRaceStats()
+        return stats
+
+    def record_first_token(self, name: str, latency_s: float) -> None:
+        """Record time from request to first streamed token"""
+        self.provider(name).first_token_samples.append(latency_s)
+
+    def hedge_delay_s(self, name: str) -> float:
+        """
+        How long to wait for the primary's first token before starting the fallback.
+
+        Args:
+            name: Primary provider type
+
+        Returns:
+            Delay in seconds
+        """
+        samples = self.provider(name).first_token_samples
+        if len(samples) < self.min_samples:
+            delay = self.default_delay_s
+        else:
+            ordered = sorted(samples)
+            delay = ordered[min(len(ordered) - 1, int(self.percentile * len(ordered)))]
+        return min(self.max_delay_s, max(self.min_delay_s, delay))
+
+    def record_race(
+        self,
+        winner: str,
+        loser: str,
+        wasted_tokens: int = 0,
+    ) -> None:
+        """
+        Record the outcome of a latency hedge (both providers streaming).
+
+        Args:
+            winner: Provider that streamed the first token first
+            loser: The other provider (cancelled)
+            wasted_tokens: Tokens the loser produced before being cancelled
+        """
+        winner_stats = self.provider(winner)
+        winner_stats.races += 1
+        winner_stats.wins += 1
+
+        loser_stats = self.provider(loser)
+        loser_stats.races += 1
+        loser_stats.wasted_streams += 1
+        loser_stats.wasted_tokens += wasted_tokens
+
+    def record_hedge_fired(self, primary: str) -> None:
+        """Record that primary was slow enough to start a hedge"""
+        self.provider(primary).hedges_fired += 1
+
+    def record_failover(self, primary: str) -> None:
+        """Record that primary failed before its first token and the fallback took over"""
+        self.provider(primary).failovers += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hedging statistics.
+
+        Returns:
+            Dictionary with per-provider race counters, win rates, waste and
+            the current hedge delay
+        """
+        return {
+            name: {**stats.get_stats(), 'hedge_delay_ms': self.hedge_delay_s(name) * 1000}
+            for name, stats in self._providers.items()
+        }
+
+
+# Singleton instance
+_llm_hedge_tracker: Optional[LLMHedgeTracker] = None
+
+
+def get_llm_hedge_tracker() -> LLMHedgeTracker:
+    """
+    Get the process-wide LLMHedgeTracker instance.
+
+    Returns:
+        Shared tracker (created on first use)
+    """
+    global _llm_hedge_tracker
+    if _llm_hedge_tracker is None:
+        _llm_hedge_tracker = LLMHedgeTracker()
+    return _llm_hedge_tracker
+
+
+def reset_llm_hedge_tracker() -> None:
+    """Drop the shared tracker (next get_llm_hedge_tracker() creates a fresh one)"""
+    global _llm_hedge_tracker
+    _llm_hedge_tracker = None
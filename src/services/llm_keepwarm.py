@@ -0,0 +1,442 @@
+"""
+LLM Keep-Warm Manager
+
+Background task that keeps LLM backends warm between requests so the first
+voice turn after a quiet period doesn't pay for a TLS handshake or a
+multi-second model load. Pooled connections close once idle and Ollama
+unloads a model a few minutes after its last request; the manager touches
+both on a schedule that follows each agent's traffic.
+
+Key Features:
+- Connection keep-alive: a tiny authenticated request on each provider's
+  pooled client while it is idle, so the HTTP/2 (or HTTP/1.1 keep-alive)
+  connection and its TLS session stay open
+- Model keep-alive: Ollama preload requests (POST /api/generate with only
+  model + keep_alive) that keep each local model resident until its traffic
+  window after the last real request expires
+- Traffic-matched windows: per model, a multiple of the smoothed gap between
+  requests, clamped to [LLM_KEEPWARM_MIN_WINDOW_S, LLM_KEEPWARM_MAX_WINDOW_S];
+  chatty agents are kept warm briefly, sporadic ones longer, idle ones let go
+- Startup preload of every agent's local model and provider connection
+- Cold-start incidents per provider: requests after an idle period whose
+  first token took longer than LLM_COLD_START_THRESHOLD_MS, plus models that
+  had to be reloaded on a keep-warm refresh
+
+Key Design Principles:
+- Process-wide (shared by every cached per-agent LLMService); LLMService
+  reports each request's first-token latency, the manager does the rest
+- Holds providers by weak reference: a provider retired from the LLM
+  service cache stops being kept warm
+- Best effort: keep-warm failures are logged and counted, never raised
+"""
+
+import asyncio
+import os
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+LLM_KEEPWARM_ENABLED = os.getenv('LLM_KEEPWARM_ENABLED', 'true').lower() in ('true', '1', 'yes')
+LLM_KEEPWARM_INTERVAL_S = float(os.getenv('LLM_KEEPWARM_INTERVAL_S', '45'))
+LLM_KEEPWARM_MIN_WINDOW_S = float(os.getenv('LLM_KEEPWARM_MIN_WINDOW_S', '300'))
+LLM_KEEPWARM_DEFAULT_WINDOW_S = float(os.getenv('LLM_KEEPWARM_DEFAULT_WINDOW_S', '900'))
+LLM_KEEPWARM_MAX_WINDOW_S = float(os.getenv('LLM_KEEPWARM_MAX_WINDOW_S', '3600'))
+LLM_KEEPWARM_PRELOAD_ON_STARTUP = os.getenv('LLM_KEEPWARM_PRELOAD_ON_STARTUP', 'true').lower() in ('true', '1', 'yes')
+LLM_COLD_START_THRESHOLD_MS = int(os.getenv('LLM_COLD_START_THRESHOLD_MS', '2500'))
+
+# Traffic window = this many smoothed inter-request gaps
+_WINDOW_GAPS = 3.0
+# Smoothing factor for the inter-request gap
+_GAP_EWMA_ALPHA = 0.3
+
+
+@dataclass
+class _WarmTarget:
+    """A pooled connection, or a local model, being kept warm"""
+    provider_name: str
+    provider_ref: weakref.ref
+    model: Optional[str] = None  # None = connection only
+    last_request: float = 0.0  # monotonic; last real request (or registration)
+    last_touched: float = 0.0  # last request or keep-warm call
+    warm_until: float = 0.0  # keep_alive deadline last sent to the server
+    gap_ewma_s: Optional[float] = None
+
+    def window_s(self, min_s: float, default_s: float, max_s: float) -> float:
+        """How long after the last request to keep this target warm"""
+        if self.gap_ewma_s is None:
+            return default_s
+        return min(max_s, max(min_s, _WINDOW_GAPS * self.gap_ewma_s))
+
+    def record_request(self, now: float) -> None:
+        if self.last_request:
+            gap = now - self.last_request
+            self.gap_ewma_s = gap if self.gap_ewma_s is None else (
+                _GAP_EWMA_ALPHA * gap + (1 - _GAP_EWMA_ALPHA) * self.gap_ewma_s
+            )
+        self.last_request = now
+        self.last_touched = now
+
+
+@dataclass
+class ProviderWarmthStats:
+    """
+    Keep-warm counters for one provider type.
+
+    Attributes:
+        pings: Connection keep-alive requests sent
+        ping_failures: Keep-alive requests that failed
+        preloads: Model preload / keep_alive requests sent
+        preload_failures: Preload requests that failed
+        model_reloads: Refreshes that found the model unloaded
+        load_s_total: Time spent loading models on preload
+        requests_after_idle: Requests arriving after an idle period
+        cold_starts: Of those, requests whose first token exceeded the threshold
+    """
+    pings: int = 0
+    ping_failures: int = 0
+    preloads: int = 0
+    preload_failures: int = 0
+    model_reloads: int = 0
+    load_s_total: float = 0.0
+    requests_after_idle: int = 0
+    cold_starts: int = 0
+    last_cold_start: Optional[Dict[str, Any]] = field(default=None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'pings': self.pings,
+            'ping_failures': self.ping_failures,
+            'preloads': self.preloads,
+            'preload_failures': self.preload_failures,
+            'model_reloads': self.model_reloads,
+            'load_s_total': round(self.load_s_total, 3),
+            'requests_after_idle': self.requests_after_idle,
+            'cold_starts': self.cold_starts,
+            'cold_start_rate': (
+                self.cold_starts / self.requests_after_idle if self.requests_after_idle else None
+            ),
+            'last_cold_start': self.last_cold_start,
+        }
+
+
+class LLMKeepWarmManager:
+    """
+    Keeps LLM provider connections and local models warm between requests.
+
+    Example usage:
+        manager = get_llm_keepwarm_manager()
+        if manager:
+            manager.start()
+            await manager.preload_agents()
+
+        # In LLMService, on each request's first token:
+        manager.record_request("local", provider, "llama3.1:8b", first_token_s=0.4)
+
+        # On shutdown:
+        await manager.stop()
+    """
+
+    def __init__(
+        self,
+        interval_s: float = LLM_KEEPWARM_INTERVAL_S,
+        min_window_s: float = LLM_KEEPWARM_MIN_WINDOW_S,
+        default_window_s: float = LLM_KEEPWARM_DEFAULT_WINDOW_S,
+        max_window_s: float = LLM_KEEPWARM_MAX_WINDOW_S,
+        cold_start_threshold_ms: int = LLM_COLD_START_THRESHOLD_MS,
+    ):
+        """
+        Initialize manager.
+
+        Args:
+            interval_s: Seconds between keep-warm passes (keep below the
+                connection keep-alive expiry, LLM_CONNECTION_KEEPALIVE_S)
+            min_window_s: Shortest traffic window
+            default_window_s: Traffic window before any gaps have been observed
+            max_window_s: Longest traffic window
+            cold_start_threshold_ms: First-token latency counted as a cold start
+        """
+        self.interval_s = interval_s
+        self.min_window_s = min_window_s
+        self.default_window_s = default_window_s
+        self.max_window_s = max(max_window_s, min_window_s)
+        self.cold_start_threshold_s = cold_start_threshold_ms / 1000
+
+        self._connections: Dict[int, _WarmTarget] = {}
+        self._models: Dict[Tuple[str, str], _WarmTarget] = {}
+        self._providers: Dict[str, ProviderWarmthStats] = {}
+        self._no_preload: set = set()  # Base URLs without Ollama's native API
+        self._task: Optional[asyncio.Task] = None
+
+    def provider(self, name: str) -> ProviderWarmthStats:
+        """Stats for a provider type (created on first use)"""
+        stats = self._providers.get(name)
+        if stats is None:
+            stats = self._providers[name] = ProviderWarmthStats()
+        return stats
+
+    # ------------------------------------------------------------------
+    # Traffic
+    # ------------------------------------------------------------------
+
+    def record_request(
+        self,
+        provider_name: str,
+        provider: Any,
+        model: Optional[str],
+        first_token_s: float,
+    ) -> None:
+        """
+        Record a request that produced its first token.
+
+        Args:
+            provider_name: Provider type ("openrouter", "local")
+            provider: LLMProvider instance that served it
+            model: Model name
+            first_token_s: Time from request to first token
+        """
+        now = time.monotonic()
+        connection = self._connection(provider_name, provider)
+        target = self._model(provider_name, provider, model) if model and provider_name == 'local' else connection
+
+        # "After idle" = no real request on this model/connection for a full keep-warm interval
+        idle_s = now - target.last_request if target.last_request else None
+        if idle_s is None or idle_s >= self.interval_s:
+            stats = self.provider(provider_name)
+            stats.requests_after_idle += 1
+            if first_token_s >= self.cold_start_threshold_s:
+                stats.cold_starts += 1
+                stats.last_cold_start = {
+                    'model': model,
+                    'first_token_ms': round(first_token_s * 1000),
+                    'idle_s': round(idle_s) if idle_s is not None else None,
+                    'at': time.time(),
+                }
+                logger.warning(
+                    f"🥶 LLM [{provider_name}]: Cold start for {model} - first token after "
+                    f"{first_token_s * 1000:.0f}ms"
+                    + (f" ({idle_s:.0f}s idle)" if idle_s is not None else " (first request)")
+                )
+
+        connection.record_request(now)
+        if target is not connection:
+            target.record_request(now)
+
+    def _connection(self, provider_name: str, provider: Any) -> _WarmTarget:
+        target = self._connections.get(id(provider))
+        if target is None or target.provider_ref() is not provider:
+            target = _WarmTarget(provider_name=provider_name, provider_ref=weakref.ref(provider))
+            self._connections[id(provider)] = target
+        return target
+
+    def _model(self, provider_name: str, provider: Any, model: str) -> _WarmTarget:
+        key = (getattr(provider, 'base_url', '') or '', model)
+        target = self._models.get(key)
+        if target is None:
+            target = _WarmTarget(provider_name=provider_name, provider_ref=weakref.ref(provider), model=model)
+            self._models[key] = target
+        elif target.provider_ref() is not provider:
+            target.provider_ref = weakref.ref(provider)  # Newest instance serving this model
+        return target
+
+    # ------------------------------------------------------------------
+    # Keep-warm passes
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background keep-warm loop (no-op if running)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"🔥 LLM keep-warm manager started (every {self.interval_s:.0f}s)")
+
+    async def stop(self) -> None:
+        """Stop the background loop"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_s)
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"🔥 LLM keep-warm pass failed: {e}", exc_info=True)
+
+    async def run_once(self) -> None:
+        """
+        One keep-warm pass: refresh models whose keep_alive would lapse within
+        their traffic window, ping idle connections, and let go of anything
+        idle for longer than its window.
+        """
+        now = time.monotonic()
+
+        for key, target in list(self._models.items()):
+            provider = self._live(target)
+            window_s = target.window_s(self.min_window_s, self.default_window_s, self.max_window_s)
+            if provider is None or now - target.last_request >= window_s:
+                del self._models[key]
+                if provider is not None:
+                    logger.info(f"💤 LLM [local]: {target.model} idle for {now - target.last_request:.0f}s, no longer kept warm")
+                continue
+
+            wanted_until = target.last_request + window_s
+            if wanted_until - target.warm_until >= self.interval_s:
+                await self._preload(provider, target, wanted_until - now, refresh=True)
+
+        for key, target in list(self._connections.items()):
+            provider = self._live(target)
+            window_s = target.window_s(self.min_window_s, self.default_window_s, self.max_window_s)
+            if provider is None or now - target.last_request >= window_s:
+                del self._connections[key]
+                continue
+            if now - target.last_touched >= self.interval_s / 2:
+                await self._ping(provider, target)
+
+    async def preload_agents(self, agents=None) -> int:
+        """
+        Warm the backends of every agent: open each provider's connection and
+        load each local model (default agent first).
+
+        Args:
+            agents: Agents to warm (default: all agents from the database)
+
+        Returns:
+            Number of local models preloaded
+        """
+        # Import here to avoid circular dependency
+        from src.services.llm_service import ProviderType, get_llm_service_for_agent
+
+        if agents is None:
+            from src.services.agent_service import AgentService
+            agents = await AgentService.get_all_agents()
+
+        preloaded = 0
+        for agent in sorted(agents, key=lambda a: not getattr(a, 'is_default', False)):
+            try:
+                provider_type = ProviderType(agent.llm_provider)
+                service = await get_llm_service_for_agent(agent)
+                provider = service.get_provider(provider_type)
+                if provider is None:
+                    continue
+
+                connection = self._connection(provider_type.value, provider)
+                connection.last_request = connection.last_request or time.monotonic()
+
+                if provider_type == ProviderType.LOCAL and agent.llm_model:
+                    target = self._model(provider_type.value, provider, agent.llm_model)
+                    target.last_request = target.last_request or time.monotonic()
+                    window_s = target.window_s(self.min_window_s, self.default_window_s, self.max_window_s)
+                    if await self._preload(provider, target, window_s):
+                        preloaded += 1
+                else:
+                    await self._ping(provider, connection)
+            except Exception as e:
+                logger.warning(f"🔥 Failed to warm LLM backend for agent '{getattr(agent, 'name', '?')}': {e}")
+
+        logger.info(f"🔥 Warmed LLM backends for {len(agents)} agents ({preloaded} local models loaded)")
+        return preloaded
+
+    async def _preload(self, provider: Any, target: _WarmTarget, keep_alive_s: float, refresh: bool = False) -> bool:
+        base_url = getattr(provider, 'base_url', '') or ''
+        if base_url in self._no_preload or not hasattr(provider, 'preload_model'):
+            return False
+
+        stats = self.provider(target.provider_name)
+        stats.preloads += 1
+        try:
+            load_s = await provider.preload_model(target.model, keep_alive_s)
+        except Exception as e:
+            stats.preload_failures += 1
+            logger.warning(f"🔥 LLM [{target.provider_name}]: Preload of {target.model} failed: {e}")
+            return False
+
+        if load_s is None:
+            # Not Ollama (vLLM, LM Studio, ...): nothing to preload there
+            stats.preloads -= 1
+            self._no_preload.add(base_url)
+            logger.info(f"🔥 LLM [{target.provider_name}]: {base_url} has no model keep-alive API, connection warming only")
+            return False
+
+        now = time.monotonic()
+        target.warm_until = now + keep_alive_s
+        target.last_touched = now
+        stats.load_s_total += load_s
+        if refresh and load_s >= self.cold_start_threshold_s:
+            stats.model_reloads += 1
+            logger.warning(f"🥶 LLM [{target.provider_name}]: {target.model} had been unloaded (reload took {load_s:.1f}s)")
+        logger.debug(f"🔥 LLM [{target.provider_name}]: {target.model} kept loaded for {keep_alive_s:.0f}s (load {load_s:.2f}s)")
+        return True
+
+    async def _ping(self, provider: Any, target: _WarmTarget) -> None:
+        stats = self.provider(target.provider_name)
+        stats.pings += 1
+        if not await provider.warm_connection():
+            stats.ping_failures += 1
+        target.last_touched = time.monotonic()
+
+    @staticmethod
+    def _live(target: _WarmTarget) -> Optional[Any]:
+        """Provider still in use, or None if it was retired / closed"""
+        provider = target.provider_ref()
+        client = getattr(provider, 'client', None)
+        if provider is None or (client is not None and client.is_closed):
+            return None
+        return provider
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get keep-warm statistics.
+
+        Returns:
+            Dictionary with targets being kept warm and per-provider counters
+            (pings, preloads, model reloads, cold starts)
+        """
+        now = time.monotonic()
+        return {
+            'interval_s': self.interval_s,
+            'connections': len(self._connections),
+            'models': {
+                f"{base_url}|{model}": {
+                    'idle_s': round(now - target.last_request, 1),
+                    'window_s': round(target.window_s(self.min_window_s, self.default_window_s, self.max_window_s)),
+                    'warm_for_s': round(max(0.0, target.warm_until - now)),
+                }
+                for (base_url, model), target in self._models.items()
+            },
+            'providers': {name: stats.get_stats() for name, stats in self._providers.items()},
+        }
+
+
+# Singleton instance
+_llm_keepwarm_manager: Optional[LLMKeepWarmManager] = None
+
+
+def get_llm_keepwarm_manager() -> Optional[LLMKeepWarmManager]:
+    """
+    Get the process-wide LLMKeepWarmManager instance.
+
+    Returns:
+        Shared manager, or None when LLM_KEEPWARM_ENABLED=false
+    """
+    global _llm_keepwarm_manager
+    if not LLM_KEEPWARM_ENABLED:
+        return None
+    if _llm_keepwarm_manager is None:
+        _llm_keepwarm_manager = LLMKeepWarmManager()
+    return _llm_keepwarm_manager
+
+
+def reset_llm_keepwarm_manager() -> None:
+    """Drop the shared manager (next get_llm_keepwarm_manager() creates a fresh one)"""
+    global _llm_keepwarm_manager
+    _llm_keepwarm_manager = None
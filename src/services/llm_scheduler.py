@@ -0,0 +1,437 @@
+"""
+LLM Concurrency Limiting and Priority Scheduling
+
+Process-wide gate in front of every LLM call. Without it a burst of Discord
+and web turns all hit Ollama at once, where they serialize behind each other
+(and behind memory extraction's relevance checks on the same model) until
+they time out.
+
+Key Features:
+- One lane per (provider, model), each with its own concurrency limit
+- Priority classes: voice turns before text chat before background work
+  (memory extraction, summarization)
+- Fair between sessions within a priority (one session's burst can't
+  starve others)
+- Queue-wait metrics (p50/p95 per priority class) and service-time EWMA
+- Deadline-aware rejection: a request whose estimated or actual queue wait
+  exceeds its deadline is rejected instead of timing out later, and
+  background work yields outright while interactive requests are queued
+
+Key Design Principles:
+- Uncontended admission is O(1) with no awaiting (no added latency)
+- Cancelled waiters (barge-in) never leak slots
+- Rejection raises LLMRequestRejectedError, a rate-limit error, so the
+  service's existing fallback handling applies
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from src.config.logging_config import get_logger
+from src.llm import LLMRateLimitError
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+LLM_SCHEDULER_ENABLED = os.getenv('LLM_SCHEDULER_ENABLED', 'true').lower() in ('true', '1', 'yes')
+LLM_MAX_CONCURRENT_LOCAL = int(os.getenv('LLM_MAX_CONCURRENT_LOCAL', '2'))
+LLM_MAX_CONCURRENT_OPENROUTER = int(os.getenv('LLM_MAX_CONCURRENT_OPENROUTER', '16'))
+LLM_QUEUE_DEADLINE_VOICE_S = float(os.getenv('LLM_QUEUE_DEADLINE_VOICE_S', '15'))
+LLM_QUEUE_DEADLINE_TEXT_S = float(os.getenv('LLM_QUEUE_DEADLINE_TEXT_S', '45'))
+LLM_QUEUE_DEADLINE_BACKGROUND_S = float(os.getenv('LLM_QUEUE_DEADLINE_BACKGROUND_S', '30'))
+
+# Recent queue waits kept per priority class for percentiles
+_WAIT_WINDOW = 200
+
+# Service time assumed before any request on a lane has completed
+_INITIAL_SERVICE_S = 2.0
+
+
+class LLMPriority(IntEnum):
+    """Admission priority (lower is served first)"""
+    VOICE = 0       # Someone is listening for the reply
+    TEXT = 1        # Text chat, reading the reply
+    BACKGROUND = 2  # Nobody is waiting (memory extraction, summarization)
+
+
+class LLMRequestRejectedError(LLMRateLimitError):
+    """Request rejected by the scheduler (queue wait would exceed its deadline)"""
+    pass
+
+
+@dataclass(order=True)
+class _Waiter:
+    """One queued admission request (ordered by priority, then virtual finish tag)"""
+    priority: int
+    finish_tag: float
+    seq: int
+    session_id: str = field(compare=False)
+    start_tag: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+@dataclass
+class _Lane:
+    """Concurrency lane for one (provider, model)"""
+    max_concurrent: int
+    active: int = 0
+    heap: List[_Waiter] = field(default_factory=list)
+    waiting: Dict[int, int] = field(default_factory=dict)  # priority → count
+    active_by_priority: Dict[int, int] = field(default_factory=dict)
+    virtual_time: float = 0.0
+    session_finish: Dict[str, float] = field(default_factory=dict)
+    ewma_service_s: float = _INITIAL_SERVICE_S
+    admitted: int = 0
+    rejected: int = 0
+
+    def waiting_at_or_above(self, priority: int) -> int:
+        """Queued requests that would be served before a new one at priority"""
+        return sum(count for p, count in self.waiting.items() if p <= priority)
+
+    def interactive_load(self) -> int:
+        """Queued plus running voice and text requests"""
+        return sum(
+            counts.get(p, 0)
+            for counts in (self.waiting, self.active_by_priority)
+            for p in (LLMPriority.VOICE, LLMPriority.TEXT)
+        )
+
+
+class LLMScheduler:
+    """
+    Per-(provider, model) LLM admission controller with priority classes.
+
+    Example usage:
+        scheduler = get_llm_scheduler()
+
+        async with scheduler.slot("local", "llama3.1:8b", LLMPriority.VOICE, session_id):
+            ...  # stream the response
+
+        # Background work should expect LLMRequestRejectedError under load
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        deadlines_s: Optional[Dict[LLMPriority, float]] = None,
+        ewma_alpha: float = 0.2,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            limits: Concurrent requests per model lane, by provider name
+                    (unknown providers use the OpenRouter limit)
+            deadlines_s: Default queue deadline per priority class (<= 0: none)
+            ewma_alpha: Weight of the newest sample in the service-time EWMA
+        """
+        self.limits = limits or {
+            'local': LLM_MAX_CONCURRENT_LOCAL,
+            'openrouter': LLM_MAX_CONCURRENT_OPENROUTER,
+        }
+        self.deadlines_s = deadlines_s or {
+            LLMPriority.VOICE: LLM_QUEUE_DEADLINE_VOICE_S,
+            LLMPriority.TEXT: LLM_QUEUE_DEADLINE_TEXT_S,
+            LLMPriority.BACKGROUND: LLM_QUEUE_DEADLINE_BACKGROUND_S,
+        }
+        self.ewma_alpha = ewma_alpha
+
+        self._lanes: Dict[Tuple[str, str], _Lane] = {}
+        self._seq = itertools.count()
+
+        # Metrics
+        self.queued = 0
+        self.abandoned = 0
+        self.rejected: Dict[str, int] = {'deadline': 0, 'yielded': 0, 'timed_out': 0}
+        self._waits: Dict[LLMPriority, Deque[float]] = {
+            priority: deque(maxlen=_WAIT_WINDOW) for priority in LLMPriority
+        }
+
+    def lane(self, provider: str, model: str) -> _Lane:
+        """Lane for a provider/model (created on first use)"""
+        key = (provider, model or '')
+        lane = self._lanes.get(key)
+        if lane is None:
+            limit = self.limits.get(provider, LLM_MAX_CONCURRENT_OPENROUTER)
+            lane = self._lanes[key] = _Lane(max_concurrent=max(1, limit))
+        return lane
+
+    def estimated_wait_s(self, provider: str, model: str, priority: LLMPriority) -> float:
+        """
+        Expected queue wait for a new request.
+
+        Requests ahead of it (running plus queued at the same or higher
+        priority) beyond the lane's free slots, served max_concurrent at a
+        time at the lane's smoothed service time.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            priority: Priority of the new request
+
+        Returns:
+            Estimated wait in seconds (0.0 if a slot is free)
+        """
+        lane = self.lane(provider, model)
+        ahead = lane.active + lane.waiting_at_or_above(int(priority))
+        if ahead < lane.max_concurrent:
+            return 0.0
+        rounds = (ahead - lane.max_concurrent) // lane.max_concurrent + 1
+        return rounds * lane.ewma_service_s
+
+    async def acquire(
+        self,
+        provider: str,
+        model: str,
+        priority: LLMPriority = LLMPriority.TEXT,
+        session_id: str = '',
+        deadline_s: Optional[float] = None,
+    ) -> float:
+        """
+        Wait for a slot on the provider/model lane.
+
+        Args:
+            provider: Provider name ("local", "openrouter")
+            model: Model name
+            priority: Admission class
+            session_id: Session the request belongs to (unit of fairness)
+            deadline_s: Longest acceptable queue wait (None = class default)
+
+        Returns:
+            Seconds spent queued
+
+        Raises:
+            LLMRequestRejectedError: Wait would exceed (or exceeded) the deadline,
+                or background work yielded to interactive load
+            asyncio.CancelledError: If cancelled while queued
+        """
+        priority = LLMPriority(priority)
+        lane = self.lane(provider, model)
+        label = f"{provider}:{model}"
+        if deadline_s is None:
+            deadline_s = self.deadlines_s.get(priority, 0)
+
+        # Fast path: free slot and nobody ahead
+        if lane.active < lane.max_concurrent and not lane.heap:
+            self._admit(lane, priority)
+            self._record_wait(priority, 0.0)
+            return 0.0
+
+        if priority == LLMPriority.BACKGROUND and lane.interactive_load() >= lane.max_concurrent:
+            self._reject(lane, 'yielded', f"🚦 LLM {label}: Background request yielded to interactive load")
+
+        estimate_s = self.estimated_wait_s(provider, model, priority)
+        if deadline_s and deadline_s > 0 and estimate_s > deadline_s:
+            self._reject(
+                lane, 'deadline',
+                f"🚦 LLM {label}: Rejected {priority.name.lower()} request "
+                f"(estimated wait {estimate_s:.1f}s > deadline {deadline_s:.1f}s)"
+            )
+
+        start_tag = max(lane.virtual_time, lane.session_finish.get(session_id, 0.0))
+        lane.session_finish[session_id] = start_tag + 1.0
+        waiter = _Waiter(
+            priority=int(priority),
+            finish_tag=start_tag + 1.0,
+            seq=next(self._seq),
+            session_id=session_id,
+            start_tag=start_tag,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(lane.heap, waiter)
+        lane.waiting[waiter.priority] = lane.waiting.get(waiter.priority, 0) + 1
+        self.queued += 1
+
+        # A slot may be free behind abandoned waiters
+        self._dispatch(lane)
+
+        t_enqueue = time.monotonic()
+        try:
+            if deadline_s and deadline_s > 0:
+                await asyncio.wait_for(asyncio.shield(waiter.future), timeout=deadline_s)
+            else:
+                await waiter.future
+        except asyncio.TimeoutError:
+            if not (waiter.future.done() and not waiter.future.cancelled()):
+                self._abandon(lane, waiter)
+                self._reject(
+                    lane, 'timed_out',
+                    f"🚦 LLM {label}: {priority.name.lower()} request waited {deadline_s:.1f}s without a slot"
+                )
+        except asyncio.CancelledError:
+            self._abandon(lane, waiter)
+            raise
+
+        queue_wait_s = time.monotonic() - t_enqueue
+        self._record_wait(priority, queue_wait_s)
+        if queue_wait_s > 0.1:
+            logger.debug(
+                f"🚦 LLM {label}: Admitted after {queue_wait_s * 1000:.0f}ms queued "
+                f"(priority={priority.name}, waiting={len(lane.heap)})"
+            )
+        return queue_wait_s
+
+    def release(self, provider: str, model: str, priority: LLMPriority, service_s: Optional[float] = None) -> None:
+        """
+        Return a slot (call once per successful acquire).
+
+        Args:
+            provider: Provider name
+            model: Model name
+            priority: Priority the slot was acquired with
+            service_s: How long the slot was held (updates the lane's EWMA)
+        """
+        lane = self.lane(provider, model)
+        if service_s is not None:
+            lane.ewma_service_s = self.ewma_alpha * service_s + (1 - self.ewma_alpha) * lane.ewma_service_s
+        self._release_slot(lane, int(priority))
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        provider: str,
+        model: str,
+        priority: LLMPriority = LLMPriority.TEXT,
+        session_id: str = '',
+        deadline_s: Optional[float] = None,
+    ) -> AsyncIterator[float]:
+        """
+        Hold a lane slot for the duration of the block.
+
+        Yields:
+            Seconds spent queued
+        """
+        queue_wait_s = await self.acquire(provider, model, priority, session_id, deadline_s)
+        t_start = time.monotonic()
+        try:
+            yield queue_wait_s
+        finally:
+            self.release(provider, model, priority, time.monotonic() - t_start)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with per-lane usage, queue-time percentiles per
+            priority class and rejection counters
+        """
+        return {
+            'lanes': {
+                f"{provider}:{model}": {
+                    'max_concurrent': lane.max_concurrent,
+                    'active': lane.active,
+                    'waiting': len(lane.heap),
+                    'admitted': lane.admitted,
+                    'rejected': lane.rejected,
+                    'ewma_service_s': lane.ewma_service_s,
+                }
+                for (provider, model), lane in self._lanes.items()
+            },
+            'queued': self.queued,
+            'abandoned': self.abandoned,
+            'rejected': dict(self.rejected),
+            'queue_wait_s': {
+                priority.name.lower(): self._percentiles(waits)
+                for priority, waits in self._waits.items()
+            },
+        }
+
+    def _admit(self, lane: _Lane, priority: int) -> None:
+        lane.active += 1
+        lane.admitted += 1
+        lane.active_by_priority[int(priority)] = lane.active_by_priority.get(int(priority), 0) + 1
+
+    def _dispatch(self, lane: _Lane) -> None:
+        """Admit queued requests while slots are free"""
+        while lane.active < lane.max_concurrent and lane.heap:
+            waiter = heapq.heappop(lane.heap)
+            if waiter.future.done():
+                continue  # Abandoned while queued (already uncounted)
+            self._leave_queue(lane, waiter)
+            self._admit(lane, waiter.priority)
+            lane.virtual_time = max(lane.virtual_time, waiter.start_tag)
+            waiter.future.set_result(None)
+
+        # Sessions with no lead over the clock need no state
+        if len(lane.session_finish) > 4 * _WAIT_WINDOW:
+            lane.session_finish = {
+                session_id: tag for session_id, tag in lane.session_finish.items()
+                if tag > lane.virtual_time
+            }
+
+    def _abandon(self, lane: _Lane, waiter: _Waiter) -> None:
+        """Handle a waiter cancelled or timed out while queued (or right after being admitted)"""
+        if waiter.future.done() and not waiter.future.cancelled():
+            # Slot was granted just before the cancellation landed
+            self._release_slot(lane, waiter.priority)
+            return
+        waiter.future.cancel()
+        self.abandoned += 1
+        # Removed lazily from the heap; fix the per-priority count now
+        self._leave_queue(lane, waiter)
+
+    def _release_slot(self, lane: _Lane, priority: int) -> None:
+        lane.active = max(0, lane.active - 1)
+        lane.active_by_priority[priority] = max(0, lane.active_by_priority.get(priority, 0) - 1)
+        self._dispatch(lane)
+
+    def _leave_queue(self, lane: _Lane, waiter: _Waiter) -> None:
+        count = lane.waiting.get(waiter.priority, 0)
+        if count <= 1:
+            lane.waiting.pop(waiter.priority, None)
+        else:
+            lane.waiting[waiter.priority] = count - 1
+
+    def _reject(self, lane: _Lane, reason: str, message: str) -> None:
+        lane.rejected += 1
+        self.rejected[reason] += 1
+        logger.warning(message)
+        raise LLMRequestRejectedError(message.split(': ', 1)[-1])
+
+    def _record_wait(self, priority: LLMPriority, wait_s: float) -> None:
+        self._waits[priority].append(wait_s)
+
+    @staticmethod
+    def _percentiles(waits: Deque[float]) -> Dict[str, Optional[float]]:
+        if not waits:
+            return {'p50': None, 'p95': None}
+        ordered = sorted(waits)
+        return {
+            'p50': ordered[len(ordered) // 2],
+            'p95': ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))],
+        }
+
+
+# Singleton instance
+_llm_scheduler: Optional[LLMScheduler] = None
+
+
+def get_llm_scheduler() -> Optional[LLMScheduler]:
+    """
+    Get the process-wide LLMScheduler instance.
+
+    Returns:
+        Shared scheduler (created on first use), or None if
+        LLM_SCHEDULER_ENABLED is false
+    """
+    global _llm_scheduler
+    if not LLM_SCHEDULER_ENABLED:
+        return None
+    if _llm_scheduler is None:
+        _llm_scheduler = LLMScheduler()
+    return _llm_scheduler
+
+
+def reset_llm_scheduler() -> None:
+    """Drop the shared scheduler (next get_llm_scheduler() creates a fresh one)"""
+    global _llm_scheduler
+    _llm_scheduler = None
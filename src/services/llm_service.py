@@ -9,12 +9,19 @@ Design Patterns:
 - Strategy pattern: Provider selection based on agent configuration
 - Singleton-like: Shared provider instances per service instance
 - Observer pattern: Callback mechanism for streaming chunks
+- Keyed cache: One LLMService per (agent, provider, config) reused across turns
+- Hedged requests: Optionally race the fallback against a slow primary
+- Admission control: Every provider call takes a slot from the shared
+  LLMScheduler (per provider/model concurrency, priority classes)
 """
 
 import asyncio
+import contextlib
+import hashlib
 import os
 import time
-from typing import Dict, List, Optional, Callable, AsyncIterator, Awaitable
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Callable, AsyncIterator, Awaitable, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -30,10 +37,38 @@ from src.llm import (
     LLMConnectionError,
     LLMAuthenticationError,
 )
+from src.services.llm_hedging import LLM_HEDGE_ENABLED, get_llm_hedge_tracker
+from src.services.llm_keepwarm import get_llm_keepwarm_manager
+from src.services.llm_scheduler import LLMPriority, get_llm_scheduler
+from src.services.prompt_builder import estimate_message_tokens, estimate_tokens
+from src.services.response_cache import ResponseCachePolicy, get_response_cache, split_for_replay
 from src.types.error_events import ServiceErrorEvent, ServiceErrorType
 
 logger = get_logger(__name__)
 
+# Per-agent service cache configuration
+LLM_SERVICE_CACHE_ENABLED = os.getenv('LLM_SERVICE_CACHE_ENABLED', 'true').lower() in ('true', '1', 'yes')
+LLM_SERVICE_CACHE_MAX_SIZE = int(os.getenv('LLM_SERVICE_CACHE_MAX_SIZE', '64'))
+LLM_SERVICE_CACHE_CLOSE_GRACE_S = float(os.getenv('LLM_SERVICE_CACHE_CLOSE_GRACE_S', '120'))
+
+# Env vars that change what LLMService() builds (part of the cache key)
+_ENV_CONFIG_KEYS = (
+    'OPENROUTER_API_KEY',
+    'LOCAL_LLM_BASE_URL',
+    'LLM_FALLBACK_ENABLED',
+    'LLM_TIMEOUT_S',
+    'LLM_MAX_RETRIES',
+    'LLM_SERVICE_TIMEOUT_S',
+)
+
+# End-of-stream marker for hedged contender queues
+_STREAM_END = object()
+
+
+class LLMHedgeFailedError(LLMError):
+    """Every provider in a hedged race failed (fallback already attempted)"""
+    pass
+
 
 class ProviderType(Enum):
     """Supported LLM provider types"""
@@ -52,6 +87,7 @@ class LLMConfig:
     model: str
     temperature: float
     system_prompt: Optional[str] = None
+    response_cache: Optional[ResponseCachePolicy] = None  # None = don't cache (agent hasn't opted in)
 
 
 class LLMService:
@@ -81,7 +117,8 @@ class LLMService:
         timeout_s: float = 60.0,
         max_retries: int = 2,
         db_provider_config: Optional[dict] = None,
-        error_callback: Optional[Callable[[ServiceErrorEvent], Awaitable[None]]] = None
+        error_callback: Optional[Callable[[ServiceErrorEvent], Awaitable[None]]] = None,
+        hedge_enabled: Optional[bool] = None,
     ):
         """
         Initialize LLM service with provider configuration.
@@ -102,6 +139,8 @@ class LLMService:
                 - api_key: str (decrypted API key)
                 - base_url: str (API endpoint)
             error_callback: Optional async callback for error events
+            hedge_enabled: Start the fallback in parallel when the primary's
+                first token is late (None = LLM_HEDGE_ENABLED)
         """
         # Configuration
         # Priority: db_provider_config > function params > env vars
@@ -138,6 +177,9 @@ class LLMService:
         self.max_retries = max_retries if max_retries != 2 else int(os.getenv("LLM_MAX_RETRIES", "2"))
         self.service_timeout_s = float(os.getenv("LLM_SERVICE_TIMEOUT_S", "90.0"))
         self.error_callback = error_callback
+        self.hedge_enabled = LLM_HEDGE_ENABLED if hedge_enabled is None else hedge_enabled
+        self.hedge_tracker = get_llm_hedge_tracker()
+        self.response_cache = get_response_cache()
 
         # Provider cache (shared instances for connection pooling)
         self._providers: Dict[ProviderType, Optional[LLMProvider]] = {}
@@ -147,6 +189,7 @@ class LLMService:
 
         logger.info(
             f"🤖 LLM Service: Initialized (fallback={self.fallback_enabled}, "
+            f"hedge={self.hedge_enabled}, "
             f"openrouter={'enabled' if self.openrouter_api_key else 'disabled'}, "
             f"local={self.local_base_url})"
         )
@@ -193,6 +236,7 @@ class LLMService:
         config: LLMConfig,
         stream: bool = True,
         callback: Optional[Callable[[str], None]] = None,
+        priority: LLMPriority = LLMPriority.TEXT,
     ) -> str:
         """
         Generate LLM response with provider routing and streaming support.
@@ -205,6 +249,8 @@ class LLMService:
             config: LLM configuration (provider, model, temperature, system_prompt)
             stream: Enable streaming response (default: True)
             callback: Optional callback for streaming chunks (sync or async)
+            priority: Admission class for the shared LLM scheduler (voice turns
+                      go first; background work may be rejected under load)
 
         Returns:
             str: Complete LLM response text
@@ -264,6 +310,27 @@ class LLMService:
                 f"content=\"{content_preview}\""
             )
 
+        # Opt-in response cache: repeated questions are answered without the LLM,
+        # streamed through the callback like a live response
+        cache_lookup = None
+        if config.response_cache is not None:
+            try:
+                cache_lookup = await self.response_cache.lookup(config.response_cache, messages)
+            except Exception as e:
+                logger.warning(f"🤖 LLM Service [{session_id[:8]}]: Response cache lookup failed: {e}")
+
+            if cache_lookup is not None and cache_lookup.hit:
+                if stream and callback:
+                    for chunk in split_for_replay(cache_lookup.text):
+                        await self._invoke_callback(callback, chunk)
+                        await asyncio.sleep(0)  # Let sentence/TTS consumers run between chunks
+                logger.info(
+                    f"🤖 LLM Service [{session_id[:8]}]: Response served from cache "
+                    f"({cache_lookup.match}, {len(cache_lookup.text)} chars, "
+                    f"{(time.time() - start_time) * 1000:.0f}ms)"
+                )
+                return cache_lookup.text
+
         # Create LLM request
         request = LLMRequest(
             messages=llm_messages,
@@ -279,6 +346,7 @@ class LLMService:
                 config=config,
                 stream=stream,
                 callback=callback,
+                priority=priority,
             )
 
             elapsed_ms = (time.time() - start_time) * 1000
@@ -287,6 +355,9 @@ class LLMService:
                 f"({len(full_response)} chars, {elapsed_ms:.0f}ms)"
             )
 
+            if cache_lookup is not None:
+                self.response_cache.store(cache_lookup, full_response)
+
             return full_response
 
         except LLMAuthenticationError as e:
@@ -306,6 +377,7 @@ class LLMService:
         config: LLMConfig,
         stream: bool,
         callback: Optional[Callable[[str], None]],
+        priority: LLMPriority = LLMPriority.TEXT,
     ) -> str:
         """
         Generate response with fallback chain.
@@ -315,6 +387,9 @@ class LLMService:
         2. If fallback enabled and primary fails:
            - If primary was OpenRouter → try local
            - If primary was local → fail (no fallback)
+        3. If hedging is enabled (OpenRouter primary only), the local
+           fallback also starts when the primary's first token is late
+           (see _generate_hedged)
 
         Args:
             session_id: Session UUID
@@ -322,6 +397,7 @@ class LLMService:
             config: LLM configuration
             stream: Enable streaming
             callback: Optional streaming callback
+            priority: Scheduler admission class
 
         Returns:
             str: Complete response text
@@ -346,13 +422,45 @@ class LLMService:
                 f"({primary_provider_type.value})"
             )
 
+            if self._can_hedge(primary_provider_type):
+                return await self._generate_hedged(
+                    session_id=session_id,
+                    primary=provider,
+                    fallback=self._providers[ProviderType.LOCAL],
+                    request=request,
+                    stream=stream,
+                    callback=callback,
+                    priority=priority,
+                )
+
             return await self._generate_with_provider(
                 provider=provider,
                 request=request,
                 stream=stream,
                 callback=callback,
+                provider_type=primary_provider_type,
+                priority=priority,
+                session_id=session_id,
             )
 
+        except LLMHedgeFailedError as e:
+            # Hedged race already tried the fallback - nothing left to fail over to
+            logger.error(f"🤖 LLM Service [{session_id[:8]}]: {e}")
+
+            # Emit error event (both providers failed)
+            if self.error_callback:
+                await self.error_callback(ServiceErrorEvent(
+                    service_name="llm_provider",
+                    error_type=ServiceErrorType.LLM_PROVIDER_FAILED,
+                    user_message="AI response failed. Both primary and fallback providers unavailable.",
+                    technical_details=str(e),
+                    session_id=session_id,
+                    severity="critical",
+                    retry_suggested=True
+                ))
+
+            raise
+
         except (LLMTimeoutError, LLMRateLimitError, LLMConnectionError) as e:
             # Transient errors - consider fallback
             error_type_str = type(e).__name__
@@ -462,6 +570,9 @@ class LLMService:
                     request=fallback_request,
                     stream=stream,
                     callback=callback,
+                    provider_type=ProviderType.LOCAL,
+                    priority=priority,
+                    session_id=session_id,
                 )
 
             except Exception as fallback_error:
@@ -530,6 +641,9 @@ class LLMService:
         request: LLMRequest,
         stream: bool,
         callback: Optional[Callable[[str], None]],
+        provider_type: Optional[ProviderType] = None,
+        priority: LLMPriority = LLMPriority.TEXT,
+        session_id: str = '',
     ) -> str:
         """
         Generate response with specific provider.
@@ -541,6 +655,10 @@ class LLMService:
             request: LLM request
             stream: Enable streaming
             callback: Optional streaming callback
+            provider_type: Provider's type, for first-token latency tracking
+                and scheduler admission (None = unscheduled)
+            priority: Scheduler admission class
+            session_id: Session UUID (scheduler fairness)
 
         Returns:
             str: Complete response text
@@ -561,33 +679,32 @@ class LLMService:
                 pass  # Normal cancellation when generation completes
 
         warner_task = asyncio.create_task(timeout_warner())
+        t_start = time.monotonic()
 
         try:
             async with asyncio.timeout(self.service_timeout_s):
                 if not stream:
                     # Non-streaming mode: Collect all chunks
                     chunks = []
-                    async for chunk in provider.generate_stream(request):
-                        chunks.append(chunk)
+                    contents = self._scheduled_stream(provider, provider_type, request, priority, session_id)
+                    async with contextlib.aclosing(contents) as contents:
+                        async for chunk in contents:
+                            if not chunks and provider_type is not None:
+                                self.hedge_tracker.record_first_token(provider_type.value, time.monotonic() - t_start)
+                            chunks.append(chunk)
                     return "".join(chunks)
 
                 # Streaming mode: Yield chunks to callback
                 chunks = []
-                async for chunk in provider.generate_stream(request):
-                    chunks.append(chunk)
+                contents = self._scheduled_stream(provider, provider_type, request, priority, session_id)
+                async with contextlib.aclosing(contents) as contents:
+                    async for chunk in contents:
+                        if not chunks and provider_type is not None:
+                            self.hedge_tracker.record_first_token(provider_type.value, time.monotonic() - t_start)
+                        chunks.append(chunk)
 
-                    if callback:
-                        # Call callback with chunk (supports both sync and async callbacks)
-                        if hasattr(callback, "__call__"):
-                            try:
-                                result = callback(chunk)
-                                # If callback is async, await it
-                                if hasattr(result, "__await__"):
-                                    await result
-                            except Exception as e:
-                                logger.warning(
-                                    f"🤖 LLM Service: Callback error (continuing): {e}"
-                                )
+                        if callback:
+                            await self._invoke_callback(callback, chunk)
 
                 return "".join(chunks)
 
@@ -602,6 +719,257 @@ class LLMService:
             except asyncio.CancelledError:
                 pass
 
+    async def _scheduled_stream(
+        self,
+        provider: LLMProvider,
+        provider_type: Optional[ProviderType],
+        request: LLMRequest,
+        priority: LLMPriority,
+        session_id: str,
+    ) -> AsyncIterator[str]:
+        """
+        Stream from a provider while holding a scheduler slot for its lane.
+
+        The first token's latency (measured after admission) goes to the
+        keep-warm manager, which tracks traffic and cold starts.
+
+        Raises:
+            LLMRequestRejectedError: Scheduler rejected the request (queue
+                wait over its deadline, or background work under load)
+        """
+        scheduler = get_llm_scheduler()
+        if scheduler is None or provider_type is None:
+            slot = contextlib.nullcontext()
+        else:
+            slot = scheduler.slot(provider_type.value, request.model, priority, session_id)
+        keepwarm = get_llm_keepwarm_manager() if provider_type is not None else None
+
+        async with slot:
+            t_start = time.monotonic()
+            async with contextlib.aclosing(provider.generate_stream(request)) as chunks:
+                async for chunk in chunks:
+                    if keepwarm is not None:
+                        keepwarm.record_request(provider_type.value, provider, request.model, time.monotonic() - t_start)
+                        keepwarm = None
+                    yield chunk
+
+    def _can_hedge(self, primary_provider_type: ProviderType) -> bool:
+        """Whether a request to this primary may be hedged with the local fallback"""
+        return (
+            self.hedge_enabled
+            and self.fallback_enabled
+            and primary_provider_type == ProviderType.OPENROUTER
+            and self._providers.get(ProviderType.LOCAL) is not None
+        )
+
+    async def _generate_hedged(
+        self,
+        session_id: str,
+        primary: LLMProvider,
+        fallback: LLMProvider,
+        request: LLMRequest,
+        stream: bool,
+        callback: Optional[Callable[[str], None]],
+        priority: LLMPriority = LLMPriority.TEXT,
+    ) -> str:
+        """
+        Race the primary against the fallback provider on first token.
+
+        The primary starts alone. If it hasn't streamed a first token within
+        the adaptive hedge delay (or fails with a transient error before one),
+        the fallback starts in parallel. Whichever provider streams a first
+        token first wins: the other stream is cancelled and only the winner's
+        chunks reach the callback.
+
+        Args:
+            session_id: Session UUID
+            primary: Primary (OpenRouter) provider
+            fallback: Fallback (local) provider
+            request: LLM request
+            stream: Enable streaming
+            callback: Optional streaming callback
+            priority: Scheduler admission class (both contenders)
+
+        Returns:
+            str: Complete response text from the winner
+
+        Raises:
+            LLMHedgeFailedError: Every provider that was started failed
+            LLMAuthenticationError / LLMError: Primary failed with a
+                non-transient error before the fallback started
+        """
+        primary_name = ProviderType.OPENROUTER.value
+        fallback_name = ProviderType.LOCAL.value
+        tracker = self.hedge_tracker
+
+        changed = asyncio.Event()
+        tasks: Dict[str, asyncio.Task] = {}
+        queues: Dict[str, asyncio.Queue] = {}
+        errors: Dict[str, Exception] = {}
+        started_at: Dict[str, float] = {}
+        streamed_tokens: Dict[str, int] = {}
+        winner: Optional[str] = None
+        hedged = False
+
+        async def contend(name: str, provider: LLMProvider) -> None:
+            nonlocal winner
+            queue = queues[name]
+            contents = self._scheduled_stream(provider, ProviderType(name), request, priority, session_id)
+            try:
+                async with contextlib.aclosing(contents) as chunks:
+                    async for chunk in chunks:
+                        if not chunk:
+                            continue
+                        if winner is None:
+                            winner = name
+                            tracker.record_first_token(name, time.monotonic() - started_at[name])
+                        elif winner != name:
+                            streamed_tokens[name] = streamed_tokens.get(name, 0) + estimate_tokens(chunk)
+                            return  # Lost the race
+                        queue.put_nowait(chunk)
+                        changed.set()
+            except Exception as e:
+                errors[name] = e
+            finally:
+                queue.put_nowait(_STREAM_END)
+                changed.set()
+
+        def start(name: str, provider: LLMProvider) -> None:
+            started_at[name] = time.monotonic()
+            queues[name] = asyncio.Queue()
+            tasks[name] = asyncio.create_task(contend(name, provider))
+
+        hedge_delay_s = tracker.hedge_delay_s(primary_name)
+        hedge_at = time.monotonic() + hedge_delay_s
+        start(primary_name, primary)
+
+        try:
+            async with asyncio.timeout(self.service_timeout_s):
+                while winner is None:
+                    changed.clear()
+
+                    if fallback_name not in tasks:
+                        if tasks[primary_name].done():
+                            error = errors.get(primary_name)
+                            if error is None:
+                                return ""  # Empty response
+                            if not isinstance(error, (LLMTimeoutError, LLMRateLimitError, LLMConnectionError)):
+                                raise error  # Handled by _generate_with_fallback (no failover)
+
+                            # Transient failure before the first token: fail over now
+                            logger.warning(
+                                f"🤖 LLM Service [{session_id[:8]}]: Primary failed before first token "
+                                f"({type(error).__name__}: {error}), falling back to local LLM"
+                            )
+                            tracker.record_failover(primary_name)
+                            if self.error_callback:
+                                await self.error_callback(ServiceErrorEvent(
+                                    service_name="llm_provider",
+                                    error_type=ServiceErrorType.LLM_FALLBACK_TRIGGERED,
+                                    user_message="Primary AI unavailable. Using local AI as fallback.",
+                                    technical_details=f"Primary provider failed: {type(error).__name__}: {error} (falling back to local LLM)",
+                                    session_id=session_id,
+                                    severity="warning",
+                                    retry_suggested=False
+                                ))
+                            start(fallback_name, fallback)
+                            continue
+
+                        if time.monotonic() >= hedge_at:
+                            logger.info(
+                                f"🏁 LLM Service [{session_id[:8]}]: No first token from {primary_name} "
+                                f"after {hedge_delay_s * 1000:.0f}ms, hedging with {fallback_name}"
+                            )
+                            hedged = True
+                            tracker.record_hedge_fired(primary_name)
+                            start(fallback_name, fallback)
+                            continue
+
+                    elif all(task.done() for task in tasks.values()):
+                        if len(errors) < len(tasks):
+                            return ""  # A provider finished without output
+                        break
+
+                    wait_s = hedge_at - time.monotonic() if fallback_name not in tasks else None
+                    try:
+                        await asyncio.wait_for(changed.wait(), timeout=wait_s)
+                    except asyncio.TimeoutError:
+                        pass
+
+                if winner is None:
+                    raise self._hedge_failed(errors)
+
+                # Cancel the loser and forward the winner's stream
+                for name, task in tasks.items():
+                    if name != winner:
+                        task.cancel()
+                if hedged:
+                    logger.info(
+                        f"🏁 LLM Service [{session_id[:8]}]: {winner} won the race "
+                        f"({(time.monotonic() - started_at[winner]) * 1000:.0f}ms to first token)"
+                    )
+
+                chunks = []
+                queue = queues[winner]
+                while (chunk := await queue.get()) is not _STREAM_END:
+                    chunks.append(chunk)
+                    if stream and callback:
+                        await self._invoke_callback(callback, chunk)
+
+                if winner in errors:
+                    if winner == fallback_name:
+                        raise self._hedge_failed(errors)
+                    raise errors[winner]
+                return "".join(chunks)
+
+        except asyncio.TimeoutError:
+            logger.error(f"🤖 LLM Service: ⏱️ Service layer timeout after {self.service_timeout_s}s")
+            if fallback_name in tasks:
+                raise self._hedge_failed(errors, timed_out=True)
+            raise LLMTimeoutError(f"LLM service timeout: No response in {self.service_timeout_s}s")
+
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+            if hedged and winner is not None:
+                loser = fallback_name if winner == primary_name else primary_name
+                # The cancelled request still processed the prompt
+                wasted = sum(estimate_message_tokens(m) for m in request.messages) + streamed_tokens.get(loser, 0)
+                tracker.record_race(winner=winner, loser=loser, wasted_tokens=wasted)
+
+    def _hedge_failed(self, errors: Dict[str, Exception], timed_out: bool = False) -> LLMHedgeFailedError:
+        """Build the error for a hedged race nobody won"""
+        details = ", ".join(f"{name}: {type(e).__name__}: {e}" for name, e in errors.items())
+        if timed_out:
+            details = f"timeout after {self.service_timeout_s}s" + (f" ({details})" if details else "")
+        return LLMHedgeFailedError(f"Both primary and fallback providers failed. {details}")
+
+    async def _invoke_callback(self, callback: Callable[[str], None], chunk: str) -> None:
+        """Call a streaming callback (sync or async); errors are logged, not raised"""
+        try:
+            result = callback(chunk)
+            # If callback is async, await it
+            if hasattr(result, "__await__"):
+                await result
+        except Exception as e:
+            logger.warning(
+                f"🤖 LLM Service: Callback error (continuing): {e}"
+            )
+
+    def get_provider(self, provider_type: ProviderType) -> Optional[LLMProvider]:
+        """
+        Get this service's provider instance for a type.
+
+        Args:
+            provider_type: Provider type
+
+        Returns:
+            LLMProvider, or None if that provider is not configured
+        """
+        return self._providers.get(provider_type)
+
     async def get_provider_status(self) -> Dict[str, bool]:
         """
         Get health status of all providers.
@@ -708,14 +1076,263 @@ def get_llm_service() -> LLMService:
     return _llm_service_instance
 
 
+CacheKey = Tuple[str, Optional[str], str]
+
+
+class LLMServiceCache:
+    """
+    Keyed cache of per-agent LLMService instances.
+
+    Building an LLMService means a database round trip, Fernet decryption of
+    the provider API key and fresh httpx clients (new TCP/TLS handshakes on
+    the next request). Caching per (agent id, provider id, config hash) keeps
+    provider objects and their connection pools warm across turns.
+
+    Entries are invalidated explicitly when an agent or LLM provider is
+    updated or deleted. Invalidated or LRU-evicted services are closed after
+    a grace period so responses still streaming from them can finish.
+
+    Example usage:
+        cache = get_llm_service_cache()
+        service = await cache.get_or_create(key, build_service)
+        cache.invalidate_agent(agent_id)     # Agent updated
+        cache.invalidate_provider(provider_id)  # Provider key/URL changed
+    """
+
+    def __init__(
+        self,
+        max_size: int = LLM_SERVICE_CACHE_MAX_SIZE,
+        close_grace_s: float = LLM_SERVICE_CACHE_CLOSE_GRACE_S,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Services kept before the least recently used is evicted
+            close_grace_s: Delay before an evicted service's connections are closed
+        """
+        self.max_size = max(1, max_size)
+        self.close_grace_s = close_grace_s
+
+        self._services: "OrderedDict[CacheKey, LLMService]" = OrderedDict()
+        self._build_locks: Dict[CacheKey, asyncio.Lock] = {}
+        self._close_tasks: Set[asyncio.Task] = set()
+
+        # Metrics
+        self.reused = 0
+        self.cold_starts = 0
+        self.uncached_builds = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self.cold_start_s_total = 0.0
+
+    async def get_or_create(
+        self,
+        key: CacheKey,
+        factory: Callable[[], Awaitable[Tuple[LLMService, bool]]],
+    ) -> LLMService:
+        """
+        Return the cached service for key, building it on first use.
+
+        Concurrent callers for the same key share one build.
+
+        Args:
+            key: (agent id, provider id, config hash)
+            factory: Builds the service; returns (service, cacheable). A
+                     service built from a fallback config (e.g. the provider
+                     lookup failed) is returned but not cached.
+
+        Returns:
+            LLMService for the key
+        """
+        service = self._lookup(key)
+        if service is not None:
+            return service
+
+        lock = self._build_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                service = self._lookup(key)
+                if service is not None:
+                    return service
+
+                t_start = time.time()
+                service, cacheable = await factory()
+                build_s = time.time() - t_start
+
+                if not cacheable:
+                    self.uncached_builds += 1
+                    return service
+
+                self.cold_starts += 1
+                self.cold_start_s_total += build_s
+                self._services[key] = service
+                logger.info(
+                    f"🤖 LLM Service Cache: Cold start for agent {key[0][:8]}... "
+                    f"({build_s * 1000:.0f}ms, {len(self._services)} cached)"
+                )
+
+                while len(self._services) > self.max_size:
+                    _, evicted = self._services.popitem(last=False)
+                    self.evictions += 1
+                    self._retire(evicted)
+                return service
+        finally:
+            if not lock.locked():
+                self._build_locks.pop(key, None)
+
+    def invalidate_agent(self, agent_id: Any) -> int:
+        """
+        Drop cached services for an agent.
+
+        Args:
+            agent_id: Agent UUID
+
+        Returns:
+            Number of services invalidated
+        """
+        return self._invalidate(lambda key: key[0] == str(agent_id), f"agent {agent_id}")
+
+    def invalidate_provider(self, provider_id: Any) -> int:
+        """
+        Drop cached services built from an LLM provider.
+
+        Args:
+            provider_id: LLM provider UUID
+
+        Returns:
+            Number of services invalidated
+        """
+        return self._invalidate(lambda key: key[1] == str(provider_id), f"provider {provider_id}")
+
+    def clear(self) -> int:
+        """Drop every cached service"""
+        return self._invalidate(lambda key: True, "all")
+
+    async def close(self) -> None:
+        """Close every cached and retiring service immediately (shutdown)"""
+        services = list(self._services.values())
+        self._services.clear()
+        for task in list(self._close_tasks):
+            task.cancel()
+        for service in services:
+            await service.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, reuse and cold-start counts and mean cold-start time
+        """
+        lookups = self.reused + self.cold_starts
+        return {
+            'size': len(self._services),
+            'max_size': self.max_size,
+            'reused': self.reused,
+            'cold_starts': self.cold_starts,
+            'uncached_builds': self.uncached_builds,
+            'reuse_rate': self.reused / lookups if lookups else 0.0,
+            'avg_cold_start_ms': (
+                self.cold_start_s_total / self.cold_starts * 1000 if self.cold_starts else 0.0
+            ),
+            'invalidations': self.invalidations,
+            'evictions': self.evictions,
+            'retiring': len(self._close_tasks),
+        }
+
+    def _lookup(self, key: CacheKey) -> Optional[LLMService]:
+        service = self._services.get(key)
+        if service is not None:
+            self._services.move_to_end(key)
+            self.reused += 1
+        return service
+
+    def _invalidate(self, match: Callable[[CacheKey], bool], label: str) -> int:
+        keys = [key for key in self._services if match(key)]
+        for key in keys:
+            self._retire(self._services.pop(key))
+        if keys:
+            self.invalidations += len(keys)
+            logger.info(f"🤖 LLM Service Cache: Invalidated {len(keys)} service(s) for {label}")
+        return len(keys)
+
+    def _retire(self, service: LLMService) -> None:
+        """Close a service once in-flight requests have had time to finish"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop (sync context): connections are dropped with the service
+
+        async def close_later():
+            try:
+                await asyncio.sleep(self.close_grace_s)
+                await service.close()
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.warning(f"🤖 LLM Service Cache: Error closing retired service: {e}")
+
+        task = loop.create_task(close_later())
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+
+_llm_service_cache: Optional[LLMServiceCache] = None
+
+
+def get_llm_service_cache() -> Optional[LLMServiceCache]:
+    """
+    Get the process-wide per-agent LLMService cache.
+
+    Returns:
+        Shared cache, or None when LLM_SERVICE_CACHE_ENABLED is false
+    """
+    global _llm_service_cache
+    if not LLM_SERVICE_CACHE_ENABLED:
+        return None
+    if _llm_service_cache is None:
+        _llm_service_cache = LLMServiceCache()
+    return _llm_service_cache
+
+
+def reset_llm_service_cache() -> None:
+    """Drop the shared cache (next get_llm_service_cache() creates a fresh one)"""
+    global _llm_service_cache
+    _llm_service_cache = None
+
+
+def invalidate_agent_llm_services(agent_id: Any) -> int:
+    """Drop cached LLM services for an agent (call after the agent is updated or deleted)"""
+    return _llm_service_cache.invalidate_agent(agent_id) if _llm_service_cache else 0
+
+
+def invalidate_provider_llm_services(provider_id: Any) -> int:
+    """Drop cached LLM services using a provider (call after it is updated or deleted)"""
+    return _llm_service_cache.invalidate_provider(provider_id) if _llm_service_cache else 0
+
+
+def _env_config_hash() -> str:
+    """Hash of the env vars LLMService reads, so env changes never hit a stale entry"""
+    digest = hashlib.sha256()
+    for name in _ENV_CONFIG_KEYS:
+        digest.update(f"{name}={os.getenv(name, '')}\n".encode())
+    return digest.hexdigest()[:16]
+
+
 async def get_llm_service_for_agent(agent) -> LLMService:
     """
-    Create LLM service instance with database provider config from agent.
+    Get the LLM service for an agent, with database provider config.
 
     Priority for LLM provider configuration:
     1. Database provider (agent.llm_provider_id) - highest priority
     2. Environment variables (OPENROUTER_API_KEY, LOCAL_LLM_BASE_URL)
 
+    Services are cached per (agent id, provider id, env config hash), so
+    repeated calls reuse provider objects and HTTP connection pools instead
+    of re-fetching and decrypting the provider on every turn. Callers must not
+    close the returned service; the cache owns it.
+
     Args:
         agent: Agent database model instance with llm_provider_id relationship
 
@@ -726,10 +1343,35 @@ async def get_llm_service_for_agent(agent) -> LLMService:
         # In Discord plugin initialize()
         llm_service = await get_llm_service_for_agent(self.agent)
     """
+    cache = get_llm_service_cache()
+    if cache is None:
+        service, _ = await _build_llm_service_for_agent(agent)
+        return service
+
+    key = (
+        str(agent.id),
+        str(agent.llm_provider_id) if agent.llm_provider_id else None,
+        _env_config_hash(),
+    )
+    return await cache.get_or_create(key, lambda: _build_llm_service_for_agent(agent))
+
+
+async def _build_llm_service_for_agent(agent) -> Tuple[LLMService, bool]:
+    """
+    Create LLM service instance with database provider config from agent.
+
+    Args:
+        agent: Agent database model instance
+
+    Returns:
+        Tuple of (service, cacheable). Not cacheable when the database
+        provider could not be loaded and env vars were used as a fallback.
+    """
     # Import here to avoid circular dependency
     from src.services.llm_provider_service import LLMProviderService
 
     db_provider_config = None
+    cacheable = True
 
     # Check if agent has llm_provider_id set
     if agent.llm_provider_id:
@@ -760,6 +1402,7 @@ async def get_llm_service_for_agent(agent) -> LLMService:
                     f"{'inactive' if db_provider else 'not found'}, falling back to env vars"
                 )
         except Exception as e:
+            cacheable = False  # Transient failure: retry the provider next turn
             logger.error(
                 f"🤖 LLM Service: Failed to fetch database provider for agent '{agent.name}': {e}, "
                 f"falling back to env vars"
@@ -770,7 +1413,7 @@ async def get_llm_service_for_agent(agent) -> LLMService:
         )
 
     # Create LLM service with database config (or None to fall back to env vars)
-    return LLMService(db_provider_config=db_provider_config)
+    return LLMService(db_provider_config=db_provider_config), cacheable
 
 
 async def get_global_provider_status() -> Dict[str, bool]:
@@ -0,0 +1,231 @@
+"""
+Speculative Memory Prefetch
+
+Memory retrieval (a Mem0 vector search plus scope lookups) used to start only
+once the final transcript arrived, putting it on every voice turn's critical
+path. WhisperX partials arrive hundreds of milliseconds earlier, and by the
+time the user stops speaking they usually already contain most of the final
+words. A retrieval started from a stable partial has often finished before
+the context is built.
+
+Key Features:
+- Prefetch starts once a partial has MEMORY_PREFETCH_MIN_WORDS words
+- Restarted when later partials drift too far from the prefetched query
+  (at most one retrieval in flight per session)
+- The final context build reuses the prefetch if the final transcript's word
+  overlap with the prefetched query is at least MEMORY_PREFETCH_MIN_OVERLAP;
+  otherwise it is discarded and the memories are re-queried
+- Stats: hit rate, mismatches, expiries and retrieval time saved
+
+Key Design Principles:
+- Keyed by session id, process-wide (WebRTC and Discord share it)
+- Never blocks the STT callback: prefetch only schedules a task
+"""
+
+import asyncio
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional
+
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+MEMORY_PREFETCH_ENABLED = os.getenv('MEMORY_PREFETCH_ENABLED', 'true').lower() in ('true', '1', 'yes')
+MEMORY_PREFETCH_MIN_WORDS = int(os.getenv('MEMORY_PREFETCH_MIN_WORDS', '3'))
+MEMORY_PREFETCH_MIN_OVERLAP = float(os.getenv('MEMORY_PREFETCH_MIN_OVERLAP', '0.6'))
+MEMORY_PREFETCH_TTL_S = float(os.getenv('MEMORY_PREFETCH_TTL_S', '20'))
+
+_WORD_PATTERN = re.compile(r"[a-z0-9']+")
+
+
+def query_tokens(text: str) -> FrozenSet[str]:
+    """Lowercased word set used to compare partial and final transcripts"""
+    return frozenset(_WORD_PATTERN.findall((text or '').lower()))
+
+
+def token_overlap(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard overlap between two word sets (0.0 - 1.0)"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class _Prefetch:
+    """One speculative retrieval for a session"""
+    query: str
+    tokens: FrozenSet[str]
+    task: asyncio.Task
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+
+
+class MemoryPrefetcher:
+    """
+    Starts memory retrievals from partial transcripts and hands them to the final context build.
+
+    Usage:
+        prefetcher = get_memory_prefetcher()
+
+        # On each partial transcript (non-blocking)
+        prefetcher.on_partial(session_id, partial_text, retrieve)
+
+        # When building context for the final transcript
+        task = prefetcher.take(session_id, final_text)
+        memory_context = await task if task else await retrieve(final_text)
+    """
+
+    def __init__(
+        self,
+        min_words: int = MEMORY_PREFETCH_MIN_WORDS,
+        min_overlap: float = MEMORY_PREFETCH_MIN_OVERLAP,
+        ttl_s: float = MEMORY_PREFETCH_TTL_S,
+    ):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            min_words: Words a partial needs before it is worth searching on
+            min_overlap: Word overlap (Jaccard) for a prefetch to be reused
+            ttl_s: Prefetches older than this are discarded
+        """
+        self.min_words = min_words
+        self.min_overlap = min_overlap
+        self.ttl_s = ttl_s
+        self._pending: Dict[str, _Prefetch] = {}
+
+        self._started = 0
+        self._restarted = 0
+        self._hits = 0
+        self._mismatches = 0
+        self._expired = 0
+        self._failed = 0
+        self._saved_s = 0.0
+
+    def on_partial(
+        self,
+        session_id: str,
+        text: str,
+        retrieve: Callable[[str], Awaitable[Optional[str]]],
+    ) -> bool:
+        """
+        Start (or restart) a prefetch for a partial transcript.
+
+        Args:
+            session_id: Session the partial belongs to
+            text: Partial transcript (full text so far)
+            retrieve: Coroutine function running the memory retrieval for a query
+
+        Returns:
+            True if a retrieval was started
+        """
+        tokens = query_tokens(text)
+        if len(tokens) < self.min_words:
+            return False
+
+        current = self._pending.get(session_id)
+        if current and not self._is_expired(current):
+            if token_overlap(current.tokens, tokens) >= self.min_overlap:
+                return False  # Still a good match for what's being said
+            if not current.task.done():
+                return False  # One retrieval in flight per session; compared again at the final
+            self._restarted += 1
+
+        prefetch = _Prefetch(query=text, tokens=tokens, task=asyncio.create_task(retrieve(text)))
+        prefetch.task.add_done_callback(lambda _task: setattr(prefetch, 'finished_at', time.monotonic()))
+        self._pending[session_id] = prefetch
+        self._started += 1
+        logger.debug(f"🔮 Memory prefetch started (session={session_id[:8]}, query=\"{text[:60]}\")")
+        return True
+
+    def take(self, session_id: str, query: str) -> Optional[asyncio.Task]:
+        """
+        Claim a session's prefetch for the final query.
+
+        Args:
+            session_id: Session ID
+            query: Final transcript
+
+        Returns:
+            The prefetch task (possibly still running) if it matches the query,
+            None if memories have to be retrieved for the query
+        """
+        prefetch = self._pending.pop(session_id, None)
+        if prefetch is None:
+            return None
+
+        if self._is_expired(prefetch):
+            self._expired += 1
+            prefetch.task.cancel()
+            return None
+
+        if prefetch.task.done() and (prefetch.task.cancelled() or prefetch.task.exception()):
+            self._failed += 1
+            return None
+
+        overlap = token_overlap(prefetch.tokens, query_tokens(query))
+        if overlap < self.min_overlap:
+            self._mismatches += 1
+            prefetch.task.cancel()
+            logger.debug(f"🔮 Memory prefetch discarded (session={session_id[:8]}, overlap={overlap:.2f})")
+            return None
+
+        # Retrieval time already spent before the final transcript was ready
+        now = time.monotonic()
+        saved_s = min(prefetch.finished_at or now, now) - prefetch.started_at
+        self._hits += 1
+        self._saved_s += saved_s
+        logger.info(
+            f"🔮 Memory prefetch reused (session={session_id[:8]}, overlap={overlap:.2f}, "
+            f"saved={saved_s * 1000:.0f}ms, {'ready' if prefetch.task.done() else 'in flight'})"
+        )
+        return prefetch.task
+
+    def discard(self, session_id: str) -> None:
+        """Drop a session's prefetch (session ended)"""
+        prefetch = self._pending.pop(session_id, None)
+        if prefetch:
+            prefetch.task.cancel()
+
+    def _is_expired(self, prefetch: _Prefetch) -> bool:
+        return time.monotonic() - prefetch.started_at > self.ttl_s
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit rate and latency saved by prefetching"""
+        claimed = self._hits + self._mismatches + self._expired + self._failed
+        return {
+            "started": self._started,
+            "restarted": self._restarted,
+            "hits": self._hits,
+            "mismatches": self._mismatches,
+            "expired": self._expired,
+            "failed": self._failed,
+            "hit_rate": round(self._hits / claimed, 3) if claimed else 0.0,
+            "saved_ms_total": round(self._saved_s * 1000, 1),
+            "avg_saved_ms": round(self._saved_s / self._hits * 1000, 1) if self._hits else 0.0,
+            "pending": len(self._pending),
+            "min_overlap": self.min_overlap,
+        }
+
+
+_prefetcher: Optional[MemoryPrefetcher] = None
+
+
+def get_memory_prefetcher() -> Optional[MemoryPrefetcher]:
+    """Get the process-wide prefetcher (None if MEMORY_PREFETCH_ENABLED is off)"""
+    global _prefetcher
+    if not MEMORY_PREFETCH_ENABLED:
+        return None
+    if _prefetcher is None:
+        _prefetcher = MemoryPrefetcher()
+    return _prefetcher
+
+
+def reset_memory_prefetcher() -> None:
+    """Drop the process-wide prefetcher (tests)"""
+    global _prefetcher
+    _prefetcher = None
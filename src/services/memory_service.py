@@ -7,7 +7,8 @@ import os
 import json
 import time
 from collections import deque
-from typing import List, Dict, Optional
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Union
 from uuid import UUID
 from datetime import datetime, timedelta
 from mem0 import Memory
@@ -15,14 +16,50 @@ from sqlalchemy import select, and_, func
 from src.database.models import User, UserFact, ExtractionTask, Agent, SystemSettings, UserAgentMemorySetting
 from src.database.session import get_db_session
 from src.services.llm_service import LLMService, LLMConfig, ProviderType
+from src.services.llm_scheduler import LLMPriority, LLMRequestRejectedError, get_llm_scheduler
 from src.services.mem0_compat import Mem0ResponseNormalizer
 from src.config.logging_config import get_logger
 from src.utils.encryption import decrypt_api_key
+from src.utils.ttl_cache import get_ttl_cache
 
 # Configure logging
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class CachedUser:
+    """
+    Read-only snapshot of the User columns the memory hot path needs.
+
+    Cached lookups hand these out instead of ORM instances, which belong to
+    the session that loaded them. To change the user, load the row in your
+    own session.
+    """
+    id: UUID
+    user_id: Optional[str]
+    allow_agent_specific_memory: bool
+
+    @classmethod
+    def from_model(cls, user: User) -> 'CachedUser':
+        return cls(
+            id=user.id,
+            user_id=user.user_id,
+            allow_agent_specific_memory=bool(user.allow_agent_specific_memory),
+        )
+
+
+@dataclass(frozen=True)
+class CachedAgent:
+    """Read-only snapshot of the Agent columns the memory hot path needs (see CachedUser)"""
+    id: UUID
+    name: str
+    memory_scope: Optional[str]
+
+    @classmethod
+    def from_model(cls, agent: Agent) -> 'CachedAgent':
+        return cls(id=agent.id, name=agent.name, memory_scope=agent.memory_scope)
+
+
 class ErrorGuard:
     """
     Phase 6: Error Guards - Circuit breaker for memory operations.
@@ -180,34 +217,90 @@ async def get_admin_memory_policy() -> bool:
         1. Database (system_settings.admin_memory_policy)
         2. Environment variable (ADMIN_ALLOW_AGENT_SPECIFIC_MEMORY)
         3. Hardcoded default (True - maintains current behavior)
+
+    Cached (LOOKUP_CACHE_TTL_S); the policy routes call invalidate_memory_lookups().
     """
     try:
-        async with get_db_session() as db:
-            result = await db.execute(
-                select(SystemSettings).where(SystemSettings.setting_key == "admin_memory_policy")
-            )
-            setting = result.scalar_one_or_none()
-
-            if setting:
-                policy = setting.setting_value.get("allow_agent_specific_memory_globally", True)
-                logger.debug(f"📊 Retrieved admin memory policy from database: {policy}")
-                return policy
-            else:
-                # Fall back to environment variable
-                env_policy = os.getenv("ADMIN_ALLOW_AGENT_SPECIFIC_MEMORY", "true").lower() == "true"
-                logger.debug(f"🌍 Using admin memory policy from environment/default: {env_policy}")
-                return env_policy
+        return await get_ttl_cache("memory_policy").get_or_load("admin_memory_policy", _load_admin_memory_policy)
     except Exception as e:
         logger.error(f"❌ Failed to fetch admin memory policy from database: {e}")
         # Fall back to safe default (allow agent-specific memory)
         return True
 
 
+async def _load_admin_memory_policy() -> bool:
+    async with get_db_session() as db:
+        result = await db.execute(
+            select(SystemSettings).where(SystemSettings.setting_key == "admin_memory_policy")
+        )
+        setting = result.scalar_one_or_none()
+
+        if setting:
+            policy = setting.setting_value.get("allow_agent_specific_memory_globally", True)
+            logger.debug(f"📊 Retrieved admin memory policy from database: {policy}")
+            return policy
+        else:
+            # Fall back to environment variable
+            env_policy = os.getenv("ADMIN_ALLOW_AGENT_SPECIFIC_MEMORY", "true").lower() == "true"
+            logger.debug(f"🌍 Using admin memory policy from environment/default: {env_policy}")
+            return env_policy
+
+
+async def get_user_agent_memory_preference(user_id: str, agent_id: UUID) -> Optional[bool]:
+    """
+    Get a user's explicit memory scope preference for an agent.
+
+    Args:
+        user_id: User identifier
+        agent_id: Agent UUID
+
+    Returns:
+        UserAgentMemorySetting.allow_agent_specific_memory, or None if the
+        user hasn't set one (cached; the preference routes invalidate it)
+    """
+    async def load() -> Optional[bool]:
+        async with get_db_session() as db:
+            result = await db.execute(
+                select(UserAgentMemorySetting).where(
+                    UserAgentMemorySetting.user_id == user_id,
+                    UserAgentMemorySetting.agent_id == agent_id
+                )
+            )
+            user_pref = result.scalar_one_or_none()
+            return None if user_pref is None else bool(user_pref.allow_agent_specific_memory)
+
+    return await get_ttl_cache("memory_preferences").get_or_load((user_id, str(agent_id)), load)
+
+
+def invalidate_memory_lookups(
+    user_id: Optional[str] = None,
+    agent_id: Optional[UUID] = None,
+    admin_policy: bool = False,
+) -> None:
+    """
+    Drop cached memory lookups after the underlying rows change.
+
+    Args:
+        user_id: User whose row or per-agent preferences changed
+        agent_id: Agent that changed (with user_id: that one preference)
+        admin_policy: The admin memory policy changed
+    """
+    if admin_policy:
+        get_ttl_cache("memory_policy").invalidate("admin_memory_policy")
+    if user_id and agent_id:
+        get_ttl_cache("memory_preferences").invalidate((user_id, str(agent_id)))
+    elif user_id:
+        get_ttl_cache("memory_users").invalidate(user_id)
+        get_ttl_cache("memory_preferences").invalidate_where(lambda key: key[0] == user_id)
+    elif agent_id:
+        get_ttl_cache("agents").invalidate(str(agent_id))
+
+
 async def resolve_memory_scope(
     user_id: str,
     agent_id: UUID,
-    agent: Optional[Agent],
-    user: Optional[User] = None
+    agent: Optional[Union[Agent, CachedAgent]],
+    user: Optional[Union[User, CachedUser]] = None
 ) -> tuple[str, Optional[UUID]]:
     """
     Resolve final memory scope using two-tier hierarchy (Phase 2: Per-Agent Memory Preferences).
@@ -221,8 +314,8 @@ async def resolve_memory_scope(
     Args:
         user_id: User identifier (e.g., "discord:123456789")
         agent_id: Agent UUID
-        agent: Agent model instance (can be None if agent was deleted)
-        user: Optional User model instance (for backwards compat check)
+        agent: Agent model instance or snapshot (can be None if agent was deleted)
+        user: Optional User model instance or snapshot (for backwards compat check)
 
     Returns:
         tuple[scope, fact_agent_id]:
@@ -240,46 +333,39 @@ async def resolve_memory_scope(
         return ('global', None)
 
     # Tier 2: Per-Agent User Preference
-    async with get_db_session() as db:
-        # Check for explicit user preference
-        result = await db.execute(
-            select(UserAgentMemorySetting).where(
-                UserAgentMemorySetting.user_id == user_id,
-                UserAgentMemorySetting.agent_id == agent_id
-            )
-        )
-        user_pref = result.scalar_one_or_none()
-
-        if user_pref is not None:
-            # User has explicitly set preference for this agent
-            if user_pref.allow_agent_specific_memory:
-                logger.info(f"🎯 User {user_id} preference: agent-specific memory for agent {agent_id}")
-                return ('agent', agent_id)
-            else:
-                logger.info(f"🌍 User {user_id} preference: global memory for agent {agent_id}")
-                return ('global', None)
+    # Check for explicit user preference
+    user_pref = await get_user_agent_memory_preference(user_id, agent_id)
 
-        # BACKWARDS COMPATIBILITY: Check global toggle (deprecated)
-        # TODO: Remove after migration period (migration 024)
-        if user and not user.allow_agent_specific_memory:
-            logger.warning(
-                f"⚠️ DEPRECATED: User {user_id} using global toggle (User.allow_agent_specific_memory=False). "
-                f"Migrate to per-agent preferences via user_agent_memory_settings table."
-            )
-            return ('global', None)
-
-        # Fall back to agent default (if agent still exists)
-        if agent is None:
-            logger.warning(f"⚠️ Agent {agent_id} not found (deleted?), falling back to global scope")
-            return ('global', None)
-
-        if agent.memory_scope == "agent":
-            logger.info(f"🎯 Agent {agent_id} default: agent-specific memory")
+    if user_pref is not None:
+        # User has explicitly set preference for this agent
+        if user_pref:
+            logger.info(f"🎯 User {user_id} preference: agent-specific memory for agent {agent_id}")
             return ('agent', agent_id)
         else:
-            logger.info(f"🌍 Agent {agent_id} default: global memory")
+            logger.info(f"🌍 User {user_id} preference: global memory for agent {agent_id}")
             return ('global', None)
 
+    # BACKWARDS COMPATIBILITY: Check global toggle (deprecated)
+    # TODO: Remove after migration period (migration 024)
+    if user and not user.allow_agent_specific_memory:
+        logger.warning(
+            f"⚠️ DEPRECATED: User {user_id} using global toggle (User.allow_agent_specific_memory=False). "
+            f"Migrate to per-agent preferences via user_agent_memory_settings table."
+        )
+        return ('global', None)
+
+    # Fall back to agent default (if agent still exists)
+    if agent is None:
+        logger.warning(f"⚠️ Agent {agent_id} not found (deleted?), falling back to global scope")
+        return ('global', None)
+
+    if agent.memory_scope == "agent":
+        logger.info(f"🎯 Agent {agent_id} default: agent-specific memory")
+        return ('agent', agent_id)
+    else:
+        logger.info(f"🌍 Agent {agent_id} default: global memory")
+        return ('global', None)
+
 
 async def get_embedding_model_status(model_name: str) -> dict:
     """
@@ -818,6 +904,15 @@ If no user-specific facts are found, extract nothing.
                                 except Exception as ws_error:
                                     logger.warning(f"⚠️ Failed to broadcast completed event: {ws_error}")
 
+                        except LLMRequestRejectedError as e:
+                            # Interactive load on the LLM - yield the rest of the batch and
+                            # retry on the next pass without using up an attempt
+                            task.status = "pending"
+                            task.attempts -= 1
+                            await db.commit()
+                            logger.info(f"⏸️ Extraction task {task.id} deferred: {e}")
+                            break
+
                         except Exception as e:
                             logger.error(f"❌ Extraction task {task.id} failed (attempt {task.attempts}): {e}")
 
@@ -1296,6 +1391,21 @@ If no user-specific facts are found, extract nothing.
             logger.error(f"❌ Failed to retrieve memories for user {user_id}: {e}")
             return ""  # Degrade gracefully
 
+    async def embed_text(self, text: str) -> List[float]:
+        """
+        Embed text with the memory system's embedding model.
+
+        Runs on the default thread pool rather than self.executor so short
+        lookups don't queue behind fact extraction.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        return await asyncio.to_thread(self.memory.embedding_model.embed, text, "search")
+
     def _build_embedder_config_from_db(self, db_config: dict) -> dict:
         """
         Build Mem0 embedder config from database settings (Priority 1).
@@ -1411,7 +1521,8 @@ Answer with only "yes" or "no".
             session_id="memory_relevance_check",
             messages=[{"role": "system", "content": relevance_prompt}],
             config=config,
-            stream=False
+            stream=False,
+            priority=LLMPriority.BACKGROUND,
         )
 
         return response.strip().lower() == "yes"
@@ -1709,32 +1820,46 @@ Answer with only "yes" or "no".
             # On error, allow the fact to be saved (fail open)
             return False
 
-    async def _get_or_create_user(self, user_id: str, db) -> User:
-        """Get user from database or create if doesn't exist."""
-        result = await db.execute(
-            select(User).where(User.user_id == user_id)
-        )
-        user = result.scalar_one_or_none()
+    async def _get_or_create_user(self, user_id: str, db) -> CachedUser:
+        """
+        Get user from database or create if doesn't exist.
 
-        if not user:
-            user = User(user_id=user_id)
-            db.add(user)
-            await db.commit()
-            await db.refresh(user)
-            logger.info(f"👤 Created new user: {user_id}")
+        Returns a read-only snapshot, cached per user_id (every path that
+        changes or deletes the user calls invalidate_memory_lookups(user_id=...)).
+        """
+        async def load() -> CachedUser:
+            result = await db.execute(
+                select(User).where(User.user_id == user_id)
+            )
+            user = result.scalar_one_or_none()
+
+            if not user:
+                user = User(user_id=user_id)
+                db.add(user)
+                await db.commit()
+                await db.refresh(user)
+                logger.info(f"👤 Created new user: {user_id}")
 
-        return user
+            return CachedUser.from_model(user)
 
-    async def _get_agent(self, agent_id: UUID, db) -> Optional[Agent]:
+        return await get_ttl_cache("memory_users").get_or_load(user_id, load)
+
+    async def _get_agent(self, agent_id: UUID, db) -> Optional[CachedAgent]:
         """
         Get agent by ID.
 
         Returns None if agent doesn't exist (e.g., deleted between task creation and processing).
+        Returns a read-only snapshot, cached per agent (AgentService invalidates it
+        on update, default change and delete).
         """
-        result = await db.execute(
-            select(Agent).where(Agent.id == agent_id)
-        )
-        return result.scalar_one_or_none()
+        async def load() -> Optional[CachedAgent]:
+            result = await db.execute(
+                select(Agent).where(Agent.id == agent_id)
+            )
+            agent = result.scalar_one_or_none()
+            return CachedAgent.from_model(agent) if agent is not None else None
+
+        return await get_ttl_cache("agents").get_or_load(str(agent_id), load)
 
     def _infer_fact_category(self, fact_text: str) -> str:
         """
@@ -2350,7 +2475,7 @@ Respond ONLY with JSON, no other text:
         )
         return result.scalar() or 0
 
-    async def _enforce_memory_limit(self, user: User, db) -> int:
+    async def _enforce_memory_limit(self, user: CachedUser, db) -> int:
         """
         Check memory limit and prune if needed BEFORE adding new facts.
 
@@ -2505,7 +2630,7 @@ Respond ONLY with JSON, no other text:
 
     async def _upsert_fact(
         self,
-        user: User,
+        user: CachedUser,
         agent_id: UUID | None,
         vector_id: str,
         fact_text: str,
@@ -2965,6 +3090,35 @@ Output a single paragraph summary."""
         """
         Call the LLM for summarization.
 
+        Takes a background slot from the shared LLM scheduler, so it waits
+        behind (or yields to) interactive turns on the same model.
+
+        Args:
+            prompt: The summarization prompt
+
+        Returns:
+            Summary text or empty string on failure or under load
+        """
+        scheduler = get_llm_scheduler()
+        if scheduler is None:
+            return await self._request_summary(prompt)
+
+        try:
+            async with scheduler.slot(
+                self.summarization_llm_provider,
+                self.summarization_llm_model,
+                LLMPriority.BACKGROUND,
+                session_id="memory_summarization",
+            ):
+                return await self._request_summary(prompt)
+        except LLMRequestRejectedError as e:
+            logger.info(f"⏸️ Summarization deferred: {e}")
+            return ""
+
+    async def _request_summary(self, prompt: str) -> str:
+        """
+        Send the summarization request.
+
         Uses configured provider (OpenRouter or local).
 
         Args:
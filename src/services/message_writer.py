@@ -0,0 +1,346 @@
+"""
+Write-Behind Message Persistence
+
+Saving a conversation message used to cost a duplicate-check SELECT, an
+INSERT, a commit and a refresh, all awaited between the LLM finishing and
+the next turn starting. Messages now go into the session cache immediately
+and are queued here; a background flusher writes them to the conversations
+table in batches across all sessions.
+
+Key Features:
+- Multi-row INSERT ... ON CONFLICT DO NOTHING RETURNING id per batch
+- Flushes when MESSAGE_FLUSH_BATCH_SIZE messages are queued or
+  MESSAGE_FLUSH_INTERVAL_MS after the first one, whichever comes first
+- Idempotency keys (unique conversations.idempotency_key): a batch retried
+  after a lost commit acknowledgement never inserts a row twice
+- Database ids are written back onto the queued Message objects, so cached
+  messages get their id once persisted
+- Failed batches stay queued and are retried with backoff; a row the
+  database rejects outright (e.g. its session was deleted) is dropped
+  rather than blocking the queue
+- flush() for read-your-writes (history endpoints) and close() drains the
+  queue on shutdown
+
+Key Design Principles:
+- Process-wide and shared by every ConversationService
+- MESSAGE_WRITE_BEHIND_ENABLED=false keeps synchronous writes (write())
+  through the same insert path
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+
+from src.config.logging_config import get_logger
+from src.database.models import Conversation
+from src.database.session import get_db_session
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+MESSAGE_WRITE_BEHIND_ENABLED = os.getenv('MESSAGE_WRITE_BEHIND_ENABLED', 'true').lower() in ('true', '1', 'yes')
+MESSAGE_FLUSH_INTERVAL_MS = int(os.getenv('MESSAGE_FLUSH_INTERVAL_MS', '100'))
+MESSAGE_FLUSH_BATCH_SIZE = int(os.getenv('MESSAGE_FLUSH_BATCH_SIZE', '64'))
+MESSAGE_FLUSH_RETRY_MAX_S = float(os.getenv('MESSAGE_FLUSH_RETRY_MAX_S', '5'))
+
+_ROW_FIELDS = (
+    'session_id', 'role', 'content', 'timestamp', 'idempotency_key',
+    'audio_duration_ms', 'tts_duration_ms', 'llm_latency_ms', 'total_latency_ms',
+)
+
+# insert(rows) -> {idempotency_key: conversation id}
+InsertFn = Callable[[List[Dict[str, Any]]], Awaitable[Dict[str, int]]]
+
+
+async def insert_conversation_rows(rows: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Insert conversation rows in one statement.
+
+    Rows whose idempotency key already exists (an earlier attempt committed)
+    are skipped by the INSERT and their ids looked up instead.
+
+    Args:
+        rows: Column dicts, each with an idempotency_key
+
+    Returns:
+        Conversation id for every row, by idempotency key
+    """
+    async with get_db_session() as db:
+        result = await db.execute(
+            pg_insert(Conversation)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=['idempotency_key'])
+            .returning(Conversation.id, Conversation.idempotency_key)
+        )
+        ids = {key: row_id for row_id, key in result.all()}
+
+        existing = [row['idempotency_key'] for row in rows if row['idempotency_key'] not in ids]
+        if existing:
+            result = await db.execute(
+                select(Conversation.id, Conversation.idempotency_key)
+                .where(Conversation.idempotency_key.in_(existing))
+            )
+            ids.update({key: row_id for row_id, key in result.all()})
+
+        await db.commit()
+        return ids
+
+
+@dataclass
+class _Pending:
+    """A queued message and the future resolved with its database id"""
+    message: Any
+    future: asyncio.Future
+    queued_at: float = field(default_factory=time.monotonic)
+
+    def row(self) -> Dict[str, Any]:
+        row = {name: getattr(self.message, name, None) for name in _ROW_FIELDS}
+        row['session_id'] = UUID(str(row['session_id']))
+        return row
+
+
+class MessageWriter:
+    """
+    Batches conversation message inserts behind the interactive path.
+
+    Usage:
+        writer = get_message_writer()
+
+        # Write-behind: returns immediately, message.id is set once flushed
+        writer.enqueue(message)
+
+        # Read-your-writes before querying the conversations table
+        await writer.flush()
+
+        # Shutdown
+        await writer.close()
+    """
+
+    def __init__(
+        self,
+        flush_interval_s: float = MESSAGE_FLUSH_INTERVAL_MS / 1000,
+        batch_size: int = MESSAGE_FLUSH_BATCH_SIZE,
+        insert: Optional[InsertFn] = None,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            flush_interval_s: Longest a message waits before its batch is written
+            batch_size: Queued messages that trigger an immediate flush (and rows per INSERT)
+            insert: Coroutine inserting rows (default: insert_conversation_rows)
+        """
+        self.flush_interval_s = flush_interval_s
+        self.batch_size = max(1, batch_size)
+        self.insert = insert or insert_conversation_rows
+
+        self._queue: Deque[_Pending] = deque()
+        self._queued = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        self._flush_failed = False
+
+        self._messages_written = 0
+        self._batches = 0
+        self._failures = 0
+        self._dropped = 0
+        self._total_flush_s = 0.0
+        self._max_batch = 0
+
+    def enqueue(self, message: Any) -> asyncio.Future:
+        """
+        Queue a message for the next batch.
+
+        Args:
+            message: Message with the conversations columns as attributes
+                     (including idempotency_key); its id is set when written
+
+        Returns:
+            Future resolved with the database id once the batch commits
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append(_Pending(message=message, future=future))
+        self._queued.set()
+        if len(self._queue) >= self.batch_size:
+            self._batch_full.set()
+        self._ensure_flusher()
+        return future
+
+    async def write(self, message: Any) -> int:
+        """
+        Write one message now (synchronous mode; errors propagate).
+
+        Returns:
+            Database id of the message
+        """
+        await self._write_batch([_Pending(message=message, future=asyncio.get_running_loop().create_future())])
+        return message.id
+
+    async def flush(self) -> int:
+        """
+        Write everything queued so far.
+
+        Returns:
+            Number of messages written (failed batches stay queued)
+        """
+        written = 0
+        async with self._flush_lock:
+            while self._queue:
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                try:
+                    await self._write_batch(batch)
+                except asyncio.CancelledError:
+                    # Requeue; if the insert did commit, the retry is a no-op per idempotency key
+                    self._queue.extendleft(reversed(batch))
+                    raise
+                except IntegrityError:
+                    # Find the offending row(s) instead of retrying the batch forever
+                    written += await self._write_individually(batch)
+                    if self._flush_failed:
+                        break
+                    continue
+                except Exception as e:
+                    self._queue.extendleft(reversed(batch))
+                    self._failures += 1
+                    self._flush_failed = True
+                    logger.error(f"❌ Message flush failed ({len(self._queue)} queued, will retry): {e}")
+                    break
+                written += len(batch)
+                self._flush_failed = False
+
+            if not self._queue:
+                self._queued.clear()
+            if len(self._queue) < self.batch_size:
+                self._batch_full.clear()
+        return written
+
+    async def close(self) -> None:
+        """Stop the flusher and write whatever is still queued"""
+        if self._flusher:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+
+        for attempt in range(3):
+            await self.flush()
+            if not self._queue:
+                break
+            await asyncio.sleep(0.5 * (attempt + 1))
+
+        if self._queue:
+            logger.error(f"❌ {len(self._queue)} conversation messages could not be written on shutdown")
+        else:
+            logger.info(f"✅ Message writer closed ({self._messages_written} messages written)")
+
+    async def _write_individually(self, batch: List[_Pending]) -> int:
+        """Write a rejected batch row by row, dropping rows that violate constraints"""
+        written = 0
+        for index, pending in enumerate(batch):
+            try:
+                await self._write_batch([pending])
+                written += 1
+            except asyncio.CancelledError:
+                self._queue.extendleft(reversed(batch[index:]))
+                raise
+            except IntegrityError as e:
+                self._dropped += 1
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+                    pending.future.exception()  # Nobody may be awaiting it
+                logger.error(
+                    f"❌ Dropped conversation message the database rejected "
+                    f"(session={str(pending.message.session_id)[:8]}..., role={pending.message.role}): {e.orig}"
+                )
+            except Exception as e:
+                self._queue.extendleft(reversed(batch[index:]))
+                self._failures += 1
+                self._flush_failed = True
+                logger.error(f"❌ Message flush failed ({len(self._queue)} queued, will retry): {e}")
+                break
+        else:
+            self._flush_failed = False
+        return written
+
+    async def _write_batch(self, batch: List[_Pending]) -> None:
+        start = time.perf_counter()
+        ids = await self.insert([pending.row() for pending in batch])
+        elapsed = time.perf_counter() - start
+
+        for pending in batch:
+            row_id = ids.get(pending.message.idempotency_key)
+            pending.message.id = row_id
+            if not pending.future.done():
+                pending.future.set_result(row_id)
+
+        self._messages_written += len(batch)
+        self._batches += 1
+        self._total_flush_s += elapsed
+        self._max_batch = max(self._max_batch, len(batch))
+        logger.debug(f"💾 Flushed {len(batch)} conversation messages in {elapsed * 1000:.1f}ms")
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Flush on size or time trigger; back off while the database is failing"""
+        retry_delay = max(self.flush_interval_s, 0.1)
+        while True:
+            await self._queued.wait()
+            if not self._batch_full.is_set():
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), timeout=self.flush_interval_s)
+                except asyncio.TimeoutError:
+                    pass
+
+            await self.flush()
+
+            if self._flush_failed:
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, MESSAGE_FLUSH_RETRY_MAX_S)
+            else:
+                retry_delay = max(self.flush_interval_s, 0.1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, batch sizes and flush timings"""
+        return {
+            "pending": len(self._queue),
+            "oldest_pending_ms": round((time.monotonic() - self._queue[0].queued_at) * 1000, 1) if self._queue else 0.0,
+            "messages_written": self._messages_written,
+            "batches": self._batches,
+            "avg_batch_size": round(self._messages_written / self._batches, 1) if self._batches else 0.0,
+            "max_batch_size": self._max_batch,
+            "avg_flush_ms": round(self._total_flush_s / self._batches * 1000, 1) if self._batches else 0.0,
+            "failures": self._failures,
+            "dropped": self._dropped,
+            "write_behind": MESSAGE_WRITE_BEHIND_ENABLED,
+        }
+
+
+_writer: Optional[MessageWriter] = None
+
+
+def get_message_writer() -> MessageWriter:
+    """Get the process-wide message writer"""
+    global _writer
+    if _writer is None:
+        _writer = MessageWriter()
+    return _writer
+
+
+def reset_message_writer() -> None:
+    """Drop the process-wide writer (tests)"""
+    global _writer
+    _writer = None
@@ -0,0 +1,303 @@
+"""
+Prompt Assembly for LLM Requests
+
+Orders the messages sent to the LLM so that providers with prefix (KV)
+caching - Ollama, vLLM, OpenRouter-routed models - can reuse the work done
+on the previous turn. A cache hit requires the new prompt to start with the
+exact bytes of the old one, so anything that changes every turn (the current
+time, retrieved memories) must come after everything that doesn't.
+
+Key Features:
+- Stable prefix: agent system prompt first, byte-identical across turns
+- Volatile context (date/time, memories) in one late system message, just
+  before the user message being answered
+- Approximate tokenizer (no model-specific vocab needed) to fit history
+  into a per-model token budget instead of a fixed message count
+- Sticky history window: once history has to be trimmed it is cut with
+  headroom, so the window start (and the cached prefix) stays put for
+  several turns instead of sliding on every turn
+- Rolling summary of older turns as a system message right after the
+  system prompt (it only changes when turns are folded into it)
+
+Key Design Principles:
+- Pure functions over message-like objects (anything with .role/.content)
+- Conservative estimates: overcounting costs a little history, undercounting
+  overflows the model's context
+"""
+
+import os
+import re
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple, TypeVar
+from zoneinfo import ZoneInfo
+
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+LLM_HISTORY_TOKEN_BUDGET = int(os.getenv('LLM_HISTORY_TOKEN_BUDGET', '3000'))
+LLM_RESPONSE_RESERVE_TOKENS = int(os.getenv('LLM_RESPONSE_RESERVE_TOKENS', '1024'))
+LLM_CONTEXT_WINDOW_TOKENS = int(os.getenv('LLM_CONTEXT_WINDOW_TOKENS', '0'))  # 0 = by model name
+LOCAL_LLM_CONTEXT_TOKENS = int(os.getenv('LOCAL_LLM_CONTEXT_TOKENS', '4096'))  # Ollama num_ctx
+LLM_HISTORY_TRIM_HEADROOM = float(os.getenv('LLM_HISTORY_TRIM_HEADROOM', '0.25'))
+
+DEFAULT_CONTEXT_WINDOW = 8192
+DEFAULT_TIMEZONE = "America/Los_Angeles"
+
+# Context windows by model name fragment (first match wins, so specific before generic)
+MODEL_CONTEXT_WINDOWS: List[Tuple[str, int]] = [
+    ('claude', 200000),
+    ('gemini', 1000000),
+    ('gpt-4o', 128000),
+    ('gpt-4.1', 1000000),
+    ('gpt-4-turbo', 128000),
+    ('gpt-4', 8192),
+    ('gpt-3.5', 16385),
+    ('llama-3.1', 128000),
+    ('llama3.1', 128000),
+    ('llama-3.2', 128000),
+    ('llama3.2', 128000),
+    ('llama-3.3', 128000),
+    ('llama3.3', 128000),
+    ('llama3', 8192),
+    ('llama-3', 8192),
+    ('mixtral', 32768),
+    ('mistral', 32768),
+    ('qwen', 32768),
+    ('gemma3', 128000),
+    ('gemma', 8192),
+    ('deepseek', 64000),
+]
+
+# Tokens added per message by chat templates (role markers, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Words, single digits, and any other non-space character
+_TOKEN_PATTERN = re.compile(r"[A-Za-z]+|\d|[^\sA-Za-z\d]")
+
+DATETIME_CONTEXT_HEADER = "[Current Date/Time Context]"
+CONVERSATION_SUMMARY_HEADER = "[Conversation Summary]"
+
+T = TypeVar('T')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate BPE token count of text.
+
+    English words average ~1.3 tokens; long words split into more pieces.
+    Digits and punctuation count one each, as do non-Latin characters, which
+    overcounts slightly for most vocabularies.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    count = 0
+    for match in _TOKEN_PATTERN.finditer(text):
+        piece = match.group()
+        count += 1 + (len(piece) - 1) // 6 if piece.isalpha() else 1
+    return count
+
+
+def estimate_message_tokens(message) -> int:
+    """Estimated tokens for one chat message (content plus template overhead)"""
+    return estimate_tokens(message.content or '') + MESSAGE_OVERHEAD_TOKENS
+
+
+def context_window_for_model(model: Optional[str], provider: Optional[str] = None) -> int:
+    """
+    Look up a model's context window.
+
+    Args:
+        model: Model name (e.g. "llama3.1:8b", "openai/gpt-4o")
+        provider: Agent's llm_provider; local servers are capped at
+                  LOCAL_LLM_CONTEXT_TOKENS (Ollama truncates at num_ctx
+                  whatever the model supports)
+
+    Returns:
+        Context window in tokens
+    """
+    if LLM_CONTEXT_WINDOW_TOKENS > 0:
+        return LLM_CONTEXT_WINDOW_TOKENS
+
+    window = DEFAULT_CONTEXT_WINDOW
+    name = (model or '').lower()
+    for fragment, tokens in MODEL_CONTEXT_WINDOWS:
+        if fragment in name:
+            window = tokens
+            break
+
+    if provider == 'local' and LOCAL_LLM_CONTEXT_TOKENS > 0:
+        window = min(window, LOCAL_LLM_CONTEXT_TOKENS)
+    return window
+
+
+def history_token_budget(model: Optional[str], provider: Optional[str] = None, fixed_tokens: int = 0) -> int:
+    """
+    Tokens available for conversation history.
+
+    Bounded by LLM_HISTORY_TOKEN_BUDGET (long histories add prefill latency
+    to every voice turn) and by what the model's window leaves after the
+    system prompt, volatile context and the response reserve.
+
+    Args:
+        model: Model name
+        provider: Agent's llm_provider
+        fixed_tokens: Tokens used by the system prompt and volatile context
+
+    Returns:
+        History budget in tokens (>= 0)
+    """
+    window = context_window_for_model(model, provider)
+    available = window - LLM_RESPONSE_RESERVE_TOKENS - fixed_tokens
+    return max(0, min(LLM_HISTORY_TOKEN_BUDGET, available))
+
+
+def select_history(
+    messages: Sequence[T],
+    budget_tokens: int,
+    anchor_id: Optional[int] = None,
+    headroom: float = LLM_HISTORY_TRIM_HEADROOM,
+) -> Tuple[List[T], Optional[int]]:
+    """
+    Pick the most recent messages that fit the token budget.
+
+    The window start is sticky: if the message that started the previous
+    window (anchor_id) is still present and the window from there fits, it is
+    kept, so the prompt prefix doesn't change. When trimming is needed, the
+    window is cut to (1 - headroom) of the budget so it can then grow for a
+    few turns before moving again. Windows start on a user message where
+    possible, and the newest message is always kept.
+
+    Args:
+        messages: History in chronological order (objects with .id/.role/.content)
+        budget_tokens: Token budget for history
+        anchor_id: id of the first message of the previous window
+        headroom: Fraction of the budget left free after a trim
+
+    Returns:
+        Tuple of (selected messages, anchor id to pass next turn)
+    """
+    if not messages:
+        return [], None
+
+    costs = [estimate_message_tokens(message) for message in messages]
+    suffix = [0] * (len(messages) + 1)
+    for i in range(len(messages) - 1, -1, -1):
+        suffix[i] = suffix[i + 1] + costs[i]
+
+    # Keep the previous window start while it still fits
+    if anchor_id:
+        for i, message in enumerate(messages):
+            if getattr(message, 'id', None) == anchor_id:
+                if suffix[i] <= budget_tokens:
+                    return list(messages[i:]), anchor_id
+                break
+        else:
+            anchor_id = None  # Anchor aged out of the cached history
+
+    if suffix[0] <= budget_tokens and not anchor_id:
+        return list(messages), _message_id(messages[0])
+
+    # Trim with headroom so the new start survives several turns
+    target = budget_tokens * (1 - headroom)
+    last = len(messages) - 1
+    start = 0
+    while start < last and suffix[start] > target:
+        start += 1
+    while start < last and messages[start].role != 'user':
+        start += 1
+
+    logger.debug(
+        f"📐 History trimmed to {len(messages) - start}/{len(messages)} messages "
+        f"(~{suffix[start]} tokens, budget {budget_tokens})"
+    )
+    return list(messages[start:]), _message_id(messages[start])
+
+
+def format_datetime_context(timezone: Optional[str], now: Optional[datetime] = None) -> str:
+    """
+    Describe the current date and time in the user's timezone.
+
+    Args:
+        timezone: IANA timezone name (invalid or None falls back to the default)
+        now: Time to describe (default: now)
+
+    Returns:
+        Date/time context block
+    """
+    try:
+        tz = ZoneInfo(timezone or DEFAULT_TIMEZONE)
+    except Exception:
+        tz = ZoneInfo(DEFAULT_TIMEZONE)
+
+    now = now.astimezone(tz) if now else datetime.now(tz)
+    return (
+        f"{DATETIME_CONTEXT_HEADER}\n"
+        f"Today is {now.strftime('%A, %B %d, %Y')}. "
+        f"The current time is {now.strftime('%I:%M %p')} {now.strftime('%Z')}."
+    )
+
+
+def format_summary_context(summary: str) -> str:
+    """
+    Wrap a rolling conversation summary for the prompt.
+
+    Args:
+        summary: Running summary of earlier turns
+
+    Returns:
+        Summary context block
+    """
+    return f"{CONVERSATION_SUMMARY_HEADER}\nEarlier in this conversation: {summary}"
+
+
+def volatile_context_index(history: Sequence) -> int:
+    """
+    Where the volatile context message goes in the history.
+
+    Just before the newest user message (the one being answered), so every
+    earlier turn stays in the cacheable prefix; at the end if there is none.
+
+    Args:
+        history: Selected history (chronological)
+
+    Returns:
+        Insert position within history
+    """
+    for i in range(len(history) - 1, -1, -1):
+        if history[i].role == 'user':
+            return i
+    return len(history)
+
+
+def assemble_prompt(prefix: Sequence[T], history: Sequence[T], volatile: Optional[T] = None) -> List[T]:
+    """
+    Assemble the final message list: stable prefix, history, volatile context late.
+
+    Args:
+        prefix: Messages identical on every turn (system prompt)
+        history: Selected conversation history
+        volatile: Per-turn context message, if any
+
+    Returns:
+        Ordered messages
+    """
+    messages = list(prefix)
+    if volatile is None:
+        messages.extend(history)
+        return messages
+
+    index = volatile_context_index(history)
+    messages.extend(history[:index])
+    messages.append(volatile)
+    messages.extend(history[index:])
+    return messages
+
+
+def _message_id(message) -> Optional[int]:
+    return getattr(message, 'id', None) or None
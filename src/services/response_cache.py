@@ -0,0 +1,461 @@
+"""
+Semantic LLM Response Cache
+
+Opt-in per-agent cache for answers to repeated questions. Voice users ask
+the same things over and over ("hello", "how are you", "what can you do",
+"what's the weather like"), and each one costs a full LLM round trip. With
+the cache enabled on an agent, a question that matches an earlier one - in
+the same context - is answered from the cache and streamed back through the
+normal chunk callback, so sentence splitting and TTS pipelining work as usual.
+
+Key Features:
+- Keyed on the normalized last user message plus a hash of the context the
+  answer depends on: the system prompt and any retrieved memory snippets
+  (the per-turn date/time block is ignored)
+- Exact normalized match first; then a similarity lookup over embeddings of
+  earlier questions (the memory system's embedding model, so no extra model
+  is loaded), kept in an in-process numpy index per agent
+- Entries expire after LLM_RESPONSE_CACHE_TTL_S; each agent's index is
+  bounded to LLM_RESPONSE_CACHE_MAX_ENTRIES (oldest evicted)
+- Bypass rules: built-in patterns for questions whose answer changes
+  (clock, dates, reminders) or that refer back to the conversation
+  ("it", "that", "again"), long queries, plus per-agent regex patterns
+  (Agent.response_cache_bypass)
+
+Key Design Principles:
+- Process-wide (shared by every cached per-agent LLMService)
+- Misses must stay cheap: a question is only embedded when the agent already
+  has candidate entries in the same context, under a short time budget;
+  otherwise it is embedded in the background after the answer is stored
+- Any cache failure is a miss, never an error
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Pattern, Sequence, Tuple
+
+import numpy as np
+
+from src.config.logging_config import get_logger
+from src.services.prompt_builder import CONVERSATION_SUMMARY_HEADER, DATETIME_CONTEXT_HEADER
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+LLM_RESPONSE_CACHE_ENABLED = os.getenv('LLM_RESPONSE_CACHE_ENABLED', 'true').lower() in ('true', '1', 'yes')
+LLM_RESPONSE_CACHE_TTL_S = float(os.getenv('LLM_RESPONSE_CACHE_TTL_S', '3600'))
+LLM_RESPONSE_CACHE_MIN_SIMILARITY = float(os.getenv('LLM_RESPONSE_CACHE_MIN_SIMILARITY', '0.92'))
+LLM_RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('LLM_RESPONSE_CACHE_MAX_ENTRIES', '256'))
+LLM_RESPONSE_CACHE_MAX_QUERY_WORDS = int(os.getenv('LLM_RESPONSE_CACHE_MAX_QUERY_WORDS', '12'))
+LLM_RESPONSE_CACHE_EMBED_TIMEOUT_MS = int(os.getenv('LLM_RESPONSE_CACHE_EMBED_TIMEOUT_MS', '150'))
+
+# Answers that change with the clock, or questions that lean on earlier turns
+DEFAULT_BYPASS_PATTERNS: Tuple[str, ...] = (
+    r"\b(time|date|day|today|tonight|tomorrow|yesterday|now|currently|latest|news|"
+    r"remind|reminder|timer|alarm|schedule)\b",
+    r"\b(it|that|this|those|these|he|she|they|him|her|them|again|more|else|also|another)\b",
+)
+
+# Spoken filler that doesn't change the question
+_FILLER_WORDS = frozenset({'um', 'uh', 'hmm', 'er', 'please', 'hey', 'ok', 'okay', 'so', 'well'})
+_WORD_PATTERN = re.compile(r"[a-z0-9']+")
+_CONTRACTIONS = {"what's": "what is", "how's": "how is", "who's": "who is", "where's": "where is", "it's": "it is"}
+
+# Replayed text is sent in chunks of about this many words
+_REPLAY_WORDS_PER_CHUNK = 4
+_REPLAY_CHUNK_PATTERN = re.compile(r"\S+\s*")
+
+# Per-query relevance scores in the memory block (same memories, different score)
+_MEMORY_SCORE_PATTERN = re.compile(r" \(relevance: [0-9.]+\)")
+
+EmbedFn = Callable[[str], Awaitable[Sequence[float]]]
+
+
+def normalize_query(text: str) -> str:
+    """
+    Normalize a user message for cache keys.
+
+    Lowercases, strips accents and punctuation, expands common contractions
+    and drops spoken filler, so "Um, what's the weather like?" and
+    "what is the weather like" share a key.
+
+    Args:
+        text: Raw user message (typically an STT transcript)
+
+    Returns:
+        Normalized query ('' if nothing is left)
+    """
+    text = unicodedata.normalize('NFKD', text.lower().replace('’', "'")).encode('ascii', 'ignore').decode()
+    words = []
+    for word in _WORD_PATTERN.findall(text):
+        word = _CONTRACTIONS.get(word, word.strip("'"))
+        if word and word not in _FILLER_WORDS:
+            words.append(word)
+    return ' '.join(words)
+
+
+def context_hash(messages: Sequence[Dict[str, str]]) -> str:
+    """
+    Hash the context an answer depends on.
+
+    Covers every system message (agent prompt, memory snippets, without
+    their per-query relevance scores) except the per-turn date/time block. Conversation turns are not included, nor
+    is their rolling summary; the bypass rules keep questions that refer back to them out of the cache.
+
+    Args:
+        messages: Prompt messages ({role, content} dicts)
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    for message in messages:
+        if message.get('role') != 'system':
+            continue
+        for part in (message.get('content') or '').split('\n\n'):
+            if part.startswith((DATETIME_CONTEXT_HEADER, CONVERSATION_SUMMARY_HEADER)):
+                continue
+            digest.update(_MEMORY_SCORE_PATTERN.sub('', part).encode('utf-8'))
+            digest.update(b'\x00')
+    return digest.hexdigest()[:32]
+
+
+def split_for_replay(text: str, words_per_chunk: int = _REPLAY_WORDS_PER_CHUNK) -> List[str]:
+    """
+    Split a cached response into stream-like chunks.
+
+    Args:
+        text: Cached response
+        words_per_chunk: Words per chunk (whitespace is kept with its word)
+
+    Returns:
+        Chunks that concatenate back to text
+    """
+    pieces = _REPLAY_CHUNK_PATTERN.findall(text)
+    leading = text[:len(text) - len(text.lstrip())]
+    chunks = [''.join(pieces[i:i + words_per_chunk]) for i in range(0, len(pieces), words_per_chunk)]
+    if leading:
+        chunks = [leading + chunks[0]] + chunks[1:] if chunks else [leading]
+    return chunks
+
+
+@dataclass(frozen=True)
+class ResponseCachePolicy:
+    """
+    Per-agent cache settings, built from the agent row.
+
+    Attributes:
+        agent_id: Agent UUID (string)
+        ttl_s: Entry lifetime
+        min_similarity: Cosine similarity for a semantic hit
+        bypass: Compiled bypass patterns (built-in + agent's own)
+    """
+    agent_id: str
+    ttl_s: float = LLM_RESPONSE_CACHE_TTL_S
+    min_similarity: float = LLM_RESPONSE_CACHE_MIN_SIMILARITY
+    bypass: Tuple[Pattern, ...] = ()
+
+    @classmethod
+    def for_agent(cls, agent) -> Optional['ResponseCachePolicy']:
+        """
+        Cache policy for an agent.
+
+        Args:
+            agent: Agent database model instance
+
+        Returns:
+            Policy, or None if the agent hasn't opted in (or the cache is
+            disabled globally)
+        """
+        if not LLM_RESPONSE_CACHE_ENABLED or getattr(agent, 'response_cache_enabled', False) is not True:
+            return None
+
+        patterns = list(DEFAULT_BYPASS_PATTERNS)
+        agent_patterns = getattr(agent, 'response_cache_bypass', None)
+        if isinstance(agent_patterns, list):
+            patterns.extend(p for p in agent_patterns if isinstance(p, str) and p.strip())
+
+        compiled = []
+        for pattern in patterns:
+            try:
+                compiled.append(re.compile(pattern, re.IGNORECASE))
+            except re.error as e:
+                logger.warning(f"💾 Response cache: invalid bypass pattern {pattern!r} for agent {agent.id} ({e}), matching literally")
+                compiled.append(re.compile(re.escape(pattern), re.IGNORECASE))
+
+        return cls(agent_id=str(agent.id), bypass=tuple(compiled))
+
+
+@dataclass
+class ResponseCacheLookup:
+    """
+    Result of a cache lookup; pass it back to store() after a miss.
+
+    Attributes:
+        text: Cached response on a hit, else None
+        match: 'exact' or 'semantic' on a hit
+        bypass: Why the cache was skipped ('' if it wasn't)
+    """
+    policy: ResponseCachePolicy
+    query: str
+    context: str
+    text: Optional[str] = None
+    match: Optional[str] = None
+    bypass: str = ''
+    embedding: Optional[np.ndarray] = None
+
+    @property
+    def hit(self) -> bool:
+        return self.text is not None
+
+
+@dataclass
+class _Entry:
+    query: str
+    text: str
+    expires_at: float
+    embedding: Optional[np.ndarray] = None
+    hits: int = 0
+
+
+@dataclass
+class _AgentIndex:
+    """One agent's entries, by (context hash, normalized query), oldest first"""
+    entries: 'OrderedDict[Tuple[str, str], _Entry]' = field(default_factory=OrderedDict)
+
+    def candidates(self, context: str) -> List[Tuple[Tuple[str, str], _Entry]]:
+        return [
+            (key, entry) for key, entry in self.entries.items()
+            if key[0] == context and entry.embedding is not None
+        ]
+
+
+class ResponseCache:
+    """
+    Per-agent semantic response cache.
+
+    Example usage:
+        cache = get_response_cache()
+        policy = ResponseCachePolicy.for_agent(agent)
+
+        lookup = await cache.lookup(policy, messages)
+        if lookup.hit:
+            ...  # replay lookup.text
+        else:
+            text = ...  # generate
+            cache.store(lookup, text)
+    """
+
+    def __init__(
+        self,
+        embed: Optional[EmbedFn] = None,
+        max_entries: int = LLM_RESPONSE_CACHE_MAX_ENTRIES,
+        max_query_words: int = LLM_RESPONSE_CACHE_MAX_QUERY_WORDS,
+        embed_timeout_ms: int = LLM_RESPONSE_CACHE_EMBED_TIMEOUT_MS,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            embed: Async text embedder (None = exact matches only until set)
+            max_entries: Entries kept per agent
+            max_query_words: Longer questions are not cached
+            embed_timeout_ms: Time budget for embedding a question on lookup
+        """
+        self.embed = embed
+        self.max_entries = max_entries
+        self.max_query_words = max_query_words
+        self.embed_timeout_s = embed_timeout_ms / 1000
+
+        self._agents: Dict[str, _AgentIndex] = {}
+        self._background: set = set()
+        self.stats = {
+            'hits_exact': 0,
+            'hits_semantic': 0,
+            'misses': 0,
+            'bypassed': 0,
+            'stores': 0,
+            'expired': 0,
+            'evicted': 0,
+            'embed_timeouts': 0,
+            'embed_failures': 0,
+        }
+
+    async def lookup(self, policy: ResponseCachePolicy, messages: Sequence[Dict[str, str]]) -> ResponseCacheLookup:
+        """
+        Look up a cached answer for the last user message.
+
+        Args:
+            policy: Agent's cache policy
+            messages: Prompt messages ({role, content} dicts)
+
+        Returns:
+            Lookup result (hit, miss, or bypass with reason)
+        """
+        last_user = next((m.get('content') or '' for m in reversed(messages) if m.get('role') == 'user'), '')
+        query = normalize_query(last_user)
+        lookup = ResponseCacheLookup(policy=policy, query=query, context=context_hash(messages))
+
+        lookup.bypass = self._bypass_reason(policy, last_user, query)
+        if lookup.bypass:
+            self.stats['bypassed'] += 1
+            logger.debug(f"💾 Response cache bypassed ({lookup.bypass}): \"{last_user[:60]}\"")
+            return lookup
+
+        index = self._agents.get(policy.agent_id)
+        if index is not None:
+            self._expire(index)
+            entry = index.entries.get((lookup.context, query))
+            if entry is not None:
+                return self._hit(lookup, entry, 'exact', 1.0)
+
+            candidates = index.candidates(lookup.context)
+            if candidates and self.embed is not None:
+                lookup.embedding = await self._embed(query, self.embed_timeout_s)
+                if lookup.embedding is not None:
+                    matrix = np.stack([entry.embedding for _, entry in candidates])
+                    scores = matrix @ lookup.embedding
+                    best = int(np.argmax(scores))
+                    if scores[best] >= policy.min_similarity:
+                        return self._hit(lookup, candidates[best][1], 'semantic', float(scores[best]))
+
+        self.stats['misses'] += 1
+        return lookup
+
+    def store(self, lookup: ResponseCacheLookup, text: str) -> None:
+        """
+        Cache the answer generated after a miss.
+
+        Args:
+            lookup: Result of lookup() for this request
+            text: Complete response
+        """
+        if lookup.hit or lookup.bypass or not text or not text.strip():
+            return
+
+        index = self._agents.setdefault(lookup.policy.agent_id, _AgentIndex())
+        key = (lookup.context, lookup.query)
+        entry = _Entry(
+            query=lookup.query,
+            text=text,
+            expires_at=time.monotonic() + lookup.policy.ttl_s,
+            embedding=lookup.embedding,
+        )
+        index.entries.pop(key, None)
+        index.entries[key] = entry
+        self.stats['stores'] += 1
+
+        while len(index.entries) > self.max_entries:
+            index.entries.popitem(last=False)
+            self.stats['evicted'] += 1
+
+        # Embedding wasn't needed for the lookup; compute it off the response path
+        if entry.embedding is None and self.embed is not None:
+            task = asyncio.create_task(self._embed_entry(entry))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    def invalidate_agent(self, agent_id: Any) -> int:
+        """
+        Drop every entry for an agent.
+
+        Args:
+            agent_id: Agent UUID
+
+        Returns:
+            Number of entries dropped
+        """
+        index = self._agents.pop(str(agent_id), None)
+        return len(index.entries) if index else 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss/bypass counters, hit rate and entries per agent
+        """
+        hits = self.stats['hits_exact'] + self.stats['hits_semantic']
+        lookups = hits + self.stats['misses']
+        return {
+            **self.stats,
+            'hit_rate': hits / lookups if lookups else None,
+            'semantic_enabled': self.embed is not None,
+            'agents': {agent_id: len(index.entries) for agent_id, index in self._agents.items()},
+        }
+
+    def _bypass_reason(self, policy: ResponseCachePolicy, raw: str, query: str) -> str:
+        if not query:
+            return 'empty'
+        if len(query.split()) > self.max_query_words:
+            return 'long_query'
+        for pattern in policy.bypass:
+            if pattern.search(query) or pattern.search(raw):
+                return f"rule:{pattern.pattern[:40]}"
+        return ''
+
+    def _hit(self, lookup: ResponseCacheLookup, entry: _Entry, match: str, score: float) -> ResponseCacheLookup:
+        entry.hits += 1
+        lookup.text = entry.text
+        lookup.match = match
+        self.stats[f'hits_{match}'] += 1
+        logger.info(
+            f"💾 Response cache hit ({match}, score={score:.3f}): "
+            f"\"{lookup.query[:60]}\" ~ \"{entry.query[:60]}\""
+        )
+        return lookup
+
+    def _expire(self, index: _AgentIndex) -> None:
+        now = time.monotonic()
+        expired = [key for key, entry in index.entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del index.entries[key]
+        self.stats['expired'] += len(expired)
+
+    async def _embed(self, text: str, timeout_s: Optional[float] = None) -> Optional[np.ndarray]:
+        """Unit-length embedding of text, or None on failure / timeout"""
+        try:
+            async with asyncio.timeout(timeout_s):
+                vector = np.asarray(await self.embed(text), dtype=np.float32)
+        except TimeoutError:
+            self.stats['embed_timeouts'] += 1
+            return None
+        except Exception as e:
+            self.stats['embed_failures'] += 1
+            logger.warning(f"💾 Response cache: embedding failed: {e}")
+            return None
+
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else None
+
+    async def _embed_entry(self, entry: _Entry) -> None:
+        entry.embedding = await self._embed(entry.query)
+
+
+# Singleton instance
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get the process-wide ResponseCache instance.
+
+    Returns:
+        Shared cache (created on first use)
+    """
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
+
+
+def reset_response_cache() -> None:
+    """Drop the shared cache (next get_response_cache() creates a fresh one)"""
+    global _response_cache
+    _response_cache = None
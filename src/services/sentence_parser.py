@@ -7,6 +7,12 @@ Detects sentence boundaries in LLM streaming output while handling edge cases:
 - Ellipsis (...)
 - Quoted speech
 
+Chunking strategies:
+- 'sentence' (default): Emit at sentence terminators once min length is met
+- 'adaptive': Emit the first chunk at a clause boundary (comma, semicolon,
+  conjunction) as soon as it is long enough to sound natural, then grow later
+  chunks to several sentences or a paragraph to reduce TTS request count
+
 Works alongside Chatterbox TTS's native chunking strategy - we detect sentences
 at the LLM callback level, then pass to Chatterbox with its native `streaming_strategy`.
 """
@@ -24,6 +30,7 @@ class SentenceParser:
 
     Example usage:
         parser = SentenceParser(min_sentence_length=10)
+        # or: SentenceParser(min_sentence_length=10, strategy='adaptive')
 
         # Add chunks as they arrive from LLM
         sentences = parser.add_chunk("Hello! How are you")
@@ -58,7 +65,29 @@ class SentenceParser:
     # Pattern for detecting numbers (e.g., 1.5, 3.14, $1,000.00)
     NUMBER_PATTERN = re.compile(r'\d+\.(?:\d+)?')
 
-    def __init__(self, min_sentence_length: int = 10):
+    # Clause boundary markers (adaptive first chunk only)
+    CLAUSE_ENDERS = {',', ';', ':'}
+
+    # Conjunctions that open a new clause (split happens before the conjunction)
+    CLAUSE_CONJUNCTION_PATTERN = re.compile(
+        r'\s(?:and|but|or|so|because|which|while|although|though)\s',
+        re.IGNORECASE
+    )
+
+    # Paragraph break following an extracted sentence
+    PARAGRAPH_BREAK_PATTERN = re.compile(r'^[ \t]*\n[ \t]*\n')
+
+    # Adaptive strategy defaults
+    FIRST_CLAUSE_MIN_LENGTH = 25  # Shortest first chunk that still sounds natural
+    MAX_CHUNK_LENGTH = 300  # Growth cap for later chunks (sentences are never split)
+
+    def __init__(
+        self,
+        min_sentence_length: int = 10,
+        strategy: str = 'sentence',
+        first_clause_min_length: int = FIRST_CLAUSE_MIN_LENGTH,
+        max_chunk_length: int = MAX_CHUNK_LENGTH,
+    ):
         """
         Initialize sentence parser.
 
@@ -66,10 +95,20 @@ class SentenceParser:
             min_sentence_length: Minimum characters per sentence. Shorter sentences
                                 are buffered with next sentence to avoid synthesizing
                                 very short phrases like "Hi." or "Oh."
+            strategy: Chunking strategy ('adaptive' enables first-clause chunking;
+                      any other value uses sentence boundaries)
+            first_clause_min_length: Adaptive only - minimum length of a first
+                                     chunk cut at a clause boundary
+            max_chunk_length: Adaptive only - cap on the target length later
+                              chunks grow to
         """
         self.min_sentence_length = min_sentence_length
+        self.strategy = strategy
+        self.first_clause_min_length = first_clause_min_length
+        self.max_chunk_length = max_chunk_length
         self.buffer = ""
         self.pending_sentence = ""  # Buffer for sentences below min length
+        self.chunks_emitted = 0  # Chunks returned this turn (drives adaptive growth)
 
     def add_chunk(self, text: str) -> List[str]:
         """
@@ -99,8 +138,15 @@ class SentenceParser:
             sentence = self.buffer[:boundary_pos + 1].strip()
             self.buffer = self.buffer[boundary_pos + 1:]
 
-            # Handle minimum sentence length
-            if len(sentence) < self.min_sentence_length:
+            if self.strategy == 'adaptive' and self.chunks_emitted > 0:
+                # Grow later chunks: keep whole sentences together until the
+                # target length is reached or the paragraph ends
+                if (len(self.pending_sentence) + len(sentence) < self._growth_target()
+                        and not self.PARAGRAPH_BREAK_PATTERN.match(self.buffer)):
+                    self.pending_sentence += sentence + " "
+                    continue
+            elif len(sentence) < self.min_sentence_length:
+                # Handle minimum sentence length
                 # Buffer this sentence to combine with next
                 self.pending_sentence += sentence + " "
                 continue
@@ -111,9 +157,59 @@ class SentenceParser:
                 self.pending_sentence = ""
 
             completed_sentences.append(sentence)
+            self.chunks_emitted += 1
+
+        # Adaptive: don't hold the first audio back for a long first sentence
+        if self.strategy == 'adaptive' and self.chunks_emitted == 0:
+            clause = self._take_first_clause()
+            if clause:
+                completed_sentences.append(clause)
+                self.chunks_emitted += 1
 
         return completed_sentences
 
+    def _take_first_clause(self) -> Optional[str]:
+        """
+        Cut the first chunk at a clause boundary if it is long enough.
+
+        Returns:
+            Clause text (including any pending short sentences), or None
+        """
+        clause_end = self._find_clause_boundary()
+        if clause_end is None:
+            return None
+
+        clause = (self.pending_sentence + self.buffer[:clause_end]).strip()
+        self.buffer = self.buffer[clause_end:]
+        self.pending_sentence = ""
+        return clause
+
+    def _find_clause_boundary(self) -> Optional[int]:
+        """
+        Find the end of the earliest clause that meets first_clause_min_length.
+
+        Clause boundaries are ',', ';' or ':' followed by whitespace (so
+        "$1,000" is not split), or the whitespace before a conjunction.
+
+        Returns:
+            Buffer position the clause ends at (exclusive), or None
+        """
+        positions = [
+            i + 1 for i, char in enumerate(self.buffer[:-1])
+            if char in self.CLAUSE_ENDERS and self.buffer[i + 1].isspace()
+        ]
+        positions += [match.start() for match in self.CLAUSE_CONJUNCTION_PATTERN.finditer(self.buffer)]
+
+        for pos in sorted(positions):
+            if len((self.pending_sentence + self.buffer[:pos]).strip()) >= self.first_clause_min_length:
+                return pos
+
+        return None
+
+    def _growth_target(self) -> int:
+        """Target length of the next adaptive chunk (doubles per chunk, capped)"""
+        return min(self.max_chunk_length, self.first_clause_min_length * 2 ** self.chunks_emitted)
+
     def _find_next_boundary(self) -> Optional[int]:
         """
         Find the position of the next sentence boundary in the buffer.
@@ -257,6 +353,7 @@ class SentenceParser:
         # Clear state
         self.buffer = ""
         self.pending_sentence = ""
+        self.chunks_emitted = 0
 
         return final_text
 
@@ -264,6 +361,7 @@ class SentenceParser:
         """Reset parser state for new conversation turn"""
         self.buffer = ""
         self.pending_sentence = ""
+        self.chunks_emitted = 0
 
 
 # Example usage and testing
@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Session, Conversation, Agent
 from src.database.session import get_db_session
+from src.services.message_writer import get_message_writer
 
 logger = logging.getLogger(__name__)
 
@@ -191,6 +192,9 @@ class SessionService:
         Returns:
             True if deleted, False if not found
         """
+        # Queued messages go first so they are deleted with the session
+        await get_message_writer().flush()
+
         async with get_db_session() as db:
             result = await db.execute(select(Session).where(Session.id == session_id))
             session = result.scalar_one_or_none()
@@ -218,6 +222,9 @@ class SessionService:
         Returns:
             List of Conversation instances (chronological order)
         """
+        # Read-your-writes: include messages still queued by the write-behind writer
+        await get_message_writer().flush()
+
         async with get_db_session() as db:
             # DIAGNOSTIC: Log query start
             logger.info(f"📥 [DB_QUERY] Fetching messages for session {session_id}")
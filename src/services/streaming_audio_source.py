@@ -0,0 +1,326 @@
+"""
+Streaming PCM Audio Source for Discord Playback
+
+In-memory discord.AudioSource fed directly from TTS output. Replaces the
+tempfile + FFmpegPCMAudio (one ffmpeg subprocess per sentence) + is_playing()
+polling pattern.
+
+Key Features:
+- 20ms PCM frames served from an in-memory segment queue
+- WAV → 48kHz stereo s16 conversion in process (incremental header parsing,
+  streaming polyphase resampler, mono → stereo)
+- Raw 48kHz stereo PCM (negotiated with Chatterbox, DISCORD_PCM_FORMAT) is
+  appended as-is via write_pcm(), skipping header handling and conversion
+- Back-to-back segments are spliced inside a single frame (no gaps)
+- Playback starts from the first streamed bytes, not after full synthesis
+- Segment start/finish reported to asyncio via futures (no polling)
+
+Key Design Principles:
+- read() runs on discord.py's player thread; all buffer access is guarded by
+  a threading.Lock and results are handed to the event loop with
+  call_soon_threadsafe
+- Underruns while a segment is still streaming are filled with silence
+- When idle (no segments) the source lingers briefly with silence, then ends
+  so Discord stops sending frames; a new source is started on demand
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+import discord
+
+from src.config.logging_config import get_logger
+from src.services.audio_transcode import PCMFormat, StreamingPCMConverter
+
+logger = get_logger(__name__)
+
+# Discord voice PCM format: 48kHz, stereo, signed 16-bit little endian, 20ms frames
+DISCORD_SAMPLE_RATE = 48000
+DISCORD_CHANNELS = 2
+FRAME_MS = 20
+FRAME_BYTES = DISCORD_SAMPLE_RATE * DISCORD_CHANNELS * 2 * FRAME_MS // 1000  # 3840
+SILENCE_FRAME = b'\x00' * FRAME_BYTES
+
+# Raw PCM layout requested from TTS for Discord (chunks of whole 20ms frames)
+DISCORD_PCM_FORMAT = PCMFormat(
+    sample_rate=DISCORD_SAMPLE_RATE,
+    channels=DISCORD_CHANNELS,
+    align_frames=DISCORD_SAMPLE_RATE * FRAME_MS // 1000
+)
+
+# Configuration from environment variables
+PLAYBACK_IDLE_LINGER_MS = int(os.getenv('PLAYBACK_IDLE_LINGER_MS', '300'))
+
+# Compact consumed bytes once this much has been read from a segment buffer
+_COMPACT_THRESHOLD = 64 * 1024
+
+
+class PCMConverter(StreamingPCMConverter):
+    """
+    Incremental WAV → Discord PCM (48kHz stereo s16) converter.
+
+    Example usage:
+        converter = PCMConverter()
+        for chunk in wav_chunks:
+            pcm = converter.feed(chunk)
+        pcm += converter.finish()
+    """
+
+    def __init__(self):
+        super().__init__(PCMFormat(DISCORD_SAMPLE_RATE, DISCORD_CHANNELS))
+
+
+class AudioSegment:
+    """
+    One utterance (e.g. a sentence) inside a StreamingPCMAudioSource.
+
+    Written from the event loop (write/finish), read from the player thread.
+    `started` and `played` futures resolve when the first frame is read and
+    when the last byte has been read.
+
+    Attributes:
+        metadata: Caller metadata (sentence, session_id, sequence, ...)
+        started: Future resolved when playback of this segment begins
+        played: Future resolved (True) when fully played, (False) when dropped
+        convert_time_s: Cumulative in-process conversion time
+    """
+
+    def __init__(self, source: "StreamingPCMAudioSource", metadata: Dict[str, Any]):
+        self._source = source
+        self.metadata = metadata
+        self.started: asyncio.Future = source.loop.create_future()
+        self.played: asyncio.Future = source.loop.create_future()
+        self.convert_time_s = 0.0
+        self.bytes_written = 0
+
+        self._converter = PCMConverter()
+        self._buffer = bytearray()
+        self._offset = 0
+        self._finished = False
+        self._started = False
+
+    def write(self, wav_bytes: bytes) -> None:
+        """
+        Append WAV bytes (converted to Discord PCM in process).
+
+        Args:
+            wav_bytes: Next chunk of the WAV stream
+        """
+        if self.played.done() or not wav_bytes:
+            return
+        t_start = time.perf_counter()
+        pcm = self._converter.feed(wav_bytes)
+        self.convert_time_s += time.perf_counter() - t_start
+        if pcm:
+            with self._source.lock:
+                self._buffer.extend(pcm)
+                self.bytes_written += len(pcm)
+
+    def write_pcm(self, pcm: bytes) -> None:
+        """
+        Append raw Discord PCM (48kHz stereo s16le, no header).
+
+        Args:
+            pcm: PCM bytes, ideally whole 20ms frames
+        """
+        if self.played.done() or not pcm:
+            return
+        with self._source.lock:
+            self._buffer.extend(pcm)
+            self.bytes_written += len(pcm)
+
+    def finish(self) -> None:
+        """Mark the segment complete (no more writes)"""
+        if self.played.done():
+            return
+        tail = self._converter.finish()
+        with self._source.lock:
+            if tail:
+                self._buffer.extend(tail)
+                self.bytes_written += len(tail)
+            self._finished = True
+
+    async def wait_played(self) -> bool:
+        """
+        Wait until the segment has been fully played or dropped.
+
+        Returns:
+            True if played to the end, False if dropped (interruption)
+        """
+        return await self.played
+
+    # Player thread (called with source lock held)
+
+    def _read(self, size: int) -> bytes:
+        if not self._started:
+            self._started = True
+            self._source._resolve(self.started, time.time())
+        data = bytes(self._buffer[self._offset:self._offset + size])
+        self._offset += len(data)
+        if self._offset >= _COMPACT_THRESHOLD:
+            del self._buffer[:self._offset]
+            self._offset = 0
+        return data
+
+    def _exhausted(self) -> bool:
+        return self._offset >= len(self._buffer)
+
+
+class StreamingPCMAudioSource(discord.AudioSource):
+    """
+    Continuous discord.AudioSource reading 20ms PCM frames from in-memory segments.
+
+    Example usage:
+        source = StreamingPCMAudioSource()
+        voice_client.play(source)
+
+        segment = source.begin_segment({"sentence": "Hello!"})
+        async for chunk in tts_stream:
+            segment.write(chunk)
+        segment.finish()
+        await segment.wait_played()
+    """
+
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        idle_linger_ms: int = PLAYBACK_IDLE_LINGER_MS,
+    ):
+        """
+        Initialize streaming audio source.
+
+        Args:
+            loop: Event loop that owns segment futures (defaults to running loop)
+            idle_linger_ms: Silence to play while idle before ending the source
+        """
+        self.loop = loop or asyncio.get_running_loop()
+        self.lock = threading.Lock()
+        self.idle_linger_frames = max(0, idle_linger_ms // FRAME_MS)
+
+        self._segments: Deque[AudioSegment] = deque()
+        self._idle_frames = 0
+        self.closed = False
+
+        # Metrics
+        self.frames_read = 0
+        self.underrun_frames = 0
+
+    def begin_segment(self, metadata: Optional[Dict[str, Any]] = None) -> AudioSegment:
+        """
+        Append a new segment (plays right after the previous one).
+
+        Args:
+            metadata: Caller metadata attached to the segment
+
+        Returns:
+            Segment to write WAV bytes into
+
+        Raises:
+            RuntimeError: If the source has already ended (start a new one)
+        """
+        segment = AudioSegment(self, metadata or {})
+        with self.lock:
+            if self.closed:
+                raise RuntimeError("Audio source has ended")
+            self._segments.append(segment)
+            self._idle_frames = 0
+        return segment
+
+    def pending_segments(self) -> int:
+        """Number of segments not yet fully played"""
+        with self.lock:
+            return len(self._segments)
+
+    def clear(self) -> int:
+        """
+        Drop all segments, including the one playing (immediate interruption).
+
+        Returns:
+            Number of segments dropped
+        """
+        with self.lock:
+            dropped = list(self._segments)
+            self._segments.clear()
+        for segment in dropped:
+            self._resolve(segment.played, False)
+        return len(dropped)
+
+    def clear_pending(self) -> int:
+        """
+        Drop segments that haven't started playing (current one finishes).
+
+        Returns:
+            Number of segments dropped
+        """
+        with self.lock:
+            keep = [s for s in self._segments if s._started]
+            dropped = [s for s in self._segments if not s._started]
+            self._segments = deque(keep)
+        for segment in dropped:
+            self._resolve(segment.played, False)
+        return len(dropped)
+
+    # discord.AudioSource interface (player thread)
+
+    def read(self) -> bytes:
+        """Return the next 20ms PCM frame (b'' ends playback)"""
+        with self.lock:
+            if self.closed:
+                return b''
+
+            frame = bytearray()
+            while len(frame) < FRAME_BYTES and self._segments:
+                segment = self._segments[0]
+                frame.extend(segment._read(FRAME_BYTES - len(frame)))
+
+                if segment._exhausted():
+                    if not segment._finished:
+                        break  # Still streaming: underrun
+                    self._segments.popleft()
+                    self._resolve(segment.played, True)
+
+            if frame:
+                self._idle_frames = 0
+                self.frames_read += 1
+                if len(frame) < FRAME_BYTES:
+                    self.underrun_frames += 1
+                    frame.extend(SILENCE_FRAME[len(frame):])
+                return bytes(frame)
+
+            if self._segments:
+                # Waiting on the next streamed bytes
+                self.underrun_frames += 1
+                return SILENCE_FRAME
+
+            self._idle_frames += 1
+            if self._idle_frames <= self.idle_linger_frames:
+                return SILENCE_FRAME
+
+            self.closed = True
+            return b''
+
+    def is_opus(self) -> bool:
+        return False
+
+    def cleanup(self) -> None:
+        """Called by discord.py when the player stops"""
+        with self.lock:
+            self.closed = True
+            dropped = list(self._segments)
+            self._segments.clear()
+        for segment in dropped:
+            self._resolve(segment.played, False)
+
+    def _resolve(self, future: asyncio.Future, result: Any) -> None:
+        """Resolve a segment future on the event loop (thread-safe)"""
+        def _set():
+            if not future.done():
+                future.set_result(result)
+        try:
+            self.loop.call_soon_threadsafe(_set)
+        except RuntimeError:
+            pass  # Loop closed during shutdown
@@ -0,0 +1,533 @@
+"""
+TTS Backend Pool
+
+Routes Chatterbox requests across several TTS backends and tracks per-backend
+latency so that slow or failing instances are avoided, and optionally hedges
+requests whose first audio byte is late.
+
+Key Features:
+- Least-outstanding-requests routing (EWMA first-byte latency breaks ties)
+- Per-backend circuit breakers (failing instances are skipped while open)
+- Pool-wide circuit breaker and a single background /health prober
+- Per-backend EWMA of first-byte and total synthesis latency
+- Hedge delay from the p90 of recent first-byte latencies
+- Cancellation accounting (synthesis seconds avoided by tearing requests down,
+  per-backend server-side cancel support)
+- Per-backend raw PCM output support (learned from responses)
+
+Key Design Principles:
+- The pool only decides *where* a request goes and *when* to hedge; the
+  request itself (and winner/loser cancellation) lives in TTSService
+- A single configured URL behaves exactly like the old single-backend client
+- O(1)-ish bookkeeping on the hot path (no I/O)
+- One pool per backend URL set per process (get_tts_backend_pool), so every
+  TTSService (Discord singleton, one per WebRTC connection) shares load counts,
+  latency samples, breakers and health probing
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from src.config.logging_config import get_logger
+from src.services.circuit_breaker import CircuitBreaker, CircuitState
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+TTS_BACKEND_URLS = [url.strip() for url in os.getenv('TTS_BACKEND_URLS', '').split(',') if url.strip()]
+TTS_BACKEND_EWMA_ALPHA = float(os.getenv('TTS_BACKEND_EWMA_ALPHA', '0.2'))
+TTS_HEDGE_ENABLED = os.getenv('TTS_HEDGE_ENABLED', 'false').lower() in ['true', '1', 'yes']
+TTS_HEDGE_PERCENTILE = float(os.getenv('TTS_HEDGE_PERCENTILE', '0.9'))
+TTS_HEDGE_MIN_SAMPLES = int(os.getenv('TTS_HEDGE_MIN_SAMPLES', '20'))
+TTS_HEDGE_MIN_DELAY_MS = int(os.getenv('TTS_HEDGE_MIN_DELAY_MS', '100'))
+
+# Recent first-byte latencies kept for the hedge percentile
+_LATENCY_WINDOW = 200
+
+
+def normalize_backend_url(url: str) -> str:
+    """
+    Normalize a Chatterbox base URL.
+
+    Strips a trailing slash and a '/v1' suffix (endpoints are appended with
+    their own prefix).
+
+    Args:
+        url: Configured URL
+
+    Returns:
+        Base URL without trailing '/v1'
+    """
+    url = url.rstrip('/')
+    if url.endswith('/v1'):
+        logger.warning(
+            f"⚠️ Chatterbox URL should not include '/v1' suffix. "
+            f"Got: {url}. Stripping '/v1' for compatibility."
+        )
+        url = url[:-3]
+    return url
+
+
+@dataclass(eq=False)
+class TTSBackend:
+    """
+    One Chatterbox instance in the pool.
+
+    Attributes:
+        url: Base URL (without '/v1')
+        circuit_breaker: Health of this instance
+        outstanding: Requests currently in flight
+        ewma_first_byte_s: Smoothed time to first audio byte
+        ewma_total_s: Smoothed total synthesis time
+        ewma_s_per_char: Smoothed synthesis time per input character
+        requests: Requests sent
+        failures: Requests that failed
+        cancelled: Requests cancelled mid-synthesis (barge-in, hedge loser)
+        hedges_won: Hedged races this backend won
+        supports_cancel: Whether the cancel endpoint exists (None until first tried)
+        supports_pcm: Whether response_format=pcm is honoured (None until first tried)
+    """
+    url: str
+    circuit_breaker: CircuitBreaker
+    outstanding: int = 0
+    ewma_first_byte_s: Optional[float] = None
+    ewma_total_s: Optional[float] = None
+    ewma_s_per_char: Optional[float] = None
+    requests: int = 0
+    failures: int = 0
+    cancelled: int = 0
+    hedges_won: int = 0
+    supports_cancel: Optional[bool] = None
+    supports_pcm: Optional[bool] = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'url': self.url,
+            'state': self.circuit_breaker.state.value,
+            'outstanding': self.outstanding,
+            'ewma_first_byte_s': self.ewma_first_byte_s,
+            'ewma_total_s': self.ewma_total_s,
+            'requests': self.requests,
+            'failures': self.failures,
+            'cancelled': self.cancelled,
+            'hedges_won': self.hedges_won,
+            'supports_cancel': self.supports_cancel,
+            'supports_pcm': self.supports_pcm,
+        }
+
+
+class TTSBackendPool:
+    """
+    Least-outstanding-requests router over Chatterbox backends.
+
+    Example usage:
+        pool = TTSBackendPool(["http://tts-a:4123", "http://tts-b:4123"], hedge_enabled=True)
+
+        backend = pool.acquire()
+        try:
+            ...  # stream from backend.url
+            pool.record_first_byte(backend, ttfb_s)
+            pool.record_success(backend, total_s)
+        except Exception:
+            pool.record_failure(backend)
+        finally:
+            pool.release(backend)
+
+        delay = pool.hedge_delay_s()  # None → don't hedge
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        ewma_alpha: float = TTS_BACKEND_EWMA_ALPHA,
+        hedge_enabled: bool = TTS_HEDGE_ENABLED,
+        hedge_percentile: float = TTS_HEDGE_PERCENTILE,
+        hedge_min_samples: int = TTS_HEDGE_MIN_SAMPLES,
+        hedge_min_delay_ms: int = TTS_HEDGE_MIN_DELAY_MS,
+        failure_threshold: int = 3,
+        recovery_timeout_s: float = 10.0,
+        health_check_interval_s: float = 15.0,
+    ):
+        """
+        Initialize backend pool.
+
+        Args:
+            urls: Chatterbox base URLs (at least one)
+            ewma_alpha: Weight of the newest sample in latency EWMAs
+            hedge_enabled: Fire a duplicate request when the first byte is late
+            hedge_percentile: Percentile of recent first-byte latency used as hedge delay
+            hedge_min_samples: Samples required before hedging starts
+            hedge_min_delay_ms: Lower bound of the hedge delay
+            failure_threshold: Consecutive failures before a backend is skipped
+            recovery_timeout_s: Seconds before a skipped backend gets a trial request
+            health_check_interval_s: Background /health probe interval (0 disables)
+        """
+        if not urls:
+            raise ValueError("TTSBackendPool requires at least one backend URL")
+
+        self.backends: List[TTSBackend] = []
+        for url in urls:
+            url = normalize_backend_url(url)
+            self.backends.append(TTSBackend(
+                url=url,
+                circuit_breaker=CircuitBreaker(
+                    name=f"chatterbox@{url}",
+                    failure_threshold=failure_threshold,
+                    recovery_timeout_s=recovery_timeout_s
+                )
+            ))
+
+        self.ewma_alpha = ewma_alpha
+        self.hedge_enabled = hedge_enabled
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_min_delay_s = hedge_min_delay_ms / 1000
+
+        self._first_byte_samples: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+        # Circuit breaker for the pool as a whole (consulted by TTSService instead
+        # of a per-request health check); each backend has its own breaker for routing
+        self.circuit_breaker = CircuitBreaker(
+            name="chatterbox",
+            failure_threshold=failure_threshold,
+            recovery_timeout_s=recovery_timeout_s
+        )
+
+        # Background health prober (lazy started on first synthesis, one per pool)
+        self.health_check_interval_s = health_check_interval_s
+        self._health_task: Optional[asyncio.Task] = None
+        self._health_client: Optional[httpx.AsyncClient] = None
+
+        # Metrics
+        self.hedges_fired = 0
+        self.hedges_won = 0
+        self.cancelled = 0
+        self.server_cancels_sent = 0
+        self.synthesis_s_avoided = 0.0
+
+    @property
+    def primary(self) -> TTSBackend:
+        """First configured backend"""
+        return self.backends[0]
+
+    def __len__(self) -> int:
+        return len(self.backends)
+
+    # Routing
+
+    def acquire(self, exclude: Iterable[TTSBackend] = ()) -> Optional[TTSBackend]:
+        """
+        Pick a backend and count the request as outstanding.
+
+        Backends with an open circuit are skipped; if every candidate is open,
+        the least loaded one is used anyway (the service-level breaker decides
+        whether to fail fast).
+
+        Args:
+            exclude: Backends not to use (e.g. the one a hedge duplicates)
+
+        Returns:
+            Backend, or None if every backend is excluded
+        """
+        excluded = set(exclude)
+        candidates = [b for b in self.backends if b not in excluded]
+        if not candidates:
+            return None
+
+        candidates.sort(key=lambda b: (
+            b.outstanding,
+            b.ewma_first_byte_s if b.ewma_first_byte_s is not None else 0.0
+        ))
+
+        chosen = next((b for b in candidates if b.circuit_breaker.allow_request()), candidates[0])
+        chosen.outstanding += 1
+        chosen.requests += 1
+        return chosen
+
+    def release(self, backend: TTSBackend) -> None:
+        """Mark a request on backend as finished"""
+        backend.outstanding = max(0, backend.outstanding - 1)
+
+    # Outcomes
+
+    def record_first_byte(self, backend: TTSBackend, latency_s: float) -> None:
+        """Record time to first audio byte for a request on backend"""
+        backend.ewma_first_byte_s = self._ewma(backend.ewma_first_byte_s, latency_s)
+        self._first_byte_samples.append(latency_s)
+
+    def record_success(self, backend: TTSBackend, total_s: float, chars: int = 0) -> None:
+        """
+        Record a completed request on backend.
+
+        Args:
+            backend: Backend the request went to
+            total_s: Total synthesis time
+            chars: Input text length (feeds the per-character synthesis estimate)
+        """
+        backend.ewma_total_s = self._ewma(backend.ewma_total_s, total_s)
+        if chars > 0:
+            backend.ewma_s_per_char = self._ewma(backend.ewma_s_per_char, total_s / chars)
+        backend.circuit_breaker.record_success()
+
+    def record_failure(self, backend: TTSBackend, unhealthy: bool = True) -> None:
+        """
+        Record a failed request on backend.
+
+        Args:
+            backend: Backend the request went to
+            unhealthy: False for client errors (4xx) that say nothing about backend health
+        """
+        backend.failures += 1
+        if unhealthy:
+            backend.circuit_breaker.record_failure()
+        else:
+            backend.circuit_breaker.record_success()
+
+    def record_cancelled(self, backend: TTSBackend, elapsed_s: Optional[float] = None, chars: int = 0) -> float:
+        """
+        Record a request on backend that was cancelled (hedge loser, barge-in).
+
+        Args:
+            backend: Backend the request went to
+            elapsed_s: How long the request had been running (None if it never started)
+            chars: Input text length
+
+        Returns:
+            Estimated synthesis seconds the backend no longer has to spend
+        """
+        backend.circuit_breaker.release()
+        if elapsed_s is None:
+            return 0.0
+
+        backend.cancelled += 1
+        self.cancelled += 1
+
+        # Remaining work, estimated from this backend's synthesis rate
+        avoided_s = 0.0
+        if backend.ewma_s_per_char is not None and chars > 0:
+            avoided_s = max(0.0, backend.ewma_s_per_char * chars - elapsed_s)
+        self.synthesis_s_avoided += avoided_s
+        return avoided_s
+
+    def record_server_cancel(self, backend: TTSBackend, supported: Optional[bool]) -> None:
+        """
+        Record a server-side cancel request sent to backend.
+
+        Args:
+            backend: Backend the cancel went to
+            supported: True if accepted, False if the backend has no cancel
+                       endpoint (not tried again), None if the outcome is unknown
+        """
+        self.server_cancels_sent += 1
+        if supported is not None:
+            backend.supports_cancel = supported
+
+    def record_pcm_support(self, backend: TTSBackend, supported: bool) -> None:
+        """
+        Record whether backend honoured a raw PCM (response_format=pcm) request.
+
+        Args:
+            backend: Backend the request went to
+            supported: False if it rejected the format or answered with WAV
+        """
+        if backend.supports_pcm is None:
+            logger.info(
+                f"🔊 Chatterbox at {backend.url} "
+                f"{'delivers raw PCM' if supported else 'has no raw PCM output, using WAV'}"
+            )
+        backend.supports_pcm = supported
+
+    def record_hedge(self, winner: TTSBackend, hedge_won: bool) -> None:
+        """
+        Record the outcome of a hedged race.
+
+        Args:
+            winner: Backend whose audio was used
+            hedge_won: True if the duplicate request beat the original
+        """
+        if hedge_won:
+            self.hedges_won += 1
+            winner.hedges_won += 1
+
+    # Hedging
+
+    def hedge_delay_s(self) -> Optional[float]:
+        """
+        How long to wait for a first byte before firing a hedge.
+
+        Returns:
+            Delay in seconds, or None if hedging is disabled, there is only one
+            backend, or not enough latency samples have been collected yet
+        """
+        if not self.hedge_enabled or len(self.backends) < 2:
+            return None
+        if len(self._first_byte_samples) < self.hedge_min_samples:
+            return None
+
+        samples = sorted(self._first_byte_samples)
+        index = min(len(samples) - 1, int(self.hedge_percentile * len(samples)))
+        return max(self.hedge_min_delay_s, samples[index])
+
+    # Health probing
+
+    @property
+    def health_monitor_running(self) -> bool:
+        """Whether the background prober task is alive"""
+        return self._health_task is not None and not self._health_task.done()
+
+    def ensure_health_monitor(self) -> None:
+        """
+        Lazily start the background health prober (requires a running event loop).
+
+        Every TTSService calls this; only the first call per pool (and event
+        loop) starts a task.
+        """
+        if self.health_check_interval_s <= 0:
+            return
+        if self.health_monitor_running and self._health_task.get_loop() is asyncio.get_running_loop():
+            return
+        self._health_task = asyncio.create_task(self._health_monitor_loop())
+
+    async def check_health(self, backend: TTSBackend) -> bool:
+        """
+        GET /health on one backend.
+
+        Args:
+            backend: Backend to check
+
+        Returns:
+            True if healthy, False otherwise
+        """
+        try:
+            if self._health_client is None:
+                self._health_client = httpx.AsyncClient(timeout=5.0)
+            response = await self._health_client.get(f"{backend.url}/health")
+            return response.status_code == 200
+
+        except Exception as e:
+            logger.debug(f"⚠️ Chatterbox health check failed ({backend.url}): {e}")
+            return False
+
+    async def probe_health(self) -> None:
+        """Probe every backend and record the outcomes (pool is healthy if any backend is)"""
+        results = await asyncio.gather(*(self.check_health(backend) for backend in self.backends))
+
+        for backend, healthy in zip(self.backends, results):
+            if healthy:
+                backend.circuit_breaker.record_success()
+            else:
+                backend.circuit_breaker.record_failure()
+
+        if any(results):
+            self.circuit_breaker.record_success()
+        else:
+            self.circuit_breaker.record_failure()
+
+    async def _health_monitor_loop(self) -> None:
+        """
+        Background prober that feeds /health results into the circuit breakers.
+
+        - CLOSED: probe only if no real request succeeded during the last
+          interval (live traffic is the health signal)
+        - OPEN: wait for the recovery timeout, then probe as the trial request
+        - HALF_OPEN: probe unless a real trial request is already in flight
+        """
+        logger.debug(f"🩺 Chatterbox health monitor started (interval={self.health_check_interval_s}s)")
+
+        try:
+            while True:
+                state = self.circuit_breaker.state
+
+                if state == CircuitState.OPEN:
+                    await asyncio.sleep(min(self.health_check_interval_s, self.circuit_breaker.recovery_timeout_s))
+                    continue
+
+                if state == CircuitState.CLOSED:
+                    last_success = self.circuit_breaker.last_success_at
+                    if last_success is None or time.time() - last_success >= self.health_check_interval_s:
+                        await self.probe_health()
+                elif self.circuit_breaker.allow_request():
+                    await self.probe_health()
+
+                await asyncio.sleep(self.health_check_interval_s)
+
+        except asyncio.CancelledError:
+            logger.debug("🩺 Chatterbox health monitor stopped")
+            raise
+
+    async def close(self) -> None:
+        """Stop the health prober and close its HTTP client"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+
+        if self._health_client is not None:
+            await self._health_client.aclose()
+            self._health_client = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with per-backend load/latency, hedge and cancellation counters
+        """
+        return {
+            'backends': [backend.get_stats() for backend in self.backends],
+            'hedge_enabled': self.hedge_enabled,
+            'hedge_delay_s': self.hedge_delay_s(),
+            'hedges_fired': self.hedges_fired,
+            'hedges_won': self.hedges_won,
+            'cancelled': self.cancelled,
+            'server_cancels_sent': self.server_cancels_sent,
+            'synthesis_s_avoided': self.synthesis_s_avoided,
+        }
+
+    def _ewma(self, current: Optional[float], sample: float) -> float:
+        if current is None:
+            return sample
+        return self.ewma_alpha * sample + (1 - self.ewma_alpha) * current
+
+
+# Shared pools, keyed by normalized backend URLs
+_tts_backend_pools: Dict[Tuple[str, ...], TTSBackendPool] = {}
+
+
+def get_tts_backend_pool(urls: List[str], **kwargs: Any) -> TTSBackendPool:
+    """
+    Get the process-wide TTSBackendPool for a set of backend URLs.
+
+    Args:
+        urls: Chatterbox base URLs (at least one)
+        **kwargs: TTSBackendPool options, used only when the pool is created
+
+    Returns:
+        Shared pool (created on first use)
+    """
+    key = tuple(url.rstrip('/').removesuffix('/v1') for url in urls)
+    pool = _tts_backend_pools.get(key)
+    if pool is None:
+        pool = TTSBackendPool(urls, **kwargs)
+        _tts_backend_pools[key] = pool
+    return pool
+
+
+async def close_tts_backend_pools() -> None:
+    """Stop the health probers of every shared pool (call on shutdown)"""
+    for pool in _tts_backend_pools.values():
+        await pool.close()
+
+
+def reset_tts_backend_pools() -> None:
+    """Drop the shared pools (next get_tts_backend_pool() creates fresh ones)"""
+    _tts_backend_pools.clear()
@@ -0,0 +1,355 @@
+"""
+TTS Audio Cache
+
+Content-addressed cache for synthesized TTS audio. Agents repeat the same
+phrases constantly (greetings, fallback apologies, error messages, short
+acknowledgements), so identical (text, voice, parameters) requests are served
+from cache instead of going back to Chatterbox.
+
+Tiers:
+- Memory: byte-bounded LRU (OrderedDict), shared across sessions
+- Disk (optional): one file per entry, byte-bounded with oldest-first
+  eviction; survives restarts
+
+Key Design Principles:
+- Key = SHA-256 of (normalized text, voice_id, exaggeration, cfg_weight,
+  temperature, language)
+- Only complete, successful syntheses are stored
+- Long texts are not cached (unique LLM responses would only pollute the LRU)
+- Disk reads and writes run off the event loop (asyncio.to_thread)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+TTS_CACHE_ENABLED = os.getenv('TTS_CACHE_ENABLED', 'true').lower() in ['true', '1', 'yes']
+TTS_CACHE_MEMORY_MB = float(os.getenv('TTS_CACHE_MEMORY_MB', '64'))
+TTS_CACHE_DIR = os.getenv('TTS_CACHE_DIR', '')
+TTS_CACHE_DISK_MB = float(os.getenv('TTS_CACHE_DISK_MB', '512'))
+TTS_CACHE_MAX_TEXT_LENGTH = int(os.getenv('TTS_CACHE_MAX_TEXT_LENGTH', '300'))
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_CACHE_FILE_SUFFIX = '.audio'
+
+
+def normalize_tts_text(text: str) -> str:
+    """
+    Normalize text for cache keying.
+
+    Applies Unicode NFC normalization, collapses whitespace and strips. Case
+    and punctuation are preserved because both affect prosody.
+
+    Args:
+        text: Raw text to synthesize
+
+    Returns:
+        Normalized text
+    """
+    return _WHITESPACE_RE.sub(' ', unicodedata.normalize('NFC', text)).strip()
+
+
+class TTSAudioCache:
+    """
+    Two-tier (memory LRU + optional disk) cache for synthesized audio.
+
+    Example usage:
+        cache = TTSAudioCache(max_memory_bytes=64 * 1024 * 1024, cache_dir="/cache/tts")
+
+        key = cache.make_key("Hello!", "default", 1.0, 0.7, 0.3, "en")
+        audio = await cache.get(key)
+        if audio is None:
+            audio = await synthesize(...)
+            await cache.put(key, audio)
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = int(TTS_CACHE_MEMORY_MB * 1024 * 1024),
+        cache_dir: Optional[str] = TTS_CACHE_DIR or None,
+        max_disk_bytes: int = int(TTS_CACHE_DISK_MB * 1024 * 1024),
+        max_text_length: int = TTS_CACHE_MAX_TEXT_LENGTH,
+    ):
+        """
+        Initialize TTS audio cache.
+
+        Args:
+            max_memory_bytes: Memory tier budget in bytes
+            cache_dir: Directory for the disk tier (None disables it)
+            max_disk_bytes: Disk tier budget in bytes
+            max_text_length: Texts longer than this (normalized) are not cached
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.max_text_length = max_text_length
+        self.cache_dir = cache_dir
+
+        # Memory tier: key → audio bytes (most recently used last)
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+
+        # Disk tier index: key → file size (oldest first)
+        self._disk_index: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+
+        if self.cache_dir:
+            self._load_disk_index()
+
+    # Keys
+
+    def make_key(
+        self,
+        text: str,
+        voice_id: str,
+        exaggeration: Optional[float],
+        cfg_weight: Optional[float],
+        temperature: Optional[float],
+        language_id: str,
+    ) -> str:
+        """
+        Build a content-addressed cache key.
+
+        Returns:
+            Hex SHA-256 digest of the normalized request
+        """
+        payload = json.dumps(
+            [normalize_tts_text(text), voice_id, exaggeration, cfg_weight, temperature, language_id],
+            ensure_ascii=False,
+            separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def is_cacheable(self, text: str) -> bool:
+        """Check whether text is short enough to be worth caching"""
+        normalized = normalize_tts_text(text)
+        return 0 < len(normalized) <= self.max_text_length
+
+    # Lookup / store
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up audio by key (memory tier first, then disk tier).
+
+        Disk hits are promoted to the memory tier.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached audio bytes, or None on miss
+        """
+        audio = self._memory.get(key)
+        if audio is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            self.memory_hits += 1
+            self.bytes_saved += len(audio)
+            return audio
+
+        if self.cache_dir and key in self._disk_index:
+            audio = await self._read_disk(key)
+            if audio is not None:
+                if key in self._disk_index:  # May have been evicted during the read
+                    self._disk_index.move_to_end(key)
+                self._put_memory(key, audio)
+                self.hits += 1
+                self.disk_hits += 1
+                self.bytes_saved += len(audio)
+                return audio
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, audio: bytes) -> None:
+        """
+        Store audio under key in both tiers.
+
+        Args:
+            key: Cache key from make_key()
+            audio: Complete synthesized audio
+        """
+        if not audio:
+            return
+
+        self._put_memory(key, audio)
+
+        if self.cache_dir and key not in self._disk_index and len(audio) <= self.max_disk_bytes:
+            try:
+                await asyncio.to_thread(_write_file_atomic, self._path_for(key), audio)
+            except Exception as e:
+                logger.warning(f"⚠️ TTS cache disk write failed: {e}")
+                return
+
+            self._disk_index[key] = len(audio)
+            self._disk_bytes += len(audio)
+
+            # Evict oldest entries over budget
+            evicted_paths = []
+            while self._disk_bytes > self.max_disk_bytes and self._disk_index:
+                old_key, size = self._disk_index.popitem(last=False)
+                self._disk_bytes -= size
+                evicted_paths.append(self._path_for(old_key))
+
+            if evicted_paths:
+                await asyncio.to_thread(_unlink_quietly, evicted_paths)
+
+    def clear(self) -> None:
+        """Clear the memory tier and reset metrics (disk tier is left intact)"""
+        self._memory.clear()
+        self._memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit ratio, bytes saved and tier usage
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'hit_ratio': (self.hits / lookups) if lookups else 0.0,
+            'bytes_saved': self.bytes_saved,
+            'evictions': self.evictions,
+            'memory_entries': len(self._memory),
+            'memory_bytes': self._memory_bytes,
+            'max_memory_bytes': self.max_memory_bytes,
+            'disk_enabled': bool(self.cache_dir),
+            'disk_entries': len(self._disk_index),
+            'disk_bytes': self._disk_bytes,
+            'max_disk_bytes': self.max_disk_bytes,
+        }
+
+    # Memory tier
+
+    def _put_memory(self, key: str, audio: bytes) -> None:
+        """Insert into memory LRU, evicting least recently used entries"""
+        if len(audio) > self.max_memory_bytes:
+            return
+
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+
+        while self._memory_bytes > self.max_memory_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.evictions += 1
+
+    # Disk tier
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{_CACHE_FILE_SUFFIX}")
+
+    def _load_disk_index(self) -> None:
+        """Build the disk index from existing files (oldest first by mtime)"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(_CACHE_FILE_SUFFIX):
+                    continue
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime, name[:-len(_CACHE_FILE_SUFFIX)], stat.st_size))
+
+            for _, key, size in sorted(entries):
+                self._disk_index[key] = size
+                self._disk_bytes += size
+
+            logger.info(
+                f"💾 TTS cache disk tier loaded (dir={self.cache_dir}, "
+                f"entries={len(self._disk_index)}, bytes={self._disk_bytes:,})"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ TTS cache disk tier disabled ({self.cache_dir}): {e}")
+            self.cache_dir = None
+            self._disk_index.clear()
+            self._disk_bytes = 0
+
+    async def _read_disk(self, key: str) -> Optional[bytes]:
+        """Read an entry off the event loop (drops the index entry if the file vanished)"""
+        try:
+            return await asyncio.to_thread(_read_file, self._path_for(key))
+        except OSError as e:
+            logger.debug(f"⚠️ TTS cache disk read failed for {key[:12]}...: {e}")
+            size = self._disk_index.pop(key, 0)
+            self._disk_bytes -= size
+            return None
+
+
+def _read_file(path: str) -> bytes:
+    """Read a whole file"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _write_file_atomic(path: str, data: bytes) -> None:
+    """Write data to path via a temp file + rename"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _unlink_quietly(paths: list) -> None:
+    """Delete files, ignoring ones that are already gone"""
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+# Singleton instance (shared across TTSService instances)
+_tts_audio_cache: Optional[TTSAudioCache] = None
+
+
+def get_tts_audio_cache() -> Optional[TTSAudioCache]:
+    """
+    Get the shared TTSAudioCache instance.
+
+    Returns:
+        Shared cache, or None if TTS_CACHE_ENABLED is false
+    """
+    global _tts_audio_cache
+    if not TTS_CACHE_ENABLED:
+        return None
+    if _tts_audio_cache is None:
+        _tts_audio_cache = TTSAudioCache()
+    return _tts_audio_cache
+
+
+def reset_tts_audio_cache() -> None:
+    """Drop the shared cache instance (next get_tts_audio_cache() creates a fresh one)"""
+    global _tts_audio_cache
+    _tts_audio_cache = None
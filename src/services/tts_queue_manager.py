@@ -5,21 +5,33 @@ Manages concurrent TTS synthesis without interfering with Chatterbox's native
 parallelization. Queues sentences and processes them with configurable concurrency.
 
 Key Design Principles:
-- FIFO queue (preserves sentence order)
+- Sequence-ordered queue (lowest pending sentence is synthesized first, so a
+  retried sentence is picked up before later ones)
 - Semaphore-based concurrency control
+- Per-utterance synthesis (each sentence has its own TTS id and cancellation
+  scope, so concurrent sentences of one response never cancel each other)
+- In-order delivery by per-session sequence number (reorder buffer)
+- Optional bounded look-ahead window (synthesize N+1…N+k while N plays);
+  workers only dequeue sentences inside the window, never park on one
+- Optional global admission control (TTSScheduler): the sentence playback is
+  waiting on is admitted first, and the look-ahead window shrinks while
+  Chatterbox is saturated instead of requests timing out
 - Graceful cancellation support
 - Per-sentence error handling
 - Works alongside Chatterbox's streaming_strategy parameter
 """
 
 import asyncio
+import heapq
 import logging
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Callable, Awaitable, Any
+from typing import Optional, Dict, Callable, Awaitable, Any, Set, Tuple
 from enum import Enum
 import time
 import uuid
 
+from src.services.tts_scheduler import TTSPriority, TTSScheduler
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,11 +50,16 @@ class SynthesisTask:
     Represents a single sentence TTS synthesis task.
 
     Attributes:
-        task_id: Unique identifier for this synthesis task
+        task_id: Unique identifier for this synthesis task (also the TTS utterance ID)
         sentence: Text to synthesize
         session_id: Voice session identifier
         voice_id: Chatterbox voice ID
         speed: Speech rate (0.5-2.0)
+        sequence: Per-session sequence number (delivery order)
+        exaggeration: Emotion intensity (Chatterbox parameter)
+        cfg_weight: Pace control (Chatterbox parameter)
+        temperature: Sampling randomness (Chatterbox parameter)
+        language: Language code
         metadata: Additional metadata (timestamps, etc.)
         status: Current synthesis status
         audio_bytes: Synthesized audio (populated on completion)
@@ -56,6 +73,11 @@ class SynthesisTask:
     session_id: str
     voice_id: str
     speed: float
+    sequence: int = 0
+    exaggeration: Optional[float] = None
+    cfg_weight: Optional[float] = None
+    temperature: Optional[float] = None
+    language: str = "en"
     metadata: Dict[str, Any] = field(default_factory=dict)
     status: SynthesisStatus = SynthesisStatus.QUEUED
     audio_bytes: Optional[bytes] = None
@@ -64,6 +86,56 @@ class SynthesisTask:
     started_at: Optional[float] = None
     completed_at: Optional[float] = None
 
+    def __lt__(self, other: "SynthesisTask") -> bool:
+        # Queue order: lowest sequence first (closest to playback), then enqueue time
+        return (self.sequence, self.created_at) < (other.sequence, other.created_at)
+
+
+class SequenceQueue(asyncio.PriorityQueue):
+    """
+    Pending synthesis tasks ordered by sequence number.
+
+    Besides the regular Queue API, take_first() removes the lowest-sequence task
+    matching a predicate, so workers can skip tasks outside the look-ahead window
+    without dequeuing them.
+    """
+
+    def take_first(self, predicate: Callable[[SynthesisTask], bool]) -> Optional[SynthesisTask]:
+        """Remove and return the lowest-sequence task matching predicate (None if none do)"""
+        for task in sorted(self._queue):
+            if predicate(task):
+                self._queue.remove(task)
+                heapq.heapify(self._queue)
+                return task
+        return None
+
+    def count(self, predicate: Callable[[SynthesisTask], bool]) -> int:
+        """Number of queued tasks matching predicate"""
+        return sum(1 for task in self._queue if predicate(task))
+
+
+@dataclass
+class SessionSequence:
+    """
+    Per-session ordering state for sentence delivery and look-ahead.
+
+    Attributes:
+        next_sequence: Next sequence number to assign at enqueue
+        next_delivery: Next sequence number to hand to on_complete
+        played_through: Highest contiguous sequence number finished playing
+        finished: Played/skipped sequence numbers above played_through
+        ready: Completed syntheses awaiting in-order delivery (None = skipped)
+        requeued: Sequence numbers re-enqueued by on_error (retry keeps its slot)
+        delivery_lock: Serializes delivery so on_complete calls stay ordered
+    """
+    next_sequence: int = 0
+    next_delivery: int = 0
+    played_through: int = -1
+    finished: Set[int] = field(default_factory=set)
+    ready: Dict[int, Optional[Tuple[bytes, Dict[str, Any]]]] = field(default_factory=dict)
+    requeued: Set[int] = field(default_factory=set)
+    delivery_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
 
 class TTSQueueManager:
     """
@@ -82,8 +154,14 @@ class TTSQueueManager:
         await manager.enqueue_sentence("Hello!", {...})
         await manager.enqueue_sentence("How are you?", {...})
 
+        # Report playback progress (required when lookahead is set)
+        manager.mark_played(session_id, metadata['sequence'])
+
         # Stop and cleanup
         await manager.stop()
+
+    Completed sentences are delivered to on_complete strictly in enqueue order
+    per session (metadata['sequence']), even when later sentences finish first.
     """
 
     def __init__(
@@ -92,6 +170,10 @@ class TTSQueueManager:
         tts_service: Any,  # TTSService instance
         on_complete: Callable[[bytes, Dict], Awaitable[None]],
         on_error: Optional[Callable[[str, Exception, Dict], Awaitable[None]]] = None,
+        lookahead: Optional[int] = None,
+        output_format: str = "wav",
+        pcm_format: Optional[Any] = None,
+        scheduler: Optional[TTSScheduler] = None,
     ):
         """
         Initialize TTS queue manager.
@@ -99,24 +181,38 @@ class TTSQueueManager:
         Args:
             max_concurrent: Maximum number of concurrent TTS synthesis requests
             tts_service: TTSService instance for synthesis
-            on_complete: Async callback when sentence synthesis completes
+            on_complete: Async callback when sentence synthesis completes (in sequence order)
                         Args: (audio_bytes, metadata)
             on_error: Optional async callback when synthesis fails
                      Args: (sentence, error, metadata)
+            lookahead: Max sentences synthesized ahead of the one playing (None = unbounded).
+                      Requires playback progress via mark_played().
+            output_format: Audio format handed to on_complete ('wav', 'opus' or 'pcm')
+            pcm_format: PCMFormat for output_format='pcm' (e.g. DISCORD_PCM_FORMAT)
+            scheduler: Global TTS scheduler; when given, the look-ahead window is
+                      shrunk under load (the TTSService it feeds does admission)
         """
         self.max_concurrent = max_concurrent
         self.tts_service = tts_service
         self.on_complete = on_complete
         self.on_error = on_error
+        self.lookahead = lookahead
+        self.output_format = output_format
+        self.pcm_format = pcm_format
+        self.scheduler = scheduler
 
-        # Queue and task management
-        self.queue: asyncio.Queue[SynthesisTask] = asyncio.Queue()
+        # Queue and task management (ordered by sequence, see SequenceQueue)
+        self.queue: SequenceQueue = SequenceQueue()
         self.active_tasks: Dict[str, SynthesisTask] = {}
         self.completed_tasks: Dict[str, SynthesisTask] = {}
 
         # Concurrency control
         self.semaphore = asyncio.Semaphore(max_concurrent)
 
+        # Ordering and look-ahead state
+        self.sessions: Dict[str, SessionSequence] = {}
+        self._window_changed = asyncio.Condition()  # queue or look-ahead window changed
+
         # Worker management
         self.workers: list[asyncio.Task] = []
         self.running = False
@@ -127,6 +223,7 @@ class TTSQueueManager:
         self.total_completed = 0
         self.total_failed = 0
         self.total_cancelled = 0
+        self.total_window_waits = 0
 
     async def start(self, num_workers: Optional[int] = None):
         """
@@ -157,31 +254,64 @@ class TTSQueueManager:
         voice_id: str,
         speed: float = 1.0,
         metadata: Optional[Dict[str, Any]] = None,
+        exaggeration: Optional[float] = None,
+        cfg_weight: Optional[float] = None,
+        temperature: Optional[float] = None,
+        language: str = "en",
     ) -> str:
         """
         Add sentence to TTS synthesis queue.
 
+        If metadata carries a 'sequence' from a failed task of the same session
+        (retry from on_error), the sentence keeps its original delivery slot.
+
         Args:
             sentence: Text to synthesize
             session_id: Voice session identifier
             voice_id: Chatterbox voice ID
             speed: Speech rate (0.5-2.0)
             metadata: Additional metadata
+            exaggeration: Emotion intensity (Chatterbox parameter)
+            cfg_weight: Pace control (Chatterbox parameter)
+            temperature: Sampling randomness (Chatterbox parameter)
+            language: Language code
 
         Returns:
             Task ID for tracking this synthesis request
         """
+        metadata = metadata or {}
+        state = self.sessions.setdefault(session_id, SessionSequence())
+
+        retry_sequence = metadata.get('sequence')
+        if (
+            isinstance(retry_sequence, int)
+            and retry_sequence >= state.next_delivery
+            and retry_sequence < state.next_sequence
+            and retry_sequence not in state.ready
+        ):
+            sequence = retry_sequence
+            state.requeued.add(sequence)
+        else:
+            sequence = state.next_sequence
+            state.next_sequence += 1
+
         task = SynthesisTask(
             task_id=str(uuid.uuid4()),
             sentence=sentence,
             session_id=session_id,
             voice_id=voice_id,
             speed=speed,
-            metadata=metadata or {},
+            sequence=sequence,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight,
+            temperature=temperature,
+            language=language,
+            metadata=metadata,
         )
 
         await self.queue.put(task)
         self.total_enqueued += 1
+        await self._notify_window()
 
         logger.debug(
             f"📝 Enqueued sentence for TTS (task={task.task_id[:8]}..., "
@@ -201,11 +331,9 @@ class TTSQueueManager:
 
         while self.running:
             try:
-                # Wait for task or stop signal
-                try:
-                    task = await asyncio.wait_for(self.queue.get(), timeout=0.5)
-                except asyncio.TimeoutError:
-                    # Check stop signal
+                # Wait for a task inside its look-ahead window, or stop signal
+                task = await self._next_task()
+                if task is None:
                     if self.stop_event.is_set():
                         break
                     continue
@@ -222,6 +350,130 @@ class TTSQueueManager:
 
         logger.debug(f"👷 TTS Worker {worker_id} stopped")
 
+    def _in_window(self, task: SynthesisTask) -> bool:
+        """Check whether a task may start synthesis under the look-ahead bound"""
+        if self.lookahead is None or not self.running or task.status == SynthesisStatus.CANCELLED:
+            return True
+        state = self.sessions.get(task.session_id)
+        if state is None:
+            return True
+        # played_through + 1 is the sentence playing now (N); allow up to N + k
+        return task.sequence <= state.played_through + 1 + self._current_lookahead()
+
+    def _current_lookahead(self) -> int:
+        """Look-ahead bound, reduced by the scheduler while Chatterbox is saturated"""
+        if self.scheduler is None:
+            return self.lookahead
+        return self.scheduler.effective_lookahead(self.lookahead)
+
+    def _priority(self, task: SynthesisTask) -> TTSPriority:
+        """URGENT for the sentence playback needs next (e.g. first of a response)"""
+        state = self.sessions.get(task.session_id)
+        if state is None or task.sequence <= state.played_through + 1:
+            return TTSPriority.URGENT
+        return TTSPriority.LOOKAHEAD
+
+    def _has_ready_task(self) -> bool:
+        """Check whether any queued task may start synthesis now"""
+        return self.queue.count(self._in_window) > 0
+
+    async def _next_task(self) -> Optional[SynthesisTask]:
+        """
+        Dequeue the lowest-sequence task inside its session's look-ahead window.
+
+        Tasks outside the window stay queued, so a worker never holds a task it
+        cannot start (a retried earlier sentence can always be picked up).
+
+        Returns:
+            Task to synthesize, or None after a short timeout (lets the worker
+            check the stop signal)
+        """
+        async with self._window_changed:
+            if not self._has_ready_task():
+                if not self.queue.empty():
+                    self.total_window_waits += 1
+                try:
+                    await asyncio.wait_for(
+                        self._window_changed.wait_for(
+                            lambda: not self.running or self._has_ready_task()
+                        ),
+                        timeout=0.5,
+                    )
+                except asyncio.TimeoutError:
+                    return None
+            if not self.running:
+                return None
+            return self.queue.take_first(self._in_window)
+
+    async def _notify_window(self) -> None:
+        """Wake workers waiting for a queued task or a look-ahead window to open"""
+        async with self._window_changed:
+            self._window_changed.notify_all()
+
+    def mark_played(self, session_id: str, sequence: int) -> None:
+        """
+        Report that a sentence finished playing (advances the look-ahead window).
+
+        Args:
+            session_id: Voice session identifier
+            sequence: metadata['sequence'] of the played sentence
+        """
+        state = self.sessions.get(session_id)
+        if state is None or sequence <= state.played_through:
+            return
+
+        state.finished.add(sequence)
+        while state.played_through + 1 in state.finished:
+            state.played_through += 1
+            state.finished.discard(state.played_through)
+
+        if self.lookahead is not None:
+            asyncio.ensure_future(self._notify_window())
+
+    def release_session(self, session_id: str) -> None:
+        """
+        Drop ordering state for a session (call on session cleanup).
+
+        Args:
+            session_id: Voice session identifier
+        """
+        self.sessions.pop(session_id, None)
+
+    async def _deliver(self, task: SynthesisTask, result: Optional[Tuple[bytes, Dict[str, Any]]]) -> None:
+        """
+        Hand a finished task to the reorder buffer and flush in sequence order.
+
+        Args:
+            task: Finished task
+            result: (audio_bytes, metadata) to deliver, or None to skip this slot
+        """
+        state = self.sessions.get(task.session_id)
+        if state is None or task.sequence < state.next_delivery:
+            return
+
+        state.ready[task.sequence] = result
+
+        async with state.delivery_lock:
+            while state.next_delivery in state.ready:
+                ready = state.ready.pop(state.next_delivery)
+                sequence = state.next_delivery
+                state.next_delivery += 1
+
+                if ready is None:
+                    # Skipped slot never plays; count it as played for the window
+                    self.mark_played(task.session_id, sequence)
+                    continue
+
+                if self.on_complete:
+                    try:
+                        await self.on_complete(*ready)
+                    except Exception as e:
+                        logger.error(f"❌ TTS on_complete callback error (sequence={sequence}): {e}", exc_info=True)
+
+    async def _retire(self, task: SynthesisTask) -> None:
+        """Skip a cancelled/failed task's delivery slot so later sentences aren't blocked"""
+        await self._deliver(task, None)
+
     async def _synthesize_task(self, task: SynthesisTask):
         """
         Synthesize audio for a single task.
@@ -236,19 +488,38 @@ class TTSQueueManager:
         try:
             logger.debug(
                 f"🔊 Synthesizing sentence (task={task.task_id[:8]}..., "
-                f"length={len(task.sentence)} chars, active={len(self.active_tasks)})"
+                f"sequence={task.sequence}, length={len(task.sentence)} chars, "
+                f"active={len(self.active_tasks)})"
             )
 
-            # Call TTS service (uses Chatterbox with native streaming)
+            # Call TTS service (uses Chatterbox with native streaming).
+            # utterance_id gives each sentence its own tracking and cancellation
+            # scope, so concurrent sentences of one session don't cancel each other.
             audio_bytes = await self.tts_service.synthesize_speech(
                 session_id=task.session_id,
                 text=task.sentence,
                 voice_id=task.voice_id,
-                speed=task.speed,
+                exaggeration=task.exaggeration,
+                cfg_weight=task.cfg_weight,
+                temperature=task.temperature,
+                language_id=task.language,
                 stream=False,  # Get complete audio for this sentence
                 callback=None,  # No streaming callback for individual sentences
+                utterance_id=task.task_id,
+                output_format=self.output_format,
+                pcm_format=self.pcm_format,
+                priority=self._priority(task),
             )
 
+            if task.status == SynthesisStatus.CANCELLED:
+                self.active_tasks.pop(task.task_id, None)
+                await self._retire(task)
+                return
+
+            if not audio_bytes:
+                # TTSService degrades gracefully to b'' on failure
+                raise RuntimeError("TTS returned no audio")
+
             task.audio_bytes = audio_bytes
             task.status = SynthesisStatus.COMPLETED
             task.completed_at = time.time()
@@ -265,15 +536,15 @@ class TTSQueueManager:
                 f"audio_size={len(audio_bytes)} bytes, latency={latency:.2f}s)"
             )
 
-            # Call completion callback
-            if self.on_complete:
-                await self.on_complete(audio_bytes, {
-                    'task_id': task.task_id,
-                    'sentence': task.sentence,
-                    'session_id': task.session_id,
-                    'latency': latency,
-                    **task.metadata,
-                })
+            # Deliver in sequence order (may wait on earlier sentences)
+            await self._deliver(task, (audio_bytes, {
+                'task_id': task.task_id,
+                'sentence': task.sentence,
+                'session_id': task.session_id,
+                'latency': latency,
+                **task.metadata,
+                'sequence': task.sequence,
+            }))
 
         except Exception as e:
             task.status = SynthesisStatus.FAILED
@@ -287,13 +558,52 @@ class TTSQueueManager:
                 f"sentence={task.sentence[:50]}..., error={e})"
             )
 
-            # Call error callback
+            # Call error callback (may re-enqueue the sentence into the same slot)
             if self.on_error:
-                await self.on_error(task.sentence, e, {
-                    'task_id': task.task_id,
-                    'session_id': task.session_id,
-                    **task.metadata,
-                })
+                try:
+                    await self.on_error(task.sentence, e, {
+                        'task_id': task.task_id,
+                        'session_id': task.session_id,
+                        **task.metadata,
+                        'sequence': task.sequence,
+                    })
+                except Exception as callback_error:
+                    logger.error(f"❌ TTS on_error callback error: {callback_error}", exc_info=True)
+
+            state = self.sessions.get(task.session_id)
+            if state is not None and task.sequence in state.requeued:
+                state.requeued.discard(task.sequence)
+            else:
+                await self._retire(task)
+
+    async def _cancel_tasks(self, tasks: list) -> None:
+        """Mark tasks cancelled and release their delivery slots"""
+        for task in tasks:
+            task.status = SynthesisStatus.CANCELLED
+            self.total_cancelled += 1
+            await self._retire(task)
+
+    def _drain_queue(self) -> list:
+        """Remove and return all tasks still in the queue (sequence order)"""
+        tasks = []
+        while not self.queue.empty():
+            try:
+                tasks.append(self.queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return tasks
+
+    async def _release_window(self) -> None:
+        """
+        Open look-ahead windows after an interruption.
+
+        Audio already delivered to playback may be dropped by the playback queue
+        without a completion report, so treat everything delivered as played.
+        """
+        for state in self.sessions.values():
+            state.played_through = max(state.played_through, state.next_delivery - 1)
+            state.finished = {seq for seq in state.finished if seq > state.played_through}
+        await self._notify_window()
 
     async def cancel_all(self):
         """
@@ -301,15 +611,18 @@ class TTSQueueManager:
 
         Used when user interrupts or session ends.
         """
-        # Cancel all pending tasks in queue
-        pending_count = self.queue.qsize()
-        while not self.queue.empty():
-            try:
-                task = self.queue.get_nowait()
-                task.status = SynthesisStatus.CANCELLED
-                self.total_cancelled += 1
-            except asyncio.QueueEmpty:
-                break
+        # Cancel all pending tasks (including those outside the look-ahead window)
+        pending = self._drain_queue()
+        pending_count = len(pending)
+        await self._cancel_tasks(pending)
+
+        # Cancel active syntheses (per-utterance scope)
+        for task in list(self.active_tasks.values()):
+            task.status = SynthesisStatus.CANCELLED
+            self.total_cancelled += 1
+            await self.tts_service.cancel_utterance(task.task_id)
+
+        await self._release_window()
 
         logger.info(
             f"🚫 Cancelled all TTS tasks (pending={pending_count}, "
@@ -322,14 +635,10 @@ class TTSQueueManager:
 
         Used for graceful interruption strategy.
         """
-        pending_count = self.queue.qsize()
-        while not self.queue.empty():
-            try:
-                task = self.queue.get_nowait()
-                task.status = SynthesisStatus.CANCELLED
-                self.total_cancelled += 1
-            except asyncio.QueueEmpty:
-                break
+        pending = self._drain_queue()
+        pending_count = len(pending)
+        await self._cancel_tasks(pending)
+        await self._release_window()
 
         logger.info(f"🚫 Cancelled pending TTS tasks (count={pending_count})")
 
@@ -345,21 +654,15 @@ class TTSQueueManager:
         if self.queue.qsize() <= num_to_keep:
             return  # Nothing to cancel
 
-        # Drain queue to list
-        tasks = []
-        while not self.queue.empty():
-            try:
-                tasks.append(self.queue.get_nowait())
-            except asyncio.QueueEmpty:
-                break
+        # Drain queue to list (sequence order)
+        tasks = self._drain_queue()
 
         # Keep first N, cancel rest
         for task in tasks[:num_to_keep]:
             await self.queue.put(task)
 
-        for task in tasks[num_to_keep:]:
-            task.status = SynthesisStatus.CANCELLED
-            self.total_cancelled += 1
+        await self._cancel_tasks(tasks[num_to_keep:])
+        await self._release_window()
 
         logger.info(
             f"🚫 Cancelled TTS tasks (kept={num_to_keep}, "
@@ -379,6 +682,7 @@ class TTSQueueManager:
 
         self.running = False
         self.stop_event.set()
+        await self._notify_window()
 
         # Wait for workers to finish
         if self.workers:
@@ -408,4 +712,9 @@ class TTSQueueManager:
             'total_failed': self.total_failed,
             'total_cancelled': self.total_cancelled,
             'max_concurrent': self.max_concurrent,
+            'lookahead': self.lookahead,
+            'output_format': self.output_format,
+            'effective_lookahead': self._current_lookahead() if self.lookahead is not None else None,
+            'waiting_for_window': self.queue.count(lambda task: not self._in_window(task)),
+            'total_window_waits': self.total_window_waits,
         }
@@ -0,0 +1,350 @@
+"""
+TTS Admission Control and Fair Scheduling
+
+Process-wide gate in front of Chatterbox. Every TTSQueueManager (one per
+agent) runs its own workers, so without a shared budget 20 active sessions
+could put 80 concurrent requests on the backend and push every one of them
+into a timeout.
+
+Key Features:
+- Global concurrency budget across all sessions and agents
+- Weighted fair queuing between sessions (virtual finish tags, cost =
+  characters to synthesize), so one long response can't starve others
+- Priority classes: the sentence playback is waiting on (e.g. the first
+  sentence of a response) goes before look-ahead and background work
+- Queue-time metrics (EWMA, p50/p95 per priority class)
+- Load shedding: under sustained queueing, callers are told to synthesize
+  fewer sentences ahead instead of letting requests time out
+
+Key Design Principles:
+- Uncontended admission is O(1) with no awaiting (no added latency)
+- Waiting requests can be abandoned (barge-in) without leaking slots
+- The scheduler only decides *when* a request may start; *where* it goes
+  is the backend pool's job
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Deque, Dict, List, Optional
+
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+TTS_GLOBAL_MAX_CONCURRENT = int(os.getenv('TTS_GLOBAL_MAX_CONCURRENT', '8'))
+TTS_SHED_QUEUE_WAIT_MS = int(os.getenv('TTS_SHED_QUEUE_WAIT_MS', '1500'))
+TTS_SHED_MIN_LOOKAHEAD = int(os.getenv('TTS_SHED_MIN_LOOKAHEAD', '1'))
+
+# Recent queue waits kept per priority class for percentiles
+_WAIT_WINDOW = 200
+
+
+class TTSPriority(IntEnum):
+    """Admission priority (lower is served first)"""
+    URGENT = 0      # Playback is waiting on this sentence (first sentence of a response)
+    LOOKAHEAD = 1   # Synthesized ahead of playback
+    BACKGROUND = 2  # Nobody is waiting (cache warm-up, filler clips)
+
+
+@dataclass(order=True)
+class _Waiter:
+    """One queued admission request (ordered by priority, then virtual finish tag)"""
+    priority: int
+    finish_tag: float
+    seq: int
+    session_id: str = field(compare=False)
+    start_tag: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+
+class TTSScheduler:
+    """
+    Global TTS admission controller with weighted fair queuing.
+
+    Example usage:
+        scheduler = get_tts_scheduler()
+
+        queue_wait_s = await scheduler.acquire(session_id, cost=len(text), priority=TTSPriority.URGENT)
+        try:
+            ...  # request audio from Chatterbox
+        finally:
+            scheduler.release()
+
+        lookahead = scheduler.effective_lookahead(3)  # fewer under load
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = TTS_GLOBAL_MAX_CONCURRENT,
+        shed_queue_wait_ms: int = TTS_SHED_QUEUE_WAIT_MS,
+        min_lookahead: int = TTS_SHED_MIN_LOOKAHEAD,
+        ewma_alpha: float = 0.2,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrent: Requests allowed in flight across the process
+            shed_queue_wait_ms: Smoothed queue wait at which look-ahead is cut
+                                to min_lookahead (halved from half of it)
+            min_lookahead: Look-ahead never shed below this
+            ewma_alpha: Weight of the newest sample in the queue wait EWMA
+        """
+        if max_concurrent < 1:
+            raise ValueError("TTSScheduler requires max_concurrent >= 1")
+
+        self.max_concurrent = max_concurrent
+        self.shed_queue_wait_s = shed_queue_wait_ms / 1000
+        self.min_lookahead = min_lookahead
+        self.ewma_alpha = ewma_alpha
+
+        self.active = 0
+        self._heap: List[_Waiter] = []
+        self._seq = itertools.count()
+
+        # Fair queuing state: virtual clock and each session's last finish tag
+        self._virtual_time = 0.0
+        self._session_finish: Dict[str, float] = {}
+        self._session_waiting: Dict[str, int] = {}
+
+        # Metrics
+        self.admitted = 0
+        self.queued = 0
+        self.abandoned = 0
+        self.lookahead_shed = 0
+        self.max_waiting = 0
+        self.ewma_queue_wait_s = 0.0
+        self._waits: Dict[TTSPriority, Deque[float]] = {
+            priority: deque(maxlen=_WAIT_WINDOW) for priority in TTSPriority
+        }
+
+    @property
+    def waiting(self) -> int:
+        """Requests queued for admission"""
+        return sum(self._session_waiting.values())
+
+    async def acquire(
+        self,
+        session_id: str,
+        cost: float = 1.0,
+        priority: TTSPriority = TTSPriority.LOOKAHEAD,
+        weight: float = 1.0,
+        cancel_event: Optional[asyncio.Event] = None,
+    ) -> float:
+        """
+        Wait for a slot in the global budget.
+
+        Args:
+            session_id: Session the request belongs to (unit of fairness)
+            cost: Work estimate (characters to synthesize)
+            priority: Admission class
+            weight: Session's share relative to others (2.0 = twice the throughput)
+            cancel_event: Abandon the wait when set (barge-in)
+
+        Returns:
+            Seconds spent queued
+
+        Raises:
+            asyncio.CancelledError: If cancelled or cancel_event was set while queued
+        """
+        priority = TTSPriority(priority)
+        t_enqueue = time.time()
+        start_tag = max(self._virtual_time, self._session_finish.get(session_id, 0.0))
+        finish_tag = start_tag + max(cost, 1.0) / max(weight, 1e-6)
+        self._session_finish[session_id] = finish_tag
+
+        # Fast path: free slot and nobody ahead
+        if self.active < self.max_concurrent and not self._heap:
+            self.active += 1
+            self._virtual_time = max(self._virtual_time, start_tag)
+            self._record_wait(priority, 0.0)
+            return 0.0
+
+        waiter = _Waiter(
+            priority=int(priority),
+            finish_tag=finish_tag,
+            seq=next(self._seq),
+            session_id=session_id,
+            start_tag=start_tag,
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=t_enqueue,
+        )
+        heapq.heappush(self._heap, waiter)
+        self._session_waiting[session_id] = self._session_waiting.get(session_id, 0) + 1
+        self.queued += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+
+        # A slot may be free behind abandoned waiters
+        self._dispatch()
+
+        try:
+            if cancel_event is None:
+                await waiter.future
+            else:
+                cancel_waiter = asyncio.create_task(cancel_event.wait())
+                try:
+                    await asyncio.wait({waiter.future, cancel_waiter}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    cancel_waiter.cancel()
+                if not waiter.future.done():
+                    raise asyncio.CancelledError()
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+        queue_wait_s = time.time() - t_enqueue
+        self._record_wait(priority, queue_wait_s)
+        if queue_wait_s > 0.1:
+            logger.debug(
+                f"🚦 TTS admitted after {queue_wait_s * 1000:.0f}ms queued "
+                f"(session={session_id[:8]}..., priority={priority.name}, waiting={self.waiting})"
+            )
+        return queue_wait_s
+
+    def release(self) -> None:
+        """Return a slot (call once per successful acquire)"""
+        self.active = max(0, self.active - 1)
+        self._dispatch()
+
+    def effective_lookahead(self, lookahead: int) -> int:
+        """
+        Look-ahead a caller should use given current queueing.
+
+        Full look-ahead while queue waits are short, halved once the smoothed
+        wait reaches half of TTS_SHED_QUEUE_WAIT_MS, and cut to min_lookahead
+        beyond it. Sentences outside the window simply wait their turn.
+
+        Args:
+            lookahead: Look-ahead the caller would use unloaded
+
+        Returns:
+            Reduced (or unchanged) look-ahead
+        """
+        level = self.shed_level()
+        if level == 0:
+            return lookahead
+        reduced = lookahead // 2 if level == 1 else self.min_lookahead
+        return min(lookahead, max(self.min_lookahead, reduced))
+
+    def shed_level(self) -> int:
+        """Load shedding level: 0 (none), 1 (halve look-ahead), 2 (minimum look-ahead)"""
+        if self.shed_queue_wait_s <= 0:
+            return 0
+        pressure = self.ewma_queue_wait_s / self.shed_queue_wait_s
+        if pressure < 0.5:
+            return 0
+        return 1 if pressure < 1.0 else 2
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with budget usage, queue depth, queue-time percentiles
+            per priority class and load shedding counters
+        """
+        return {
+            'max_concurrent': self.max_concurrent,
+            'active': self.active,
+            'waiting': self.waiting,
+            'max_waiting': self.max_waiting,
+            'admitted': self.admitted,
+            'queued': self.queued,
+            'abandoned': self.abandoned,
+            'ewma_queue_wait_s': self.ewma_queue_wait_s,
+            'queue_wait_s': {
+                priority.name.lower(): self._percentiles(waits)
+                for priority, waits in self._waits.items()
+            },
+            'shed_level': self.shed_level(),
+            'lookahead_shed': self.lookahead_shed,
+        }
+
+    def _dispatch(self) -> None:
+        """Admit queued requests while slots are free"""
+        while self.active < self.max_concurrent and self._heap:
+            waiter = heapq.heappop(self._heap)
+            self._leave_queue(waiter.session_id)
+            if waiter.future.done():
+                continue  # Abandoned while queued
+            self.active += 1
+            self._virtual_time = max(self._virtual_time, waiter.start_tag)
+            waiter.future.set_result(None)
+
+        # Sessions with nothing queued and no lead over the clock need no state
+        if len(self._session_finish) > 4 * _WAIT_WINDOW:
+            self._session_finish = {
+                session_id: tag for session_id, tag in self._session_finish.items()
+                if tag > self._virtual_time or session_id in self._session_waiting
+            }
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Handle a waiter cancelled while queued (or right after being admitted)"""
+        if waiter.future.done() and not waiter.future.cancelled():
+            # Slot was granted just before the cancellation landed
+            self.release()
+            return
+        waiter.future.cancel()
+        self.abandoned += 1
+        # Removed lazily from the heap; fix the per-session count now
+        self._leave_queue(waiter.session_id)
+        waiter.session_id = ''
+
+    def _leave_queue(self, session_id: str) -> None:
+        if session_id not in self._session_waiting:
+            return
+        self._session_waiting[session_id] -= 1
+        if self._session_waiting[session_id] <= 0:
+            del self._session_waiting[session_id]
+
+    def _record_wait(self, priority: TTSPriority, wait_s: float) -> None:
+        self.admitted += 1
+        self._waits[priority].append(wait_s)
+        level = self.shed_level()
+        self.ewma_queue_wait_s = self.ewma_alpha * wait_s + (1 - self.ewma_alpha) * self.ewma_queue_wait_s
+
+        # Count each escalation of load shedding once (effective_lookahead() is
+        # evaluated per queued task and must stay side-effect free)
+        if self.shed_level() > level:
+            self.lookahead_shed += 1
+
+    @staticmethod
+    def _percentiles(waits: Deque[float]) -> Dict[str, Optional[float]]:
+        if not waits:
+            return {'p50': None, 'p95': None}
+        ordered = sorted(waits)
+        return {
+            'p50': ordered[len(ordered) // 2],
+            'p95': ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))],
+        }
+
+
+# Singleton instance
+_tts_scheduler: Optional[TTSScheduler] = None
+
+
+def get_tts_scheduler() -> TTSScheduler:
+    """
+    Get the process-wide TTSScheduler instance.
+
+    Returns:
+        Shared scheduler (created on first use)
+    """
+    global _tts_scheduler
+    if _tts_scheduler is None:
+        _tts_scheduler = TTSScheduler()
+    return _tts_scheduler
+
+
+def reset_tts_scheduler() -> None:
+    """Drop the shared scheduler (next get_tts_scheduler() creates a fresh one)"""
+    global _tts_scheduler
+    _tts_scheduler = None
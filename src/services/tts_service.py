@@ -9,20 +9,28 @@ Key Features:
 - Streaming audio chunks via callback
 - HTTP client connection pooling
 - Health monitoring (latency tracking, availability)
+- Circuit breaker with background health prober (no per-request health checks)
+- Multi-backend pool (least-outstanding routing, optional hedged requests)
+- Content-addressed audio cache for repeated phrases (memory LRU + disk tier)
+- Optional streaming Opus/WebM transcode of output (negotiated per client)
 - Graceful degradation (return empty bytes on failure)
-- Session-based cancellation
+- Session-based cancellation, propagated to Chatterbox (stream closed at once,
+  cancel endpoint called when the backend has one)
 
 Design Patterns:
-- Connection Pool Pattern: Single HTTP client for all requests
+- Connection Pool Pattern: Single HTTP client for all requests (all backends)
+- Hedged Request Pattern: Duplicate a late request, keep the first to answer
 - Observer Pattern: Callback-based audio chunk delivery
 - Health Check Pattern: Service availability monitoring
+- Circuit Breaker Pattern: Fail fast while Chatterbox is down
 - Metrics Pattern: Per-session latency and throughput tracking
 """
 
 import os
 import asyncio
 import time
-from typing import Dict, List, Optional, Callable, Any, Awaitable, Tuple
+import uuid
+from typing import Dict, List, Optional, Callable, Any, Awaitable, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import httpx
@@ -31,6 +39,10 @@ import json
 from src.config.logging_config import get_logger
 from src.types.error_events import ServiceErrorEvent, ServiceErrorType
 from src.config.streaming import StreamingConfig, get_streaming_config
+from src.services.audio_transcode import PCMFormat, create_transcoder, make_wav_header
+from src.services.tts_backend_pool import TTS_BACKEND_URLS, TTSBackend, get_tts_backend_pool
+from src.services.tts_cache import TTSAudioCache, get_tts_audio_cache
+from src.services.tts_scheduler import TTSPriority, TTSScheduler, get_tts_scheduler
 from src.utils.text_filters import filter_action_text_with_metadata
 
 logger = get_logger(__name__)
@@ -44,6 +56,31 @@ TTS_STREAMING_STRATEGY = os.getenv('TTS_STREAMING_STRATEGY', 'word')
 TTS_STREAMING_CHUNK_SIZE = int(os.getenv('TTS_STREAMING_CHUNK_SIZE', '100'))
 TTS_STREAMING_BUFFER_SIZE = int(os.getenv('TTS_STREAMING_BUFFER_SIZE', '3'))
 TTS_STREAMING_QUALITY = os.getenv('TTS_STREAMING_QUALITY', 'fast')
+TTS_HEALTH_CHECK_INTERVAL_S = float(os.getenv('TTS_HEALTH_CHECK_INTERVAL_S', '15'))
+TTS_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('TTS_CIRCUIT_FAILURE_THRESHOLD', '3'))
+TTS_CIRCUIT_RECOVERY_S = float(os.getenv('TTS_CIRCUIT_RECOVERY_S', '10'))
+TTS_MAX_CONNECTIONS_PER_BACKEND = int(os.getenv('TTS_MAX_CONNECTIONS_PER_BACKEND', '10'))
+TTS_SERVER_CANCEL_ENABLED = os.getenv('TTS_SERVER_CANCEL_ENABLED', 'true').lower() in ['true', '1', 'yes']
+TTS_CANCEL_PATH = os.getenv('TTS_CANCEL_PATH', '/audio/speech/cancel')
+
+# Status codes meaning "this backend has no cancel endpoint"
+_CANCEL_UNSUPPORTED_STATUS = {404, 405, 501}
+
+# Status codes meaning "this backend rejects response_format=pcm"
+_PCM_UNSUPPORTED_STATUS = {400, 415, 422}
+
+
+class TTSSinkError(Exception):
+    """
+    The caller's audio callback failed (e.g. the client socket already closed).
+
+    Raised around callback errors inside a synthesis so they are never counted
+    against Chatterbox health; unwrapped before leaving _stream_tts.
+    """
+
+    def __init__(self, error: Exception):
+        super().__init__(str(error))
+        self.error = error
 
 
 class TTSStatus(Enum):
@@ -104,6 +141,7 @@ class ActiveTTS:
         started_at: When synthesis started
         cancel_event: Event to signal cancellation
         stream_task: Background task for streaming
+        utterance_id: Per-utterance ID (None for session-scoped synthesis)
     """
     session_id: str
     text: str
@@ -116,6 +154,7 @@ class ActiveTTS:
     started_at: float
     cancel_event: asyncio.Event
     stream_task: Optional[asyncio.Task] = None
+    utterance_id: Optional[str] = None
 
 
 class TTSService:
@@ -145,6 +184,9 @@ class TTSService:
     Configuration:
         All parameters can be set via environment variables:
         - CHATTERBOX_URL: Chatterbox API URL (default: http://chatterbox-tts:4123)
+        - TTS_BACKEND_URLS: Comma-separated Chatterbox URLs for a backend pool (overrides CHATTERBOX_URL)
+        - TTS_MAX_CONNECTIONS_PER_BACKEND: HTTP connection cap per backend (default: 10)
+        - TTS_HEDGE_ENABLED: Hedge requests whose first byte is later than p90 (default: false)
         - CHATTERBOX_VOICE_ID: Default voice ID (default: default)
         - TTS_TIMEOUT_S: Request timeout in seconds (default: 60)
         - TTS_STREAM_CHUNK_SIZE: Audio chunk size (default: 8192)
@@ -152,6 +194,11 @@ class TTSService:
         - TTS_STREAMING_CHUNK_SIZE: Chunks per buffer (default: 100)
         - TTS_STREAMING_BUFFER_SIZE: Buffer size (default: 3)
         - TTS_STREAMING_QUALITY: Quality preset (default: fast)
+        - TTS_HEALTH_CHECK_INTERVAL_S: Background health probe interval (default: 15, 0 disables)
+        - TTS_CIRCUIT_FAILURE_THRESHOLD: Consecutive failures before circuit opens (default: 3)
+        - TTS_CIRCUIT_RECOVERY_S: Seconds before an open circuit allows a trial (default: 10)
+        - TTS_SERVER_CANCEL_ENABLED: Call the backend cancel endpoint on barge-in (default: true)
+        - TTS_CANCEL_PATH: Backend cancel endpoint (default: /audio/speech/cancel)
     """
 
     def __init__(
@@ -161,7 +208,10 @@ class TTSService:
         timeout_s: Optional[float] = None,
         chunk_size: Optional[int] = None,
         error_callback: Optional[Callable[[ServiceErrorEvent], Awaitable[None]]] = None,
-        streaming_config: Optional[StreamingConfig] = None
+        streaming_config: Optional[StreamingConfig] = None,
+        audio_cache: Optional[TTSAudioCache] = None,
+        backend_urls: Optional[List[str]] = None,
+        scheduler: Optional[TTSScheduler] = None
     ):
         """
         Initialize TTSService.
@@ -173,19 +223,29 @@ class TTSService:
             chunk_size: Override default chunk size
             error_callback: Optional async callback for error events
             streaming_config: Sentence-level streaming configuration (defaults to global config)
+            audio_cache: Audio cache for repeated phrases (defaults to shared cache, None if disabled)
+            backend_urls: Chatterbox URLs for a backend pool (overrides chatterbox_url)
+            scheduler: Admission control for Chatterbox requests (defaults to the
+                       process-wide scheduler)
         """
-        # Initialize Chatterbox URL and validate format
-        base_url = chatterbox_url or CHATTERBOX_URL
-
-        # Strip /v1 suffix if present (backward compatibility)
-        if base_url.endswith('/v1'):
-            logger.warning(
-                f"⚠️ CHATTERBOX_URL should not include '/v1' suffix. "
-                f"Got: {base_url}. Stripping '/v1' for compatibility."
-            )
-            base_url = base_url.rstrip('/v1')
-
-        self.chatterbox_url = base_url
+        # Backend pool: explicit list > explicit URL > TTS_BACKEND_URLS > CHATTERBOX_URL
+        # ('/v1' suffixes are stripped for backward compatibility)
+        if backend_urls:
+            urls = backend_urls
+        elif chatterbox_url:
+            urls = [chatterbox_url]
+        else:
+            urls = TTS_BACKEND_URLS or [CHATTERBOX_URL]
+
+        # Shared by every TTSService using the same backends (load, latency,
+        # breakers, health prober)
+        self.backend_pool = get_tts_backend_pool(
+            urls,
+            failure_threshold=TTS_CIRCUIT_FAILURE_THRESHOLD,
+            recovery_timeout_s=TTS_CIRCUIT_RECOVERY_S,
+            health_check_interval_s=TTS_HEALTH_CHECK_INTERVAL_S
+        )
+        self.chatterbox_url = self.backend_pool.primary.url
         self.default_voice_id = default_voice_id or CHATTERBOX_VOICE_ID
         self.timeout = timeout_s or TTS_TIMEOUT_S
         self.chunk_size = chunk_size or TTS_STREAM_CHUNK_SIZE
@@ -204,8 +264,22 @@ class TTSService:
         self._metrics_history: List[TTSMetrics] = []
         self._max_metrics_history = 100
 
+        # Circuit breaker for the pool as a whole (consulted instead of a per-request
+        # health check); owned by the shared pool so every connection sees the same state
+        self.circuit_breaker = self.backend_pool.circuit_breaker
+
+        # Audio cache (shared across TTSService instances by default)
+        self.audio_cache = audio_cache if audio_cache is not None else get_tts_audio_cache()
+
+        # Global admission control (shared budget and fair queuing across sessions)
+        self.scheduler = scheduler or get_tts_scheduler()
+
+        # Server-side cancel requests in flight (fire-and-forget, never block barge-in)
+        self.server_cancel_enabled = TTS_SERVER_CANCEL_ENABLED
+        self._cancel_tasks: Set[asyncio.Task] = set()
+
         logger.info(
-            f"🔊 TTSService initialized (url={self.chatterbox_url}, voice={self.default_voice_id}, "
+            f"🔊 TTSService initialized (backends={[b.url for b in self.backend_pool.backends]}, voice={self.default_voice_id}, "
             f"streaming={'enabled' if self.streaming_config.enabled else 'disabled'})"
         )
 
@@ -220,7 +294,11 @@ class TTSService:
         language_id: str = "en",
         stream: bool = True,
         callback: Optional[Callable[[bytes], None]] = None,
-        filter_actions: bool = False
+        filter_actions: bool = False,
+        utterance_id: Optional[str] = None,
+        output_format: str = "wav",
+        pcm_format: Optional[PCMFormat] = None,
+        priority: TTSPriority = TTSPriority.URGENT
     ) -> bytes:
         """
         Synthesize speech from text using Chatterbox TTS API.
@@ -240,6 +318,19 @@ class TTSService:
             stream: Enable streaming (default: True)
             callback: Optional callback for streaming audio chunks
             filter_actions: Remove roleplay actions (*text*) before synthesis (default: False)
+            utterance_id: Per-utterance ID. When given, this synthesis gets its own
+                cancellation scope (cancel_utterance) and does not cancel other
+                in-flight syntheses of the session (concurrent per-sentence TTS).
+                When omitted, any existing TTS for the session is cancelled first.
+            output_format: 'wav' (Chatterbox output unchanged), 'opus' (WebM/Opus,
+                transcoded incrementally as chunks arrive) or 'pcm' (headerless
+                s16le at pcm_format's rate/channels, requested from Chatterbox
+                directly and resampled in process if it can't deliver that rate).
+                The audio cache always stores WAV; transcoding happens on delivery.
+            pcm_format: Target layout for output_format='pcm' (rate, channels,
+                chunk alignment)
+            priority: Admission class when Chatterbox is busy (URGENT when playback
+                is waiting on this audio, LOOKAHEAD/BACKGROUND otherwise)
 
         Returns:
             bytes: Complete audio (if no callback), or empty bytes (if streaming)
@@ -269,12 +360,27 @@ class TTSService:
             f"exaggeration={exaggeration}, cfg_weight={cfg_weight}, temp={temperature}, lang={language_id}"
         )
 
-        # Cancel any existing TTS for this session
-        await self.cancel_tts(session_id)
+        # Session-scoped synthesis replaces any existing TTS for this session;
+        # per-utterance synthesis runs alongside its siblings
+        active_key = utterance_id or session_id
+        if utterance_id is None:
+            await self.cancel_tts(session_id)
 
-        # Check Chatterbox health first
-        if not await self.test_tts_health():
-            logger.warning("⚠️ Chatterbox unavailable, cannot synthesize")
+        # Repeated phrases are served from the audio cache (even while Chatterbox is down)
+        cache_key = None
+        cached_audio = None
+        if self.audio_cache is not None and self.audio_cache.is_cacheable(text):
+            cache_key = self.audio_cache.make_key(
+                text, voice_id, exaggeration, cfg_weight, temperature, language_id
+            )
+            cached_audio = await self.audio_cache.get(cache_key)
+
+        # Consult cached health state (O(1), no network round-trip)
+        self.backend_pool.ensure_health_monitor()
+        if cached_audio is None and not self.circuit_breaker.allow_request():
+            logger.warning(
+                f"⚠️ Chatterbox unavailable (circuit {self.circuit_breaker.state.value}), cannot synthesize"
+            )
             self._record_metrics(
                 session_id=session_id,
                 text_length=len(text),
@@ -298,23 +404,63 @@ class TTSService:
             language_id=language_id,
             status=TTSStatus.SYNTHESIZING,
             started_at=time.time(),
-            cancel_event=asyncio.Event()
+            cancel_event=asyncio.Event(),
+            utterance_id=utterance_id
         )
-        self._active_sessions[session_id] = active_tts
+        self._active_sessions[active_key] = active_tts
 
+        # Wrap delivery in a per-utterance transcoder if the client negotiated one
         try:
-            # Stream TTS audio
-            audio_bytes = await self._stream_tts(
-                session_id=session_id,
-                text=text,
-                voice_id=voice_id,
-                exaggeration=exaggeration,
-                cfg_weight=cfg_weight,
-                temperature=temperature,
-                language_id=language_id,
-                callback=callback,
-                cancel_event=active_tts.cancel_event
-            )
+            transcoder = create_transcoder(output_format, pcm_format)
+        except ValueError as e:
+            logger.warning(f"⚠️ {e}, sending WAV")
+            transcoder = None
+
+        client_callback = callback
+        if transcoder is not None and callback is not None:
+            async def callback(chunk: bytes) -> None:
+                encoded = transcoder.feed(chunk)
+                if encoded:
+                    await client_callback(encoded)
+
+        try:
+            if cached_audio is not None:
+                # Replay cached audio with the same chunking as a live stream
+                audio_bytes = await self._deliver_cached_audio(
+                    session_id=session_id,
+                    text=text,
+                    voice_id=voice_id,
+                    audio=cached_audio,
+                    callback=callback,
+                    cancel_event=active_tts.cancel_event,
+                    active_key=active_key
+                )
+            else:
+                # Stream TTS audio
+                audio_bytes = await self._stream_tts(
+                    session_id=session_id,
+                    text=text,
+                    voice_id=voice_id,
+                    exaggeration=exaggeration,
+                    cfg_weight=cfg_weight,
+                    temperature=temperature,
+                    language_id=language_id,
+                    callback=callback,
+                    cancel_event=active_tts.cancel_event,
+                    cache_key=cache_key,
+                    active_key=active_key,
+                    pcm_sample_rate=transcoder.target.sample_rate if output_format == 'pcm' else None,
+                    priority=priority
+                )
+
+            if transcoder is not None:
+                if client_callback is not None:
+                    tail = transcoder.finish()
+                    if tail:
+                        await client_callback(tail)
+                elif audio_bytes:
+                    audio_bytes = transcoder.feed(audio_bytes) + transcoder.finish()
+                logger.debug(f"🗜️ TTS transcoded ({output_format}): {transcoder.get_stats()}")
 
             # Mark as completed
             active_tts.status = TTSStatus.COMPLETED
@@ -333,9 +479,9 @@ class TTSService:
             return b''
 
         finally:
-            # Cleanup
-            if session_id in self._active_sessions:
-                del self._active_sessions[session_id]
+            # Cleanup (only our own entry; a newer synthesis may have replaced it)
+            if self._active_sessions.get(active_key) is active_tts:
+                del self._active_sessions[active_key]
 
     async def get_available_voices(self) -> List[Dict[str, str]]:
         """
@@ -364,16 +510,19 @@ class TTSService:
             logger.error(f"❌ Failed to fetch voices: {e}", exc_info=True)
             return []
 
-    async def test_tts_health(self) -> bool:
+    async def test_tts_health(self, backend_url: Optional[str] = None) -> bool:
         """
         Check if Chatterbox TTS service is available.
 
+        Args:
+            backend_url: Backend to check (defaults to the primary backend)
+
         Returns:
             True if healthy, False otherwise
         """
         try:
-            # Strip /v1 if present (health endpoint is at root)
-            base_url = self.chatterbox_url.rstrip('/v1')
+            # Health endpoint is at root (backend URLs never carry /v1)
+            base_url = backend_url or self.chatterbox_url
             client = await self._ensure_client()
             response = await client.get(f"{base_url}/health", timeout=5.0)
             return response.status_code == 200
@@ -382,6 +531,45 @@ class TTSService:
             logger.debug(f"⚠️ Chatterbox health check failed: {e}")
             return False
 
+    def is_available(self) -> bool:
+        """
+        Check cached Chatterbox availability (circuit breaker state).
+
+        Unlike test_tts_health(), this performs no I/O and is safe to call on
+        the critical path of every response.
+
+        Returns:
+            False while the circuit is open, True otherwise
+        """
+        return self.circuit_breaker.is_available()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get audio cache statistics (hit ratio, bytes saved, tier usage).
+
+        Returns:
+            Cache stats dict, or {'enabled': False} if caching is disabled
+        """
+        if self.audio_cache is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.audio_cache.get_stats()}
+
+    def get_health_status(self) -> Dict[str, Any]:
+        """
+        Get circuit breaker, health prober, backend pool and scheduler status.
+
+        Returns:
+            Dictionary with circuit breaker stats, prober state, per-backend
+            load/latency/hedge stats and admission queue stats
+        """
+        return {
+            **self.circuit_breaker.get_stats(),
+            'health_monitor_running': self.backend_pool.health_monitor_running,
+            'health_check_interval_s': self.backend_pool.health_check_interval_s,
+            'pool': self.backend_pool.get_stats(),
+            'scheduler': self.scheduler.get_stats(),
+        }
+
     async def get_metrics(self, session_id: Optional[str] = None) -> List[TTSMetrics]:
         """
         Get TTS metrics (all or filtered by session).
@@ -399,36 +587,61 @@ class TTSService:
 
     async def cancel_tts(self, session_id: str) -> None:
         """
-        Cancel active TTS synthesis for a session.
+        Cancel all active TTS synthesis for a session (including per-utterance syntheses).
 
         Args:
             session_id: UUID of the session
         """
-        if session_id in self._active_sessions:
-            active = self._active_sessions[session_id]
-            logger.info(f"⚠️ Cancelling TTS: session={session_id}")
-
-            # Signal cancellation
-            active.cancel_event.set()
-
-            # Cancel stream task if exists
-            if active.stream_task and not active.stream_task.done():
-                active.stream_task.cancel()
-                try:
-                    await active.stream_task
-                except asyncio.CancelledError:
-                    pass
+        keys = [
+            key for key, active in self._active_sessions.items()
+            if key == session_id or active.session_id == session_id
+        ]
+        for key in keys:
+            active = self._active_sessions.get(key)
+            if active is not None:
+                logger.info(f"⚠️ Cancelling TTS: session={session_id}, utterance={active.utterance_id}")
+                await self._cancel_active(active)
+
+    async def cancel_utterance(self, utterance_id: str) -> None:
+        """
+        Cancel a single per-utterance synthesis (siblings keep running).
 
-            # Update status
-            active.status = TTSStatus.CANCELLED
+        Args:
+            utterance_id: ID passed to synthesize_speech(utterance_id=...)
+        """
+        active = self._active_sessions.get(utterance_id)
+        if active is not None and active.utterance_id == utterance_id:
+            logger.info(f"⚠️ Cancelling TTS utterance: {utterance_id[:8]}... (session={active.session_id})")
+            await self._cancel_active(active)
+
+    async def _cancel_active(self, active: ActiveTTS) -> None:
+        """Internal: Signal cancellation for one active synthesis"""
+        # Signal cancellation (in-flight Chatterbox requests are torn down by
+        # _request_audio's watcher, without waiting for the next audio chunk)
+        active.cancel_event.set()
+
+        # Cancel stream task if exists
+        if active.stream_task and not active.stream_task.done():
+            active.stream_task.cancel()
+            try:
+                await active.stream_task
+            except asyncio.CancelledError:
+                pass
+
+        # Update status
+        active.status = TTSStatus.CANCELLED
 
     async def close(self) -> None:
         """
         Close HTTP client and cleanup resources.
         """
         # Cancel all active TTS
-        for session_id in list(self._active_sessions.keys()):
-            await self.cancel_tts(session_id)
+        for active in list(self._active_sessions.values()):
+            await self._cancel_active(active)
+
+        # Let pending server-side cancels go out before the client closes
+        if self._cancel_tasks:
+            await asyncio.gather(*self._cancel_tasks, return_exceptions=True)
 
         # Close HTTP client
         if self._client is not None:
@@ -447,9 +660,13 @@ class TTSService:
             Configured httpx.AsyncClient instance
         """
         if self._client is None:
+            backends = len(self.backend_pool)
             self._client = httpx.AsyncClient(
                 timeout=self.timeout,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
+                limits=httpx.Limits(
+                    max_keepalive_connections=max(5, TTS_MAX_CONNECTIONS_PER_BACKEND // 2) * backends,
+                    max_connections=TTS_MAX_CONNECTIONS_PER_BACKEND * backends
+                )
             )
         return self._client
 
@@ -463,7 +680,11 @@ class TTSService:
         temperature: Optional[float],
         language_id: str,
         callback: Optional[Callable],
-        cancel_event: asyncio.Event
+        cancel_event: asyncio.Event,
+        cache_key: Optional[str] = None,
+        active_key: Optional[str] = None,
+        pcm_sample_rate: Optional[int] = None,
+        priority: TTSPriority = TTSPriority.URGENT
     ) -> bytes:
         """
         Internal: Stream TTS audio from Chatterbox API.
@@ -481,6 +702,12 @@ class TTSService:
             language_id: Language code (e.g. 'en')
             callback: Optional callback for streaming chunks
             cancel_event: Event to signal cancellation
+            cache_key: Audio cache key (complete audio is stored on success)
+            active_key: Key of the ActiveTTS entry (defaults to session_id)
+            pcm_sample_rate: Ask Chatterbox for raw PCM at this rate (None = WAV).
+                Raw PCM is given a WAV header on arrival, so callers and the
+                cache always see WAV.
+            priority: Admission class for the global TTS scheduler
 
         Returns:
             Complete audio bytes (empty if callback provided or on error)
@@ -501,6 +728,11 @@ class TTSService:
                 'streaming_quality': TTS_STREAMING_QUALITY
             }
 
+            # Negotiate raw PCM at the consumer's rate (skips WAV → PCM conversion)
+            if pcm_sample_rate is not None:
+                tts_data['response_format'] = 'pcm'
+                tts_data['sample_rate'] = pcm_sample_rate
+
             # Add Chatterbox-specific TTS parameters if provided
             if exaggeration is not None:
                 tts_data['exaggeration'] = exaggeration
@@ -509,51 +741,38 @@ class TTSService:
             if temperature is not None:
                 tts_data['temperature'] = temperature
 
-            client = await self._ensure_client()
+            # Wait for a slot in the global budget (fair across sessions)
+            queue_wait = await self.scheduler.acquire(
+                session_id, cost=len(text), priority=priority, cancel_event=cancel_event
+            )
+            if queue_wait > 0.1:
+                logger.info(f"🚦 TTS queued {queue_wait:.3f}s for admission: session={session_id}, priority={TTSPriority(priority).name}")
 
-            # Stream audio from Chatterbox
-            async with client.stream(
-                'POST',
-                f"{self.chatterbox_url}/audio/speech/stream/upload",
-                data=tts_data,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'}
-            ) as response:
-                response.raise_for_status()
-
-                first_byte = True
-                total_bytes = 0
-                time_to_first_byte = 0.0
-
-                # Update status to streaming
-                if session_id in self._active_sessions:
-                    self._active_sessions[session_id].status = TTSStatus.STREAMING
-
-                async for chunk in response.aiter_bytes(chunk_size=self.chunk_size):
-                    # Check for cancellation
-                    if cancel_event.is_set():
-                        logger.info(f"⚠️ TTS stream cancelled: session={session_id}")
-                        raise asyncio.CancelledError()
-
-                    # Log first byte latency (critical UX metric)
-                    if first_byte:
-                        t_first_byte = time.time()
-                        time_to_first_byte = t_first_byte - t_start
-                        logger.info(f"⏱️ ⭐ LATENCY [TTS first byte]: session={session_id}, latency={time_to_first_byte:.3f}s")
-                        first_byte = False
-
-                    # Stream chunk via callback or buffer
-                    if callback is not None:
-                        await callback(chunk)
-                    else:
-                        audio_buffer.extend(chunk)
-
-                    total_bytes += len(chunk)
+            # Stream audio from the backend pool (hedged if the first byte is late)
+            try:
+                total_bytes, time_to_first_byte = await self._request_audio(
+                    session_id=session_id,
+                    tts_data=tts_data,
+                    callback=callback,
+                    audio_buffer=audio_buffer if (callback is None or cache_key is not None) else None,
+                    cancel_event=cancel_event,
+                    active_key=active_key,
+                    t_start=t_start
+                )
+            finally:
+                self.scheduler.release()
 
             # Log completion
             t_complete = time.time()
             total_duration = t_complete - t_start
             logger.info(f"✅ TTS streaming complete: session={session_id}, bytes={total_bytes:,}, duration={total_duration:.2f}s")
 
+            self.circuit_breaker.record_success()
+
+            # Store complete audio for repeated phrases
+            if cache_key is not None and self.audio_cache is not None and audio_buffer:
+                await self.audio_cache.put(cache_key, bytes(audio_buffer))
+
             # Record metrics
             self._record_metrics(
                 session_id=session_id,
@@ -568,9 +787,15 @@ class TTSService:
 
         except httpx.HTTPStatusError as e:
             error_msg = f"HTTP {e.response.status_code}"
-            tech_details = f"Chatterbox HTTP error: status={e.response.status_code}, url={self.chatterbox_url}"
+            tech_details = f"Chatterbox HTTP error: status={e.response.status_code}, url={e.request.url}"
             logger.error(f"❌ {tech_details}", exc_info=True)
 
+            # Only server-side errors count against backend health
+            if e.response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+
             self._record_metrics(
                 session_id=session_id,
                 text_length=len(text),
@@ -608,6 +833,7 @@ class TTSService:
         except httpx.TimeoutException:
             tech_details = f"Chatterbox TTS timeout: session={session_id}, timeout={self.timeout}s"
             logger.error(f"❌ {tech_details}", exc_info=True)
+            self.circuit_breaker.record_failure()
 
             self._record_metrics(
                 session_id=session_id,
@@ -634,13 +860,25 @@ class TTSService:
             return b''
 
         except asyncio.CancelledError:
-            # Re-raise cancellation
+            # Cancellation says nothing about backend health
+            self.circuit_breaker.release()
             raise
 
+        except TTSSinkError as e:
+            # The caller's sink failed (e.g. client hung up), not Chatterbox
+            self.circuit_breaker.release()
+            raise e.error from None
+
         except Exception as e:
             tech_details = f"TTS stream error: session={session_id}, error={e}"
             logger.error(f"❌ {tech_details}", exc_info=True)
 
+            # Only transport errors from the backend count against its health
+            if isinstance(e, httpx.TransportError):
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.release()
+
             self._record_metrics(
                 session_id=session_id,
                 text_length=len(text),
@@ -664,6 +902,365 @@ class TTSService:
 
             return b''
 
+    async def _request_audio(
+        self,
+        session_id: str,
+        tts_data: Dict[str, Any],
+        callback: Optional[Callable],
+        audio_buffer: Optional[bytearray],
+        cancel_event: asyncio.Event,
+        active_key: Optional[str],
+        t_start: float
+    ) -> Tuple[int, float]:
+        """
+        Internal: Run one synthesis request against the backend pool.
+
+        The request goes to the least loaded backend. If hedging is enabled and
+        no audio byte has arrived within the pool's hedge delay (p90 of recent
+        first-byte latency), a duplicate request is sent to another backend.
+        Whichever backend produces the first byte wins; the other request is
+        cancelled and its connection closed.
+
+        Setting cancel_event (barge-in) tears every in-flight request down
+        immediately rather than at the next audio chunk. Each request carries
+        an X-Request-ID, so cancelled requests are also reported to the
+        backend's cancel endpoint (when it has one) in case generation
+        continues after the disconnect.
+
+        Raw PCM requests (response_format='pcm') fall back to WAV on backends
+        known not to support them; raw responses get a WAV header prepended.
+
+        Args:
+            session_id: Session UUID
+            tts_data: Chatterbox form parameters
+            callback: Optional callback for streaming chunks (winner only)
+            audio_buffer: Buffer collecting the winner's audio (None to skip)
+            cancel_event: Event to signal cancellation
+            active_key: Key of the ActiveTTS entry (defaults to session_id)
+            t_start: Synthesis start time (for time to first byte)
+
+        Returns:
+            (total_bytes, time_to_first_byte_s) of the winning request
+
+        Raises:
+            asyncio.CancelledError: If cancel_event was set
+            Exception: The primary request's error if every request failed
+        """
+        pool = self.backend_pool
+        client = await self._ensure_client()
+
+        first_byte = asyncio.Event()
+        race: Dict[str, Optional[TTSBackend]] = {'winner': None}
+        attempts: Dict[asyncio.Task, TTSBackend] = {}
+        request_ids: Dict[asyncio.Task, str] = {}
+        started_at: Dict[asyncio.Task, float] = {}  # Only requests that were actually sent
+
+        async def attempt(backend: TTSBackend) -> Tuple[int, float]:
+            t_attempt = time.time()
+            started_at[asyncio.current_task()] = t_attempt
+            total_bytes = 0
+            time_to_first_byte = 0.0
+            data = self._negotiate_response_format(backend, tts_data)
+            try:
+                async with client.stream(
+                    'POST',
+                    f"{backend.url}/audio/speech/stream/upload",
+                    data=data,
+                    headers={
+                        'Content-Type': 'application/x-www-form-urlencoded',
+                        'X-Request-ID': request_ids[asyncio.current_task()]
+                    }
+                ) as response:
+                    response.raise_for_status()
+
+                    async for chunk in response.aiter_bytes(chunk_size=self.chunk_size):
+                        # Check for cancellation
+                        if cancel_event.is_set():
+                            logger.info(f"⚠️ TTS stream cancelled: session={session_id}")
+                            raise asyncio.CancelledError()
+
+                        if total_bytes == 0 and data['response_format'] == 'pcm':
+                            chunk = self._wrap_raw_pcm(backend, response, chunk, data['sample_rate'])
+
+                        # First byte decides the race: cancel the other request(s)
+                        if race['winner'] is None:
+                            race['winner'] = backend
+                            first_byte.set()
+                            for task in attempts:
+                                if task is not asyncio.current_task():
+                                    task.cancel()
+
+                            time_to_first_byte = time.time() - t_start
+                            pool.record_first_byte(backend, time.time() - t_attempt)
+                            logger.info(f"⏱️ ⭐ LATENCY [TTS first byte]: session={session_id}, latency={time_to_first_byte:.3f}s")
+
+                            # Update status to streaming
+                            active = self._active_sessions.get(active_key or session_id)
+                            if active is not None:
+                                active.status = TTSStatus.STREAMING
+
+                        # Stream chunk via callback and/or buffer (buffer also feeds the cache)
+                        if callback is not None:
+                            try:
+                                await callback(chunk)
+                            except Exception as e:
+                                raise TTSSinkError(e) from e
+                        if audio_buffer is not None:
+                            audio_buffer.extend(chunk)
+
+                        total_bytes += len(chunk)
+
+                pool.record_success(backend, time.time() - t_attempt, chars=len(tts_data['input']))
+                return total_bytes, time_to_first_byte
+
+            except httpx.HTTPStatusError as e:
+                if data['response_format'] == 'pcm' and e.response.status_code in _PCM_UNSUPPORTED_STATUS:
+                    # Backend rejects raw PCM: remember and retry as WAV
+                    pool.record_pcm_support(backend, False)
+                    return await attempt(backend)
+                # Only server-side errors count against backend health
+                pool.record_failure(backend, unhealthy=e.response.status_code >= 500)
+                raise
+            except httpx.TransportError:
+                # Connection errors and timeouts (TimeoutException is a TransportError)
+                pool.record_failure(backend)
+                raise
+            except Exception:
+                # Not a backend failure (e.g. the caller's sink raised): no health outcome
+                backend.circuit_breaker.release()
+                raise
+
+        def start(backend: TTSBackend) -> asyncio.Task:
+            task = asyncio.create_task(attempt(backend))
+            attempts[task] = backend
+            request_ids[task] = uuid.uuid4().hex
+            return task
+
+        def settle(results: List[Any]) -> None:
+            # Release every acquired backend (a task cancelled before it started never ran its own cleanup)
+            t_settle = time.time()
+            for (task, backend), result in zip(attempts.items(), results):
+                if isinstance(result, asyncio.CancelledError):
+                    t_attempt = started_at.get(task)
+                    pool.record_cancelled(
+                        backend,
+                        elapsed_s=(t_settle - t_attempt) if t_attempt is not None else None,
+                        chars=len(tts_data['input'])
+                    )
+                    if t_attempt is not None:
+                        self._send_server_cancel(backend, request_ids[task])
+                pool.release(backend)
+
+        async def propagate_cancel() -> None:
+            # Barge-in: close the streams now (Chatterbox may be mid-generation with no chunk due)
+            await cancel_event.wait()
+            for task in attempts:
+                task.cancel()
+
+        primary = pool.acquire()
+        primary_task = start(primary)
+        cancel_watcher = asyncio.create_task(propagate_cancel())
+
+        try:
+            hedge_delay = pool.hedge_delay_s()
+            if hedge_delay is not None:
+                first_byte_waiter = asyncio.create_task(first_byte.wait())
+                await asyncio.wait(
+                    {primary_task, first_byte_waiter},
+                    timeout=hedge_delay,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                first_byte_waiter.cancel()
+
+                if not first_byte.is_set() and not primary_task.done() and not cancel_event.is_set():
+                    hedge = pool.acquire(exclude=[primary])
+                    if hedge is not None:
+                        pool.hedges_fired += 1
+                        logger.info(
+                            f"🏁 TTS first byte late (>{hedge_delay * 1000:.0f}ms from {primary.url}), "
+                            f"hedging to {hedge.url}: session={session_id}"
+                        )
+                        start(hedge)
+
+            results = await asyncio.gather(*attempts, return_exceptions=True)
+
+        except asyncio.CancelledError:
+            for task in attempts:
+                task.cancel()
+            settle(await asyncio.gather(*attempts, return_exceptions=True))
+            raise
+
+        finally:
+            cancel_watcher.cancel()
+
+        settle(results)
+
+        if cancel_event.is_set():
+            raise asyncio.CancelledError()
+
+        outcomes = dict(zip(attempts.values(), results))
+        winner = race['winner']
+        if winner is not None:
+            if len(attempts) > 1:
+                pool.record_hedge(winner, hedge_won=winner is not primary)
+            outcome = outcomes[winner]
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return outcome
+
+        # No audio from anyone: prefer a clean (empty) completion, else the primary's error
+        for outcome in outcomes.values():
+            if not isinstance(outcome, BaseException):
+                return outcome
+        raise outcomes[primary]
+
+    @staticmethod
+    def _negotiate_response_format(backend: TTSBackend, tts_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Internal: Form data for backend (raw PCM requests become WAV where unsupported)"""
+        if tts_data['response_format'] != 'pcm' or backend.supports_pcm is not False:
+            return tts_data
+        data = dict(tts_data, response_format='wav')
+        data.pop('sample_rate', None)
+        return data
+
+    def _wrap_raw_pcm(
+        self,
+        backend: TTSBackend,
+        response: httpx.Response,
+        chunk: bytes,
+        requested_rate: int
+    ) -> bytes:
+        """
+        Internal: Give the first chunk of a raw PCM response a WAV header.
+
+        The layout comes from the response (X-Sample-Rate / X-Channels headers or
+        'rate=' / 'channels=' Content-Type parameters), defaulting to the
+        requested rate, mono. Backends that ignore response_format=pcm send WAV,
+        which is passed through and remembered.
+
+        Args:
+            backend: Backend the response came from
+            response: Streaming response (headers only)
+            chunk: First audio chunk
+            requested_rate: Sample rate that was asked for
+
+        Returns:
+            Chunk starting with a WAV header
+        """
+        if chunk[:4] == b'RIFF':
+            self.backend_pool.record_pcm_support(backend, False)
+            return chunk
+        self.backend_pool.record_pcm_support(backend, True)
+
+        params = {}
+        for part in response.headers.get('content-type', '').split(';')[1:]:
+            key, _, value = part.strip().partition('=')
+            params[key.lower()] = value
+        try:
+            sample_rate = int(response.headers.get('x-sample-rate') or params.get('rate') or requested_rate)
+            channels = int(response.headers.get('x-channels') or params.get('channels') or 1)
+        except ValueError:
+            sample_rate, channels = requested_rate, 1
+
+        return make_wav_header(sample_rate, channels) + chunk
+
+    def _send_server_cancel(self, backend: TTSBackend, request_id: str) -> None:
+        """
+        Internal: Ask backend to stop generating a cancelled request (fire-and-forget).
+
+        Closing the stream is usually enough, but a backend may keep generating
+        until its next write. Skipped when disabled or when the backend is known
+        to have no cancel endpoint.
+
+        Args:
+            backend: Backend the cancelled request went to
+            request_id: X-Request-ID of the cancelled request
+        """
+        if not self.server_cancel_enabled or backend.supports_cancel is False:
+            return
+
+        task = asyncio.create_task(self._post_server_cancel(backend, request_id))
+        self._cancel_tasks.add(task)
+        task.add_done_callback(self._cancel_tasks.discard)
+
+    async def _post_server_cancel(self, backend: TTSBackend, request_id: str) -> None:
+        """Internal: POST the cancel request and learn whether the backend supports it"""
+        supported: Optional[bool] = None
+        try:
+            client = await self._ensure_client()
+            response = await client.post(
+                f"{backend.url}{TTS_CANCEL_PATH}",
+                data={'request_id': request_id},
+                headers={'X-Request-ID': request_id},
+                timeout=2.0
+            )
+            if response.status_code in _CANCEL_UNSUPPORTED_STATUS:
+                supported = False
+                logger.info(f"🔊 Chatterbox at {backend.url} has no cancel endpoint, relying on stream close")
+            elif response.is_success:
+                supported = True
+                logger.debug(f"🛑 Chatterbox cancelled request {request_id[:8]}... on {backend.url}")
+        except Exception as e:
+            logger.debug(f"⚠️ Chatterbox cancel request failed ({backend.url}): {e}")
+
+        self.backend_pool.record_server_cancel(backend, supported)
+
+    async def _deliver_cached_audio(
+        self,
+        session_id: str,
+        text: str,
+        voice_id: str,
+        audio: bytes,
+        callback: Optional[Callable],
+        cancel_event: asyncio.Event,
+        active_key: Optional[str] = None
+    ) -> bytes:
+        """
+        Internal: Deliver cached audio using the same chunking as _stream_tts().
+
+        Args:
+            session_id: Session UUID
+            text: Text that was synthesized
+            voice_id: Voice ID
+            audio: Cached audio bytes
+            callback: Optional callback for streaming chunks
+            cancel_event: Event to signal cancellation
+            active_key: Key of the ActiveTTS entry (defaults to session_id)
+
+        Returns:
+            Complete audio bytes (empty if callback provided)
+        """
+        t_start = time.time()
+
+        active = self._active_sessions.get(active_key or session_id)
+        if active is not None:
+            active.status = TTSStatus.STREAMING
+
+        if callback is not None:
+            for offset in range(0, len(audio), self.chunk_size):
+                if cancel_event.is_set():
+                    logger.info(f"⚠️ TTS cache replay cancelled: session={session_id}")
+                    raise asyncio.CancelledError()
+                await callback(audio[offset:offset + self.chunk_size])
+
+        total_duration = time.time() - t_start
+        logger.info(
+            f"💾 TTS cache hit: session={session_id}, bytes={len(audio):,}, "
+            f"hit_ratio={self.audio_cache.get_stats()['hit_ratio']:.2f}"
+        )
+
+        self._record_metrics(
+            session_id=session_id,
+            text_length=len(text),
+            audio_bytes=len(audio),
+            time_to_first_byte_s=0.0,
+            total_duration_s=total_duration,
+            voice_id=voice_id,
+            success=True
+        )
+
+        return audio if callback is None else b''
+
     def _record_metrics(
         self,
         session_id: str,
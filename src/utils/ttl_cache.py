@@ -0,0 +1,211 @@
+"""
+Async TTL/LRU cache for hot-path database lookups.
+
+Rows like a user's timezone, an agent, the admin memory policy or a user's
+per-agent memory preference almost never change, but used to be re-read on
+every turn (and the authenticated user on every HTTP request). These lookups
+go through a named AsyncTTLCache instead; the routes that change the rows
+invalidate the affected keys, and the TTL bounds staleness for anything
+changed elsewhere (another process, a manual SQL edit).
+
+Key Features:
+- Per-entry TTL plus LRU bound on entry count
+- Single-flight loading: concurrent misses for one key share one load
+- None results are cached too ("no preference set" is an answer)
+- Explicit invalidation by key, by predicate, or whole cache
+- Hit/miss/eviction/invalidation counters per cache
+
+Example:
+    >>> timezones = get_ttl_cache("user_timezone", ttl_s=300)
+    >>> tz = await timezones.get_or_load(user_id, lambda: load_timezone(user_id))
+    >>> timezones.invalidate(user_id)  # after the user changes it
+"""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables
+LOOKUP_CACHE_ENABLED = os.getenv('LOOKUP_CACHE_ENABLED', 'true').lower() in ('true', '1', 'yes')
+LOOKUP_CACHE_TTL_S = float(os.getenv('LOOKUP_CACHE_TTL_S', '300'))
+LOOKUP_CACHE_MAX_ENTRIES = int(os.getenv('LOOKUP_CACHE_MAX_ENTRIES', '1024'))
+
+
+class AsyncTTLCache:
+    """
+    Async-safe TTL + LRU cache with single-flight loads.
+
+    Usage:
+        cache = AsyncTTLCache("agents", ttl_s=300, max_entries=256)
+        agent = await cache.get_or_load(agent_id, lambda: load_agent(agent_id))
+        cache.invalidate(agent_id)
+    """
+
+    def __init__(self, name: str, ttl_s: float = LOOKUP_CACHE_TTL_S, max_entries: int = LOOKUP_CACHE_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            name: Cache name (stats, logs)
+            ttl_s: Entry lifetime in seconds (0 disables caching)
+            max_entries: Entries kept before least-recently-used eviction
+        """
+        self.name = name
+        self.ttl_s = ttl_s
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._loading: Dict[Hashable, asyncio.Future] = {}
+        self._generation = 0  # Bumped by invalidation; loads started earlier aren't stored
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return LOOKUP_CACHE_ENABLED and self.ttl_s > 0
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get a cached value, loading it on a miss.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function producing the value (exceptions propagate
+                    and are not cached)
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        if not self.enabled:
+            return await loader()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+            del self._entries[key]
+
+        # Someone is already loading this key: share their result
+        pending = self._loading.get(key)
+        if pending is not None:
+            try:
+                value = await asyncio.shield(pending)
+                self._hits += 1
+                return value
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # We were cancelled, not the load
+                # Their load was cancelled (e.g. deadline): load it ourselves
+
+        self._misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        generation = self._generation
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved if nobody else was waiting
+            raise
+        finally:
+            if self._loading.get(key) is future:
+                del self._loading[key]
+
+        if generation == self._generation:
+            self.set(key, value)
+        future.set_result(value)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value (e.g. one just written by an update route)"""
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_s, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Drop entries for keys (and discard results of loads already running)"""
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+        self._generation += 1
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches predicate"""
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
+            self._invalidations += 1
+        self._generation += 1
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+        self._generation += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Entry count and hit/miss/eviction/invalidation counters"""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+            "ttl_s": self.ttl_s,
+            "max_entries": self.max_entries,
+        }
+
+
+_caches: Dict[str, AsyncTTLCache] = {}
+
+
+def get_ttl_cache(
+    name: str,
+    ttl_s: float = LOOKUP_CACHE_TTL_S,
+    max_entries: int = LOOKUP_CACHE_MAX_ENTRIES,
+) -> AsyncTTLCache:
+    """
+    Get (or create) a named process-wide cache.
+
+    Args:
+        name: Cache name; callers sharing a name share the cache
+        ttl_s: Entry lifetime, used when the cache is created
+        max_entries: LRU bound, used when the cache is created
+
+    Returns:
+        The named cache
+    """
+    cache = _caches.get(name)
+    if cache is None:
+        cache = _caches[name] = AsyncTTLCache(name, ttl_s=ttl_s, max_entries=max_entries)
+    return cache
+
+
+def get_ttl_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every named cache"""
+    return {name: cache.get_stats() for name, cache in sorted(_caches.items())}
+
+
+def clear_ttl_caches() -> None:
+    """Empty every named cache (tests, admin resets)"""
+    for cache in _caches.values():
+        cache.clear()
@@ -36,7 +36,11 @@ from src.config.logging_config import get_logger
 from src.services.conversation_service import ConversationService
 from src.services.stt_service import STTService
 from src.services.llm_service import LLMService, LLMConfig, ProviderType
+from src.services.response_cache import ResponseCachePolicy
+from src.services.llm_scheduler import LLMPriority
 from src.services.tts_service import TTSService
+from src.services.audio_transcode import AUDIO_OUTPUT_FORMATS, PCMFormat, create_transcoder
+from src.services.filler_clips import FillerClip, get_filler_clip_bank
 from src.types.error_events import ServiceErrorEvent
 from src.api.server import get_metrics_tracker, ws_manager
 
@@ -54,7 +58,7 @@ class WebRTCVoiceHandler:
     4. PCM Audio → STTService: Send to WhisperX (format='pcm' path)
     5. STTService → Browser: Partial/final transcripts
     6. LLMService → Browser: Stream AI response chunks
-    7. TTSService → Browser: Stream audio chunks
+    7. TTSService → Browser: Stream audio chunks (WAV, or WebM/Opus if negotiated)
 
     Note: Uses PCM path (not Opus) to avoid frame size mismatch with WhisperX
     """
@@ -64,7 +68,9 @@ class WebRTCVoiceHandler:
         websocket: WebSocket,
         user_id: str,
         session_id: UUID,
-        conversation_service: ConversationService
+        conversation_service: ConversationService,
+        tts_format: str = 'wav',
+        tts_sample_rate: Optional[int] = None
     ):
         """
         Initialize WebRTC voice handler
@@ -74,11 +80,18 @@ class WebRTCVoiceHandler:
             user_id: User identifier (browser session ID)
             session_id: Active session ID for this conversation
             conversation_service: INJECTED ConversationService singleton (shared across all handlers)
+            tts_format: TTS audio format negotiated by the client ('wav', 'opus' or 'pcm')
+            tts_sample_rate: Sample rate for tts_format='pcm' (e.g. the browser's
+                AudioContext rate; defaults to TTS_PCM_SAMPLE_RATE)
         """
         self.websocket = websocket
         self.user_id = user_id
         self.session_id = str(session_id)  # Convert UUID to string for service layer
         self.is_active = True
+        self.tts_format = tts_format if tts_format in AUDIO_OUTPUT_FORMATS else 'wav'
+        self.tts_pcm_format = (
+            PCMFormat(sample_rate=tts_sample_rate) if tts_sample_rate else PCMFormat()
+        ) if self.tts_format == 'pcm' else None
 
         # CRITICAL: Use injected singleton instead of creating new instance
         self.conversation_service = conversation_service
@@ -114,6 +127,7 @@ class WebRTCVoiceHandler:
 
         # LLM task tracking (Phase 3: Prevent orphaned tasks)
         self.llm_task: Optional[asyncio.Task] = None
+        self.filler_task: Optional[asyncio.Task] = None  # Latency-masking filler clip for current turn
 
         # WebM continuous stream decoding (maintains Opus codec state)
         self.frames_sent_to_whisperx: int = 0  # Track frames already sent (to skip on next decode)
@@ -304,6 +318,9 @@ class WebRTCVoiceHandler:
                         self.metrics.record_first_partial_transcript_latency(latency_s)
                         logger.info(f"⏱️ LATENCY [WebRTC - First Partial]: {latency_s * 1000:.2f}ms (utterance start → first partial)")
 
+                    # Start memory retrieval early; the final context build reuses it if the words still match
+                    self.conversation_service.prefetch_memory_context(self.session_id, text)
+
                     await self._send_partial_transcript(text)
                 else:
                     # ✅ FIX: Store WhisperX final transcript and set flag
@@ -1196,7 +1213,6 @@ class WebRTCVoiceHandler:
             # Get conversation context from ConversationService
             messages = await self.conversation_service.get_conversation_context(
                 session_id=self.session_id,
-                limit=10,
                 include_system_prompt=True
             )
 
@@ -1217,7 +1233,8 @@ class WebRTCVoiceHandler:
                 provider=ProviderType(agent.llm_provider),
                 model=agent.llm_model,
                 temperature=agent.temperature,
-                system_prompt=agent.system_prompt
+                system_prompt=agent.system_prompt,
+                response_cache=ResponseCachePolicy.for_agent(agent),
             )
 
             logger.info(f"📤 Sending to LLM ({agent.llm_provider}/{agent.llm_model}): \"{transcript}\"")
@@ -1231,6 +1248,12 @@ class WebRTCVoiceHandler:
             retry_count = 0
             full_response = ""
 
+            # Filler clip masks a slow first token (queued ahead of the response audio)
+            first_token = asyncio.Event()
+            self.filler_task = asyncio.create_task(
+                get_filler_clip_bank().play_if_slow(agent, first_token, self._send_filler_clip)
+            )
+
             while retry_count <= max_retries:
                 # Stream response via LLMService
                 full_response = ""
@@ -1257,6 +1280,7 @@ class WebRTCVoiceHandler:
                             logger.warn(f"⚠️ [LLM_QUALITY] First chunk is suspiciously short ({len(chunk)} chars) - possible truncation or streaming issue")
 
                         first_chunk_received = True
+                        first_token.set()
 
                     # Accumulate response
                     prev_length = len(full_response)
@@ -1273,7 +1297,8 @@ class WebRTCVoiceHandler:
                     messages=llm_messages,
                     config=llm_config,
                     stream=True,
-                    callback=on_chunk
+                    callback=on_chunk,
+                    priority=LLMPriority.VOICE,
                 )
 
                 # Check if response is empty
@@ -1314,6 +1339,10 @@ class WebRTCVoiceHandler:
                 # Success - break out of retry loop
                 break
 
+            # Let a filler that already started finish queueing before the response audio
+            first_token.set()
+            await self.filler_task
+
             # Generate correlation ID for this AI response (used for both event and database)
             import uuid
             ai_correlation_id = str(uuid.uuid4())
@@ -1373,6 +1402,8 @@ class WebRTCVoiceHandler:
             await self._generate_tts(full_response, agent)
 
         except Exception as e:
+            if self.filler_task and not self.filler_task.done():
+                self.filler_task.cancel()
             logger.error(f"❌ Error handling LLM response: {e}", exc_info=True)
             # ⏱️ METRIC 11: Error Count
             self.metrics.record_error()
@@ -1466,6 +1497,53 @@ class WebRTCVoiceHandler:
         except Exception as e:
             logger.debug(f"⏭️ Could not send AI response complete (connection likely closed): {e}")
 
+    async def _send_filler_clip(self, clip: FillerClip):
+        """
+        Send a pre-synthesized filler clip to the browser as its own utterance
+
+        Sent as a complete tts_start → audio → tts_complete sequence so the
+        browser plays it before the response audio that follows.
+
+        Args:
+            clip: Filler clip from the FillerClipBank
+        """
+        if not self.is_active:
+            return
+
+        try:
+            audio = clip.audio
+            audio_format = self._tts_mime_type()
+            transcoder = create_transcoder(self.tts_format, self.tts_pcm_format)
+            if transcoder:
+                audio = transcoder.feed(audio) + transcoder.finish()
+                audio_format = transcoder.mime_type
+
+            await self.websocket.send_json({
+                "event": "tts_start",
+                "data": {
+                    "session_id": self.session_id,
+                    "audio_format": audio_format,
+                    "filler": True
+                }
+            })
+            await self.websocket.send_bytes(audio)
+            await self.websocket.send_json({
+                "event": "tts_complete",
+                "data": {
+                    "session_id": self.session_id,
+                    "total_bytes": len(audio),
+                    "filler": True
+                }
+            })
+        except Exception as e:
+            logger.debug(f"⏭️ Could not send filler clip (connection likely closed): {e}")
+
+    def _tts_mime_type(self) -> str:
+        """MIME type of TTS audio sent to this client (raw PCM carries rate/channels)"""
+        if self.tts_pcm_format is not None:
+            return self.tts_pcm_format.mime_type
+        return AUDIO_OUTPUT_FORMATS[self.tts_format]
+
     async def _generate_tts(self, text: str, agent):
         """
         Generate and stream TTS audio to browser via TTSService
@@ -1494,8 +1572,8 @@ class WebRTCVoiceHandler:
 
             logger.info(f"🔊 Starting TTS synthesis for text: \"{text[:50]}...\"")
 
-            # Check TTS health first
-            if not await self.tts_service.test_tts_health():
+            # Check cached TTS health (circuit breaker state, no network round-trip)
+            if not self.tts_service.is_available():
                 logger.warning("⚠️ TTS service unavailable, skipping synthesis")
                 await self._send_error("TTS service unavailable")
                 return
@@ -1508,7 +1586,10 @@ class WebRTCVoiceHandler:
             if self.is_active:
                 await self.websocket.send_json({
                     "event": "tts_start",
-                    "data": {"session_id": self.session_id}
+                    "data": {
+                        "session_id": self.session_id,
+                        "audio_format": self._tts_mime_type()
+                    }
                 })
 
             # Send bot_speaking state change event (only if still connected)
@@ -1569,7 +1650,9 @@ class WebRTCVoiceHandler:
                 language_id=agent.tts_language,
                 stream=True,
                 callback=on_audio_chunk,
-                filter_actions=agent.filter_actions_for_tts
+                filter_actions=agent.filter_actions_for_tts,
+                output_format=self.tts_format,
+                pcm_format=self.tts_pcm_format
             )
 
             # Send completion event (only if still connected)
@@ -1684,6 +1767,9 @@ class WebRTCVoiceHandler:
             self.final_transcript = ""
             logger.debug(f"✅ Reset finalization flags after task cancellation")
 
+        if self.filler_task and not self.filler_task.done():
+            self.filler_task.cancel()
+
         # Cancel silence monitoring
         if self.silence_task and not self.silence_task.done():
             self.silence_task.cancel()
@@ -1695,9 +1781,10 @@ class WebRTCVoiceHandler:
         except Exception as e:
             logger.error(f"❌ Error disconnecting STTService: {e}")
 
-        # Cancel any active TTS
+        # Cancel any active TTS and release per-handler TTS resources (HTTP client, health prober)
         try:
             await self.tts_service.cancel_tts(self.session_id)
+            await self.tts_service.close()
             logger.info(f"✅ Cancelled active TTS")
         except Exception as e:
             logger.error(f"❌ Error cancelling TTS: {e}")
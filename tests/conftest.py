@@ -306,6 +306,54 @@ async def cleanup_tasks():
         await asyncio.gather(*tasks, return_exceptions=True)
 
 
+@pytest.fixture(autouse=True)
+def reset_tts_audio_cache():
+    """
+    Reset the shared TTS audio cache between tests so cached audio
+    from one test never satisfies another test's synthesis request
+    """
+    from src.services.tts_cache import reset_tts_audio_cache as _reset
+    _reset()
+    yield
+    _reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_tts_backend_pools():
+    """
+    Reset the shared TTS backend pools between tests so load counts,
+    latency samples and breaker state never carry over
+    """
+    from src.services.tts_backend_pool import reset_tts_backend_pools as _reset
+    _reset()
+    yield
+    _reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_lookup_caches():
+    """
+    Empty the TTL lookup caches (users, agents, timezones, memory scope)
+    between tests so rows mocked in one test never leak into another
+    """
+    from src.utils.ttl_cache import clear_ttl_caches
+    clear_ttl_caches()
+    yield
+    clear_ttl_caches()
+
+
+@pytest.fixture(autouse=True)
+def reset_message_writer():
+    """
+    Give each test a fresh write-behind message writer (its queue and
+    flusher task belong to the test's event loop)
+    """
+    from src.services.message_writer import reset_message_writer as _reset
+    _reset()
+    yield
+    _reset()
+
+
 # ============================================================
 # Service Fixtures (VoxBridge 2.0)
 # ============================================================
@@ -0,0 +1,169 @@
+"""
+LLM stream sample data for testing
+
+Provides representative streamed LLM responses (token text plus arrival
+offset) for replaying through the sentence/chunk parser, e.g. to benchmark
+time-to-first-chunk and TTS request count per chunking strategy, and the
+same responses as recorded wire bytes (OpenRouter SSE, Ollama NDJSON) for
+the stream decoder.
+"""
+import json
+import re
+from typing import Dict, Iterator, List, Tuple
+
+
+# ============================================================
+# Stream Samples
+# ============================================================
+
+# Each stream: response text, time to first token, and inter-token delay
+# (typical of a local 8B model; OpenRouter streams have a longer TTFT but
+# similar token cadence)
+LLM_STREAM_SAMPLES: List[Dict] = [
+    {
+        'name': 'short_answer',
+        'ttft_ms': 320,
+        'token_ms': 28,
+        'text': "Sure! The meeting is at three o'clock in the main conference room.",
+    },
+    {
+        'name': 'long_first_sentence',
+        'ttft_ms': 410,
+        'token_ms': 30,
+        'text': (
+            "Well, that really depends on how much traffic you hit on the way there, "
+            "but if you leave around eight you should arrive comfortably before the "
+            "doors open at nine. I'd bring an umbrella too, since the forecast shows "
+            "rain later in the afternoon. Let me know if you want me to set a reminder."
+        ),
+    },
+    {
+        'name': 'explanation',
+        'ttft_ms': 380,
+        'token_ms': 26,
+        'text': (
+            "Great question, and it's one a lot of people ask when they first start "
+            "working with containers. A Docker image is a read-only template that "
+            "describes a filesystem and a start command. A container is a running "
+            "instance of that image with its own writable layer. You can start many "
+            "containers from the same image. When a container is removed, its writable "
+            "layer is discarded, which is why persistent data belongs in volumes.\n\n"
+            "If you want, I can walk you through writing a Dockerfile for your project. "
+            "It usually takes just a few minutes."
+        ),
+    },
+    {
+        'name': 'list_response',
+        'ttft_ms': 450,
+        'token_ms': 32,
+        'text': (
+            "Here are three things you could try tonight. First, cook something new "
+            "from the recipe book you bought last month. Second, call your sister, "
+            "since you mentioned you haven't talked in a while. Third, take a short "
+            "walk after dinner. Any of those sound good?"
+        ),
+    },
+    {
+        'name': 'storytelling',
+        'ttft_ms': 500,
+        'token_ms': 27,
+        'text': (
+            "Once upon a time, in a small village tucked between two mountains, there "
+            "lived an old clockmaker named Elias who had never once been late. Every "
+            "morning he wound the great clock in the square. Every evening he oiled "
+            "its gears. The villagers said the clock kept time because Elias did. One "
+            "winter the clock stopped, and for the first time in forty years, Elias "
+            "overslept. Nobody in the village knew what time it was. Some people "
+            "laughed about it. Others were worried. But Elias simply smiled, wound "
+            "the clock again, and said that even clocks deserve a rest."
+        ),
+    },
+]
+
+
+# Token pattern: a word (or punctuation run) plus trailing whitespace
+_TOKEN_PATTERN = re.compile(r'\S+\s*')
+
+
+def replay_stream(sample: Dict) -> Iterator[Tuple[float, str]]:
+    """
+    Replay a sample as (arrival offset in ms, token text) pairs.
+
+    Args:
+        sample: Entry of LLM_STREAM_SAMPLES
+
+    Yields:
+        Tuples of (offset_ms, token)
+    """
+    offset_ms = float(sample['ttft_ms'])
+    for token in _TOKEN_PATTERN.findall(sample['text']):
+        yield offset_ms, token
+        offset_ms += sample['token_ms']
+
+
+def get_stream_sample(name: str) -> Dict:
+    """Get a stream sample by name"""
+    for sample in LLM_STREAM_SAMPLES:
+        if sample['name'] == name:
+            return sample
+    raise KeyError(name)
+
+
+def record_wire_stream(sample: Dict, wire_format: str = 'openrouter') -> bytes:
+    """
+    Render a sample as the response body a provider would send.
+
+    Args:
+        sample: Entry of LLM_STREAM_SAMPLES
+        wire_format: 'openrouter' (SSE with keep-alive comments and a usage
+                     chunk, as OpenRouter sends) or 'ollama' (native NDJSON)
+
+    Returns:
+        Raw response body bytes
+    """
+    tokens = _TOKEN_PATTERN.findall(sample['text'])
+    lines: List[str] = []
+
+    if wire_format == 'openrouter':
+        envelope = {
+            "id": "gen-1733840000-AbCdEfGhIjKlMnOp",
+            "provider": "OpenAI",
+            "model": "openai/gpt-4o-mini",
+            "object": "chat.completion.chunk",
+            "created": 1733840000,
+        }
+        lines.append(": OPENROUTER PROCESSING\n")
+        for token in tokens:
+            chunk = {**envelope, "choices": [{
+                "index": 0,
+                "delta": {"role": "assistant", "content": token},
+                "finish_reason": None,
+                "native_finish_reason": None,
+                "logprobs": None,
+            }]}
+            lines.append(f"data: {json.dumps(chunk, separators=(',', ':'))}\n\n")
+        final = {**envelope, "choices": [{
+            "index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": "stop",
+        }], "usage": {"prompt_tokens": 412, "completion_tokens": len(tokens), "total_tokens": 412 + len(tokens)}}
+        lines.append(f"data: {json.dumps(final, separators=(',', ':'))}\n\n")
+        lines.append("data: [DONE]\n\n")
+
+    elif wire_format == 'ollama':
+        for token in tokens:
+            chunk = {
+                "model": "llama3.1:8b",
+                "created_at": "2025-01-01T12:00:00.000000000Z",
+                "message": {"role": "assistant", "content": token},
+                "done": False,
+            }
+            lines.append(json.dumps(chunk, separators=(',', ':')) + "\n")
+        lines.append(json.dumps({
+            "model": "llama3.1:8b", "created_at": "2025-01-01T12:00:01.000000000Z",
+            "message": {"role": "assistant", "content": ""}, "done_reason": "stop", "done": True,
+            "total_duration": 1843230292, "eval_count": len(tokens),
+        }, separators=(',', ':')) + "\n")
+
+    else:
+        raise ValueError(f"Unknown wire format: {wire_format}")
+
+    return "".join(lines).encode()
@@ -396,7 +396,9 @@ def mock_tts_service(mocker):
 
     service.synthesize_speech = AsyncMock(side_effect=mock_synthesize)
     service.test_tts_health = AsyncMock(return_value=True)
+    service.is_available = mocker.Mock(return_value=True)
     service.cancel_tts = AsyncMock()
+    service.close = AsyncMock()
 
     return service
 
@@ -0,0 +1,101 @@
+"""
+Integration tests for the multi-backend Chatterbox pool
+
+Runs TTSService against several mock Chatterbox servers with injected
+first-byte delays to verify least-outstanding routing, per-backend latency
+tracking and hedged requests (winner kept, loser cancelled).
+"""
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.services.tts_service import TTSService
+from tests.mocks.mock_chatterbox_server import MockChatterboxServer
+
+
+@pytest.fixture
+async def chatterbox_servers():
+    """Two mock Chatterbox backends: fast (14131) and slow first byte (14132)"""
+    fast = MockChatterboxServer(port=14131, latency_ms=20)
+    slow = MockChatterboxServer(port=14132, latency_ms=20, first_byte_delay_ms=1500)
+    await fast.start()
+    await slow.start()
+    try:
+        yield fast, slow
+    finally:
+        await fast.stop()
+        await slow.stop()
+
+
+def make_service(fast, slow, hedge: bool) -> TTSService:
+    service = TTSService(
+        backend_urls=[f"http://127.0.0.1:{slow.port}", f"http://127.0.0.1:{fast.port}"],
+        audio_cache=None
+    )
+    service.audio_cache = None
+    service.backend_pool.health_check_interval_s = 0  # No background prober
+    pool = service.backend_pool
+    pool.hedge_enabled = hedge
+    pool.hedge_min_samples = 3
+    pool.hedge_min_delay_s = 0.05
+    return service
+
+
+@pytest.mark.integration
+@pytest.mark.latency
+@pytest.mark.asyncio
+async def test_concurrent_requests_spread_across_backends(chatterbox_servers):
+    """Test least-outstanding routing sends concurrent requests to both backends"""
+    fast, slow = chatterbox_servers
+    service = make_service(fast, slow, hedge=False)
+
+    try:
+        results = await asyncio.gather(*(
+            service.synthesize_speech(session_id=str(uuid4()), text=f"Sentence {i}.", stream=False)
+            for i in range(4)
+        ))
+
+        assert all(results)
+        assert len(fast.received_requests) == 2
+        assert len(slow.received_requests) == 2
+
+        backends = {b['url']: b for b in service.get_health_status()['pool']['backends']}
+        assert backends[f"http://127.0.0.1:{slow.port}"]['ewma_first_byte_s'] > 1.0
+        assert backends[f"http://127.0.0.1:{fast.port}"]['ewma_first_byte_s'] < 0.5
+        assert all(b['outstanding'] == 0 for b in backends.values())
+    finally:
+        await service.close()
+
+
+@pytest.mark.integration
+@pytest.mark.latency
+@pytest.mark.asyncio
+async def test_late_first_byte_is_hedged_to_other_backend(chatterbox_servers):
+    """Test a request stuck on the slow backend is hedged and the fast copy wins"""
+    fast, slow = chatterbox_servers
+    service = make_service(fast, slow, hedge=True)
+    pool = service.backend_pool
+
+    try:
+        # Warm the first-byte latency window with fast samples (p90 ≈ fast TTFB)
+        for _ in range(3):
+            pool.record_first_byte(pool.backends[1], 0.05)
+
+        t_start = asyncio.get_running_loop().time()
+        audio = await service.synthesize_speech(session_id=str(uuid4()), text="Hello there.", stream=False)
+        elapsed = asyncio.get_running_loop().time() - t_start
+
+        assert audio[:4] == b'RIFF'
+        assert elapsed < 1.0  # Did not wait for the slow backend's first byte
+        assert len(slow.received_requests) == 1  # Primary went to the slow backend
+        assert len(fast.received_requests) == 1  # Hedge went to the fast backend
+
+        stats = pool.get_stats()
+        assert stats['hedges_fired'] == 1
+        assert stats['hedges_won'] == 1
+        assert all(b['outstanding'] == 0 for b in stats['backends'])
+    finally:
+        await service.close()
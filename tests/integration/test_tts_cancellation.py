@@ -0,0 +1,123 @@
+"""
+Integration tests for barge-in cancellation propagation to Chatterbox
+
+Runs TTSService against mock Chatterbox servers to verify that cancelling a
+synthesis closes the HTTP stream immediately (even between chunks or before
+the first byte), that the cancel endpoint is called when the backend has one
+(and skipped once it is known not to), and that avoided synthesis time is
+reported.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from src.services.tts_service import TTSService
+from tests.mocks.mock_chatterbox_server import MockChatterboxServer
+
+LONG_TEXT = "This is a long answer that the user is going to interrupt halfway through. " * 2
+
+
+def make_service(server: MockChatterboxServer) -> TTSService:
+    service = TTSService(chatterbox_url=f"http://127.0.0.1:{server.port}", audio_cache=None)
+    service.audio_cache = None
+    service.backend_pool.health_check_interval_s = 0  # No background prober
+    return service
+
+
+async def start_and_interrupt(service: TTSService, session_id: str, after_first_chunk: bool = True) -> float:
+    """Start a streaming synthesis, cancel it, and return how long it took to stop"""
+    first_chunk = asyncio.Event()
+
+    async def on_chunk(chunk: bytes) -> None:
+        first_chunk.set()
+
+    task = asyncio.create_task(service.synthesize_speech(
+        session_id=session_id,
+        text=LONG_TEXT,
+        callback=on_chunk
+    ))
+
+    if after_first_chunk:
+        await asyncio.wait_for(first_chunk.wait(), timeout=5.0)
+    else:
+        await asyncio.sleep(0.2)
+
+    t_cancel = time.time()
+    await service.cancel_tts(session_id)
+    assert await asyncio.wait_for(task, timeout=5.0) == b''
+    return time.time() - t_cancel
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_cancel_aware_backend_stops_generating():
+    """Test barge-in closes the stream and cancels generation on the backend"""
+    server = MockChatterboxServer(port=14133, latency_ms=4000, cancel_aware=True)
+    await server.start()
+    service = make_service(server)
+    try:
+        # Teach the pool this backend's synthesis rate
+        await service.synthesize_speech(session_id=str(uuid4()), text="Warm up sentence.")
+
+        stop_s = await start_and_interrupt(service, str(uuid4()))
+        await asyncio.sleep(0.3)  # Server-side cancel is fire-and-forget
+
+        assert stop_s < 0.5
+        cancelled = [s for s in server.stream_stats.values() if s["outcome"] != "completed"]
+        assert len(cancelled) == 1
+        assert cancelled[0]["chunks"] < cancelled[0]["total_chunks"]
+        assert len(server.cancel_requests) == 1
+
+        pool = service.backend_pool
+        assert pool.primary.supports_cancel is True
+        stats = pool.get_stats()
+        assert stats["cancelled"] == 1
+        assert stats["server_cancels_sent"] == 1
+        assert stats["synthesis_s_avoided"] > 0
+    finally:
+        await service.close()
+        await server.stop()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_cancel_before_first_byte_closes_request():
+    """Test cancellation doesn't wait for a slow backend's first chunk"""
+    server = MockChatterboxServer(port=14134, latency_ms=100, first_byte_delay_ms=3000, cancel_aware=True)
+    await server.start()
+    service = make_service(server)
+    try:
+        stop_s = await start_and_interrupt(service, str(uuid4()), after_first_chunk=False)
+        await asyncio.sleep(0.3)
+
+        assert stop_s < 0.5
+        assert [s["outcome"] for s in server.stream_stats.values()] in (["cancelled"], ["disconnected"])
+        assert all(s["chunks"] == 0 for s in server.stream_stats.values())
+    finally:
+        await service.close()
+        await server.stop()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_backend_without_cancel_endpoint_is_not_retried():
+    """Test a 404 from the cancel endpoint disables server cancels for that backend"""
+    server = MockChatterboxServer(port=14135, latency_ms=4000)
+    await server.start()
+    service = make_service(server)
+    try:
+        for _ in range(2):
+            await start_and_interrupt(service, str(uuid4()))
+            await asyncio.sleep(0.3)
+
+        pool = service.backend_pool
+        assert pool.primary.supports_cancel is False
+        assert pool.get_stats()["server_cancels_sent"] == 1
+        assert pool.get_stats()["cancelled"] == 2
+    finally:
+        await service.close()
+        await server.stop()
@@ -2,12 +2,16 @@
 Mock Chatterbox TTS Server for Testing
 
 Simulates Chatterbox TTS streaming endpoint without actual TTS generation
+
+Cancel-aware mode (cancel_aware=True) adds a cancel endpoint keyed by the
+X-Request-ID header and stops generating as soon as a request is cancelled
+or its client disconnects; per-request outcomes are kept in stream_stats.
 """
 from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional, Callable
+from typing import Dict, Optional, Callable
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Form, Request
 from fastapi.responses import StreamingResponse, JSONResponse
@@ -24,7 +28,9 @@ class MockChatterboxServer:
         port: int = 14123,  # Different from real Chatterbox
         latency_ms: int = 100,
         error_mode: bool = False,
-        chunk_size: int = 8192
+        chunk_size: int = 8192,
+        first_byte_delay_ms: int = 0,
+        cancel_aware: bool = False
     ):
         """
         Initialize mock Chatterbox server
@@ -34,11 +40,20 @@ class MockChatterboxServer:
             latency_ms: Simulated TTS generation latency
             error_mode: Inject errors for testing
             chunk_size: Size of audio chunks to stream
+            first_byte_delay_ms: Extra delay before the first audio chunk (slow backend)
+            cancel_aware: Serve the cancel endpoint and stop generating on cancel/disconnect
         """
         self.port = port
         self.latency_ms = latency_ms
         self.error_mode = error_mode
         self.chunk_size = chunk_size
+        self.first_byte_delay_ms = first_byte_delay_ms
+        self.cancel_aware = cancel_aware
+
+        # Per-request generation state (keyed by X-Request-ID)
+        self._cancel_events: Dict[str, asyncio.Event] = {}
+        self.stream_stats: Dict[str, dict] = {}
+        self.cancel_requests: list[str] = []
 
         self.app = FastAPI(title="Mock Chatterbox TTS Server")
         self.server: Optional[uvicorn.Server] = None
@@ -54,7 +69,9 @@ class MockChatterboxServer:
         """Setup FastAPI routes"""
 
         @self.app.post("/v1/audio/speech/stream/upload")
+        @self.app.post("/audio/speech/stream/upload")
         async def tts_stream_upload(
+            request: Request,
             input: str = Form(...),
             voice: str = Form(default="default"),
             response_format: str = Form(default="wav"),
@@ -101,8 +118,9 @@ class MockChatterboxServer:
                     )
 
                 # Return streaming audio response
+                request_id = request.headers.get("x-request-id")
                 return StreamingResponse(
-                    self._generate_audio_stream(input),
+                    self._generate_audio_stream(input, request_id=request_id, request=request),
                     media_type="audio/wav"
                 )
 
@@ -147,6 +165,27 @@ class MockChatterboxServer:
                 media_type="audio/wav"
             )
 
+        @self.app.post("/audio/speech/cancel")
+        async def tts_cancel(request_id: str = Form(...)):
+            """Mock cancel endpoint (only in cancel-aware mode)"""
+            if not self.cancel_aware:
+                return JSONResponse(status_code=404, content={"detail": "Not Found"})
+
+            self.cancel_requests.append(request_id)
+            cancel_event = self._cancel_events.get(request_id)
+            if cancel_event is None:
+                return {"status": "unknown", "request_id": request_id}
+
+            cancel_event.set()
+            return {"status": "cancelled", "request_id": request_id}
+
+        @self.app.get("/health")
+        async def health():
+            """Mock health endpoint"""
+            if self.error_mode:
+                return JSONResponse(status_code=503, content={"status": "unhealthy"})
+            return {"status": "healthy"}
+
         @self.app.get("/v1/audio/speech/history")
         async def tts_history():
             """Get request history (for test verification)"""
@@ -158,12 +197,19 @@ class MockChatterboxServer:
             self.received_requests.clear()
             return {"status": "reset"}
 
-    async def _generate_audio_stream(self, text: str):
+    async def _generate_audio_stream(
+        self,
+        text: str,
+        request_id: Optional[str] = None,
+        request: Optional[Request] = None
+    ):
         """
         Generate streaming audio response
 
         Args:
             text: Input text (used to calculate audio length)
+            request_id: X-Request-ID of the request (cancel-aware mode)
+            request: Incoming request (cancel-aware mode polls for disconnect)
 
         Yields:
             Audio chunks
@@ -178,17 +224,62 @@ class MockChatterboxServer:
         # Stream in chunks
         total_chunks = (len(audio_data) + self.chunk_size - 1) // self.chunk_size
 
-        for i in range(total_chunks):
-            start = i * self.chunk_size
-            end = min(start + self.chunk_size, len(audio_data))
-            chunk = audio_data[start:end]
-
-            # Simulate streaming latency per chunk
-            await asyncio.sleep(self.latency_ms / 1000.0 / total_chunks)
-
-            yield chunk
-
-        logger.debug(f"🔊 Mock Chatterbox: Streamed {total_chunks} chunks ({len(audio_data)} bytes total)")
+        stats = {"total_chunks": total_chunks, "chunks": 0, "outcome": "streaming"}
+        cancel_event = asyncio.Event()
+        if request_id:
+            self.stream_stats[request_id] = stats
+            self._cancel_events[request_id] = cancel_event
+
+        async def generate(seconds: float) -> bool:
+            """Simulate generation work; False if cancelled/disconnected meanwhile"""
+            if not self.cancel_aware:
+                await asyncio.sleep(seconds)
+                return True
+            deadline = asyncio.get_running_loop().time() + seconds
+            while True:
+                if cancel_event.is_set():
+                    stats["outcome"] = "cancelled"
+                    return False
+                if request is not None and await request.is_disconnected():
+                    stats["outcome"] = "disconnected"
+                    return False
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    return True
+                try:
+                    await asyncio.wait_for(cancel_event.wait(), timeout=min(remaining, 0.02))
+                except asyncio.TimeoutError:
+                    pass
+
+        try:
+            # Simulate a slow backend (time to first byte)
+            if self.first_byte_delay_ms and not await generate(self.first_byte_delay_ms / 1000.0):
+                return
+
+            for i in range(total_chunks):
+                start = i * self.chunk_size
+                end = min(start + self.chunk_size, len(audio_data))
+                chunk = audio_data[start:end]
+
+                # Simulate streaming latency per chunk
+                if not await generate(self.latency_ms / 1000.0 / total_chunks):
+                    logger.debug(f"🛑 Mock Chatterbox: Stopped after {i}/{total_chunks} chunks ({stats['outcome']})")
+                    return
+
+                stats["chunks"] += 1
+                yield chunk
+
+            stats["outcome"] = "completed"
+            logger.debug(f"🔊 Mock Chatterbox: Streamed {total_chunks} chunks ({len(audio_data)} bytes total)")
+
+        except (asyncio.CancelledError, GeneratorExit):
+            # Client went away (server tore the response down)
+            stats["outcome"] = "disconnected"
+            raise
+
+        finally:
+            if request_id:
+                self._cancel_events.pop(request_id, None)
 
     def _generate_fake_wav(self, duration_ms: int) -> bytes:
         """
@@ -262,6 +353,8 @@ class MockChatterboxServer:
     def reset(self):
         """Reset server state (for testing)"""
         self.received_requests.clear()
+        self.stream_stats.clear()
+        self.cancel_requests.clear()
 
     def get_received_requests(self) -> list[dict]:
         """Get all received requests"""
@@ -283,7 +376,9 @@ async def create_mock_chatterbox_server(
     port: int = 14123,
     latency_ms: int = 100,
     error_mode: bool = False,
-    chunk_size: int = 8192
+    chunk_size: int = 8192,
+    first_byte_delay_ms: int = 0,
+    cancel_aware: bool = False
 ):
     """
     Create and manage mock Chatterbox server as async context manager
@@ -293,6 +388,8 @@ async def create_mock_chatterbox_server(
         latency_ms: Simulated TTS generation latency
         error_mode: Inject errors for testing
         chunk_size: Size of audio chunks
+        first_byte_delay_ms: Extra delay before the first audio chunk
+        cancel_aware: Serve the cancel endpoint and stop generating on cancel/disconnect
 
     Yields:
         Base URL of the running server
@@ -307,7 +404,9 @@ async def create_mock_chatterbox_server(
         port=port,
         latency_ms=latency_ms,
         error_mode=error_mode,
-        chunk_size=chunk_size
+        chunk_size=chunk_size,
+        first_byte_delay_ms=first_byte_delay_ms,
+        cancel_aware=cancel_aware
     )
 
     await server.start()
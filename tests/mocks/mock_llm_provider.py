@@ -0,0 +1,70 @@
+"""
+Fake LLM Provider for Testing
+
+In-process LLMProvider with scripted timing: delay before the first token,
+delay between tokens, and an optional error raised before the first token
+or after N tokens. Tracks whether each stream was started, finished or
+cancelled, so tests can race providers without any network.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, List, Optional, Sequence
+
+from src.llm import LLMProvider, LLMRequest
+
+
+class FakeLLMProvider(LLMProvider):
+    """Scripted streaming LLM provider"""
+
+    def __init__(
+        self,
+        tokens: Sequence[str] = ("Hello", " there", "!"),
+        first_token_delay_s: float = 0.0,
+        token_delay_s: float = 0.0,
+        error: Optional[Exception] = None,
+        error_after_tokens: int = 0,
+    ):
+        """
+        Args:
+            tokens: Chunks to stream
+            first_token_delay_s: Delay before the first chunk
+            token_delay_s: Delay between chunks
+            error: Raised after error_after_tokens chunks (None = succeed)
+            error_after_tokens: Chunks streamed before error is raised
+        """
+        super().__init__(base_url="fake://llm")
+        self.tokens = list(tokens)
+        self.first_token_delay_s = first_token_delay_s
+        self.token_delay_s = token_delay_s
+        self.error = error
+        self.error_after_tokens = error_after_tokens
+
+        self.requests: List[LLMRequest] = []
+        self.tokens_sent = 0
+        self.completed = 0
+        self.cancelled = 0
+
+    async def generate_stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        self.requests.append(request)
+        try:
+            await asyncio.sleep(self.first_token_delay_s)
+            for index, token in enumerate(self.tokens):
+                if self.error is not None and index == self.error_after_tokens:
+                    raise self.error
+                if index:
+                    await asyncio.sleep(self.token_delay_s)
+                self.tokens_sent += 1
+                yield token
+            if self.error is not None and self.error_after_tokens >= len(self.tokens):
+                raise self.error
+            self.completed += 1
+        except (asyncio.CancelledError, GeneratorExit):
+            self.cancelled += 1
+            raise
+
+    async def health_check(self) -> bool:
+        return self.error is None
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,251 @@
+"""
+Unit tests for streaming TTS audio transcoding
+
+Tests incremental WAV header parsing, WAV → WebM/Opus encoding as chunks
+arrive, passthrough fallback, polyphase resampling to raw PCM, and TTSService
+output format negotiation.
+"""
+import io
+import struct
+from unittest.mock import patch
+from uuid import uuid4
+
+import av
+import httpx
+import numpy as np
+import pytest
+
+from src.services.audio_transcode import (
+    PCMFormat,
+    PolyphaseResampler,
+    StreamingOpusEncoder,
+    StreamingPCMConverter,
+    create_transcoder,
+    make_wav_header,
+    parse_wav_header,
+)
+from src.services.tts_service import TTSService
+
+
+def make_wav(seconds: float = 1.0, sample_rate: int = 24000, data_size: int = None) -> bytes:
+    """Build a mono 16-bit WAV with a sine tone (data_size overrides the header field)"""
+    samples = (np.sin(np.arange(int(seconds * sample_rate)) / 10) * 8000).astype('<i2').tobytes()
+    fmt = struct.pack('<HHIIHH', 1, 1, sample_rate, sample_rate * 2, 2, 16)
+    header = (
+        b'RIFF' + struct.pack('<I', 0xFFFFFFFF) + b'WAVE'
+        + b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+        + b'LIST' + struct.pack('<I', 4) + b'INFO'
+        + b'data' + struct.pack('<I', data_size if data_size is not None else len(samples))
+    )
+    return header + samples
+
+
+def decoded_samples(data: bytes) -> int:
+    """Decode a WebM/Opus byte string and count output samples (48 kHz)"""
+    container = av.open(io.BytesIO(data))
+    return sum(frame.samples for frame in container.decode(audio=0))
+
+
+def test_parse_wav_header_incremental():
+    """Test header parsing waits for the data chunk and skips unknown chunks"""
+    wav = make_wav(0.1)
+
+    assert parse_wav_header(wav[:10]) is None
+    assert parse_wav_header(wav[:40]) is None
+
+    wav_format, offset = parse_wav_header(wav)
+    assert (wav_format.sample_rate, wav_format.channels, wav_format.bits_per_sample) == (24000, 1, 16)
+    assert wav[offset - 8:offset - 4] == b'data'
+
+
+def test_parse_wav_header_rejects_non_wav():
+    """Test non-WAV input is rejected"""
+    with pytest.raises(ValueError):
+        parse_wav_header(b'OggS' + b'\x00' * 20)
+
+
+def test_streaming_encode_emits_bytes_before_finish():
+    """Test Opus output is produced while chunks arrive and decodes to full duration"""
+    wav = make_wav(1.0, data_size=0xFFFFFFFF)  # Streaming placeholder size
+    encoder = StreamingOpusEncoder()
+
+    output = []
+    # Odd chunk size splits the header and PCM frames across chunks
+    for offset in range(0, len(wav), 1001):
+        output.append(encoder.feed(wav[offset:offset + 1001]))
+
+    streamed = b''.join(output)
+    tail = encoder.finish()
+    encoded = streamed + tail
+
+    assert len(streamed) > 0
+    assert encoded[:4] == b'\x1a\x45\xdf\xa3'  # EBML (WebM) magic
+    assert decoded_samples(encoded) == 48000  # 1s of audio at Opus' 48 kHz
+
+    stats = encoder.get_stats()
+    assert stats['compression_ratio'] > 5
+    assert not stats['passthrough']
+
+
+def test_non_wav_input_passes_through():
+    """Test audio that isn't PCM WAV is forwarded unchanged"""
+    encoder = StreamingOpusEncoder()
+
+    data = b'ID3' + b'\x00' * 50
+    assert encoder.feed(data) + encoder.finish() == data
+    assert encoder.passthrough
+    assert encoder.mime_type == 'audio/wav'
+
+
+def test_create_transcoder_formats():
+    """Test format negotiation helper"""
+    assert create_transcoder('wav') is None
+    assert isinstance(create_transcoder('opus'), StreamingOpusEncoder)
+    assert create_transcoder('pcm', PCMFormat(16000, 1)).target.sample_rate == 16000
+    with pytest.raises(ValueError):
+        create_transcoder('flac')
+
+
+@pytest.mark.asyncio
+async def test_tts_service_streams_opus_when_negotiated():
+    """Test synthesize_speech transcodes streamed chunks and caches WAV"""
+    from src.services.tts_cache import TTSAudioCache
+
+    wav = make_wav(0.5)
+    cache = TTSAudioCache()
+    service = TTSService(audio_cache=cache)
+    service.backend_pool.health_check_interval_s = 0  # No background prober
+
+    async def fake_stream(**kwargs):
+        for offset in range(0, len(wav), 4096):
+            await kwargs['callback'](wav[offset:offset + 4096])
+        await cache.put(kwargs['cache_key'], wav)
+        return b''
+
+    received = []
+
+    async def on_chunk(chunk):
+        received.append(chunk)
+
+    with patch.object(service, '_stream_tts', side_effect=fake_stream):
+        await service.synthesize_speech(
+            session_id=str(uuid4()), text="Hi!", callback=on_chunk, output_format="opus"
+        )
+
+    encoded = b''.join(received)
+    assert encoded[:4] == b'\x1a\x45\xdf\xa3'
+    assert len(encoded) < len(wav) / 5
+    assert decoded_samples(encoded) == 24000  # 0.5s at 48 kHz
+
+    # Cache keeps WAV so other clients can still negotiate WAV
+    wav_replay = await service.synthesize_speech(session_id=str(uuid4()), text="Hi!", stream=False)
+    assert wav_replay == wav
+
+
+@pytest.mark.parametrize("in_rate,out_rate", [(24000, 48000), (48000, 24000), (22050, 48000)])
+def test_polyphase_resampler_preserves_tone_and_duration(in_rate, out_rate):
+    """Test a 440 Hz tone survives chunked resampling with matching duration and phase"""
+    tone = np.sin(2 * np.pi * 440 * np.arange(in_rate) / in_rate) * 10000
+    resampler = PolyphaseResampler(in_rate, out_rate, channels=1)
+
+    blocks = [resampler.process(tone[i:i + 777, None].astype(np.float32)) for i in range(0, in_rate, 777)]
+    output = np.concatenate(blocks + [resampler.flush()])[:, 0]
+
+    assert len(output) == out_rate
+    expected = np.sin(2 * np.pi * 440 * np.arange(out_rate) / out_rate) * 10000
+    # Edges see the zero padding; the steady state matches to well under 1 LSB
+    assert np.abs(output[500:-500] - expected[500:-500]).max() < 1.0
+
+
+def test_pcm_converter_emits_aligned_frames():
+    """Test 24 kHz mono WAV becomes 48 kHz stereo PCM in whole 20ms frames"""
+    wav = make_wav(1.0, data_size=0xFFFFFFFF)
+    converter = StreamingPCMConverter(PCMFormat(48000, 2, align_frames=960))
+
+    chunks = [converter.feed(wav[i:i + 1001]) for i in range(0, len(wav), 1001)]
+    streamed = [chunk for chunk in chunks if chunk]
+    tail = converter.finish()
+
+    assert streamed and all(len(chunk) % 3840 == 0 for chunk in streamed)
+    samples = np.frombuffer(b''.join(streamed) + tail, dtype='<i2')
+    assert len(samples) == 96000
+    assert np.array_equal(samples[0::2], samples[1::2])
+    assert converter.get_stats()['resampled']
+
+
+def test_pcm_converter_passes_matching_rate_through():
+    """Test no resampling or copying happens when the source already matches"""
+    wav = make_wav(0.1)
+    converter = StreamingPCMConverter(PCMFormat(24000, 1))
+
+    pcm = converter.feed(wav) + converter.finish()
+    _, data_offset = parse_wav_header(wav)
+    assert pcm == wav[data_offset:]
+    assert not converter.get_stats()['resampled']
+    assert converter.mime_type == 'audio/pcm;rate=24000;channels=1'
+
+
+def make_tts_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_tts_service_negotiates_raw_pcm():
+    """Test raw PCM from Chatterbox is delivered unchanged and cached as WAV"""
+    from src.services.tts_cache import TTSAudioCache
+
+    raw = (np.arange(2400) % 100).astype('<i2').tobytes()
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(httpx.QueryParams(request.content.decode())))
+        return httpx.Response(200, content=raw, headers={'content-type': 'audio/pcm;rate=16000'})
+
+    cache = TTSAudioCache()
+    service = TTSService(audio_cache=cache)
+    service.backend_pool.health_check_interval_s = 0
+    service._client = make_tts_client(handler)
+
+    pcm = await service.synthesize_speech(
+        session_id=str(uuid4()), text="Hi there!", stream=False,
+        output_format="pcm", pcm_format=PCMFormat(16000, 1)
+    )
+
+    assert pcm == raw
+    assert requests[0]['response_format'] == 'pcm'
+    assert requests[0]['sample_rate'] == '16000'
+    assert service.backend_pool.primary.supports_pcm is True
+
+    # Cached copy is self-describing WAV (serves WAV and Opus clients too)
+    cached = await service.synthesize_speech(session_id=str(uuid4()), text="Hi there!", stream=False)
+    assert cached == make_wav_header(16000, 1) + raw
+
+
+@pytest.mark.asyncio
+async def test_tts_service_falls_back_to_wav_when_pcm_rejected():
+    """Test a backend rejecting response_format=pcm is retried as WAV and resampled"""
+    from src.services.tts_cache import TTSAudioCache
+
+    wav = make_wav(0.5)
+    formats = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response_format = dict(httpx.QueryParams(request.content.decode()))['response_format']
+        formats.append(response_format)
+        if response_format == 'pcm':
+            return httpx.Response(422, json={'detail': 'unsupported response_format'})
+        return httpx.Response(200, content=wav, headers={'content-type': 'audio/wav'})
+
+    service = TTSService(audio_cache=TTSAudioCache())
+    service.backend_pool.health_check_interval_s = 0
+    service._client = make_tts_client(handler)
+
+    pcm = await service.synthesize_speech(
+        session_id=str(uuid4()), text="Hello!", stream=False,
+        output_format="pcm", pcm_format=PCMFormat(48000, 2)
+    )
+
+    assert formats == ['pcm', 'wav']
+    assert len(pcm) == 48000 * 2 * 2 // 2  # 0.5s of 48 kHz stereo s16
+    assert service.backend_pool.primary.supports_pcm is False
+    assert service.circuit_breaker.state.value == 'closed'
@@ -0,0 +1,95 @@
+"""
+Unit tests for CircuitBreaker
+
+Tests closed / open / half-open transitions, trial request admission,
+and statistics reporting.
+"""
+from src.services.circuit_breaker import CircuitBreaker, CircuitState
+
+
+def test_starts_closed():
+    """Test breaker starts closed and allows requests"""
+    breaker = CircuitBreaker(name="test")
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request() is True
+    assert breaker.is_available() is True
+
+
+def test_opens_after_threshold():
+    """Test consecutive failures open the circuit"""
+    breaker = CircuitBreaker(name="test", failure_threshold=3, recovery_timeout_s=60.0)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.allow_request() is False
+    assert breaker.is_available() is False
+    assert breaker.total_rejected == 1
+
+
+def test_success_resets_failure_count():
+    """Test a success between failures prevents opening"""
+    breaker = CircuitBreaker(name="test", failure_threshold=2)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_admits_single_trial():
+    """Test half-open state admits exactly one trial request"""
+    breaker = CircuitBreaker(name="test", failure_threshold=1, recovery_timeout_s=0.0)
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False
+
+    breaker.release()
+    assert breaker.allow_request() is True
+
+
+def test_half_open_trial_success_closes():
+    """Test successful trial closes the circuit"""
+    breaker = CircuitBreaker(name="test", failure_threshold=1, recovery_timeout_s=0.0)
+    breaker.record_failure()
+
+    assert breaker.allow_request() is True
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_trial_failure_reopens():
+    """Test failed trial re-opens the circuit immediately"""
+    breaker = CircuitBreaker(name="test", failure_threshold=3, recovery_timeout_s=0.0)
+    for _ in range(3):
+        breaker.record_failure()
+
+    assert breaker.allow_request() is True
+    breaker.recovery_timeout_s = 60.0
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.times_opened == 2
+
+
+def test_get_stats():
+    """Test statistics reporting"""
+    breaker = CircuitBreaker(name="chatterbox", failure_threshold=2)
+    breaker.record_success()
+    breaker.record_failure()
+
+    stats = breaker.get_stats()
+
+    assert stats['name'] == "chatterbox"
+    assert stats['state'] == "closed"
+    assert stats['total_successes'] == 1
+    assert stats['total_failures'] == 1
+    assert stats['consecutive_failures'] == 1
@@ -0,0 +1,152 @@
+"""
+Unit tests for conversation cache backends
+
+Tests versioned compare-and-set entries on the shared backend, and a
+multi-process consistency run: several worker processes add messages to the
+same session through their own ConversationService, sharing one cache
+directory, and must neither lose turns nor load the history more than once.
+"""
+import asyncio
+import multiprocessing
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.services.conversation_cache import (
+    ConversationCacheBackend,
+    ConversationCacheConflictError,
+    InProcessConversationCache,
+    SessionSnapshot,
+    SharedFileConversationCache,
+)
+
+WORKERS = 4
+MESSAGES_PER_WORKER = 10
+
+
+@pytest.mark.asyncio
+async def test_shared_entries_are_versioned(tmp_path):
+    """Test store is a compare-and-set and load only returns newer versions"""
+    writer = SharedFileConversationCache(directory=str(tmp_path))
+    reader = SharedFileConversationCache(directory=str(tmp_path))
+    session_id = str(uuid4())
+
+    assert await reader.load(session_id) is None
+    async with writer.lock(session_id):
+        version = await writer.store(session_id, SessionSnapshot(messages=[{"content": "hi"}]), expected_version=0)
+    assert version == 1
+
+    snapshot = await reader.load(session_id)
+    assert snapshot.version == 1 and snapshot.messages == [{"content": "hi"}]
+    assert await reader.load(session_id, newer_than=1) is None
+    assert reader.get_stats()["unchanged_skips"] == 1
+
+    # A writer working from a stale version is refused
+    with pytest.raises(ConversationCacheConflictError):
+        await reader.store(session_id, SessionSnapshot(summary="stale"), expected_version=0)
+
+    await writer.delete(session_id)
+    assert await reader.load(session_id) is None
+
+
+def test_incomplete_backend_cannot_be_instantiated():
+    """Test a backend missing interface methods fails at construction, not at call time"""
+    class LoadOnlyBackend(ConversationCacheBackend):
+        async def load(self, session_id, newer_than=0):
+            return None
+
+    with pytest.raises(TypeError):
+        LoadOnlyBackend()
+
+
+@pytest.mark.asyncio
+async def test_in_process_backend_stores_nothing():
+    """Test the default backend only advances versions"""
+    backend = InProcessConversationCache()
+    session_id = str(uuid4())
+
+    async with backend.lock(session_id):
+        assert await backend.store(session_id, SessionSnapshot(), expected_version=3) == 4
+    assert await backend.load(session_id) is None
+
+
+def _run_worker(directory, session_id, worker, barrier, results):
+    """Worker process: add messages through its own ConversationService, then read the context"""
+    from src.services.conversation_service import CachedContext, ConversationService
+    from src.services.message_writer import MessageWriter
+
+    async def insert(rows):
+        return {row["idempotency_key"]: None for row in rows}
+
+    async def main():
+        loads = []
+
+        async def load_session(sid, load_messages=True):
+            loads.append(load_messages)
+            now = datetime.utcnow()
+            return CachedContext(
+                session=SimpleNamespace(id=sid, user_id="user-1", started_at=now),
+                agent=SimpleNamespace(id=uuid4(), system_prompt=None, llm_provider="local", llm_model="m"),
+                messages=[],
+                last_activity=now,
+                expires_at=now + timedelta(minutes=15),
+            )
+
+        service = ConversationService(
+            max_context_messages=100,
+            message_writer=MessageWriter(flush_interval_s=0.01, insert=insert),
+            cache_backend=SharedFileConversationCache(directory=directory),
+        )
+        service._load_session_from_db = load_session
+        service._get_user_timezone = AsyncMock(return_value="UTC")
+
+        for i in range(MESSAGES_PER_WORKER):
+            await service.add_message(session_id, "user", f"w{worker}-{i}")
+            await asyncio.sleep(0.001 * (worker + 1))
+
+        barrier.wait(timeout=30)
+        context = await service.get_conversation_context(session_id, include_system_prompt=False)
+        await service._message_writer.close()
+        results.put((worker, loads, [m.content for m in context if m.role == "user"]))
+
+    asyncio.run(main())
+
+
+def test_workers_share_one_consistent_session(tmp_path):
+    """Test concurrent workers lose no turns, keep per-worker order, load history once and all see every turn"""
+    ctx = multiprocessing.get_context("fork")
+    session_id = str(uuid4())
+    barrier = ctx.Barrier(WORKERS)
+    results = ctx.Queue()
+
+    processes = [
+        ctx.Process(target=_run_worker, args=(str(tmp_path), session_id, worker, barrier, results))
+        for worker in range(WORKERS)
+    ]
+    for process in processes:
+        process.start()
+    reports = [results.get(timeout=60) for _ in processes]
+    for process in processes:
+        process.join(timeout=30)
+        assert process.exitcode == 0
+
+    total = WORKERS * MESSAGES_PER_WORKER
+    snapshot = asyncio.run(SharedFileConversationCache(directory=str(tmp_path)).load(session_id))
+    contents = [m["content"] for m in snapshot.messages]
+
+    # Nothing lost or duplicated; one version per write (plus the initial load)
+    assert len(contents) == total and len(set(contents)) == total
+    assert snapshot.version == total + 1
+
+    # Each worker's turns stay in the order it added them
+    for worker in range(WORKERS):
+        own = [c for c in contents if c.startswith(f"w{worker}-")]
+        assert own == [f"w{worker}-{i}" for i in range(MESSAGES_PER_WORKER)]
+
+    # Only the first worker read history from the database; every worker sees every turn
+    assert sum(loads.count(True) for _, loads, _ in reports) == 1
+    for _, _, seen in reports:
+        assert seen == contents
@@ -7,7 +7,7 @@ concurrency control, and database integration.
 import pytest
 import asyncio
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch, call
 from uuid import UUID, uuid4
 
@@ -17,6 +17,7 @@ from src.services.conversation_service import (
     CachedContext,
     CONVERSATION_CACHE_TTL_MINUTES,
     MAX_CONTEXT_MESSAGES,
+    MESSAGE_DUPLICATE_WINDOW_S,
 )
 from src.database.models import Agent, Session, Conversation
 
@@ -349,13 +350,16 @@ async def test_get_conversation_context_with_messages():
     # Get context
     context = await service.get_conversation_context(session_id, limit=10, include_system_prompt=True)
 
-    # Should have system + 2 messages (chronological order)
-    assert len(context) == 3
+    # Should have system + date/time context + 2 messages (chronological order)
+    assert len(context) == 4
     assert context[0].role == "system"
-    assert context[1].role == "user"
-    assert context[1].content == "Hello"
-    assert context[2].role == "assistant"
-    assert context[2].content == "Hi there!"
+    assert context[0].content == "System prompt"
+    assert context[1].role == "system"
+    assert "[Current Date/Time Context]" in context[1].content
+    assert context[2].role == "user"
+    assert context[2].content == "Hello"
+    assert context[3].role == "assistant"
+    assert context[3].content == "Hi there!"
 
 
 @pytest.mark.asyncio
@@ -543,6 +547,33 @@ async def test_add_message_user():
         assert len(cached.messages) == 1
 
 
+def test_find_duplicate_replay_outside_window():
+    """Test a replayed idempotency key is a duplicate even when the original is older than the window"""
+    session_id = str(uuid4())
+    old = datetime.now(timezone.utc) - timedelta(seconds=MESSAGE_DUPLICATE_WINDOW_S + 60)
+
+    original = Message(
+        id=1, session_id=session_id, role="user", content="Hello",
+        timestamp=old, idempotency_key="replayed-key"
+    )
+    later = Message(
+        id=2, session_id=session_id, role="assistant", content="Hi there",
+        timestamp=old + timedelta(seconds=1), idempotency_key="other-key"
+    )
+    cached = CachedContext(
+        session=MagicMock(),
+        agent=MagicMock(),
+        messages=[original, later],
+        last_activity=datetime.utcnow(),
+        expires_at=datetime.utcnow() + timedelta(minutes=15)
+    )
+
+    assert ConversationService._find_duplicate(cached, "user", "Hello", "replayed-key") is original
+
+    # Same content with a new key only counts inside the window
+    assert ConversationService._find_duplicate(cached, "user", "Hello", "new-key") is None
+
+
 @pytest.mark.asyncio
 async def test_add_message_with_metadata():
     """Test adding message with metadata (latency metrics)"""
@@ -939,6 +970,89 @@ async def test_multiple_sessions_concurrent():
     assert all(isinstance(r, list) for r in results)
 
 
+def make_context_with_user_message(service, session_id):
+    cached = CachedContext(
+        session=Session(
+            id=UUID(session_id),
+            user_id="test_user",
+            agent_id=uuid4(),
+            session_type="webrtc",
+            active=True,
+            started_at=datetime.utcnow()
+        ),
+        agent=Agent(
+            id=uuid4(),
+            name="TestAgent",
+            system_prompt="System prompt",
+            temperature=0.7,
+            llm_provider="openrouter",
+            llm_model="gpt-4"
+        ),
+        messages=[Message(id=1, session_id=session_id, role="user", content="Hello", timestamp=datetime.utcnow())],
+        last_activity=datetime.utcnow(),
+        expires_at=datetime.utcnow() + timedelta(minutes=15)
+    )
+    service._cache[session_id] = cached
+    return cached
+
+
+@pytest.mark.asyncio
+async def test_context_lookups_run_concurrently_outside_lock():
+    """Test timezone and memory lookups overlap and don't hold the session lock"""
+    memory_service = MagicMock()
+    service = ConversationService(memory_service=memory_service)
+    session_id = str(uuid4())
+    cached = make_context_with_user_message(service, session_id)
+    lock_held = []
+
+    async def slow_timezone(user_id):
+        lock_held.append(cached.lock.locked())
+        await asyncio.sleep(0.1)
+        return "UTC"
+
+    async def slow_memories(**kwargs):
+        lock_held.append(cached.lock.locked())
+        await asyncio.sleep(0.1)
+        return "<user_memories>\n- Likes tea\n</user_memories>"
+
+    service._get_user_timezone = slow_timezone
+    memory_service.get_user_memory_context = slow_memories
+
+    start = time.perf_counter()
+    context = await service.get_conversation_context(session_id)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.18
+    assert lock_held == [False, False]
+    assert "Likes tea" in context[1].content
+    assert "UTC" in context[1].content
+
+
+@pytest.mark.asyncio
+async def test_memory_retrieval_over_budget_is_skipped():
+    """Test a memory search that misses its budget is dropped for the turn"""
+    memory_service = MagicMock()
+    service = ConversationService(memory_service=memory_service)
+    session_id = str(uuid4())
+    make_context_with_user_message(service, session_id)
+
+    async def stuck_memories(**kwargs):
+        await asyncio.sleep(5)
+        return "<user_memories>\n- Likes tea\n</user_memories>"
+
+    service._get_user_timezone = AsyncMock(return_value="UTC")
+    memory_service.get_user_memory_context = stuck_memories
+
+    with patch('src.services.conversation_service.CONTEXT_MEMORY_TIMEOUT_MS', 50):
+        start = time.perf_counter()
+        context = await service.get_conversation_context(session_id)
+
+    assert time.perf_counter() - start < 1.0
+    assert [m.role for m in context] == ["system", "system", "user"]
+    assert "[Current Date/Time Context]" in context[1].content
+    assert "Likes tea" not in context[1].content
+
+
 # ============================================================
 # Error Handling Tests
 # ============================================================
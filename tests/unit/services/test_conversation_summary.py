@@ -0,0 +1,185 @@
+"""
+Unit tests for rolling conversation summarization
+
+Tests fold selection, the summarization request, deferral under load,
+that prompts are built from summary plus recent turns, and that folding
+runs in the background without blocking context building.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.services.conversation_service import CachedContext, ConversationService, Message
+from src.services.conversation_summary import ConversationSummarizer, build_summary_messages, select_fold
+from src.services.llm_scheduler import LLMRequestRejectedError
+from src.services.prompt_builder import CONVERSATION_SUMMARY_HEADER
+
+
+def make_messages(session_id: str, turns: int, start_id: int = 1):
+    messages = []
+    for i in range(turns * 2):
+        role = "user" if i % 2 == 0 else "assistant"
+        messages.append(Message(
+            id=start_id + i,
+            session_id=session_id,
+            role=role,
+            content=f"{role} message {start_id + i}",
+            timestamp=datetime.utcnow(),
+        ))
+    return messages
+
+
+def make_cached(session_id: str, messages):
+    agent = SimpleNamespace(
+        id=uuid4(), system_prompt="You are helpful.", llm_provider="openrouter", llm_model="openai/gpt-4o"
+    )
+    session = SimpleNamespace(id=session_id, user_id="user-1", started_at=datetime.utcnow())
+    return CachedContext(
+        session=session,
+        agent=agent,
+        messages=messages,
+        last_activity=datetime.utcnow(),
+        expires_at=datetime.utcnow() + timedelta(minutes=15),
+    )
+
+
+def make_service(summarizer):
+    service = ConversationService(max_context_messages=20, summarizer=summarizer)
+    service._get_user_timezone = AsyncMock(return_value="UTC")
+    service._persist_summary = AsyncMock()
+    return service
+
+
+def test_select_fold():
+    """Test folds wait for a full batch, end before a user message and skip unsaved messages"""
+    messages = make_messages("s", turns=7)  # 14 messages
+    assert select_fold(messages, keep_recent=8, fold_batch=8) == []
+
+    messages = make_messages("s", turns=8)  # 16 messages
+    fold = select_fold(messages, keep_recent=8, fold_batch=8)
+    assert [m.id for m in fold] == list(range(1, 9))
+
+    # Odd cut moves back so the recent window starts on a user message
+    fold = select_fold(messages[:-1], keep_recent=6, fold_batch=8)
+    assert fold[-1].role == "assistant" and len(fold) == 8
+
+    # Not yet persisted: not folded
+    messages[3].id = None
+    assert select_fold(messages, keep_recent=8, fold_batch=8) == []
+
+
+@pytest.mark.asyncio
+async def test_summarize_builds_incremental_request_and_defers_when_busy():
+    """Test the request carries only the previous summary and new turns; rejections retry later"""
+    requests = []
+
+    async def generate(agent, messages):
+        requests.append(messages)
+        return "word " * 50
+
+    summarizer = ConversationSummarizer(generate=generate, max_words=10)
+    fold = make_messages("s", turns=2)
+    summary = await summarizer.summarize(None, "Alice likes tea.", fold)
+
+    assert len(summary.split()) == 20  # Hard cap at twice max_words
+    prompt = requests[0][1]["content"]
+    assert "Alice likes tea." in prompt
+    assert "User: user message 1" in prompt and "Assistant: assistant message 4" in prompt
+    assert requests[0] == build_summary_messages("Alice likes tea.", fold, 10)
+
+    summarizer.generate = AsyncMock(side_effect=LLMRequestRejectedError("queue full"))
+    assert await summarizer.summarize(None, None, fold) is None
+    stats = summarizer.get_stats()
+    assert stats["folds"] == 1 and stats["rejected"] == 1 and stats["messages_folded"] == 4
+
+
+@pytest.mark.asyncio
+async def test_context_uses_summary_plus_recent_turns():
+    """Test the summary follows the system prompt and folded turns are not sent again"""
+    session_id = str(uuid4())
+    service = make_service(ConversationSummarizer(generate=AsyncMock()))
+    cached = make_cached(session_id, make_messages(session_id, turns=6))
+    cached.summary = "The user is planning a trip to Lisbon."
+    cached.summary_through_id = 8
+    service._cache[session_id] = cached
+
+    context = await service.get_conversation_context(session_id)
+
+    assert context[0].content == "You are helpful."
+    assert context[1].role == "system" and context[1].content.startswith(CONVERSATION_SUMMARY_HEADER)
+    assert "Lisbon" in context[1].content
+    history_ids = [m.id for m in context if m.id]
+    assert history_ids == [9, 10, 11, 12]
+
+
+@pytest.mark.asyncio
+async def test_fold_runs_in_background_without_blocking_turns():
+    """Test context building proceeds during a slow fold, then the summary lands and is persisted"""
+    session_id = str(uuid4())
+    release = asyncio.Event()
+
+    async def slow_generate(agent, messages):
+        await release.wait()
+        return "The user introduced themselves as Sam."
+
+    summarizer = ConversationSummarizer(generate=slow_generate, keep_recent=4, fold_batch=4)
+    service = make_service(summarizer)
+    cached = make_cached(session_id, make_messages(session_id, turns=5))
+    service._cache[session_id] = cached
+
+    service._schedule_summary_update(session_id, cached)
+    task = cached.summary_task
+    await asyncio.sleep(0)
+
+    # Fold in flight: turns are not held up and see the old (empty) summary
+    context = await asyncio.wait_for(service.get_conversation_context(session_id), timeout=1.0)
+    assert not task.done()
+    assert len([m for m in context if m.id]) == 10
+
+    # A second schedule while one is running is a no-op
+    service._schedule_summary_update(session_id, cached)
+    assert cached.summary_task is task
+
+    release.set()
+    await task
+
+    assert cached.summary == "The user introduced themselves as Sam."
+    assert cached.summary_through_id == 6
+    service._persist_summary.assert_awaited_once_with(session_id, cached.summary, 6)
+    context = await service.get_conversation_context(session_id)
+    assert [m.id for m in context if m.id] == [7, 8, 9, 10]
+
+
+@pytest.mark.asyncio
+async def test_load_session_restores_summary_and_latest_messages():
+    """Test a reloaded session gets its summary and the newest unsummarized messages in order"""
+    session_id = str(uuid4())
+    service = ConversationService(summarizer=ConversationSummarizer(generate=AsyncMock()))
+    session = SimpleNamespace(
+        id=session_id, agent=MagicMock(), conversation_summary="Earlier: talked about jazz.", summary_through_id=40
+    )
+    newest_first = [
+        SimpleNamespace(id=i, session_id=session_id, role="user" if i % 2 else "assistant", content=str(i),
+                        timestamp=datetime.utcnow(), audio_duration_ms=None, tts_duration_ms=None,
+                        llm_latency_ms=None, total_latency_ms=None)
+        for i in (44, 43, 42, 41)
+    ]
+
+    with patch('src.services.conversation_service.get_db_session') as mock_db:
+        db = AsyncMock()
+        mock_db.return_value.__aenter__.return_value = db
+        session_result = MagicMock()
+        session_result.scalar_one_or_none.return_value = session
+        messages_result = MagicMock()
+        messages_result.scalars.return_value.all.return_value = newest_first
+        db.execute = AsyncMock(side_effect=[session_result, messages_result])
+
+        cached = await service._load_session_from_db(session_id)
+
+    assert cached.summary == "Earlier: talked about jazz."
+    assert cached.summary_through_id == 40
+    assert [m.id for m in cached.messages] == [41, 42, 43, 44]
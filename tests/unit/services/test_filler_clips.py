@@ -0,0 +1,140 @@
+"""
+Unit tests for the filler / backchannel clip bank
+
+Tests per-voice warm-up, re-synthesis on voice change, rotation, and the
+first-token budget policy with its fire-rate metrics.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.filler_clips import FillerClipBank
+
+
+def make_agent(voice: str = "alice", agent_id: str = "agent-1"):
+    return SimpleNamespace(
+        id=agent_id,
+        name="Test Agent",
+        tts_voice=voice,
+        tts_exaggeration=1.0,
+        tts_cfg_weight=0.7,
+        tts_temperature=0.3,
+        tts_language="en",
+    )
+
+
+@pytest.fixture
+def tts_service():
+    service = AsyncMock()
+    service.synthesize_speech = AsyncMock(
+        side_effect=lambda **kwargs: f"audio:{kwargs['voice_id']}:{kwargs['text']}".encode()
+    )
+    return service
+
+
+@pytest.fixture
+def bank(tts_service):
+    return FillerClipBank(tts_service, phrases=["Mm-hm.", "One sec."], enabled=True, budget_ms=50)
+
+
+@pytest.mark.asyncio
+async def test_warm_synthesizes_each_phrase_with_agent_voice(bank, tts_service):
+    """Test warm-up synthesizes every phrase without cancelling session TTS"""
+    agent = make_agent()
+
+    assert await bank.warm(agent) == 2
+    assert bank.is_warm(agent)
+
+    calls = tts_service.synthesize_speech.call_args_list
+    assert [c.kwargs['text'] for c in calls] == ["Mm-hm.", "One sec."]
+    assert all(c.kwargs['voice_id'] == "alice" and c.kwargs['utterance_id'] for c in calls)
+
+
+@pytest.mark.asyncio
+async def test_pick_rotates_and_voice_change_invalidates(bank):
+    """Test clips rotate and a voice change makes the bank stale"""
+    agent = make_agent()
+    await bank.warm(agent)
+
+    assert [bank.pick(agent).phrase for _ in range(3)] == ["Mm-hm.", "One sec.", "Mm-hm."]
+
+    agent.tts_voice = "bob"
+    assert bank.pick(agent) is None
+
+    bank.ensure_warm(agent)
+    await asyncio.sleep(0)  # Let the background warm-up run
+    assert bank.pick(agent).audio.startswith(b"audio:bob:")
+
+
+@pytest.mark.asyncio
+async def test_failed_phrase_is_skipped(bank, tts_service):
+    """Test a synthesis failure drops only that phrase"""
+    tts_service.synthesize_speech.side_effect = [Exception("boom"), b"clip"]
+
+    assert await bank.warm(make_agent()) == 1
+
+
+@pytest.mark.asyncio
+async def test_play_if_slow_fires_after_budget(bank):
+    """Test a filler plays when no token arrives within the budget"""
+    agent = make_agent()
+    await bank.warm(agent)
+    play = AsyncMock()
+
+    assert await bank.play_if_slow(agent, asyncio.Event(), play) is True
+    play.assert_awaited_once()
+    assert play.await_args.args[0].phrase == "Mm-hm."
+
+
+@pytest.mark.asyncio
+async def test_play_if_slow_skips_fast_first_token(bank):
+    """Test no filler plays when the first token beats the budget"""
+    agent = make_agent()
+    await bank.warm(agent)
+    play = AsyncMock()
+
+    first_token = asyncio.Event()
+    task = asyncio.create_task(bank.play_if_slow(agent, first_token, play))
+    first_token.set()
+
+    assert await task is False
+    play.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stats_track_fire_rate(bank, tts_service):
+    """Test fire-rate metrics count fired, skipped and not-ready turns"""
+    async def slow_synthesis(**kwargs):
+        await asyncio.sleep(0.1)
+        return b"clip"
+
+    tts_service.synthesize_speech.side_effect = slow_synthesis
+    agent = make_agent()
+    play = AsyncMock()
+
+    # Bank not warm yet: slow turn counts as not_ready (and kicks off warm-up)
+    assert await bank.play_if_slow(agent, asyncio.Event(), play) is False
+    await asyncio.sleep(0.3)
+
+    assert await bank.play_if_slow(agent, asyncio.Event(), play) is True
+
+    fast = asyncio.Event()
+    fast.set()
+    assert await bank.play_if_slow(agent, fast, play) is False
+
+    stats = bank.get_stats()
+    assert (stats['turns'], stats['fired'], stats['not_ready']) == (3, 1, 1)
+    assert stats['fire_rate'] == pytest.approx(1 / 3)
+
+
+@pytest.mark.asyncio
+async def test_disabled_bank_never_fires(tts_service):
+    """Test a disabled bank neither synthesizes nor plays"""
+    bank = FillerClipBank(tts_service, phrases=["Mm-hm."], enabled=False, budget_ms=0)
+    play = AsyncMock()
+
+    assert await bank.play_if_slow(make_agent(), asyncio.Event(), play) is False
+    tts_service.synthesize_speech.assert_not_called()
+    assert bank.get_stats()['turns'] == 0
@@ -0,0 +1,159 @@
+"""
+Unit tests for hedged LLM requests
+
+Races fake in-process providers with scripted first-token delays through
+LLMService to verify hedge timing, winner selection, loser cancellation,
+failover on early errors and the per-provider race statistics.
+"""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.llm import LLMAuthenticationError, LLMConnectionError
+from src.services.llm_hedging import LLMHedgeTracker
+from src.services.llm_service import LLMConfig, LLMHedgeFailedError, LLMService, ProviderType
+from src.types.error_events import ServiceErrorType
+from tests.mocks.mock_llm_provider import FakeLLMProvider
+
+MESSAGES = [{"role": "user", "content": "Tell me a joke"}]
+CONFIG = LLMConfig(provider=ProviderType.OPENROUTER, model="openai/gpt-4o-mini", temperature=0.7)
+
+
+def make_service(primary: FakeLLMProvider, fallback: FakeLLMProvider, **kwargs) -> LLMService:
+    providers = {"openrouter": primary, "local": fallback}
+    with patch(
+        'src.services.llm_service.LLMProviderFactory.create_provider',
+        side_effect=lambda provider_name, **_: providers[provider_name],
+    ):
+        service = LLMService(openrouter_api_key="test_key", hedge_enabled=True, **kwargs)
+    service.hedge_tracker = LLMHedgeTracker(default_delay_ms=50, min_delay_ms=10)
+    return service
+
+
+async def generate(service: LLMService):
+    chunks = []
+    response = await service.generate_response(
+        session_id="session-1234",
+        messages=MESSAGES,
+        config=CONFIG,
+        stream=True,
+        callback=chunks.append,
+    )
+    return response, chunks
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_wins_without_hedge():
+    """Test a primary that answers within the hedge delay never starts the fallback"""
+    primary = FakeLLMProvider(tokens=["Fast", " answer"])
+    fallback = FakeLLMProvider(tokens=["Local"])
+    service = make_service(primary, fallback)
+
+    response, chunks = await generate(service)
+
+    assert response == "Fast answer"
+    assert chunks == ["Fast", " answer"]
+    assert fallback.requests == []
+    stats = service.hedge_tracker.get_stats()
+    assert stats["openrouter"]["hedges_fired"] == 0
+    assert stats["openrouter"]["races"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled():
+    """Test the fallback starts after the hedge delay, wins, and the primary is cancelled"""
+    primary = FakeLLMProvider(tokens=["Slow"], first_token_delay_s=1.0)
+    fallback = FakeLLMProvider(tokens=["Local", " answer"], first_token_delay_s=0.01)
+    service = make_service(primary, fallback)
+
+    response, chunks = await generate(service)
+
+    assert response == "Local answer"
+    assert chunks == ["Local", " answer"]  # Only the winner reaches the callback
+    assert primary.cancelled == 1
+    assert primary.tokens_sent == 0
+
+    stats = service.hedge_tracker.get_stats()
+    assert stats["openrouter"]["hedges_fired"] == 1
+    assert stats["local"]["wins"] == 1
+    assert stats["local"]["win_rate"] == 1.0
+    assert stats["openrouter"]["win_rate"] == 0.0
+    assert stats["openrouter"]["wasted_streams"] == 1
+    assert stats["openrouter"]["wasted_tokens"] > 0  # Prompt processed for nothing
+
+
+@pytest.mark.asyncio
+async def test_primary_can_still_win_after_hedge():
+    """Test a hedged primary that streams first keeps the race and the fallback is cancelled"""
+    primary = FakeLLMProvider(tokens=["Primary"], first_token_delay_s=0.1)
+    fallback = FakeLLMProvider(tokens=["Local"], first_token_delay_s=1.0)
+    service = make_service(primary, fallback)
+
+    response, chunks = await generate(service)
+
+    assert response == "Primary"
+    assert chunks == ["Primary"]
+    assert fallback.cancelled == 1
+    stats = service.hedge_tracker.get_stats()
+    assert stats["openrouter"]["wins"] == 1
+    assert stats["local"]["wasted_streams"] == 1
+
+
+@pytest.mark.asyncio
+async def test_early_transient_failure_fails_over_immediately():
+    """Test a primary connection error before the first token starts the fallback without waiting"""
+    primary = FakeLLMProvider(error=LLMConnectionError("refused"))
+    fallback = FakeLLMProvider(tokens=["Local"])
+    events = []
+    service = make_service(primary, fallback, error_callback=AsyncMock(side_effect=events.append))
+    service.hedge_tracker = LLMHedgeTracker(default_delay_ms=5000, min_delay_ms=5000)
+
+    response, _ = await asyncio.wait_for(generate(service), timeout=1.0)
+
+    assert response == "Local"
+    assert [e.error_type for e in events] == [ServiceErrorType.LLM_FALLBACK_TRIGGERED]
+    assert service.hedge_tracker.get_stats()["openrouter"]["failovers"] == 1
+
+
+@pytest.mark.asyncio
+async def test_auth_failure_is_not_hedged():
+    """Test authentication errors fail fast instead of falling back"""
+    primary = FakeLLMProvider(error=LLMAuthenticationError("bad key"))
+    fallback = FakeLLMProvider(tokens=["Local"])
+    service = make_service(primary, fallback)
+
+    with pytest.raises(LLMAuthenticationError):
+        await generate(service)
+    assert fallback.requests == []
+
+
+@pytest.mark.asyncio
+async def test_both_providers_failing_raises():
+    """Test a race nobody wins raises once and reports a critical provider failure"""
+    primary = FakeLLMProvider(first_token_delay_s=0.1, error=LLMConnectionError("down"))
+    fallback = FakeLLMProvider(first_token_delay_s=0.1, error=LLMConnectionError("also down"))
+    events = []
+    service = make_service(primary, fallback, error_callback=AsyncMock(side_effect=events.append))
+
+    with pytest.raises(LLMHedgeFailedError):
+        await generate(service)
+
+    assert len(primary.requests) == 1
+    assert len(fallback.requests) == 1  # Not retried by the regular fallback path
+    assert events[-1].error_type == ServiceErrorType.LLM_PROVIDER_FAILED
+
+
+def test_hedge_delay_adapts_to_first_token_latency():
+    """Test the hedge delay is the configured percentile of recent latency, clamped"""
+    tracker = LLMHedgeTracker(percentile=0.9, min_samples=10, default_delay_ms=2000,
+                              min_delay_ms=100, max_delay_ms=5000)
+    assert tracker.hedge_delay_s("openrouter") == 2.0  # Not enough samples yet
+
+    for i in range(1, 11):
+        tracker.record_first_token("openrouter", i * 0.1)
+    assert tracker.hedge_delay_s("openrouter") == pytest.approx(1.0)
+
+    for _ in range(100):
+        tracker.record_first_token("openrouter", 0.01)
+    assert tracker.hedge_delay_s("openrouter") == pytest.approx(0.1)  # Clamped to minimum
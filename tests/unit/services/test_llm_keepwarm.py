@@ -0,0 +1,151 @@
+"""
+Unit tests for LLMKeepWarmManager
+
+Tests Ollama preload requests, traffic-matched keep_alive refreshes,
+letting idle models go, connection pings, cold-start incident reporting
+and startup preloading.
+"""
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.llm.local_llm import LocalLLMProvider
+from src.services.llm_keepwarm import LLMKeepWarmManager
+
+MODEL = "llama3.1:8b"
+
+
+def make_provider(load_duration_ns: int = 0, status_code: int = 200):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/api/generate":
+            if status_code != 200:
+                return httpx.Response(status_code)
+            return httpx.Response(200, json={"model": MODEL, "done": True, "load_duration": load_duration_ns})
+        return httpx.Response(200, json={"data": []})
+
+    provider = LocalLLMProvider(base_url="http://ollama:11434/v1")
+    provider.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return provider, requests
+
+
+def make_manager(**kwargs) -> LLMKeepWarmManager:
+    options = dict(interval_s=45, min_window_s=300, default_window_s=900, max_window_s=3600, cold_start_threshold_ms=2000)
+    options.update(kwargs)
+    return LLMKeepWarmManager(**options)
+
+
+def preload_bodies(requests):
+    return [json.loads(r.content) for r in requests if r.url.path == "/api/generate"]
+
+
+@pytest.mark.asyncio
+async def test_preload_model_uses_native_api():
+    """Test preload posts model + keep_alive at the server root and reports load time"""
+    provider, requests = make_provider(load_duration_ns=3_500_000_000)
+
+    assert await provider.preload_model(MODEL, 600) == pytest.approx(3.5)
+    assert str(requests[0].url) == "http://ollama:11434/api/generate"
+    assert preload_bodies(requests) == [{"model": MODEL, "keep_alive": "600s"}]
+
+    # Not Ollama: no native API
+    provider, _ = make_provider(status_code=404)
+    assert await provider.preload_model(MODEL, 600) is None
+
+
+@pytest.mark.asyncio
+async def test_traffic_keeps_model_loaded_until_window_expires():
+    """Test refreshes extend keep_alive to the traffic window, then the model is let go"""
+    manager = make_manager()
+    provider, requests = make_provider()
+
+    manager.record_request("local", provider, MODEL, first_token_s=0.3)
+    await manager.run_once()
+    assert preload_bodies(requests)[-1]["keep_alive"] == "900s"  # Default window, no gaps seen yet
+
+    # Nothing new: no refresh
+    await manager.run_once()
+    assert len(preload_bodies(requests)) == 1
+
+    # Requests two minutes apart shrink the window to its minimum (3 x 120s)
+    target = manager._models[(provider.base_url, MODEL)]
+    target.last_request -= 120
+    manager.record_request("local", provider, MODEL, first_token_s=0.3)
+    assert target.window_s(300, 900, 3600) == pytest.approx(360, abs=0.1)
+    target.warm_until = 0
+    await manager.run_once()
+    assert preload_bodies(requests)[-1]["keep_alive"] in ("359s", "360s")
+
+    # Idle beyond the window: no longer kept warm
+    target.last_request -= 400
+    await manager.run_once()
+    assert manager._models == {}
+    assert len(preload_bodies(requests)) == 2
+
+
+@pytest.mark.asyncio
+async def test_idle_connection_is_pinged():
+    """Test an idle connection gets a keep-alive request, a busy one doesn't"""
+    manager = make_manager()
+    provider, requests = make_provider()
+    provider.preload_model = AsyncMock(return_value=0.0)
+
+    manager.record_request("local", provider, MODEL, first_token_s=0.3)
+    await manager.run_once()
+    assert not [r for r in requests if r.url.path == "/v1/models"]
+
+    manager._connections[id(provider)].last_touched -= 30
+    await manager.run_once()
+    assert [r for r in requests if r.url.path == "/v1/models"]
+    assert manager.get_stats()["providers"]["local"]["pings"] == 1
+
+
+def test_cold_start_reported_only_after_idle():
+    """Test slow first tokens count as cold starts only after an idle period"""
+    manager = make_manager()
+    provider = MagicMock(base_url="https://openrouter.ai/api/v1")
+
+    manager.record_request("openrouter", provider, "openai/gpt-4o", first_token_s=3.0)  # First request
+    manager.record_request("openrouter", provider, "openai/gpt-4o", first_token_s=3.0)  # Busy: slow, not cold
+
+    manager._connections[id(provider)].last_request -= 600
+    manager.record_request("openrouter", provider, "openai/gpt-4o", first_token_s=0.5)  # Idle but fast
+
+    stats = manager.get_stats()["providers"]["openrouter"]
+    assert stats["requests_after_idle"] == 2
+    assert stats["cold_starts"] == 1
+    assert stats["last_cold_start"]["first_token_ms"] == 3000
+
+
+@pytest.mark.asyncio
+async def test_preload_agents_loads_local_models_at_startup():
+    """Test startup preloads local agents' models and pings remote providers"""
+    manager = make_manager()
+    local, requests = make_provider(load_duration_ns=4_000_000_000)
+    remote = MagicMock(base_url="https://openrouter.ai/api/v1", warm_connection=AsyncMock(return_value=True))
+
+    services = {
+        "local": MagicMock(get_provider=lambda provider_type: local),
+        "openrouter": MagicMock(get_provider=lambda provider_type: remote),
+    }
+    agents = [
+        SimpleNamespace(name="Remote", llm_provider="openrouter", llm_model="openai/gpt-4o", is_default=False),
+        SimpleNamespace(name="Local", llm_provider="local", llm_model=MODEL, is_default=True),
+    ]
+
+    async def service_for(agent):
+        return services[agent.llm_provider]
+
+    with patch("src.services.llm_service.get_llm_service_for_agent", service_for):
+        assert await manager.preload_agents(agents) == 1
+
+    assert preload_bodies(requests) == [{"model": MODEL, "keep_alive": "900s"}]
+    remote.warm_connection.assert_awaited_once()
+    stats = manager.get_stats()["providers"]["local"]
+    assert stats["preloads"] == 1
+    assert stats["model_reloads"] == 0  # Loading at startup is expected
@@ -0,0 +1,147 @@
+"""
+Unit tests for LLMScheduler
+
+Tests per-lane concurrency limits, priority ordering, deadline-aware
+rejection, background yielding under interactive load, abandoning queued
+requests and queue-wait metrics.
+"""
+import asyncio
+
+import pytest
+
+from src.services.llm_scheduler import LLMPriority, LLMRequestRejectedError, LLMScheduler
+
+MODEL = "llama3.1:8b"
+
+
+def make_scheduler(limit: int = 1, **deadlines) -> LLMScheduler:
+    return LLMScheduler(
+        limits={'local': limit, 'openrouter': 8},
+        deadlines_s={
+            LLMPriority.VOICE: deadlines.get('voice', 0),
+            LLMPriority.TEXT: deadlines.get('text', 0),
+            LLMPriority.BACKGROUND: deadlines.get('background', 0),
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_lane_limits_concurrency_per_provider_and_model():
+    """Test requests beyond a lane's limit wait; other lanes are unaffected"""
+    scheduler = make_scheduler(limit=1)
+    await scheduler.acquire("local", MODEL, LLMPriority.VOICE)
+
+    waiter = asyncio.create_task(scheduler.acquire("local", MODEL, LLMPriority.VOICE))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    # Different model and different provider have their own lanes
+    assert await scheduler.acquire("local", "gemma3n:latest") == 0.0
+    assert await scheduler.acquire("openrouter", MODEL) == 0.0
+
+    scheduler.release("local", MODEL, LLMPriority.VOICE)
+    assert await waiter > 0
+    assert scheduler.lane("local", MODEL).active == 1
+
+
+@pytest.mark.asyncio
+async def test_priority_order_and_session_fairness():
+    """Test voice beats text beats background, and sessions alternate within a class"""
+    scheduler = make_scheduler(limit=1)
+    await scheduler.acquire("local", MODEL, LLMPriority.TEXT, "holder")
+    order = []
+
+    async def request(name, priority, session_id):
+        await scheduler.acquire("local", MODEL, priority, session_id)
+        order.append(name)
+
+    requests = [
+        ("text-a1", LLMPriority.TEXT, "a"),
+        ("text-a2", LLMPriority.TEXT, "a"),
+        ("text-b1", LLMPriority.TEXT, "b"),
+        ("voice-c1", LLMPriority.VOICE, "c"),
+    ]
+    tasks = [asyncio.create_task(request(*r)) for r in requests]
+    await asyncio.sleep(0)
+    for name, priority, _ in [("holder", LLMPriority.TEXT, "")] + requests[:-1]:
+        scheduler.release("local", MODEL, priority)
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+
+    assert order == ["voice-c1", "text-a1", "text-b1", "text-a2"]
+
+
+@pytest.mark.asyncio
+async def test_background_yields_under_interactive_load():
+    """Test background work is rejected outright while interactive requests fill the lane"""
+    scheduler = make_scheduler(limit=1)
+    await scheduler.acquire("local", MODEL, LLMPriority.VOICE)
+
+    with pytest.raises(LLMRequestRejectedError):
+        await scheduler.acquire("local", MODEL, LLMPriority.BACKGROUND)
+    assert scheduler.get_stats()['rejected']['yielded'] == 1
+
+    # Queued behind other background work, it waits instead
+    scheduler.release("local", MODEL, LLMPriority.VOICE)
+    await scheduler.acquire("local", MODEL, LLMPriority.BACKGROUND)
+    waiter = asyncio.create_task(scheduler.acquire("local", MODEL, LLMPriority.BACKGROUND))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+    scheduler.release("local", MODEL, LLMPriority.BACKGROUND)
+    await waiter
+
+
+@pytest.mark.asyncio
+async def test_deadline_rejection_estimated_and_actual():
+    """Test requests are rejected when the estimated wait or the actual wait passes the deadline"""
+    scheduler = make_scheduler(limit=1, text=0.05)
+    lane = scheduler.lane("local", MODEL)
+    lane.ewma_service_s = 10.0  # Responses have been taking ~10s
+
+    await scheduler.acquire("local", MODEL, LLMPriority.TEXT)
+    with pytest.raises(LLMRequestRejectedError, match="estimated wait"):
+        await scheduler.acquire("local", MODEL, LLMPriority.TEXT)
+
+    lane.ewma_service_s = 0.01  # Estimate says fine, but the slot never frees
+    with pytest.raises(LLMRequestRejectedError, match="without a slot"):
+        await scheduler.acquire("local", MODEL, LLMPriority.TEXT)
+
+    stats = scheduler.get_stats()
+    assert stats['rejected'] == {'deadline': 1, 'yielded': 0, 'timed_out': 1}
+    assert lane.active == 1 and not lane.waiting  # Nothing leaked
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    """Test a request cancelled while queued (barge-in) frees its place"""
+    scheduler = make_scheduler(limit=1)
+    await scheduler.acquire("local", MODEL, LLMPriority.VOICE)
+
+    cancelled = asyncio.create_task(scheduler.acquire("local", MODEL, LLMPriority.VOICE))
+    waiter = asyncio.create_task(scheduler.acquire("local", MODEL, LLMPriority.VOICE))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+
+    scheduler.release("local", MODEL, LLMPriority.VOICE)
+    await asyncio.wait_for(waiter, timeout=1.0)
+    assert scheduler.lane("local", MODEL).active == 1
+    assert scheduler.get_stats()['abandoned'] == 1
+
+
+@pytest.mark.asyncio
+async def test_slot_records_queue_wait_and_service_time():
+    """Test the slot context manager releases, and metrics capture waits and service time"""
+    scheduler = make_scheduler(limit=1)
+
+    async def turn():
+        async with scheduler.slot("local", MODEL, LLMPriority.VOICE, "s1"):
+            await asyncio.sleep(0.05)
+
+    await asyncio.gather(turn(), turn())
+
+    stats = scheduler.get_stats()
+    lane = stats['lanes'][f"local:{MODEL}"]
+    assert lane['active'] == 0 and lane['admitted'] == 2
+    assert lane['ewma_service_s'] < 2.0  # Moved toward the observed ~50ms
+    assert stats['queue_wait_s']['voice']['p95'] >= 0.04
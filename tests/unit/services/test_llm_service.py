@@ -740,3 +740,93 @@ async def test_callback_error_does_not_crash():
         )
 
         assert response == "Test"
+
+
+# ============================================================
+# Per-agent Service Cache Tests
+# ============================================================
+
+def make_agent(provider_id=None):
+    agent = MagicMock()
+    agent.id = uuid4()
+    agent.name = "Test Agent"
+    agent.llm_provider_id = provider_id
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_agent_service_cache_reuses_service():
+    """Test repeated lookups for an agent reuse one service (no rebuild, no decrypt)"""
+    from src.services.llm_service import LLMServiceCache, get_llm_service_for_agent
+
+    provider_id = uuid4()
+    db_provider = MagicMock(is_active=True, provider_type='openrouter', base_url=None, api_key_encrypted='enc')
+    db_provider.name = "OpenRouter"
+    cache = LLMServiceCache(close_grace_s=0)
+
+    with patch('src.services.llm_service.get_llm_service_cache', return_value=cache), \
+         patch('src.services.llm_service.LLMProviderFactory.create_provider', return_value=AsyncMock(spec=LLMProvider)), \
+         patch('src.services.llm_provider_service.LLMProviderService.get_provider', AsyncMock(return_value=db_provider)) as mock_get, \
+         patch('src.services.llm_provider_service.LLMProviderService._decrypt_api_key', return_value='key') as mock_decrypt:
+        agent = make_agent(provider_id)
+
+        first, second = await asyncio.gather(
+            get_llm_service_for_agent(agent),
+            get_llm_service_for_agent(agent),
+        )
+        third = await get_llm_service_for_agent(agent)
+
+    assert first is second is third
+    assert first.openrouter_api_key == 'key'
+    mock_get.assert_awaited_once()
+    mock_decrypt.assert_called_once()
+
+    stats = cache.get_stats()
+    assert (stats['cold_starts'], stats['reused'], stats['size']) == (1, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_agent_service_cache_invalidation():
+    """Test agent and provider invalidation drop entries and close them after the grace period"""
+    from src.services.llm_service import LLMServiceCache
+
+    cache = LLMServiceCache(close_grace_s=0)
+    provider_id = str(uuid4())
+    services = {}
+
+    async def build(name):
+        service = MagicMock(spec=LLMService)
+        service.close = AsyncMock()
+        services[name] = service
+        return service, True
+
+    await cache.get_or_create(("agent-a", provider_id, "cfg"), lambda: build("a"))
+    await cache.get_or_create(("agent-b", provider_id, "cfg"), lambda: build("b"))
+    await cache.get_or_create(("agent-c", None, "cfg"), lambda: build("c"))
+
+    assert cache.invalidate_agent("agent-c") == 1
+    assert cache.invalidate_provider(provider_id) == 2
+    assert cache.get_stats()['size'] == 0
+
+    await asyncio.sleep(0.01)
+    for service in services.values():
+        service.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_agent_service_cache_skips_fallback_builds():
+    """Test a service built after a failed provider lookup is not cached"""
+    from src.services.llm_service import LLMServiceCache, get_llm_service_for_agent
+
+    cache = LLMServiceCache()
+
+    with patch('src.services.llm_service.get_llm_service_cache', return_value=cache), \
+         patch('src.services.llm_service.LLMProviderFactory.create_provider', return_value=AsyncMock(spec=LLMProvider)), \
+         patch('src.services.llm_provider_service.LLMProviderService.get_provider', AsyncMock(side_effect=Exception("db down"))):
+        agent = make_agent(uuid4())
+        first = await get_llm_service_for_agent(agent)
+        second = await get_llm_service_for_agent(agent)
+
+    assert first is not second
+    assert cache.get_stats()['uncached_builds'] == 2
+    assert cache.get_stats()['size'] == 0
@@ -0,0 +1,116 @@
+"""
+Unit tests for speculative memory prefetch
+
+Tests when partial transcripts start or restart a prefetch, reuse versus
+re-query on the final transcript, and that ConversationService takes a
+matching prefetch instead of searching again.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.services.conversation_service import CachedContext, ConversationService, Message
+from src.services.memory_prefetch import MemoryPrefetcher, query_tokens, token_overlap
+
+
+def make_retrieve(results=None, delay: float = 0.0):
+    queries = []
+
+    async def retrieve(query):
+        queries.append(query)
+        await asyncio.sleep(delay)
+        return (results or {}).get(query, f"memories for {query}")
+
+    return retrieve, queries
+
+
+def test_token_overlap():
+    """Test overlap ignores case and punctuation"""
+    assert token_overlap(query_tokens("What's the weather?"), query_tokens("what's the WEATHER")) == 1.0
+    assert token_overlap(query_tokens("play some jazz"), query_tokens("")) == 0.0
+    assert token_overlap(query_tokens("a b c"), query_tokens("a b c d")) == 0.75
+
+
+@pytest.mark.asyncio
+async def test_partials_start_and_restart_prefetch():
+    """Test short partials are ignored, close ones keep the prefetch and drifted ones restart it"""
+    prefetcher = MemoryPrefetcher(min_words=3, min_overlap=0.6)
+    retrieve, queries = make_retrieve()
+
+    assert not prefetcher.on_partial("s1", "what is", retrieve)
+    assert prefetcher.on_partial("s1", "what is my sister", retrieve)
+    assert not prefetcher.on_partial("s1", "what is my sister's", retrieve)  # In flight: compared at the final
+    await asyncio.sleep(0.01)
+
+    assert not prefetcher.on_partial("s1", "what is my sister", retrieve)  # Same words
+    assert prefetcher.on_partial("s1", "what is my sister called and where does she live", retrieve)
+    await asyncio.sleep(0.01)
+
+    assert queries == ["what is my sister", "what is my sister called and where does she live"]
+    assert prefetcher.get_stats()["restarted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_take_reuses_matching_prefetch_and_rejects_others():
+    """Test the final transcript reuses a close prefetch and discards a different one"""
+    prefetcher = MemoryPrefetcher(min_words=3, min_overlap=0.6)
+    retrieve, _ = make_retrieve(delay=0.02)
+
+    prefetcher.on_partial("s1", "remind me what my dog", retrieve)
+    await asyncio.sleep(0.03)
+    task = prefetcher.take("s1", "Remind me what my dog is called")
+    assert task is not None and await task == "memories for remind me what my dog"
+    assert prefetcher.take("s1", "anything") is None  # Claimed once
+
+    prefetcher.on_partial("s2", "turn the lights off", retrieve)
+    assert prefetcher.take("s2", "what's the weather like tomorrow") is None
+
+    stats = prefetcher.get_stats()
+    assert stats["hits"] == 1 and stats["mismatches"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["avg_saved_ms"] >= 15
+
+
+@pytest.mark.asyncio
+async def test_conversation_context_uses_prefetched_memories():
+    """Test the final context build reuses a matching prefetch and re-queries otherwise"""
+    memory_service = MagicMock()
+    memory_service.get_user_memory_context = AsyncMock(
+        side_effect=lambda **kwargs: f"<user_memories>\n- for: {kwargs['query']}\n</user_memories>"
+    )
+    with patch('src.services.conversation_service.get_memory_prefetcher', return_value=MemoryPrefetcher()):
+        service = ConversationService(memory_service=memory_service)
+    service._get_user_timezone = AsyncMock(return_value="UTC")
+
+    session_id = str(uuid4())
+    cached = CachedContext(
+        session=SimpleNamespace(id=session_id, user_id="user-1", started_at=datetime.utcnow()),
+        agent=SimpleNamespace(id=uuid4(), system_prompt="System", llm_provider="openrouter", llm_model="gpt-4"),
+        messages=[],
+        last_activity=datetime.utcnow(),
+        expires_at=datetime.utcnow() + timedelta(minutes=15),
+    )
+    service._cache[session_id] = cached
+
+    def say(message_id: int, text: str):
+        cached.messages.append(Message(
+            id=message_id, session_id=session_id, role="user", content=text, timestamp=datetime.utcnow()
+        ))
+
+    # Partial matches the final: one search, on the partial
+    service.prefetch_memory_context(session_id, "where does my sister live")
+    say(1, "Where does my sister live?")
+    context = await service.get_conversation_context(session_id)
+    assert "for: where does my sister live" in context[1].content
+    assert memory_service.get_user_memory_context.await_count == 1
+
+    # Partial differs from the final: re-queried with the final transcript
+    service.prefetch_memory_context(session_id, "set a timer for")
+    say(2, "Actually, what's my sister's birthday?")
+    context = await service.get_conversation_context(session_id)
+    assert "for: Actually, what's my sister's birthday?" in context[2].content
+    assert memory_service.get_user_memory_context.await_count == 3
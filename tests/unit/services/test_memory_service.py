@@ -6,11 +6,12 @@ and graceful degradation.
 """
 import pytest
 import asyncio
+import dataclasses
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch, call
 from uuid import UUID, uuid4
 
-from src.services.memory_service import MemoryService
+from src.services.memory_service import CachedUser, MemoryService
 from src.database.models import User, UserFact, ExtractionTask, Agent
 
 
@@ -614,7 +615,11 @@ async def test_get_or_create_user_existing():
 
     user = await service._get_or_create_user("user123", mock_db)
 
-    assert user == existing_user
+    # Cached as a detached, read-only snapshot rather than the session-bound row
+    assert isinstance(user, CachedUser)
+    assert user.id == existing_user.id and user.user_id == "user123"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        user.allow_agent_specific_memory = True
     assert not mock_db.add.called
 
 
@@ -0,0 +1,154 @@
+"""
+Unit tests for write-behind message persistence
+
+Tests size- and time-triggered batching across sessions, id write-back,
+retries without duplicates, dropping rows the database rejects, draining on
+close, and that ConversationService.add_message no longer waits on the
+database.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.services.conversation_service import CachedContext, ConversationService, Message
+from src.services.message_writer import MessageWriter
+
+
+SESSION_ID = str(uuid4())
+
+
+class FakeConversations:
+    """Conversations table keyed by idempotency key (inserts are idempotent like ON CONFLICT DO NOTHING)"""
+
+    def __init__(self):
+        self.rows = {}
+        self.batches = []
+        self.fail_next = 0
+        self.reject_content = None
+        self.release = None
+
+    async def insert(self, rows):
+        self.batches.append([row['content'] for row in rows])
+        if self.release:
+            await self.release.wait()
+        if self.fail_next:
+            self.fail_next -= 1
+            raise ConnectionError("database unavailable")
+        if any(row['content'] == self.reject_content for row in rows):
+            raise IntegrityError("INSERT", {}, Exception("violates foreign key constraint"))
+        for row in rows:
+            self.rows.setdefault(row['idempotency_key'], len(self.rows) + 1)
+        return {row['idempotency_key']: self.rows[row['idempotency_key']] for row in rows}
+
+
+def make_message(session_id: str, content: str) -> Message:
+    return Message(
+        id=None, session_id=session_id, role="user", content=content,
+        timestamp=datetime.utcnow(), idempotency_key=f"{session_id}:{content}",
+    )
+
+
+@pytest.mark.asyncio
+async def test_batches_across_sessions_on_size_trigger():
+    """Test a full batch is written at once, mixing sessions, and ids land on the messages"""
+    table = FakeConversations()
+    writer = MessageWriter(flush_interval_s=10, batch_size=4, insert=table.insert)
+
+    sessions = [str(uuid4()), str(uuid4())]
+    messages = [make_message(sessions[i % 2], f"m{i}") for i in range(4)]
+    futures = [writer.enqueue(message) for message in messages]
+    ids = await asyncio.wait_for(asyncio.gather(*futures), timeout=1.0)
+
+    assert table.batches == [["m0", "m1", "m2", "m3"]]
+    assert ids == [1, 2, 3, 4]
+    assert [m.id for m in messages] == ids
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_time_trigger_and_retry_without_duplicates():
+    """Test a partial batch flushes after the interval and a failed batch is retried once written"""
+    table = FakeConversations()
+    table.fail_next = 1
+    writer = MessageWriter(flush_interval_s=0.01, batch_size=50, insert=table.insert)
+
+    first = writer.enqueue(make_message(SESSION_ID, "hello"))
+    second = writer.enqueue(make_message(SESSION_ID, "world"))
+    assert await asyncio.wait_for(asyncio.gather(first, second), timeout=2.0) == [1, 2]
+
+    assert len(table.batches) == 2  # Failed attempt, then the retry
+    assert len(table.rows) == 2
+    stats = writer.get_stats()
+    assert stats["failures"] == 1 and stats["messages_written"] == 2 and stats["pending"] == 0
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_rejected_row_is_dropped_without_blocking_the_queue():
+    """Test a row violating a constraint is dropped and the rest of its batch still written"""
+    table = FakeConversations()
+    table.reject_content = "orphan"
+    writer = MessageWriter(flush_interval_s=10, batch_size=10, insert=table.insert)
+
+    good = writer.enqueue(make_message(SESSION_ID, "kept"))
+    bad = writer.enqueue(make_message(str(uuid4()), "orphan"))
+    assert await writer.flush() == 1
+
+    assert await good == 1
+    with pytest.raises(IntegrityError):
+        await bad
+    assert writer.get_stats()["dropped"] == 1 and writer.get_stats()["pending"] == 0
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_close_writes_queued_messages():
+    """Test shutdown drains messages still waiting for their batch"""
+    table = FakeConversations()
+    writer = MessageWriter(flush_interval_s=60, batch_size=100, insert=table.insert)
+
+    for i in range(3):
+        writer.enqueue(make_message(SESSION_ID, f"m{i}"))
+    await writer.close()
+
+    assert len(table.rows) == 3
+
+
+@pytest.mark.asyncio
+async def test_add_message_does_not_wait_for_database():
+    """Test add_message returns from the cache while the insert is still pending, and dedupes retries"""
+    table = FakeConversations()
+    table.release = asyncio.Event()
+    writer = MessageWriter(flush_interval_s=0, batch_size=10, insert=table.insert)
+    service = ConversationService(message_writer=writer)
+    service._write_behind = True
+
+    session_id = str(uuid4())
+    cached = CachedContext(
+        session=SimpleNamespace(id=session_id, user_id="user-1"),
+        agent=SimpleNamespace(id=uuid4()),
+        messages=[],
+        last_activity=datetime.utcnow(),
+        expires_at=datetime.utcnow() + timedelta(minutes=15),
+    )
+    service._cache[session_id] = cached
+
+    message = await asyncio.wait_for(
+        service.add_message(session_id, "user", "What's the weather?", correlation_id="turn-1"), timeout=0.5
+    )
+    assert message.id is None
+    assert cached.messages == [message]
+
+    # Same correlation ID (retry) or same content moments later: the first message is returned
+    assert await service.add_message(session_id, "user", "Something else", correlation_id="turn-1") is message
+    assert await service.add_message(session_id, "user", "What's the weather?") is message
+    assert len(cached.messages) == 1
+
+    table.release.set()
+    await writer.flush()
+    assert message.id == 1
+    await writer.close()
@@ -0,0 +1,151 @@
+"""
+Unit tests for prompt assembly
+
+Tests the approximate tokenizer, per-model budgets, sticky history windows
+and that the prompt prefix stays byte-identical across turns.
+"""
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.database.models import Agent, Session
+from src.services import prompt_builder
+from src.services.conversation_service import CachedContext, ConversationService, Message
+from src.services.prompt_builder import (
+    assemble_prompt,
+    context_window_for_model,
+    estimate_tokens,
+    select_history,
+)
+
+
+def make_message(id: int, role: str, content: str) -> Message:
+    return Message(id=id, session_id="s", role=role, content=content, timestamp=datetime.utcnow())
+
+
+def make_history(turns: int, words_per_message: int = 20):
+    messages = []
+    for turn in range(turns):
+        messages.append(make_message(2 * turn + 1, "user", f"question {turn} " + "word " * words_per_message))
+        messages.append(make_message(2 * turn + 2, "assistant", f"answer {turn} " + "word " * words_per_message))
+    return messages
+
+
+def test_estimate_tokens():
+    """Test the tokenizer approximation is in a sensible range for English"""
+    text = "The quick brown fox jumps over the lazy dog, twice!"
+    assert 10 <= estimate_tokens(text) <= 16
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("internationalization") > estimate_tokens("cat")
+
+
+def test_context_window_for_model():
+    """Test model lookup, generic fallback and the local server cap"""
+    assert context_window_for_model("openai/gpt-4o-mini") == 128000
+    assert context_window_for_model("gpt-4") == 8192
+    assert context_window_for_model("llama3.1:8b") == 128000
+    assert context_window_for_model("llama3.1:8b", provider="local") == prompt_builder.LOCAL_LLM_CONTEXT_TOKENS
+    assert context_window_for_model("some-unknown-model") == prompt_builder.DEFAULT_CONTEXT_WINDOW
+
+
+def test_select_history_fits_budget_and_keeps_newest():
+    """Test history is trimmed from the front, starts on a user turn and keeps the newest message"""
+    history = make_history(10)
+    selected, anchor = select_history(history, budget_tokens=150)
+
+    assert selected[-1] is history[-1]
+    assert selected[0].role == "user"
+    assert sum(estimate_tokens(m.content) + 4 for m in selected) <= 150
+    assert anchor == selected[0].id
+
+    # Newest message survives even when nothing fits
+    selected, _ = select_history(history, budget_tokens=0)
+    assert selected == [history[-1]]
+
+
+def test_select_history_window_is_sticky():
+    """Test the window start stays put on the turn after a trim"""
+    history = make_history(10)
+    budget = 300
+
+    selected, anchor = select_history(history, budget)
+    first_start = selected[0].id
+
+    history += make_history(11)[-2:]
+    selected, anchor = select_history(history, budget, anchor_id=anchor)
+
+    assert selected[0].id == first_start  # Headroom absorbs the next turn
+    assert anchor == first_start
+
+
+@pytest.mark.asyncio
+async def test_prompt_prefix_is_byte_identical_across_turns():
+    """Test everything before the volatile context is byte-identical turn to turn"""
+    service = ConversationService()
+    session_id = str(uuid4())
+    agent = Agent(
+        id=uuid4(),
+        name="TestAgent",
+        system_prompt="You are a helpful voice assistant.",
+        temperature=0.7,
+        llm_provider="local",
+        llm_model="llama3.1:8b",
+    )
+    session = Session(
+        id=UUID(session_id),
+        user_id="test_user",
+        agent_id=agent.id,
+        session_type="webrtc",
+        active=True,
+        started_at=datetime.utcnow(),
+    )
+    now = datetime.utcnow()
+    service._cache[session_id] = CachedContext(
+        session=session,
+        agent=agent,
+        messages=[make_message(1, "user", "What's the weather like?")],
+        last_activity=now,
+        expires_at=now + timedelta(minutes=15),
+    )
+
+    async def fake_timezone(user_id):
+        return "UTC"
+
+    prompts = []
+    clock = iter(datetime(2025, 1, 1, 12, minute) for minute in range(0, 60, 7))
+    with patch.object(service, "_get_user_timezone", fake_timezone), \
+         patch("src.services.conversation_service.format_datetime_context",
+               side_effect=lambda tz: prompt_builder.format_datetime_context(tz, next(clock))):
+        for turn in range(4):
+            context = await service.get_conversation_context(session_id)
+            prompts.append([{"role": m.role, "content": m.content} for m in context])
+
+            cached = service._cache[session_id]
+            cached.messages.append(make_message(2 * turn + 2, "assistant", f"Answer {turn}."))
+            cached.messages.append(make_message(2 * turn + 3, "user", f"Follow-up {turn}?"))
+
+    for previous, current in zip(prompts, prompts[1:]):
+        # Previous prompt minus its volatile context and user message is a prefix
+        stable = previous[:-2]
+        assert json.dumps(current[:len(stable)]).encode() == json.dumps(stable).encode()
+        assert previous[-2]["content"] != current[-2]["content"]  # Time moved on
+
+    assert all("[Current Date/Time Context]" not in m["content"] for m in prompts[-1][:-2])
+
+
+def test_assemble_prompt_places_volatile_before_newest_user_message():
+    """Test volatile context goes right before the message being answered"""
+    system = make_message(0, "system", "prompt")
+    volatile = make_message(0, "system", "volatile")
+    history = make_history(2)
+
+    messages = assemble_prompt([system], history, volatile)
+    assert messages[0] is system
+    assert messages[-3:] == [volatile, history[-2], history[-1]]  # Ends on an assistant turn
+
+    history.append(make_message(99, "user", "newest"))
+    messages = assemble_prompt([system], history, volatile)
+    assert messages[-2:] == [volatile, history[-1]]
@@ -0,0 +1,156 @@
+"""
+Unit tests for the semantic response cache
+
+Tests query normalization, context hashing, exact and semantic hits,
+bypass rules, TTL expiry and that LLMService replays cached answers
+through the streaming callback without calling a provider.
+"""
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from src.services.llm_service import LLMConfig, LLMService, ProviderType
+from src.services.prompt_builder import format_datetime_context
+from src.services.response_cache import (
+    ResponseCache,
+    ResponseCachePolicy,
+    context_hash,
+    normalize_query,
+    split_for_replay,
+)
+from tests.mocks.mock_llm_provider import FakeLLMProvider
+
+VOCAB = ["hello", "hi", "there", "what", "can", "you", "do", "weather", "like", "is", "the", "how", "are"]
+
+
+async def bag_of_words(text: str):
+    """Tiny deterministic embedder: word counts over a fixed vocabulary"""
+    words = text.split()
+    return [float(words.count(word)) for word in VOCAB]
+
+
+def make_agent(**kwargs):
+    fields = dict(id=uuid4(), response_cache_enabled=True, response_cache_bypass=[])
+    fields.update(kwargs)
+    return SimpleNamespace(**fields)
+
+
+def make_messages(question: str, memories: str = ""):
+    volatile = format_datetime_context("UTC")
+    if memories:
+        volatile += "\n\n" + memories
+    return [
+        {"role": "system", "content": "You are a helpful voice assistant."},
+        {"role": "system", "content": volatile},
+        {"role": "user", "content": question},
+    ]
+
+
+def test_normalize_query_and_context_hash():
+    """Test normalization ignores filler and punctuation; the hash ignores time and memory scores"""
+    assert normalize_query("Um, What's the weather like?") == "what is the weather like"
+    assert normalize_query("...") == ""
+
+    memories = "<user_memories>\n- Lives in Lisbon (relevance: {score})\n</user_memories>"
+    first = context_hash(make_messages("hi", memories.format(score="0.91")))
+    assert first == context_hash(make_messages("hello", memories.format(score="0.74")))
+    assert first != context_hash(make_messages("hi"))
+
+    text = "  Hello there! I can help with lots of things today."
+    assert "".join(split_for_replay(text)) == text
+
+
+@pytest.mark.asyncio
+async def test_exact_and_semantic_hits():
+    """Test a stored answer is reused for the same and for a similar question, in the same context only"""
+    cache = ResponseCache(embed=bag_of_words)
+    policy = ResponseCachePolicy.for_agent(make_agent())
+
+    lookup = await cache.lookup(policy, make_messages("Hello there!"))
+    assert not lookup.hit
+    cache.store(lookup, "Hi! How can I help?")
+    await cache._background.pop()  # Background embedding
+
+    assert (await cache.lookup(policy, make_messages("hello there"))).match == "exact"
+
+    similar = await cache.lookup(policy, make_messages("Hello, hello there"))
+    assert similar.hit and similar.match == "semantic"
+    assert similar.text == "Hi! How can I help?"
+
+    # Different memories: different context
+    assert not (await cache.lookup(policy, make_messages("hello there", "<user_memories>\n- x\n</user_memories>"))).hit
+
+    # Unrelated question
+    assert not (await cache.lookup(policy, make_messages("what can you do"))).hit
+
+    stats = cache.get_stats()
+    assert stats["hits_exact"] == 1 and stats["hits_semantic"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bypass_rules():
+    """Test clock questions, follow-ups, long questions and agent patterns skip the cache"""
+    cache = ResponseCache(embed=bag_of_words, max_query_words=8)
+    policy = ResponseCachePolicy.for_agent(make_agent(response_cache_bypass=[r"\bjoke\b", "[unclosed"]))
+
+    for question in [
+        "What time is it?",
+        "What's the date today",
+        "Tell me more about that",
+        "Tell me a joke",
+        "Can you explain the history of the roman empire in detail",
+        "[unclosed",
+    ]:
+        lookup = await cache.lookup(policy, make_messages(question))
+        cache.store(lookup, "answer")
+        assert lookup.bypass, question
+
+    assert cache.get_stats()["stores"] == 0
+    assert ResponseCachePolicy.for_agent(SimpleNamespace(id=uuid4(), response_cache_enabled=False)) is None
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_and_are_bounded():
+    """Test TTL expiry and oldest-first eviction per agent"""
+    cache = ResponseCache(max_entries=2)
+    agent = make_agent()
+    policy = ResponseCachePolicy(agent_id=str(agent.id), ttl_s=60)
+
+    for question in ["hello", "hi there", "how are you"]:
+        cache.store(await cache.lookup(policy, make_messages(question)), f"answer to {question}")
+
+    assert not (await cache.lookup(policy, make_messages("hello"))).hit  # Evicted
+    assert (await cache.lookup(policy, make_messages("how are you"))).hit
+
+    entry = cache._agents[policy.agent_id].entries[(context_hash(make_messages("x")), "how are you")]
+    entry.expires_at = time.monotonic() - 1
+    assert not (await cache.lookup(policy, make_messages("how are you"))).hit
+    assert cache.get_stats()["expired"] == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_service_replays_cached_answer_through_callback():
+    """Test a cache hit streams the cached text in chunks without calling the provider"""
+    provider = FakeLLMProvider(tokens=["Hi! ", "How can ", "I help ", "you today?"])
+    with patch('src.services.llm_service.LLMProviderFactory.create_provider', return_value=provider):
+        service = LLMService(openrouter_api_key="test_key", hedge_enabled=False)
+    service.response_cache = ResponseCache(embed=bag_of_words)
+    config = LLMConfig(
+        provider=ProviderType.OPENROUTER,
+        model="openai/gpt-4o-mini",
+        temperature=0.7,
+        response_cache=ResponseCachePolicy.for_agent(make_agent()),
+    )
+
+    first = await service.generate_response("session-1234", make_messages("hello"), config, callback=lambda c: None)
+    assert len(provider.requests) == 1
+
+    chunks = []
+    second = await service.generate_response("session-1234", make_messages("Hello!"), config, callback=chunks.append)
+
+    assert second == first == "Hi! How can I help you today?"
+    assert len(provider.requests) == 1
+    assert "".join(chunks) == first and len(chunks) > 1
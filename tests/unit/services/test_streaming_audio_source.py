@@ -0,0 +1,134 @@
+"""
+Unit tests for StreamingPCMAudioSource
+
+Tests in-process WAV → Discord PCM conversion, gapless segment splicing,
+underrun/idle behavior and interruption.
+"""
+import asyncio
+import struct
+
+import numpy as np
+import pytest
+
+from src.services.streaming_audio_source import (
+    FRAME_BYTES,
+    SILENCE_FRAME,
+    PCMConverter,
+    StreamingPCMAudioSource,
+)
+
+
+def make_wav(num_samples: int, value: int = 1000, sample_rate: int = 48000, channels: int = 2) -> bytes:
+    """Build a 16-bit PCM WAV filled with a constant sample value"""
+    data = struct.pack('<h', value) * (num_samples * channels)
+    fmt = struct.pack('<HHIIHH', 1, channels, sample_rate, sample_rate * channels * 2, channels * 2, 16)
+    return (
+        b'RIFF' + struct.pack('<I', 36 + len(data)) + b'WAVE'
+        + b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+        + b'data' + struct.pack('<I', len(data)) + data
+    )
+
+
+def test_converter_resamples_24k_mono_to_48k_stereo():
+    """Test 24kHz mono TTS output becomes 48kHz stereo with matching duration"""
+    wav = make_wav(24000, sample_rate=24000, channels=1)
+    converter = PCMConverter()
+
+    pcm = b''.join(converter.feed(wav[i:i + 777]) for i in range(0, len(wav), 777))
+    pcm += converter.finish()
+
+    samples = np.frombuffer(pcm, dtype='<i2')
+    # 1s at 48kHz stereo (resampler may trim a few edge samples)
+    assert abs(len(samples) - 96000) <= 64
+    # Both channels carry the mono signal
+    assert np.array_equal(samples[0::2][100:200], samples[1::2][100:200])
+
+
+def test_converter_mono_48k_duplicates_channels():
+    """Test 48kHz mono takes the fast path (channel duplication only)"""
+    converter = PCMConverter()
+    pcm = converter.feed(make_wav(10, value=7, channels=1))
+    assert pcm == struct.pack('<h', 7) * 20
+
+
+@pytest.mark.asyncio
+async def test_raw_pcm_segment_skips_conversion():
+    """Test negotiated raw PCM is played byte for byte"""
+    source = StreamingPCMAudioSource(idle_linger_ms=0)
+    pcm = struct.pack('<h', 5) * (FRAME_BYTES // 2)
+
+    segment = source.begin_segment()
+    segment.write_pcm(pcm)
+    segment.finish()
+
+    assert source.read() == pcm
+    assert segment.convert_time_s == 0.0
+
+
+@pytest.mark.asyncio
+async def test_segments_are_spliced_without_gaps():
+    """Test a frame spans the end of one segment and the start of the next"""
+    source = StreamingPCMAudioSource(idle_linger_ms=0)
+
+    first = source.begin_segment({"index": 0})
+    first.write(make_wav(480, value=1))  # Half a frame (10ms)
+    first.finish()
+    second = source.begin_segment({"index": 1})
+    second.write(make_wav(960, value=2))
+    second.finish()
+
+    frame = source.read()
+    values = np.frombuffer(frame, dtype='<i2')
+    assert len(frame) == FRAME_BYTES
+    assert set(values[:960]) == {1}
+    assert set(values[960:]) == {2}
+
+    await asyncio.sleep(0)
+    assert first.played.result() is True
+
+
+@pytest.mark.asyncio
+async def test_underrun_plays_silence_until_more_bytes_arrive():
+    """Test a streaming segment without bytes yields silence, not end-of-stream"""
+    source = StreamingPCMAudioSource(idle_linger_ms=0)
+    segment = source.begin_segment()
+
+    assert source.read() == SILENCE_FRAME
+    assert not source.closed
+
+    segment.write(make_wav(960, value=5))
+    assert set(np.frombuffer(source.read(), dtype='<i2')) == {5}
+
+
+@pytest.mark.asyncio
+async def test_idle_source_lingers_then_ends():
+    """Test an idle source plays brief silence, then returns b'' to end playback"""
+    source = StreamingPCMAudioSource(idle_linger_ms=40)
+
+    assert source.read() == SILENCE_FRAME
+    assert source.read() == SILENCE_FRAME
+    assert source.read() == b''
+    assert source.closed
+
+    with pytest.raises(RuntimeError):
+        source.begin_segment()
+
+
+@pytest.mark.asyncio
+async def test_clear_pending_keeps_current_segment():
+    """Test graceful interruption drops only segments that haven't started"""
+    source = StreamingPCMAudioSource(idle_linger_ms=0)
+
+    current = source.begin_segment()
+    current.write(make_wav(4800))
+    current.finish()
+    upcoming = source.begin_segment()
+    upcoming.write(make_wav(4800))
+    upcoming.finish()
+
+    source.read()
+    assert source.clear_pending() == 1
+
+    await asyncio.sleep(0)
+    assert upcoming.played.result() is False
+    assert not current.played.done()
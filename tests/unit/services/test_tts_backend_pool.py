@@ -0,0 +1,206 @@
+"""
+Unit tests for TTSBackendPool
+
+Tests least-outstanding routing, circuit-aware backend selection, latency
+EWMAs, the hedge delay percentile and process-wide pool sharing.
+"""
+import asyncio
+
+import pytest
+
+from src.services.tts_backend_pool import TTSBackendPool, get_tts_backend_pool, normalize_backend_url
+from src.services.tts_service import TTSService
+
+
+def make_pool(**kwargs) -> TTSBackendPool:
+    return TTSBackendPool(["http://tts-a:4123", "http://tts-b:4123/v1"], **kwargs)
+
+
+def test_normalize_backend_url():
+    """Test '/v1' suffix and trailing slash are stripped"""
+    assert normalize_backend_url("http://tts:4121/v1") == "http://tts:4121"
+    assert normalize_backend_url("http://tts:4123/") == "http://tts:4123"
+
+
+def test_requires_backend():
+    """Test an empty URL list is rejected"""
+    with pytest.raises(ValueError):
+        TTSBackendPool([])
+
+
+def test_least_outstanding_routing():
+    """Test requests go to the backend with fewest in-flight requests"""
+    pool = make_pool()
+    a, b = pool.backends
+
+    assert pool.acquire() is a
+    assert pool.acquire() is b
+    assert pool.acquire() is a
+
+    pool.release(a)
+    pool.release(a)
+    assert pool.acquire() is a
+    assert (a.outstanding, b.outstanding) == (1, 1)
+
+
+def test_ewma_breaks_ties():
+    """Test the backend with lower first-byte EWMA wins when load is equal"""
+    pool = make_pool(ewma_alpha=0.5)
+    a, b = pool.backends
+
+    pool.record_first_byte(a, 1.0)
+    pool.record_first_byte(a, 0.5)
+    pool.record_first_byte(b, 0.2)
+
+    assert a.ewma_first_byte_s == pytest.approx(0.75)
+    assert pool.acquire() is b
+
+
+def test_open_backend_is_skipped():
+    """Test a backend with an open circuit is avoided while others are healthy"""
+    pool = make_pool(failure_threshold=1, recovery_timeout_s=60.0)
+    a, b = pool.backends
+
+    pool.record_failure(a)
+    assert pool.acquire() is b
+    assert pool.acquire() is b
+
+    # Client errors don't count against health
+    pool.record_failure(b, unhealthy=False)
+    assert b.circuit_breaker.is_available()
+
+
+def test_acquire_excludes_backend():
+    """Test hedges never duplicate onto the original backend"""
+    pool = make_pool()
+    a, b = pool.backends
+
+    assert pool.acquire(exclude=[a]) is b
+    assert pool.acquire(exclude=[a, b]) is None
+
+
+def test_hedge_delay_uses_percentile():
+    """Test hedge delay is the configured percentile of recent first-byte latency"""
+    pool = make_pool(hedge_enabled=True, hedge_min_samples=10, hedge_min_delay_ms=0)
+    a = pool.backends[0]
+
+    for i in range(9):
+        pool.record_first_byte(a, 0.1 * (i + 1))
+    assert pool.hedge_delay_s() is None  # Not enough samples yet
+
+    pool.record_first_byte(a, 1.0)
+    assert pool.hedge_delay_s() == pytest.approx(1.0)  # p90 of 0.1..1.0
+
+    pool.hedge_min_delay_s = 2.0
+    assert pool.hedge_delay_s() == 2.0
+
+
+def test_hedging_needs_two_backends():
+    """Test a single-backend pool never hedges"""
+    pool = TTSBackendPool(["http://tts:4123"], hedge_enabled=True, hedge_min_samples=0)
+    assert pool.hedge_delay_s() is None
+
+
+def test_cancelled_request_estimates_avoided_synthesis():
+    """Test cancellation credits the remaining synthesis time at the backend's rate"""
+    pool = make_pool(ewma_alpha=1.0)
+    a, b = pool.backends
+
+    pool.record_success(a, 2.0, chars=100)  # 20ms per character
+    assert pool.record_cancelled(a, elapsed_s=0.5, chars=100) == pytest.approx(1.5)
+    assert pool.record_cancelled(a, elapsed_s=3.0, chars=100) == 0.0
+
+    # No rate known yet, or never sent: counted but nothing credited
+    assert pool.record_cancelled(b, elapsed_s=0.1, chars=100) == 0.0
+    assert pool.record_cancelled(b, elapsed_s=None) == 0.0
+
+    stats = pool.get_stats()
+    assert stats['cancelled'] == 3
+    assert stats['synthesis_s_avoided'] == pytest.approx(1.5)
+
+
+def test_server_cancel_support_is_learned():
+    """Test an unsupported cancel endpoint is remembered per backend"""
+    pool = make_pool()
+    a, b = pool.backends
+
+    pool.record_server_cancel(a, supported=False)
+    pool.record_server_cancel(b, supported=None)
+
+    assert (a.supports_cancel, b.supports_cancel) == (False, None)
+    assert pool.get_stats()['server_cancels_sent'] == 2
+
+
+def test_services_share_backend_pool():
+    """Test TTSService instances (e.g. one per WebRTC connection) share pool statistics"""
+    urls = ["http://tts-a:4123", "http://tts-b:4123"]
+    first = TTSService(backend_urls=urls)
+    second = TTSService(backend_urls=[url + "/v1" for url in urls])
+
+    assert first.backend_pool is second.backend_pool
+    assert get_tts_backend_pool(urls) is first.backend_pool
+
+    backend = first.backend_pool.acquire()
+    first.backend_pool.record_first_byte(backend, 0.2)
+    first.backend_pool.record_failure(backend)
+
+    stats = second.backend_pool.get_stats()
+    assert backend.url in [b['url'] for b in stats['backends'] if b['outstanding'] == 1 and b['failures'] == 1]
+    assert len(second.backend_pool._first_byte_samples) == 1
+
+    # A different backend set gets its own pool
+    assert TTSService(backend_urls=["http://tts-c:4123"]).backend_pool is not first.backend_pool
+
+
+@pytest.mark.asyncio
+async def test_services_share_circuit_breaker_and_prober():
+    """Test a new connection sees an already open circuit and no second prober is started"""
+    first = TTSService()
+    for _ in range(first.circuit_breaker.failure_threshold):
+        first.circuit_breaker.record_failure()
+
+    # A later connection fails fast without paying for its own failed requests
+    second = TTSService()
+    assert second.circuit_breaker is first.circuit_breaker
+    assert second.is_available() is False
+
+    pool = first.backend_pool
+    pool.ensure_health_monitor()
+    task = pool._health_task
+    second.backend_pool.ensure_health_monitor()
+    assert pool._health_task is task
+    assert second.get_health_status()['health_monitor_running'] is True
+
+    # Closing a connection leaves the shared prober running
+    await first.close()
+    assert pool.health_monitor_running
+
+    await pool.close()
+    assert not pool.health_monitor_running
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_prober_checks_each_backend_once_per_round():
+    """Test /health fan-out does not grow with the number of connections sharing the pool"""
+    urls = ["http://tts-a:4123", "http://tts-b:4123"]
+    services = [TTSService(backend_urls=urls) for _ in range(5)]
+    pool = services[0].backend_pool
+    pool.health_check_interval_s = 60.0
+
+    probed = []
+
+    async def check_health(backend):
+        probed.append(backend.url)
+        return True
+
+    pool.check_health = check_health
+    for service in services:
+        service.backend_pool.ensure_health_monitor()
+    await asyncio.sleep(0.01)
+
+    # One round: one request per backend, not one per backend per connection
+    assert sorted(probed) == urls
+    assert pool.circuit_breaker.total_successes == 1
+
+    await pool.close()
@@ -0,0 +1,130 @@
+"""
+Unit tests for TTSAudioCache
+
+Tests content-addressed keying, memory LRU eviction, disk tier persistence
+(reads off the event loop), and hit/miss statistics.
+"""
+import threading
+
+import pytest
+
+from src.services import tts_cache
+from src.services.tts_cache import TTSAudioCache, normalize_tts_text
+
+
+def test_normalize_collapses_whitespace():
+    """Test normalization collapses whitespace but preserves case/punctuation"""
+    assert normalize_tts_text("  Hello,\n  World!  ") == "Hello, World!"
+
+
+def test_make_key_is_content_addressed():
+    """Test identical requests map to the same key and parameters change it"""
+    cache = TTSAudioCache()
+
+    key1 = cache.make_key("Hello  world", "voice", 1.0, 0.7, 0.3, "en")
+    key2 = cache.make_key("Hello world", "voice", 1.0, 0.7, 0.3, "en")
+    key3 = cache.make_key("Hello world", "voice", 1.0, 0.7, 0.5, "en")
+    key4 = cache.make_key("Hello world", "other_voice", 1.0, 0.7, 0.3, "en")
+
+    assert key1 == key2
+    assert key1 != key3
+    assert key1 != key4
+
+
+def test_is_cacheable_respects_max_text_length():
+    """Test long texts are not cached"""
+    cache = TTSAudioCache(max_text_length=10)
+
+    assert cache.is_cacheable("Hi there")
+    assert not cache.is_cacheable("This sentence is too long")
+    assert not cache.is_cacheable("   ")
+
+
+@pytest.mark.asyncio
+async def test_memory_hit_and_miss_stats():
+    """Test hits, misses, hit ratio and bytes saved"""
+    cache = TTSAudioCache()
+
+    assert await cache.get("k") is None
+    await cache.put("k", b"audio" * 10)
+    assert await cache.get("k") == b"audio" * 10
+
+    stats = cache.get_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['memory_hits'] == 1
+    assert stats['hit_ratio'] == 0.5
+    assert stats['bytes_saved'] == 50
+
+
+@pytest.mark.asyncio
+async def test_memory_lru_eviction_by_bytes():
+    """Test least recently used entries are evicted when over byte budget"""
+    cache = TTSAudioCache(max_memory_bytes=20)
+
+    await cache.put("a", b"x" * 10)
+    await cache.put("b", b"y" * 10)
+    await cache.get("a")  # a is now most recently used
+    await cache.put("c", b"z" * 10)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"x" * 10
+    assert await cache.get("c") == b"z" * 10
+    assert cache.get_stats()['memory_bytes'] == 20
+    assert cache.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_new_instance(tmp_path):
+    """Test disk tier entries are found by a fresh cache instance"""
+    cache = TTSAudioCache(cache_dir=str(tmp_path))
+    await cache.put("key1", b"RIFF" + b"\x00" * 100)
+
+    fresh = TTSAudioCache(cache_dir=str(tmp_path))
+    audio = await fresh.get("key1")
+
+    assert audio == b"RIFF" + b"\x00" * 100
+    assert fresh.disk_hits == 1
+
+    # Promoted to memory tier
+    await fresh.get("key1")
+    assert fresh.memory_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_reads_run_off_event_loop(tmp_path, monkeypatch):
+    """Test disk hits are read in a worker thread and vanished files become misses"""
+    cache = TTSAudioCache(max_memory_bytes=0, cache_dir=str(tmp_path))
+    await cache.put("key1", b"RIFF" + b"\x01" * 10)
+    await cache.put("key2", b"RIFF" + b"\x02" * 10)
+
+    read_threads = []
+    read_file = tts_cache._read_file
+
+    def tracking_read(path):
+        read_threads.append(threading.get_ident())
+        return read_file(path)
+
+    monkeypatch.setattr(tts_cache, "_read_file", tracking_read)
+
+    assert await cache.get("key1") == b"RIFF" + b"\x01" * 10
+    assert read_threads and threading.get_ident() not in read_threads
+
+    (tmp_path / "key2.audio").unlink()
+    assert await cache.get("key2") is None
+    assert cache.get_stats()['disk_entries'] == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_evicts_oldest(tmp_path):
+    """Test disk tier stays within byte budget"""
+    cache = TTSAudioCache(max_memory_bytes=0, cache_dir=str(tmp_path), max_disk_bytes=25)
+
+    await cache.put("a", b"1" * 10)
+    await cache.put("b", b"2" * 10)
+    await cache.put("c", b"3" * 10)
+
+    assert cache.get_stats()['disk_bytes'] == 20
+    assert not (tmp_path / "a.audio").exists()
+    assert await cache.get("a") is None
+    assert await cache.get("c") == b"3" * 10
@@ -0,0 +1,147 @@
+"""
+Unit tests for TTSScheduler
+
+Tests the global concurrency budget, priority and weighted fair ordering
+across sessions, abandoning queued requests, queue-time metrics and
+look-ahead load shedding.
+"""
+import asyncio
+
+import pytest
+
+from src.services.tts_scheduler import TTSPriority, TTSScheduler
+
+
+async def hold_slots(scheduler: TTSScheduler, count: int) -> None:
+    for _ in range(count):
+        await scheduler.acquire("holder")
+
+
+async def admission_order(scheduler: TTSScheduler, requests) -> list:
+    """Queue requests behind a full budget, then free slots one at a time"""
+    order = []
+
+    async def request(name, session_id, cost, priority):
+        await scheduler.acquire(session_id, cost=cost, priority=priority)
+        order.append(name)
+
+    tasks = [asyncio.create_task(request(*r)) for r in requests]
+    await asyncio.sleep(0)
+    for _ in requests:
+        scheduler.release()
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_budget_limits_concurrency():
+    """Test requests beyond the global budget wait for a release"""
+    scheduler = TTSScheduler(max_concurrent=2)
+    await hold_slots(scheduler, 2)
+
+    waiter = asyncio.create_task(scheduler.acquire("s1"))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+    assert scheduler.waiting == 1
+
+    scheduler.release()
+    assert await waiter > 0
+    assert scheduler.active == 2
+
+
+@pytest.mark.asyncio
+async def test_urgent_sentence_jumps_lookahead():
+    """Test a response's first sentence is admitted before other sessions' look-ahead"""
+    scheduler = TTSScheduler(max_concurrent=1)
+    await hold_slots(scheduler, 1)
+
+    order = await admission_order(scheduler, [
+        ("a-lookahead", "a", 40, TTSPriority.LOOKAHEAD),
+        ("filler", "c", 10, TTSPriority.BACKGROUND),
+        ("b-first", "b", 40, TTSPriority.URGENT),
+    ])
+    assert order == ["b-first", "a-lookahead", "filler"]
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_fairly():
+    """Test a session with a long backlog doesn't starve a newly arriving one"""
+    scheduler = TTSScheduler(max_concurrent=1)
+    await hold_slots(scheduler, 1)
+
+    order = await admission_order(scheduler, [
+        ("a1", "a", 100, TTSPriority.LOOKAHEAD),
+        ("a2", "a", 100, TTSPriority.LOOKAHEAD),
+        ("a3", "a", 100, TTSPriority.LOOKAHEAD),
+        ("b1", "b", 100, TTSPriority.LOOKAHEAD),
+    ])
+    assert order.index("b1") < order.index("a2")
+
+
+@pytest.mark.asyncio
+async def test_abandoned_wait_releases_nothing_and_is_skipped():
+    """Test barge-in while queued abandons the wait without leaking a slot"""
+    scheduler = TTSScheduler(max_concurrent=1)
+    await hold_slots(scheduler, 1)
+
+    cancel_event = asyncio.Event()
+    waiter = asyncio.create_task(scheduler.acquire("s1", cancel_event=cancel_event))
+    await asyncio.sleep(0)
+    cancel_event.set()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert scheduler.waiting == 0
+    scheduler.release()
+    assert scheduler.active == 0
+    assert await scheduler.acquire("s2") == 0.0
+    assert scheduler.get_stats()['abandoned'] == 1
+
+
+def test_lookahead_is_shed_under_sustained_queueing():
+    """Test look-ahead halves, then drops to the minimum as queue waits grow"""
+    scheduler = TTSScheduler(max_concurrent=4, shed_queue_wait_ms=1000, min_lookahead=1)
+
+    assert scheduler.effective_lookahead(4) == 4
+    scheduler.ewma_queue_wait_s = 0.6
+    assert scheduler.effective_lookahead(4) == 2
+    scheduler.ewma_queue_wait_s = 1.2
+    assert scheduler.effective_lookahead(4) == 1
+
+    stats = scheduler.get_stats()
+    assert stats['shed_level'] == 2
+
+
+def test_lookahead_shed_counts_escalations_not_evaluations():
+    """Test the shed counter moves once per shed-level increase, not per look-ahead query"""
+    scheduler = TTSScheduler(max_concurrent=4, shed_queue_wait_ms=1000, min_lookahead=1, ewma_alpha=1.0)
+
+    scheduler._record_wait(TTSPriority.LOOKAHEAD, 0.6)  # Level 0 -> 1
+    for _ in range(10):
+        assert scheduler.effective_lookahead(4) == 2
+        scheduler.get_stats()
+    assert scheduler.lookahead_shed == 1
+
+    scheduler._record_wait(TTSPriority.LOOKAHEAD, 0.7)  # Still level 1
+    scheduler._record_wait(TTSPriority.LOOKAHEAD, 1.2)  # Level 1 -> 2
+    scheduler._record_wait(TTSPriority.LOOKAHEAD, 0.0)  # Back to 0
+    scheduler._record_wait(TTSPriority.LOOKAHEAD, 1.5)  # Level 0 -> 2
+    assert scheduler.get_stats()['lookahead_shed'] == 3
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_metrics_by_priority():
+    """Test queue-time percentiles are tracked per priority class"""
+    scheduler = TTSScheduler(max_concurrent=1)
+    await scheduler.acquire("s1", priority=TTSPriority.URGENT)
+
+    waiter = asyncio.create_task(scheduler.acquire("s2", priority=TTSPriority.LOOKAHEAD))
+    await asyncio.sleep(0.05)
+    scheduler.release()
+    await waiter
+
+    waits = scheduler.get_stats()['queue_wait_s']
+    assert waits['urgent']['p50'] == 0.0
+    assert waits['lookahead']['p95'] >= 0.04
+    assert waits['background'] == {'p50': None, 'p95': None}
@@ -391,25 +391,137 @@ async def test_synthesize_filtering_preserves_math():
 
 @pytest.mark.asyncio
 async def test_synthesize_chatterbox_unavailable():
-    """Test graceful degradation when Chatterbox unavailable"""
+    """Test graceful degradation when Chatterbox unavailable (circuit open)"""
     service = TTSService()
+    service.backend_pool.health_check_interval_s = 0  # No background prober
     session_id = str(uuid4())
 
-    # Mock health check failure
     mock_client = AsyncMock()
-    mock_health_response = AsyncMock()
-    mock_health_response.status_code = 503  # Service unavailable
-    mock_client.get = AsyncMock(return_value=mock_health_response)
-
+    mock_client.stream = MagicMock()
     service._client = mock_client
 
-    # Should return empty bytes
+    # Trip the circuit breaker
+    for _ in range(service.circuit_breaker.failure_threshold):
+        service.circuit_breaker.record_failure()
+
+    # Should return empty bytes without contacting Chatterbox
     result = await service.synthesize_speech(
         session_id=session_id,
         text="Test"
     )
 
     assert result == b''
+    assert not mock_client.stream.called
+    assert service.is_available() is False
+
+
+@pytest.mark.asyncio
+async def test_synthesize_does_not_call_health_endpoint():
+    """Test synthesis consults cached circuit state instead of GET /health"""
+    service = TTSService()
+    service.backend_pool.health_check_interval_s = 0  # No background prober
+    session_id = str(uuid4())
+
+    mock_response = AsyncMock()
+    mock_response.raise_for_status = MagicMock()
+
+    async def mock_aiter_bytes(chunk_size):
+        yield b"audio"
+
+    mock_response.aiter_bytes = mock_aiter_bytes
+
+    mock_client = AsyncMock()
+    mock_client.stream = MagicMock()
+    mock_client.stream.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_client.stream.return_value.__aexit__ = AsyncMock()
+    mock_client.get = AsyncMock()
+
+    service._client = mock_client
+
+    result = await service.synthesize_speech(session_id=session_id, text="Hello")
+
+    assert result == b"audio"
+    mock_client.get.assert_not_called()
+    assert service.circuit_breaker.total_successes == 1
+
+
+@pytest.mark.asyncio
+async def test_synthesize_failures_trip_circuit_breaker():
+    """Test real request failures open the circuit directly"""
+    service = TTSService()
+    service.backend_pool.health_check_interval_s = 0  # No background prober
+
+    mock_client = AsyncMock()
+    mock_client.stream = MagicMock(side_effect=httpx.TimeoutException("Timeout"))
+    service._client = mock_client
+
+    for _ in range(service.circuit_breaker.failure_threshold):
+        assert await service.synthesize_speech(session_id=str(uuid4()), text="Test") == b''
+
+    assert service.is_available() is False
+    assert mock_client.stream.call_count == service.circuit_breaker.failure_threshold
+
+    # Further requests fail fast
+    await service.synthesize_speech(session_id=str(uuid4()), text="Test")
+    assert mock_client.stream.call_count == service.circuit_breaker.failure_threshold
+    assert service.get_health_status()['state'] == 'open'
+
+
+@pytest.mark.asyncio
+async def test_callback_errors_do_not_trip_circuit_breaker():
+    """Test a failing audio sink (e.g. closed client socket) is not counted as a Chatterbox failure"""
+    service = TTSService()
+    service.backend_pool.health_check_interval_s = 0  # No background prober
+
+    mock_response = AsyncMock()
+    mock_response.raise_for_status = MagicMock()
+
+    async def mock_aiter_bytes(chunk_size):
+        yield b"audio"
+
+    mock_response.aiter_bytes = mock_aiter_bytes
+
+    mock_client = AsyncMock()
+    mock_client.stream = MagicMock()
+    mock_client.stream.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_client.stream.return_value.__aexit__ = AsyncMock()
+    service._client = mock_client
+
+    async def closed_socket(chunk):
+        raise RuntimeError("Cannot call send once a close message has been sent")
+
+    for _ in range(service.circuit_breaker.failure_threshold + 1):
+        result = await service.synthesize_speech(
+            session_id=str(uuid4()), text="Test", callback=closed_socket
+        )
+        assert result == b''
+
+    assert service.is_available() is True
+    assert service.get_health_status()['state'] == 'closed'
+    assert service.circuit_breaker.total_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_health_probe_closes_open_circuit():
+    """Test a successful background probe closes an open circuit"""
+    service = TTSService()
+    service.circuit_breaker.recovery_timeout_s = 0.0
+
+    mock_health_response = AsyncMock()
+    mock_health_response.status_code = 200
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=mock_health_response)
+    service.backend_pool._health_client = mock_client
+
+    for _ in range(service.circuit_breaker.failure_threshold):
+        service.circuit_breaker.record_failure()
+
+    assert service.circuit_breaker.allow_request() is True  # Half-open trial slot
+    service.circuit_breaker.release()
+
+    await service.backend_pool.probe_health()
+
+    assert service.get_health_status()['state'] == 'closed'
 
 
 # ============================================================
@@ -893,3 +1005,87 @@ async def test_lazy_client_initialization():
         # Second call should return same client
         client2 = await service._ensure_client()
         assert client2 == mock_client
+
+
+# ============================================================
+# Audio Cache Tests
+# ============================================================
+
+@pytest.mark.asyncio
+async def test_repeated_phrase_served_from_cache():
+    """Test repeated phrase is synthesized once and replayed with same chunking"""
+    from src.services.tts_cache import TTSAudioCache
+
+    service = TTSService(chunk_size=4, audio_cache=TTSAudioCache())
+    service.backend_pool.health_check_interval_s = 0  # No background prober
+
+    mock_response = AsyncMock()
+    mock_response.raise_for_status = MagicMock()
+
+    async def mock_aiter_bytes(chunk_size):
+        yield b"abcd"
+        yield b"efgh"
+        yield b"ij"
+
+    mock_response.aiter_bytes = mock_aiter_bytes
+
+    mock_client = AsyncMock()
+    mock_client.stream = MagicMock()
+    mock_client.stream.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_client.stream.return_value.__aexit__ = AsyncMock()
+    service._client = mock_client
+
+    first_chunks = []
+    second_chunks = []
+
+    async def first_callback(chunk):
+        first_chunks.append(chunk)
+
+    async def second_callback(chunk):
+        second_chunks.append(chunk)
+
+    await service.synthesize_speech(session_id=str(uuid4()), text="Hello there!", callback=first_callback)
+    await service.synthesize_speech(session_id=str(uuid4()), text="Hello  there!", callback=second_callback)
+
+    assert mock_client.stream.call_count == 1
+    assert second_chunks == [b"abcd", b"efgh", b"ij"]
+    assert b"".join(second_chunks) == b"".join(first_chunks)
+
+    stats = service.get_cache_stats()
+    assert stats['hits'] == 1
+    assert stats['bytes_saved'] == 10
+
+    # Buffered mode returns the full cached audio
+    assert await service.synthesize_speech(session_id=str(uuid4()), text="Hello there!") == b"abcdefghij"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_utterances_do_not_cancel_each_other():
+    """Test per-utterance syntheses of one session run concurrently with own cancellation scope"""
+    service = TTSService(audio_cache=None)
+    service.backend_pool.health_check_interval_s = 0  # No background prober
+    session_id = str(uuid4())
+
+    async def slow_stream(**kwargs):
+        for _ in range(20):
+            if kwargs['cancel_event'].is_set():
+                raise asyncio.CancelledError()
+            await asyncio.sleep(0.01)
+        return kwargs['text'].encode()
+
+    with patch.object(service, '_stream_tts', side_effect=slow_stream):
+        first = asyncio.create_task(service.synthesize_speech(
+            session_id=session_id, text="First", stream=False, utterance_id="utt-1"
+        ))
+        second = asyncio.create_task(service.synthesize_speech(
+            session_id=session_id, text="Second", stream=False, utterance_id="utt-2"
+        ))
+        await asyncio.sleep(0.05)
+
+        assert set(service._active_sessions) == {"utt-1", "utt-2"}
+
+        await service.cancel_utterance("utt-2")
+
+        assert await first == b"First"
+        assert await second == b''
+        assert len(service._active_sessions) == 0
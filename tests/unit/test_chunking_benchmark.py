@@ -0,0 +1,95 @@
+"""
+Chunking strategy benchmark
+
+Replays LLM stream samples through SentenceParser and compares chunking
+strategies on:
+- Time to first chunk (stream offset at which the first TTS request can start)
+- TTS request count (chunks per response)
+
+Run with -s to print the comparison table.
+"""
+
+from typing import Dict, List
+
+import pytest
+
+from src.services.sentence_parser import SentenceParser
+from tests.fixtures.llm_stream_samples import LLM_STREAM_SAMPLES, get_stream_sample, replay_stream
+
+
+def run_stream(sample: Dict, strategy: str) -> Dict:
+    """
+    Replay a stream through a parser configured like the Discord plugin.
+
+    Returns:
+        Dict with first_chunk_ms, requests and the emitted chunks
+    """
+    parser = SentenceParser(min_sentence_length=10, strategy=strategy)
+    chunks: List[str] = []
+    first_chunk_ms = None
+    last_offset_ms = 0.0
+
+    for offset_ms, token in replay_stream(sample):
+        last_offset_ms = offset_ms
+        emitted = parser.add_chunk(token)
+        if emitted and first_chunk_ms is None:
+            first_chunk_ms = offset_ms
+        chunks.extend(emitted)
+
+    final = parser.finalize()
+    if final:
+        chunks.append(final)
+        if first_chunk_ms is None:
+            first_chunk_ms = last_offset_ms
+
+    return {'first_chunk_ms': first_chunk_ms, 'requests': len(chunks), 'chunks': chunks}
+
+
+@pytest.fixture(scope="module")
+def results() -> Dict[str, Dict[str, Dict]]:
+    table = {
+        sample['name']: {
+            strategy: run_stream(sample, strategy)
+            for strategy in ('sentence', 'adaptive')
+        }
+        for sample in LLM_STREAM_SAMPLES
+    }
+
+    print(f"\n{'stream':<22}{'strategy':<10}{'first chunk (ms)':>18}{'requests':>10}")
+    for name, by_strategy in table.items():
+        for strategy, result in by_strategy.items():
+            print(f"{name:<22}{strategy:<10}{result['first_chunk_ms']:>18.0f}{result['requests']:>10}")
+
+    return table
+
+
+@pytest.mark.parametrize("sample", LLM_STREAM_SAMPLES, ids=lambda s: s['name'])
+def test_adaptive_preserves_text(sample, results):
+    """Test adaptive chunking emits exactly the streamed text"""
+    chunks = results[sample['name']]['adaptive']['chunks']
+    assert " ".join(chunks).split() == sample['text'].split()
+
+
+@pytest.mark.parametrize("sample", LLM_STREAM_SAMPLES, ids=lambda s: s['name'])
+def test_adaptive_first_chunk_never_later(sample, results):
+    """Test adaptive time-to-first-chunk is never worse than sentence chunking"""
+    by_strategy = results[sample['name']]
+    assert by_strategy['adaptive']['first_chunk_ms'] <= by_strategy['sentence']['first_chunk_ms']
+
+
+def test_adaptive_first_chunk_faster_on_long_sentence(results):
+    """Test a long first sentence no longer holds back the first chunk"""
+    ttft_ms = get_stream_sample('long_first_sentence')['ttft_ms']
+    by_strategy = results['long_first_sentence']
+
+    # Wait after the first LLM token is at least halved
+    adaptive_wait = by_strategy['adaptive']['first_chunk_ms'] - ttft_ms
+    sentence_wait = by_strategy['sentence']['first_chunk_ms'] - ttft_ms
+    assert adaptive_wait < sentence_wait / 2
+
+
+def test_adaptive_reduces_request_count(results):
+    """Test adaptive chunking sends fewer TTS requests across the corpus"""
+    sentence_total = sum(r['sentence']['requests'] for r in results.values())
+    adaptive_total = sum(r['adaptive']['requests'] for r in results.values())
+    assert adaptive_total < sentence_total
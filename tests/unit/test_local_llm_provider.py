@@ -5,6 +5,9 @@ Tests streaming responses, error handling, retry logic, and health checks
 for OpenAI-compatible local LLM endpoints (Ollama, vLLM, etc.).
 """
 
+import asyncio
+import json
+
 import pytest
 import httpx
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -17,6 +20,7 @@ from src.llm.types import (
     LLMTimeoutError,
     LLMConnectionError,
 )
+from tests.utils.helpers import lines_as_bytes
 
 
 # ============================================================
@@ -108,11 +112,11 @@ async def test_local_llm_streaming_success():
         yield 'data: {"choices":[{"delta":{"content":" Ollama"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
 
-    # Mock httpx.AsyncClient.post
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    # Mock httpx.AsyncClient.send (streaming request)
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status = MagicMock()
 
         # ACT
@@ -122,7 +126,7 @@ async def test_local_llm_streaming_success():
 
         # ASSERT
         assert chunks == ["Hello", " from", " Ollama"]
-        mock_post.assert_called_once()
+        mock_send.assert_called_once()
 
     await provider.close()
 
@@ -148,10 +152,10 @@ async def test_local_llm_streaming_with_max_tokens():
         yield 'data: {"choices":[{"delta":{"content":"Test"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status = MagicMock()
 
         # ACT
@@ -159,8 +163,8 @@ async def test_local_llm_streaming_with_max_tokens():
             pass
 
         # ASSERT
-        call_args = mock_post.call_args
-        payload = call_args.kwargs["json"]
+        sent_request = mock_send.call_args.args[0]
+        payload = json.loads(sent_request.content)
         assert payload["max_tokens"] == 500
 
     await provider.close()
@@ -186,10 +190,10 @@ async def test_local_llm_streaming_no_max_tokens():
         yield 'data: {"choices":[{"delta":{"content":"Test"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status = MagicMock()
 
         # ACT
@@ -197,8 +201,8 @@ async def test_local_llm_streaming_no_max_tokens():
             pass
 
         # ASSERT
-        call_args = mock_post.call_args
-        payload = call_args.kwargs["json"]
+        sent_request = mock_send.call_args.args[0]
+        payload = json.loads(sent_request.content)
         assert "max_tokens" not in payload
 
     await provider.close()
@@ -226,10 +230,10 @@ async def test_local_llm_streaming_request_headers():
     async def mock_aiter_lines():
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status = MagicMock()
 
         # ACT
@@ -237,8 +241,8 @@ async def test_local_llm_streaming_request_headers():
             pass
 
         # ASSERT
-        call_args = mock_post.call_args
-        headers = call_args.kwargs["headers"]
+        sent_request = mock_send.call_args.args[0]
+        headers = sent_request.headers
         assert headers["Authorization"] == "Bearer optional_key"
         assert headers["Content-Type"] == "application/json"
 
@@ -264,10 +268,10 @@ async def test_local_llm_streaming_no_auth_header():
     async def mock_aiter_lines():
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status = MagicMock()
 
         # ACT
@@ -275,8 +279,8 @@ async def test_local_llm_streaming_no_auth_header():
             pass
 
         # ASSERT
-        call_args = mock_post.call_args
-        headers = call_args.kwargs["headers"]
+        sent_request = mock_send.call_args.args[0]
+        headers = sent_request.headers
         assert "Authorization" not in headers
         assert headers["Content-Type"] == "application/json"
 
@@ -306,10 +310,10 @@ async def test_local_llm_streaming_empty_chunks():
         yield 'data: {"choices":[{"delta":{"content":"!"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status = MagicMock()
 
         # ACT
@@ -345,10 +349,10 @@ async def test_local_llm_streaming_malformed_json():
         yield 'data: {"choices":[{"delta":{"content":"!"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status = MagicMock()
 
         # ACT
@@ -381,8 +385,8 @@ async def test_local_llm_timeout_error():
     )
 
     # Mock timeout
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.side_effect = httpx.TimeoutException("Request timed out")
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.side_effect = httpx.TimeoutException("Request timed out")
 
         # ACT & ASSERT
         with pytest.raises(LLMTimeoutError) as exc_info:
@@ -408,8 +412,8 @@ async def test_local_llm_connection_error():
     )
 
     # Mock connection error
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.side_effect = httpx.RequestError("Connection refused")
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.side_effect = httpx.RequestError("Connection refused")
 
         # ACT & ASSERT
         with pytest.raises(LLMConnectionError) as exc_info:
@@ -435,8 +439,8 @@ async def test_local_llm_unexpected_error():
     )
 
     # Mock unexpected error
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.side_effect = RuntimeError("Unexpected error")
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.side_effect = RuntimeError("Unexpected error")
 
         # ACT & ASSERT
         with pytest.raises(LLMError) as exc_info:
@@ -661,12 +665,12 @@ async def test_local_llm_retry_on_connection_error():
         yield 'data: {"choices":[{"delta":{"content":"Success"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
     mock_response.raise_for_status = MagicMock()
 
-    # Mock post to fail twice, then succeed
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.side_effect = [
+    # Mock send to fail twice, then succeed
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.side_effect = [
             httpx.RequestError("Transient error 1"),
             httpx.RequestError("Transient error 2"),
             mock_response,
@@ -679,7 +683,7 @@ async def test_local_llm_retry_on_connection_error():
 
         # ASSERT
         assert chunks == ["Success"]
-        assert mock_post.call_count == 3  # 2 retries + 1 success
+        assert mock_send.call_count == 3  # 2 retries + 1 success
 
     await provider.close()
 
@@ -697,9 +701,9 @@ async def test_local_llm_retry_exhausted():
         model="llama3:8b",
     )
 
-    # Mock post to always fail
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.side_effect = httpx.RequestError("Persistent error")
+    # Mock send to always fail
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.side_effect = httpx.RequestError("Persistent error")
 
         # ACT & ASSERT
         with pytest.raises(LLMConnectionError):
@@ -707,7 +711,7 @@ async def test_local_llm_retry_exhausted():
                 pass
 
         # Should have tried 3 times (initial + 2 retries)
-        assert mock_post.call_count == 3
+        assert mock_send.call_count == 3
 
     await provider.close()
 
@@ -732,12 +736,12 @@ async def test_local_llm_retry_on_timeout():
         yield 'data: {"choices":[{"delta":{"content":"Success"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
     mock_response.raise_for_status = MagicMock()
 
-    # Mock post to timeout once, then succeed
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.side_effect = [
+    # Mock send to timeout once, then succeed
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.side_effect = [
             httpx.TimeoutException("Timeout"),
             mock_response,
         ]
@@ -749,7 +753,7 @@ async def test_local_llm_retry_on_timeout():
 
         # ASSERT
         assert chunks == ["Success"]
-        assert mock_post.call_count == 2  # 1 retry + 1 success
+        assert mock_send.call_count == 2  # 1 retry + 1 success
 
     await provider.close()
 
@@ -784,11 +788,11 @@ async def test_local_llm_multiple_requests_same_provider():
         yield 'data: {"choices":[{"delta":{"content":"Response"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
     mock_response.raise_for_status = MagicMock()
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
 
         # ACT
         chunks1 = []
@@ -802,7 +806,7 @@ async def test_local_llm_multiple_requests_same_provider():
         # ASSERT
         assert chunks1 == ["Response"]
         assert chunks2 == ["Response"]
-        assert mock_post.call_count == 2
+        assert mock_send.call_count == 2
 
     await provider.close()
 
@@ -828,11 +832,11 @@ async def test_local_llm_done_marker_stops_stream():
         yield "data: [DONE]"
         yield 'data: {"choices":[{"delta":{"content":"After"}}]}'  # Should not be processed
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
     mock_response.raise_for_status = MagicMock()
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
 
         # ACT
         chunks = []
@@ -864,19 +868,155 @@ async def test_local_llm_url_construction():
     async def mock_aiter_lines():
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
     mock_response.raise_for_status = MagicMock()
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
 
         # ACT
         async for _ in provider.generate_stream(request):
             pass
 
         # ASSERT
-        call_args = mock_post.call_args
-        url = call_args.args[0]
-        assert url == "http://localhost:11434/v1/chat/completions"
+        sent_request = mock_send.call_args.args[0]
+        assert str(sent_request.url) == "http://localhost:11434/v1/chat/completions"
+
+    await provider.close()
+
+
+# ============================================================
+# Incremental Streaming Tests
+# ============================================================
+
+
+class _GatedStream(httpx.AsyncByteStream):
+    """Response body that sends each line only when the test releases it"""
+
+    def __init__(self, lines, gate: asyncio.Queue):
+        self.lines = lines
+        self.gate = gate
+        self.closed = False
+
+    async def __aiter__(self):
+        for line in self.lines:
+            await self.gate.get()
+            yield line.encode()
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _transport_provider(handler) -> LocalLLMProvider:
+    provider = LocalLLMProvider(base_url="http://localhost:11434/v1")
+    provider.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return provider
+
+
+def _request() -> LLMRequest:
+    return LLMRequest(
+        messages=[LLMMessage(role="user", content="Test")],
+        temperature=0.7,
+        model="llama3:8b",
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_local_llm_yields_before_response_completes():
+    """Test chunks reach the caller while the server is still generating"""
+    gate = asyncio.Queue()
+    body = _GatedStream([
+        'data: {"choices":[{"delta":{"content":"Hello"}}]}\n\n',
+        'data: {"choices":[{"delta":{"content":" there"}}]}\n\n',
+        "data: [DONE]\n\n",
+    ], gate)
+    provider = _transport_provider(lambda request: httpx.Response(200, stream=body))
+
+    stream = provider.generate_stream(_request())
+    gate.put_nowait(None)
+    assert await stream.__anext__() == "Hello"  # Rest of the body not sent yet
+
+    gate.put_nowait(None)
+    gate.put_nowait(None)
+    assert [chunk async for chunk in stream] == [" there"]
+
+    await provider.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_local_llm_early_close_closes_response():
+    """Test stopping iteration (barge-in) closes the HTTP response"""
+    gate = asyncio.Queue()
+    body = _GatedStream(['data: {"choices":[{"delta":{"content":"Hi"}}]}\n\n'] * 5, gate)
+    provider = _transport_provider(lambda request: httpx.Response(200, stream=body))
+
+    stream = provider.generate_stream(_request())
+    gate.put_nowait(None)
+    assert await stream.__anext__() == "Hi"
+    await stream.aclose()
+
+    assert body.closed
+
+    await provider.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_local_llm_first_token_timeout():
+    """Test a server that never produces content hits the first-token timeout"""
+    body = _GatedStream(['data: {"choices":[{"delta":{"content":"late"}}]}\n\n'], asyncio.Queue())
+    provider = _transport_provider(lambda request: httpx.Response(200, stream=body))
+    provider.TIMEOUT_FIRST_TOKEN = 0.05
+
+    with pytest.raises(LLMTimeoutError, match="first token"):
+        async for _ in provider.generate_stream(_request()):
+            pass
+
+    await provider.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_local_llm_no_retry_after_first_token():
+    """Test a connection error after output has been yielded is not retried"""
+    calls = 0
+
+    class _BrokenStream(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            yield b'data: {"choices":[{"delta":{"content":"Partial"}}]}\n\n'
+            raise httpx.ReadError("connection reset")
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, stream=_BrokenStream())
+
+    provider = _transport_provider(handler)
+
+    chunks = []
+    with pytest.raises(LLMConnectionError):
+        async for chunk in provider.generate_stream(_request()):
+            chunks.append(chunk)
+
+    assert chunks == ["Partial"]
+    assert calls == 1
+
+    await provider.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_local_llm_ndjson_stream():
+    """Test Ollama's native newline-delimited JSON format is parsed"""
+    body = (
+        b'{"message":{"role":"assistant","content":"Hi"},"done":false}\n'
+        b'{"message":{"role":"assistant","content":" you"},"done":false}\n'
+        b'{"message":{"role":"assistant","content":""},"done":true}\n'
+    )
+    provider = _transport_provider(lambda request: httpx.Response(200, content=body))
+
+    assert [chunk async for chunk in provider.generate_stream(_request())] == ["Hi", " you"]
 
     await provider.close()
@@ -19,6 +19,7 @@ from src.llm.types import (
     LLMConnectionError,
     LLMAuthenticationError,
 )
+from tests.utils.helpers import lines_as_bytes
 
 
 # ============================================================
@@ -90,11 +91,11 @@ async def test_openrouter_streaming_success():
         yield 'data: {"choices":[{"delta":{"content":"!"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
 
-    # Mock httpx.AsyncClient.post
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    # Mock httpx.AsyncClient.send (streaming request)
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status = MagicMock()
 
         # ACT
@@ -104,7 +105,7 @@ async def test_openrouter_streaming_success():
 
         # ASSERT
         assert chunks == ["Hello", " there", "!"]
-        mock_post.assert_called_once()
+        mock_send.assert_called_once()
 
     await provider.close()
 
@@ -130,10 +131,10 @@ async def test_openrouter_streaming_with_max_tokens():
         yield 'data: {"choices":[{"delta":{"content":"Test"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status = MagicMock()
 
         # ACT
@@ -141,8 +142,8 @@ async def test_openrouter_streaming_with_max_tokens():
             pass
 
         # ASSERT
-        call_args = mock_post.call_args
-        payload = call_args.kwargs["json"]
+        call_args = mock_send.call_args
+        payload = json.loads(call_args.args[0].content)
         assert payload["max_tokens"] == 500
 
     await provider.close()
@@ -168,10 +169,10 @@ async def test_openrouter_streaming_no_max_tokens():
         yield 'data: {"choices":[{"delta":{"content":"Test"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status = MagicMock()
 
         # ACT
@@ -179,8 +180,8 @@ async def test_openrouter_streaming_no_max_tokens():
             pass
 
         # ASSERT
-        call_args = mock_post.call_args
-        payload = call_args.kwargs["json"]
+        call_args = mock_send.call_args
+        payload = json.loads(call_args.args[0].content)
         assert "max_tokens" not in payload
 
     await provider.close()
@@ -205,10 +206,10 @@ async def test_openrouter_streaming_request_headers():
     async def mock_aiter_lines():
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status = MagicMock()
 
         # ACT
@@ -216,8 +217,8 @@ async def test_openrouter_streaming_request_headers():
             pass
 
         # ASSERT
-        call_args = mock_post.call_args
-        headers = call_args.kwargs["headers"]
+        call_args = mock_send.call_args
+        headers = call_args.args[0].headers
         assert headers["Authorization"] == "Bearer test_api_key_123"
         assert headers["Content-Type"] == "application/json"
         assert "HTTP-Referer" in headers
@@ -249,10 +250,10 @@ async def test_openrouter_streaming_empty_chunks():
         yield 'data: {"choices":[{"delta":{"content":"!"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status = MagicMock()
 
         # ACT
@@ -288,10 +289,10 @@ async def test_openrouter_streaming_malformed_json():
         yield 'data: {"choices":[{"delta":{"content":"!"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status = MagicMock()
 
         # ACT
@@ -324,8 +325,8 @@ async def test_openrouter_timeout_error():
     )
 
     # Mock timeout
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.side_effect = httpx.TimeoutException("Request timed out")
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.side_effect = httpx.TimeoutException("Request timed out")
 
         # ACT & ASSERT
         with pytest.raises(LLMTimeoutError) as exc_info:
@@ -354,8 +355,8 @@ async def test_openrouter_rate_limit_error():
     mock_response = MagicMock()
     mock_response.status_code = 429
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Rate limit",
             request=MagicMock(),
@@ -389,8 +390,8 @@ async def test_openrouter_authentication_error_401():
     mock_response = MagicMock()
     mock_response.status_code = 401
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Unauthorized",
             request=MagicMock(),
@@ -424,8 +425,8 @@ async def test_openrouter_authentication_error_403():
     mock_response = MagicMock()
     mock_response.status_code = 403
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Forbidden",
             request=MagicMock(),
@@ -454,8 +455,8 @@ async def test_openrouter_connection_error():
     )
 
     # Mock connection error
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.side_effect = httpx.RequestError("Connection failed")
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.side_effect = httpx.RequestError("Connection failed")
 
         # ACT & ASSERT
         with pytest.raises(LLMConnectionError) as exc_info:
@@ -484,8 +485,8 @@ async def test_openrouter_http_error_500():
     mock_response = MagicMock()
     mock_response.status_code = 500
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Internal Server Error",
             request=MagicMock(),
@@ -630,12 +631,12 @@ async def test_openrouter_retry_on_connection_error():
         yield 'data: {"choices":[{"delta":{"content":"Success"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
     mock_response.raise_for_status = MagicMock()
 
     # Mock post to fail twice, then succeed
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.side_effect = [
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.side_effect = [
             httpx.RequestError("Transient error 1"),
             httpx.RequestError("Transient error 2"),
             mock_response,
@@ -648,7 +649,7 @@ async def test_openrouter_retry_on_connection_error():
 
         # ASSERT
         assert chunks == ["Success"]
-        assert mock_post.call_count == 3  # 2 retries + 1 success
+        assert mock_send.call_count == 3  # 2 retries + 1 success
 
     await provider.close()
 
@@ -667,8 +668,8 @@ async def test_openrouter_retry_exhausted():
     )
 
     # Mock post to always fail
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.side_effect = httpx.RequestError("Persistent error")
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.side_effect = httpx.RequestError("Persistent error")
 
         # ACT & ASSERT
         with pytest.raises(LLMConnectionError):
@@ -676,7 +677,7 @@ async def test_openrouter_retry_exhausted():
                 pass
 
         # Should have tried 3 times (initial + 2 retries)
-        assert mock_post.call_count == 3
+        assert mock_send.call_count == 3
 
     await provider.close()
 
@@ -711,11 +712,11 @@ async def test_openrouter_multiple_requests_same_provider():
         yield 'data: {"choices":[{"delta":{"content":"Response"}}]}'
         yield "data: [DONE]"
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
     mock_response.raise_for_status = MagicMock()
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
 
         # ACT
         chunks1 = []
@@ -729,7 +730,7 @@ async def test_openrouter_multiple_requests_same_provider():
         # ASSERT
         assert chunks1 == ["Response"]
         assert chunks2 == ["Response"]
-        assert mock_post.call_count == 2
+        assert mock_send.call_count == 2
 
     await provider.close()
 
@@ -755,11 +756,11 @@ async def test_openrouter_done_marker_stops_stream():
         yield "data: [DONE]"
         yield 'data: {"choices":[{"delta":{"content":"After"}}]}'  # Should not be processed
 
-    mock_response.aiter_lines = mock_aiter_lines
+    mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
     mock_response.raise_for_status = MagicMock()
 
-    with patch.object(provider.client, "post", new_callable=AsyncMock) as mock_post:
-        mock_post.return_value = mock_response
+    with patch.object(provider.client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = mock_response
 
         # ACT
         chunks = []
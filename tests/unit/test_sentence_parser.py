@@ -351,5 +351,82 @@ class TestRealWorldExamples:
         assert "I'm here to assist." in all_sentences[1]
 
 
+class TestAdaptiveChunking:
+    """Test adaptive first-clause chunking"""
+
+    def test_first_chunk_at_comma(self):
+        """Test long first sentence is cut at a clause boundary"""
+        parser = SentenceParser(min_sentence_length=10, strategy='adaptive')
+
+        chunks = parser.add_chunk("Well, that depends on the weather forecast, which")
+        assert chunks == ["Well, that depends on the weather forecast,"]
+
+    def test_first_chunk_before_conjunction(self):
+        """Test first chunk is cut before a conjunction"""
+        parser = SentenceParser(min_sentence_length=10, strategy='adaptive')
+
+        chunks = parser.add_chunk("I checked the calendar for next week but there ")
+        assert chunks == ["I checked the calendar for next week"]
+
+        assert parser.add_chunk("is nothing booked yet.") == []
+        assert parser.finalize() == "but there is nothing booked yet."
+
+    def test_short_clause_waits(self):
+        """Test clauses shorter than first_clause_min_length are not emitted"""
+        parser = SentenceParser(min_sentence_length=10, strategy='adaptive', first_clause_min_length=12)
+
+        assert parser.add_chunk("Well, I think ") == []
+        assert parser.add_chunk("but ") == ["Well, I think"]
+
+    def test_thousands_separator_not_clause(self):
+        """Test commas inside numbers are not clause boundaries"""
+        parser = SentenceParser(min_sentence_length=10, strategy='adaptive', first_clause_min_length=5)
+
+        assert parser.add_chunk("It costs $1,000") == []
+
+    def test_complete_first_sentence_emitted_whole(self):
+        """Test a first sentence that completes in one chunk is not split"""
+        parser = SentenceParser(min_sentence_length=10, strategy='adaptive')
+
+        chunks = parser.add_chunk("Sure, the meeting is at noon, and it is in room four. ")
+        assert chunks == ["Sure, the meeting is at noon, and it is in room four."]
+
+    def test_later_chunks_grow(self):
+        """Test later chunks group sentences up to a growing target length"""
+        parser = SentenceParser(min_sentence_length=10, strategy='adaptive', first_clause_min_length=20)
+
+        chunks = parser.add_chunk("This first sentence is long enough. One. Two. Three. Four. Five. ")
+        # Target after the first chunk is 40 characters
+        assert chunks == ["This first sentence is long enough."]
+        assert parser.finalize() == "One. Two. Three. Four. Five."
+
+        parser.add_chunk("This first sentence is long enough. ")
+        chunks = parser.add_chunk("Here is another sentence. And one more sentence here. ")
+        assert chunks == ["Here is another sentence. And one more sentence here."]
+
+    def test_paragraph_break_flushes(self):
+        """Test a paragraph break ends a growing chunk early"""
+        parser = SentenceParser(min_sentence_length=10, strategy='adaptive')
+
+        parser.add_chunk("This first sentence is long enough. ")
+        chunks = parser.add_chunk("Short one.\n\nNew paragraph")
+        assert chunks == ["Short one."]
+
+    def test_reset_restarts_first_chunk(self):
+        """Test reset/finalize return the parser to first-chunk mode"""
+        parser = SentenceParser(min_sentence_length=10, strategy='adaptive')
+
+        parser.add_chunk("This first sentence is long enough. ")
+        assert parser.chunks_emitted == 1
+        parser.finalize()
+        assert parser.chunks_emitted == 0
+
+    def test_sentence_strategy_unchanged(self):
+        """Test non-adaptive strategies keep sentence-only boundaries"""
+        parser = SentenceParser(min_sentence_length=10, strategy='sentence')
+
+        assert parser.add_chunk("Well, that depends on the weather forecast, which") == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,192 @@
+"""
+Unit tests and microbenchmark for the shared LLM stream decoder
+
+Tests reassembly across arbitrary byte splits, SSE/NDJSON framing, in-stream
+errors, the bounded line buffer and the first-token / idle deadlines, then
+measures parse throughput on recorded OpenRouter and Ollama streams against
+a per-line json.loads baseline.
+
+The throughput comparison is timing-based and only runs when opted in:
+RUN_BENCHMARKS=1 pytest tests/unit/test_stream_decoder.py -s
+"""
+import asyncio
+import json
+import os
+import time
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from src.llm.stream_decoder import StreamDecoder, stream_content
+from src.llm.types import LLMError, LLMTimeoutError
+from tests.fixtures.llm_stream_samples import LLM_STREAM_SAMPLES, record_wire_stream
+from tests.utils.helpers import chunk_bytes
+
+
+RUN_BENCHMARKS = os.getenv('RUN_BENCHMARKS', '').lower() in ('1', 'true', 'yes')
+
+
+def decode_all(decoder: StreamDecoder, pieces: List[bytes]) -> str:
+    contents = []
+    for piece in pieces:
+        contents.extend(decoder.feed(piece))
+    contents.extend(decoder.finish())
+    return "".join(contents)
+
+
+@pytest.mark.parametrize("wire_format", ["openrouter", "ollama"])
+@pytest.mark.parametrize("piece_size", [1, 7, 64, 100000])
+def test_recorded_streams_decode_exactly(wire_format, piece_size):
+    """Test every recorded stream decodes to its text regardless of how bytes are split"""
+    for sample in LLM_STREAM_SAMPLES:
+        decoder = StreamDecoder(wire_format)
+        body = record_wire_stream(sample, wire_format)
+        assert decode_all(decoder, chunk_bytes(body, piece_size)) == sample['text']
+        assert decoder.done
+        assert decoder.fast_path_hits > 0
+
+
+def test_fast_path_and_full_parse_agree():
+    """Test escaped, unicode and unusually formatted deltas fall back to json.loads"""
+    lines = [
+        'data: {"choices":[{"index":0,"delta":{"role":"assistant","content":"Plain"}}]}',
+        'data: {"choices":[{"index":0,"delta":{"content":" \\"quoted\\"\\n"}}]}',
+        'data: {"choices": [{"delta": {"content": " spaced"}}]}',
+        'data: {"choices":[{"delta":{"content":" caf\\u00e9 ☕"}}]}',
+        'event: ping',
+        ': keep-alive',
+        'data: [DONE]',
+        'data: {"choices":[{"delta":{"content":"after done"}}]}',
+    ]
+    decoder = StreamDecoder("test")
+    text = decode_all(decoder, ["\n".join(lines).encode()])
+    assert text == 'Plain "quoted"\n spaced café ☕'
+    assert decoder.fast_path_hits == 1
+
+
+def test_stream_error_and_ollama_done():
+    """Test in-stream error objects raise and Ollama's done flag ends the stream"""
+    decoder = StreamDecoder("test", label="Test LLM")
+    with pytest.raises(LLMError, match="Test LLM stream error: model overloaded"):
+        decoder.feed(b'data: {"error":{"message":"model overloaded","code":502}}\n')
+
+    decoder = StreamDecoder("ollama")
+    body = b'{"message":{"content":"last"},"done":true}\n{"message":{"content":"ignored"}}\n'
+    assert decode_all(decoder, [body]) == "last"
+    assert decoder.done
+
+
+def test_line_buffer_is_bounded_and_diagnostics_ring_is_small():
+    """Test a runaway line fails instead of growing without bound, and only recent lines are kept"""
+    decoder = StreamDecoder("test", max_line_bytes=64)
+    with pytest.raises(LLMError, match="exceeds 64 bytes"):
+        decoder.feed(b"data: " + b"x" * 100)
+
+    decoder = StreamDecoder("test", diagnostic_lines=3)
+    decoder.feed(b"".join(b": comment %d\n" % i for i in range(50)))
+    assert list(decoder.recent_lines) == [": comment 47", ": comment 48", ": comment 49"]
+
+
+class _TimedStream(httpx.AsyncByteStream):
+    """Response body yielding each piece after a delay"""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+
+    async def __aiter__(self):
+        for delay_s, piece in self.pieces:
+            await asyncio.sleep(delay_s)
+            yield piece
+
+
+async def collect(pieces, **timeouts) -> List[str]:
+    response = httpx.Response(200, stream=_TimedStream(pieces))
+    deadlines = {'first_token_timeout_s': 1.0, 'idle_timeout_s': 1.0, 'total_timeout_s': 5.0, **timeouts}
+    return [c async for c in stream_content(response, StreamDecoder("test"), time.monotonic(), **deadlines)]
+
+
+@pytest.mark.asyncio
+async def test_first_token_and_idle_timeouts_are_separate():
+    """Test a slow first token and a stall between tokens get their own deadlines"""
+    delta = b'data: {"choices":[{"delta":{"content":"Hi"}}]}\n\n'
+
+    # Slow first token is fine within its budget even though it exceeds the idle timeout
+    assert await collect([(0.15, delta), (0.01, delta)], first_token_timeout_s=0.5, idle_timeout_s=0.1) == ["Hi", "Hi"]
+
+    with pytest.raises(LLMTimeoutError, match="first token timeout"):
+        await collect([(0.3, delta)], first_token_timeout_s=0.1)
+
+    # Keep-alive comments don't count as a first token
+    with pytest.raises(LLMTimeoutError, match="first token timeout"):
+        await collect([(0.05, b": keep-alive\n")] * 6, first_token_timeout_s=0.2, idle_timeout_s=1.0)
+
+    with pytest.raises(LLMTimeoutError, match="stalled"):
+        await collect([(0.0, delta), (0.3, delta)], idle_timeout_s=0.1)
+
+
+# ============================================================
+# Throughput Microbenchmark
+# ============================================================
+
+def baseline_parse(body: bytes) -> str:
+    """Previous approach: split lines, json.loads every data line"""
+    contents = []
+    for line in body.decode().splitlines():
+        line = line.strip()
+        if not line.startswith("data: "):
+            continue
+        data = line[6:]
+        if data == "[DONE]":
+            break
+        choices = json.loads(data).get("choices", [])
+        if choices and choices[0].get("delta", {}).get("content"):
+            contents.append(choices[0]["delta"]["content"])
+    return "".join(contents)
+
+
+def throughput_mb_s(parse, body: bytes, min_time_s: float = 0.1) -> float:
+    runs = 0
+    t_start = time.perf_counter()
+    while (elapsed := time.perf_counter() - t_start) < min_time_s or runs < 3:
+        parse(body)
+        runs += 1
+    return len(body) * runs / elapsed / 1e6
+
+
+@pytest.fixture(scope="module")
+def throughput() -> Dict[str, float]:
+    body = b"".join(record_wire_stream(sample, 'openrouter') for sample in LLM_STREAM_SAMPLES)
+    ollama_body = b"".join(record_wire_stream(sample, 'ollama') for sample in LLM_STREAM_SAMPLES)
+    # Typical network reads: a few hundred bytes each
+    pieces = chunk_bytes(body, 512)
+
+    table = {
+        'baseline (json.loads per line)': throughput_mb_s(baseline_parse, body),
+        'decoder (openrouter sse)': throughput_mb_s(lambda _: decode_all(StreamDecoder("bench"), pieces), body),
+        'decoder (ollama ndjson)': throughput_mb_s(
+            lambda b: decode_all(StreamDecoder("bench"), chunk_bytes(b, 512)), ollama_body
+        ),
+    }
+    print(f"\n{'parser':<34}{'MB/s':>10}")
+    for name, mb_s in table.items():
+        print(f"{name:<34}{mb_s:>10.1f}")
+    return table
+
+
+@pytest.mark.parametrize("wire_format", ["openrouter", "ollama"])
+def test_content_lines_skip_json_parsing(wire_format):
+    """Test every content delta of the recorded streams takes the fast path (no json.loads)"""
+    body = b"".join(record_wire_stream(sample, wire_format) for sample in LLM_STREAM_SAMPLES)
+    decoder = StreamDecoder("bench")
+    decode_all(decoder, chunk_bytes(body, 512))
+
+    assert decoder.content_chunks > 0
+    assert decoder.fast_path_hits == decoder.content_chunks
+
+
+@pytest.mark.latency
+@pytest.mark.skipif(not RUN_BENCHMARKS, reason="Timing benchmark. Set RUN_BENCHMARKS=1 to run.")
+def test_decoder_outpaces_per_line_json(throughput):
+    """Test the fast path parses recorded SSE faster than json.loads on every line"""
+    assert throughput['decoder (openrouter sse)'] > throughput['baseline (json.loads per line)']
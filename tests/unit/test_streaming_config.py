@@ -98,6 +98,13 @@ class TestStreamingConfig:
         with pytest.raises(ValueError, match="chunking_strategy must be"):
             config.validate()
 
+    def test_validation_adaptive_chunking_strategy(self):
+        """Test validation accepts the adaptive chunking_strategy."""
+        config = StreamingConfig(chunking_strategy='adaptive')
+
+        # Should not raise
+        config.validate()
+
     def test_validation_valid_config(self):
         """Test validation passes for valid config."""
         config = StreamingConfig(
@@ -0,0 +1,160 @@
+"""
+Unit tests for the async TTL/LRU lookup cache
+
+Tests hits and misses, TTL expiry, LRU eviction, single-flight loading,
+invalidation while a load is in flight, and the cached lookups built on it
+(user timezone, memory scope preferences).
+"""
+import asyncio
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.utils import ttl_cache
+from src.utils.ttl_cache import AsyncTTLCache, get_ttl_cache, get_ttl_cache_stats
+
+
+@pytest.mark.asyncio
+async def test_hits_misses_and_none_values():
+    """Test repeated lookups hit the cache, including cached None"""
+    cache = AsyncTTLCache("test", ttl_s=60)
+    loader = AsyncMock(return_value=None)
+
+    assert await cache.get_or_load("k", loader) is None
+    assert await cache.get_or_load("k", loader) is None
+
+    assert loader.await_count == 1
+    stats = cache.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry_and_lru_eviction():
+    """Test expired entries are reloaded and the least recently used entry is evicted"""
+    cache = AsyncTTLCache("test", ttl_s=60, max_entries=2)
+    now = [1000.0]
+
+    with patch.object(ttl_cache.time, "monotonic", side_effect=lambda: now[0]):
+        for key in ("a", "b"):
+            await cache.get_or_load(key, AsyncMock(return_value=key))
+        await cache.get_or_load("a", AsyncMock())  # "a" is now most recent
+        await cache.get_or_load("c", AsyncMock(return_value="c"))
+
+        assert set(cache._entries) == {"a", "c"}
+        assert cache.get_stats()["evictions"] == 1
+
+        now[0] += 61
+        reload = AsyncMock(return_value="a2")
+        assert await cache.get_or_load("a", reload) == "a2"
+        reload.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    """Test single-flight: concurrent misses for one key run the loader once"""
+    cache = AsyncTTLCache("test", ttl_s=60)
+    release = asyncio.Event()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "value"
+
+    tasks = [asyncio.create_task(cache.get_or_load("k", load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["value"] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached_and_invalidation_discards_inflight_load():
+    """Test failed loads retry, and a load racing an invalidation is not stored"""
+    cache = AsyncTTLCache("test", ttl_s=60)
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("k", AsyncMock(side_effect=RuntimeError("db down")))
+    assert await cache.get_or_load("k", AsyncMock(return_value=1)) == 1
+
+    cache.invalidate("k")
+    release = asyncio.Event()
+
+    async def stale_load():
+        await release.wait()
+        return "stale"
+
+    task = asyncio.create_task(cache.get_or_load("k", stale_load))
+    await asyncio.sleep(0)
+    cache.invalidate("k")  # Row updated while the old value was being read
+    release.set()
+
+    assert await task == "stale"
+    assert "k" not in cache._entries
+
+
+@pytest.mark.asyncio
+async def test_user_timezone_cached_until_invalidated():
+    """Test the timezone is read once per user and re-read after invalidate_user_timezone"""
+    from src.services.conversation_service import ConversationService, invalidate_user_timezone
+
+    service = ConversationService()
+    user_id = str(uuid4())
+    service._load_user_timezone = AsyncMock(side_effect=["Europe/Lisbon", "Asia/Tokyo"])
+
+    assert await service._get_user_timezone(user_id) == "Europe/Lisbon"
+    assert await service._get_user_timezone(user_id) == "Europe/Lisbon"
+    service._load_user_timezone.assert_awaited_once()
+
+    invalidate_user_timezone(user_id)
+    assert await service._get_user_timezone(user_id) == "Asia/Tokyo"
+    assert get_ttl_cache_stats()["user_timezones"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_preference_invalidation_scopes():
+    """Test invalidating one preference, a user's preferences, and the admin policy"""
+    from src.services.memory_service import invalidate_memory_lookups
+
+    preferences = get_ttl_cache("memory_preferences")
+    agent_a, agent_b = uuid4(), uuid4()
+    preferences.set(("user-1", str(agent_a)), True)
+    preferences.set(("user-1", str(agent_b)), False)
+    preferences.set(("user-2", str(agent_a)), True)
+    get_ttl_cache("memory_policy").set("admin_memory_policy", True)
+
+    invalidate_memory_lookups(user_id="user-1", agent_id=agent_a)
+    assert set(preferences._entries) == {("user-1", str(agent_b)), ("user-2", str(agent_a))}
+
+    invalidate_memory_lookups(user_id="user-1")
+    assert set(preferences._entries) == {("user-2", str(agent_a))}
+
+    invalidate_memory_lookups(admin_policy=True)
+    assert "admin_memory_policy" not in get_ttl_cache("memory_policy")._entries
+
+
+@pytest.mark.asyncio
+async def test_auth_user_cache_returns_fresh_detached_copies():
+    """Test each lookup gets its own User, so one request's changes never reach another"""
+    from sqlalchemy import inspect
+
+    from src.database.models import User
+    from src.dependencies import auth
+
+    user_id = uuid4()
+    columns = {attr.key: None for attr in inspect(User).column_attrs}
+    columns.update(id=user_id, username="alice", is_active=True)
+    load = AsyncMock(return_value=columns)
+
+    with patch.object(auth, "_load_user", load):
+        first = await auth.get_user_by_id(str(user_id))
+        first.username = "mallory"
+        second = await auth.get_user_by_id(str(user_id))
+
+    load.assert_awaited_once()
+    assert second is not first
+    assert second.username == "alice"
+    assert inspect(second).detached
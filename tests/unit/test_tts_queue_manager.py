@@ -7,12 +7,14 @@ Tests TTS queue management with concurrency control:
 - Cancellation strategies (all, pending, after N)
 - Error handling callbacks
 - Worker pool management
+- In-order delivery, per-utterance IDs and bounded look-ahead
 """
 
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 from src.services.tts_queue_manager import TTSQueueManager, SynthesisStatus
+from src.services.tts_scheduler import TTSPriority, TTSScheduler
 
 
 @pytest.fixture
@@ -20,6 +22,7 @@ def mock_tts_service():
     """Mock TTS service for testing"""
     service = Mock()
     service.synthesize_speech = AsyncMock(return_value=b"fake_audio_data")
+    service.cancel_utterance = AsyncMock()
     return service
 
 
@@ -382,6 +385,273 @@ class TestCancellation:
         assert queue_manager.total_cancelled == 0
 
 
+class TestOrdering:
+    """Test sequence ordering, per-utterance synthesis and look-ahead"""
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_completion_delivered_in_order(self, mock_tts_service):
+        """Test later sentences finishing first are held until earlier ones complete"""
+        delays = {"First": 0.15, "Second": 0.05, "Third": 0.0}
+
+        async def variable_synthesis(*args, **kwargs):
+            await asyncio.sleep(delays[kwargs["text"]])
+            return kwargs["text"].encode()
+
+        mock_tts_service.synthesize_speech = variable_synthesis
+        delivered = []
+
+        async def on_complete(audio_bytes, metadata):
+            delivered.append((audio_bytes, metadata["sequence"]))
+
+        manager = TTSQueueManager(
+            max_concurrent=3,
+            tts_service=mock_tts_service,
+            on_complete=on_complete,
+        )
+        await manager.start()
+
+        for sentence in ["First", "Second", "Third"]:
+            await manager.enqueue_sentence(sentence, "session123", "voice1")
+
+        await asyncio.sleep(0.3)
+
+        assert delivered == [(b"First", 0), (b"Second", 1), (b"Third", 2)]
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_each_sentence_has_own_utterance_id(self, queue_manager, mock_tts_service):
+        """Test concurrent sentences are synthesized with distinct utterance IDs"""
+        await queue_manager.start()
+
+        task_ids = [
+            await queue_manager.enqueue_sentence(f"Sentence {i}", "session123", "voice1")
+            for i in range(3)
+        ]
+
+        await asyncio.sleep(0.2)
+
+        utterance_ids = [
+            call.kwargs["utterance_id"]
+            for call in mock_tts_service.synthesize_speech.call_args_list
+        ]
+        assert sorted(utterance_ids) == sorted(task_ids)
+        assert "speed" not in mock_tts_service.synthesize_speech.call_args.kwargs
+
+        await queue_manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_sentence_does_not_block_later_ones(self, queue_manager, mock_tts_service):
+        """Test a failed sentence's slot is skipped so later sentences are delivered"""
+        async def synthesis(*args, **kwargs):
+            return b"" if kwargs["text"] == "Broken" else b"audio"
+
+        mock_tts_service.synthesize_speech = synthesis
+        await queue_manager.start()
+
+        for sentence in ["Broken", "Fine"]:
+            await queue_manager.enqueue_sentence(sentence, "session123", "voice1")
+
+        await asyncio.sleep(0.2)
+
+        queue_manager.on_error.assert_called_once()
+        queue_manager.on_complete.assert_called_once()
+        assert queue_manager.on_complete.call_args[0][1]["sequence"] == 1
+
+        await queue_manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_retry_keeps_original_sequence(self, mock_tts_service):
+        """Test a sentence re-enqueued from on_error keeps its playback position"""
+        attempts = {"First": 0}
+
+        async def flaky_synthesis(*args, **kwargs):
+            if kwargs["text"] == "First":
+                attempts["First"] += 1
+                if attempts["First"] == 1:
+                    raise Exception("TTS failed")
+            return kwargs["text"].encode()
+
+        mock_tts_service.synthesize_speech = flaky_synthesis
+        delivered = []
+
+        async def on_complete(audio_bytes, metadata):
+            delivered.append(audio_bytes)
+
+        manager = TTSQueueManager(
+            max_concurrent=2,
+            tts_service=mock_tts_service,
+            on_complete=on_complete,
+        )
+
+        async def on_error(sentence, error, metadata):
+            await manager.enqueue_sentence(sentence, metadata["session_id"], "voice1", metadata=metadata)
+
+        manager.on_error = on_error
+        await manager.start()
+
+        for sentence in ["First", "Second"]:
+            await manager.enqueue_sentence(sentence, "session123", "voice1")
+
+        await asyncio.sleep(0.2)
+
+        assert delivered == [b"First", b"Second"]
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_lookahead_bounds_synthesis_until_played(self, mock_tts_service):
+        """Test only N+1…N+k are synthesized until playback progress is reported"""
+        manager = TTSQueueManager(
+            max_concurrent=5,
+            tts_service=mock_tts_service,
+            on_complete=AsyncMock(),
+            lookahead=1,
+        )
+        await manager.start()
+
+        for i in range(5):
+            await manager.enqueue_sentence(f"Sentence {i}", "session123", "voice1")
+
+        await asyncio.sleep(0.1)
+
+        # Sentence 0 (playing) + 1 look-ahead; 2, 3, 4 stay queued
+        assert mock_tts_service.synthesize_speech.call_count == 2
+        assert manager.get_stats()["waiting_for_window"] == 3
+
+        manager.mark_played("session123", 0)
+        await asyncio.sleep(0.1)
+
+        assert mock_tts_service.synthesize_speech.call_count == 3
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_retry_with_lookahead_does_not_deadlock(self, mock_tts_service):
+        """Test a retried sentence is picked up before later queued ones under look-ahead"""
+        attempts = {"Sentence 0": 0}
+
+        async def flaky_synthesis(*args, **kwargs):
+            if kwargs["text"] == "Sentence 0":
+                attempts["Sentence 0"] += 1
+                if attempts["Sentence 0"] == 1:
+                    raise Exception("TTS failed")
+            return kwargs["text"].encode()
+
+        mock_tts_service.synthesize_speech = flaky_synthesis
+        delivered = []
+
+        manager = TTSQueueManager(
+            max_concurrent=2,
+            tts_service=mock_tts_service,
+            on_complete=AsyncMock(),
+            lookahead=1,
+        )
+
+        async def on_complete(audio_bytes, metadata):
+            delivered.append(metadata["sequence"])
+            manager.mark_played(metadata["session_id"], metadata["sequence"])
+
+        async def on_error(sentence, error, metadata):
+            await manager.enqueue_sentence(sentence, metadata["session_id"], "voice1", metadata=metadata)
+
+        manager.on_complete = on_complete
+        manager.on_error = on_error
+        await manager.start(num_workers=2)
+
+        for i in range(5):
+            await manager.enqueue_sentence(f"Sentence {i}", "session123", "voice1")
+
+        for _ in range(20):
+            if len(delivered) == 5:
+                break
+            await asyncio.sleep(0.05)
+
+        assert delivered == [0, 1, 2, 3, 4]
+        assert attempts["Sentence 0"] == 2
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_next_sentence_is_urgent_and_lookahead_is_not(self, mock_tts_service):
+        """Test the sentence playback needs next gets URGENT admission priority"""
+        manager = TTSQueueManager(
+            max_concurrent=3,
+            tts_service=mock_tts_service,
+            on_complete=AsyncMock(),
+        )
+        await manager.start()
+
+        for i in range(3):
+            await manager.enqueue_sentence(f"Sentence {i}", "session123", "voice1")
+        await asyncio.sleep(0.1)
+
+        priorities = {
+            call.kwargs["text"]: call.kwargs["priority"]
+            for call in mock_tts_service.synthesize_speech.call_args_list
+        }
+        assert priorities["Sentence 0"] == TTSPriority.URGENT
+        assert priorities["Sentence 2"] == TTSPriority.LOOKAHEAD
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_lookahead_shrinks_under_load(self, mock_tts_service):
+        """Test a saturated scheduler narrows the look-ahead window instead of queueing more"""
+        scheduler = TTSScheduler(max_concurrent=4, shed_queue_wait_ms=1000, min_lookahead=1)
+        scheduler.ewma_queue_wait_s = 2.0  # Sustained queueing
+
+        manager = TTSQueueManager(
+            max_concurrent=5,
+            tts_service=mock_tts_service,
+            on_complete=AsyncMock(),
+            lookahead=3,
+            scheduler=scheduler,
+        )
+        await manager.start()
+
+        for i in range(5):
+            await manager.enqueue_sentence(f"Sentence {i}", "session123", "voice1")
+        await asyncio.sleep(0.1)
+
+        # Sentence 0 + 1 look-ahead instead of 0 + 3
+        assert mock_tts_service.synthesize_speech.call_count == 2
+        assert manager.get_stats()["effective_lookahead"] == 1
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel_all_cancels_active_utterances(self, mock_tts_service):
+        """Test cancel_all() cancels in-flight syntheses by utterance ID"""
+        started = asyncio.Event()
+
+        async def slow_synthesis(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(0.2)
+            return b"audio"
+
+        mock_tts_service.synthesize_speech = slow_synthesis
+        on_complete = AsyncMock()
+
+        manager = TTSQueueManager(
+            max_concurrent=1,
+            tts_service=mock_tts_service,
+            on_complete=on_complete,
+        )
+        await manager.start()
+
+        task_id = await manager.enqueue_sentence("Sentence", "session123", "voice1")
+        await started.wait()
+
+        await manager.cancel_all()
+        await asyncio.sleep(0.3)
+
+        mock_tts_service.cancel_utterance.assert_awaited_once_with(task_id)
+        on_complete.assert_not_called()
+
+        await manager.stop()
+
+
 class TestMetrics:
     """Test metrics and counters"""
 
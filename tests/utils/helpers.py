@@ -280,6 +280,25 @@ async def collect_async_iterator(iterator, max_items: int = 100) -> list:
     return items
 
 
+def lines_as_bytes(aiter_lines: Callable) -> Callable:
+    """
+    Adapt a line-yielding async generator to response.aiter_bytes()
+
+    Args:
+        aiter_lines: Async generator function yielding lines (no newline)
+
+    Returns:
+        Async generator function yielding each line as newline-terminated bytes
+
+    Usage:
+        mock_response.aiter_bytes = lines_as_bytes(mock_aiter_lines)
+    """
+    async def aiter_bytes():
+        async for line in aiter_lines():
+            yield f"{line}\n".encode()
+    return aiter_bytes
+
+
 # ============================================================
 # Environment Helpers
 # ============================================================